@@ -0,0 +1,258 @@
+# Analysis Stages - every stage reads the shared AudioAsset and its results
+# are cached process-wide via the content hash of the audio file
+
+import numpy as np
+import librosa
+import essentia.standard as es
+
+import src_algo.detect_keyscale as detect_keyscale
+import src_algo.timeline as timeline
+import src_algo.tempo as tempo
+import src_algo.loudness as bs1770
+import src_algo.ingest as ingest
+import src_algo.similarity as similarity
+import src_algo.fingerprint as fingerprint
+from src_algo.audio_asset import AudioAsset
+from src_algo.features import (FeatureGraph, HOP_LENGTH, mel_pyramid, wave_envelope,
+                               wave_envelope_blocks, stream_spectral)
+from src_algo.analysis_cache import cached, peek, MAX_CACHE_BYTES
+from src_algo.scheduler import run_in_process
+
+# bump a version whenever the analysis parameters/algorithm of a stage change
+# --> stale results in the on-disk feature store are invalidated
+STAGE_VERSIONS = {'chroma': 1, 'key_scale': 2, 'key_profiles': 1,
+                  'key_incremental': 2, 'rhythm': 1, 'onsets': 1, 'spectral': 3, 'loudness': 3,
+                  'waveform': 1, 'timeline': 2,
+                  'embedding': similarity.EMBEDDING_VERSION,
+                  'fingerprint': 1}
+
+
+def load_asset(audio_hash, source):
+    # decoded audio buffer, shared between sessions uploading the same file
+    # a temporary spill file lives exactly as long as its decoded asset
+    def compute():
+        try:
+            asset = AudioAsset(source)
+        except Exception:
+            ingest.discard(source)
+            raise
+        ingest.release_with(asset, source)
+        return asset
+    return cached(audio_hash, 'asset', compute)
+
+
+def reused(original, audio_hash, stage, **params):
+    # result of the original of a near-duplicate (see find_original), None
+    # if this audio is no duplicate or the original has no such result
+    # only for gain & offset invariant stages, read only --> the original's
+    # entries are never computed from (or overwritten with) the copy's audio
+    if original is None or original['audio_hash'] == audio_hash:
+        return None
+    return peek(original['audio_hash'], stage, STAGE_VERSIONS[stage], **params)
+
+
+def shifted_rhythm(rhythm_data, offset_sec, duration):
+    # beat grid of the original moved onto the time axis of a near-duplicate
+    beats = rhythm_data['beats'] - np.float32(offset_sec)
+    beats = beats[(beats >= 0) & (beats <= duration)]
+    return dict(rhythm_data, beats=beats.astype(np.float32),
+                intervals=np.diff(beats).astype(np.float32))
+
+
+def compute_rhythm(es_audio, method):
+    # BPM estimation using essentia library, keeps the whole beat grid
+    rhythm_ex = es.RhythmExtractor2013(method=method)
+    bpm_essentia, beats, confidence, estimates, intervals = rhythm_ex(es_audio)
+    return {'bpm': float(bpm_essentia), 'confidence': float(confidence),
+            'beats': np.asarray(beats, dtype=np.float32),  # beat positions [sec]
+            'estimates': np.asarray(estimates, dtype=np.float32),
+            'intervals': np.asarray(intervals, dtype=np.float32)}
+
+
+def chroma(asset, audio_hash, original=None):
+    # 36-bin HPCP aggregated over the track, computed ONCE and shared
+    # by all key profiles (and any later chroma based feature)
+    return cached(audio_hash, 'chroma',
+                  lambda: reused(original, audio_hash, 'chroma') or
+                  {'hpcp': run_in_process(detect_keyscale.mean_hpcp, asset.essentia_mono())},
+                  version=STAGE_VERSIONS['chroma'])
+
+
+def key_scale(asset, audio_hash, profile_type='diatonic', original=None):
+    # key, scale and key strength via essentia
+    # https://essentia.upf.edu/reference/std_Key.html
+    def compute():
+        key, scale, strength, _ = detect_keyscale.key_from_chroma(
+            chroma(asset, audio_hash, original)['hpcp'], profile_type)
+        return key, scale, float(strength)
+    return cached(audio_hash, 'key_scale', compute,
+                  version=STAGE_VERSIONS['key_scale'], profile_type=profile_type)
+
+
+def compute_key_incremental(es_audio, profile_type):
+    key, scale, strength, consumed, margin, hpcp = detect_keyscale.detect_ks_incremental(
+        es_audio, profile_type)
+    return {'key': key, 'scale': scale, 'strength': strength,
+            'consumed_sec': consumed, 'confidence': margin,
+            'hpcp': np.asarray(hpcp, dtype=np.float32)}
+
+
+def key_scale_incremental(asset, audio_hash, profile_type='diatonic', original=None):
+    # early terminating key estimation for long tracks and DJ mixes
+    return cached(audio_hash, 'key_incremental',
+                  lambda: reused(original, audio_hash, 'key_incremental',
+                                 profile_type=profile_type) or
+                  run_in_process(compute_key_incremental, asset.essentia_mono(), profile_type),
+                  version=STAGE_VERSIONS['key_incremental'], profile_type=profile_type)
+
+
+def track_chroma(asset, audio_hash, incremental=False, original=None):
+    # aggregated HPCP for the chroma based stages: full track or, for long
+    # tracks (incremental), the part consumed by the early terminating key
+    # estimation --> the full track chroma is then never computed
+    if incremental:
+        return key_scale_incremental(asset, audio_hash, original=original)['hpcp']
+    return chroma(asset, audio_hash, original)['hpcp']
+
+
+def key_profiles(asset, audio_hash, profile_types=tuple(detect_keyscale.PROFILE_TYPES),
+                 original=None, incremental=False):
+    # ranked (key, scale, strength, profile) opinions of several key profiles
+    candidates = cached(audio_hash, 'key_profiles',
+                        lambda: detect_keyscale.rank_profiles(
+                            track_chroma(asset, audio_hash, incremental, original),
+                            profile_types),
+                        version=STAGE_VERSIONS['key_profiles'],
+                        profile_types=profile_types, incremental=incremental)
+    return [tuple(candidate) for candidate in candidates]
+
+
+def rhythm(asset, audio_hash, method=tempo.FULL_ENGINE, original=None):
+    # bpm, beat positions, confidence, bpm estimates and beat intervals
+    # near-duplicates get the beat grid of the original, shifted by their offset
+    def compute():
+        original_rhythm = reused(original, audio_hash, 'rhythm', method=method)
+        if original_rhythm is not None:
+            return shifted_rhythm(original_rhythm, original['offset_sec'], asset.duration)
+        return run_in_process(compute_rhythm, asset.essentia_mono(), method)
+    return cached(audio_hash, 'rhythm', compute,
+                  version=STAGE_VERSIONS['rhythm'], method=method)
+
+
+def bpm(asset, audio_hash, method=tempo.FULL_ENGINE, original=None):
+    return rhythm(asset, audio_hash, method, original)['bpm']
+
+
+def rhythm_fast(asset, audio_hash, original=None):
+    # provisional bpm & beat grid of the fast tempo engine
+    return rhythm(asset, audio_hash, tempo.FAST_ENGINE, original)
+
+
+def onsets(spectral_data, audio_hash):
+    # onset times [sec] detected on the cached full-track mel spectrogram
+    def compute():
+        sr, hop_length = spectral_data['sr'], spectral_data['hop_length']
+        onset_env = librosa.onset.onset_strength(S=spectral_data['mel_db'], sr=sr,
+                                                 hop_length=hop_length)
+        onset_times = librosa.onset.onset_detect(onset_envelope=onset_env, sr=sr,
+                                                 hop_length=hop_length, units='time')
+        return {'onsets': np.asarray(onset_times, dtype=np.float32)}
+    return cached(audio_hash, 'onsets', compute, version=STAGE_VERSIONS['onsets'])
+
+
+def spectral(asset, audio_hash):
+    # rms energy, full-track mel spectrogram and playtime duration
+    # derived from a single STFT pass, the 3D view slices the mel frames
+    def compute():
+        if asset.mapped:  # STFT block by block from the mapped wav file
+            features = stream_spectral(
+                lambda start, end: asset.data[start:end].mean(axis=1, dtype=np.float32),
+                asset.frames, asset.sr)
+        else:
+            graph = FeatureGraph(asset.mono(), asset.sr)
+            features = {'rms': graph.rms, 'times': graph.times,
+                        'mel_db': graph.mel_db(), 'duration': graph.duration}
+        return dict(features, sr=asset.sr, hop_length=HOP_LENGTH)
+    return cached(audio_hash, 'spectral', compute,
+                  version=STAGE_VERSIONS['spectral'], float16_keys=('rms', 'mel_db'))
+
+
+def spectral_pyramid(spectral_data, audio_hash):
+    # level of detail pyramid of the full-track mel spectrogram
+    # cheap to derive --> kept in memory only, not in the feature store
+    return cached(audio_hash, 'mel_pyramid',
+                  lambda: mel_pyramid(spectral_data['mel_db']))
+
+
+def waveform(asset, audio_hash):
+    # min/max peak envelope pyramid for drawing the amplitude plot
+    def compute():
+        if asset.mapped:  # min/max of one converted block at a time
+            envelope = wave_envelope_blocks(asset.iter_mono())
+        else:
+            envelope = wave_envelope(asset.mono())
+        envelope['sr'] = asset.sr
+        return envelope
+    return cached(audio_hash, 'waveform', compute,
+                  version=STAGE_VERSIONS['waveform'], float16_keys=('min_', 'max_'))
+
+
+def key_tempo_map(asset, audio_hash, profile_type='diatonic'):
+    # per segment key & local tempo over windows of the shared 44.1 kHz mono
+    # signal (also used by key & bpm), only windows go to the worker processes
+    # mapped wav files too long to hold that signal are streamed in windows
+    def compute():
+        mono_bytes = asset.duration * timeline.ESSENTIA_SR * 4  # float32
+        if asset.mapped and mono_bytes > MAX_CACHE_BYTES:
+            windows = timeline.iter_windows(asset.source)
+        else:
+            windows = timeline.signal_windows(asset.essentia_mono())
+        return timeline.key_tempo_map(
+            windows, profile_type,
+            analyse=lambda y, profile: run_in_process(timeline.analyse_window, y, profile))
+    return cached(audio_hash, 'timeline', compute,
+                  version=STAGE_VERSIONS['timeline'], profile_type=profile_type)
+
+
+def loudness(asset, audio_hash):
+    # BS.1770 loudness timeline (momentary & short-term LUFS), integrated
+    # loudness (also of the peak normalized audio), loudness range, true peak
+    return cached(audio_hash, 'loudness',
+                  lambda: bs1770.loudness_timeline(asset.data, asset.sr),
+                  version=STAGE_VERSIONS['loudness'])
+
+
+def embedding(asset, audio_hash, method=tempo.FULL_ENGINE, original=None, incremental=False):
+    # compact similarity embedding of the cached chroma, mel, rms & tempo
+    def compute():
+        spectral_data = spectral(asset, audio_hash)
+        return {'vector': similarity.embedding(
+            track_chroma(asset, audio_hash, incremental, original), spectral_data['mel_db'],
+            spectral_data['rms'], bpm(asset, audio_hash, method, original))}
+    return cached(audio_hash, 'embedding', compute, version=STAGE_VERSIONS['embedding'],
+                  method=method, incremental=incremental)['vector']
+
+
+def landmarks(asset, audio_hash):
+    # spectral peak landmarks of the canonical 11025 Hz mono signal
+    def compute():
+        hashes, frames = fingerprint.landmarks(asset.resampled(fingerprint.FP_SR, keep=False),
+                                               fingerprint.FP_SR)
+        return {'hashes': hashes, 'frames': frames}
+    return cached(audio_hash, 'fingerprint', compute, version=STAGE_VERSIONS['fingerprint'])
+
+
+def find_original(asset, audio_hash, name=None):
+    # already analysed near-duplicate (re-export) of this audio, whose key &
+    # bpm results are reused (see reused), or the audio itself, which then
+    # becomes the original for later re-exports
+    # offset_sec: time the original is ahead of this audio
+    track_landmarks = landmarks(asset, audio_hash)
+    match = fingerprint.fingerprint_index.match_or_add(audio_hash, track_landmarks,
+                                                       asset.duration, name)
+    if match is None:
+        return {'audio_hash': audio_hash, 'duplicate_of': None}
+    return {'audio_hash': match['audio_hash'],
+            'duplicate_of': match['name'] or match['audio_hash'],
+            'aligned': match['aligned'], 'ratio': match['ratio'],
+            'offset_sec': match['offset'] * fingerprint.FP_HOP / fingerprint.FP_SR}
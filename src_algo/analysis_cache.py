@@ -0,0 +1,145 @@
+# Process-wide Analysis Cache keyed by audio content hash + parameters
+
+import sys
+import hashlib
+import threading
+import functools
+from collections import OrderedDict
+
+import numpy as np
+
+from src_algo.feature_store import feature_store
+
+MAX_CACHE_BYTES = 512 * 1024 * 1024  # 512 MB upper bound for cached results
+
+
+def content_hash(data):
+    # sha256 hex digest of the raw audio bytes (bytes, bytearray, memoryview)
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_key(audio_hash, stage, **params):
+    # identical audio + identical analysis parameters --> identical key
+    return (audio_hash, stage, tuple(sorted(params.items())))
+
+
+def nbytes_of(value):
+    # approximate memory footprint of a cached value in bytes
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, 'nbytes'):  # e.g. AudioAsset
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(nbytes_of(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(nbytes_of(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    # least-recently-used cache whose eviction is bounded by bytes
+
+    def __init__(self, max_bytes=MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._entries = OrderedDict()  # key --> (value, nbytes)
+        self._lock = threading.RLock()
+        self._inflight = {}  # key --> lock, avoids duplicate computations
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)  # mark as recently used
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        if hasattr(value, 'on_resize'):  # e.g. AudioAsset growing variants
+            value.on_resize = functools.partial(self.resize, key)
+        size = nbytes_of(value)
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return value  # too large to be cached at all
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            self._evict()
+        return value
+
+    def resize(self, key):
+        # measure an entry again whose value has grown since it was put
+        with self._lock:
+            if key not in self._entries:
+                return
+            value, size = self._entries[key]
+            new_size = nbytes_of(value)
+            self._entries[key] = (value, new_size)
+            self.current_bytes += new_size - size
+            self._evict()
+
+    def _evict(self):
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+    def get_or_compute(self, key, compute):
+        # return cached value or compute it exactly once (also across threads)
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        with key_lock:
+            value = self.get(key, missing)
+            if value is missing:  # still not computed by another thread
+                value = self.put(key, compute())
+        with self._lock:
+            self._inflight.pop(key, None)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+# module level instance --> shared by all sessions of the streamlit server
+analysis_cache = LRUCache(MAX_CACHE_BYTES)
+
+
+def cached(audio_hash, stage, compute, version=None, float16_keys=(), **params):
+    # get the result of an analysis stage for one audio content
+    # lookup order: memory --> on-disk feature store (if versioned) --> compute
+    key = make_key(audio_hash, stage, **params)
+    if version is None:  # in-memory only (e.g. decoded audio buffers)
+        return analysis_cache.get_or_compute(key, compute)
+
+    def load_or_compute():
+        value = feature_store.get(audio_hash, stage, params, version)
+        if value is None:
+            value = feature_store.put(audio_hash, stage, params, version,
+                                      compute(), float16_keys)
+        return value
+    return analysis_cache.get_or_compute(key, load_or_compute)
+
+
+def peek(audio_hash, stage, version=None, **params):
+    # already computed result of a stage, None if there is none
+    # read only --> never computes (nor stores) anything for this audio_hash
+    key = make_key(audio_hash, stage, **params)
+    value = analysis_cache.get(key)
+    if value is None and version is not None:
+        value = feature_store.get(audio_hash, stage, params, version)
+        if value is not None:  # loaded from disk, it is this content's result
+            analysis_cache.put(key, value)
+    return value
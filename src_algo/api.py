@@ -0,0 +1,268 @@
+# Local HTTP Analysis API - the analyses of the app for other tools
+# (DAW exporters, catalogue ingest), raw audio in --> JSON or npz arrays out
+# usage: python -m src_algo.api [--host 127.0.0.1] [--port 8765] [--workers N]
+#
+# POST /key?profile=diatonic        key, scale & strength (detect_ks)
+# POST /rhythm?method=multifeature  bpm, confidence, beat positions
+# POST /loudness                    BS.1770 integrated, LRA, true peak, series
+# POST /spectrogram                 rms & mel spectrogram (npz by default)
+# GET  /health                      worker pool & queue state
+# add ?format=npz to get the feature arrays as binary numpy archive
+#
+# results go through the same analysis stages as the streamlit UI and land
+# in the shared on-disk feature store --> analysed once, free in both places
+
+import io
+import sys
+import json
+import math
+import asyncio
+import argparse
+from urllib.parse import urlsplit, parse_qs
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import src_algo.analysis as analysis
+import src_algo.detect_keyscale as detect_keyscale
+import src_algo.tempo as tempo
+from src_algo.analysis_cache import content_hash
+from src_algo.scheduler import STAGE_THREADS
+
+MAX_BODY_BYTES = 512 * 1024 * 1024  # largest accepted audio upload
+MAX_PENDING = 16  # requests waiting for a worker before 503 is returned
+HEADER_LIMIT = 64 * 1024
+DRAIN_LIMIT = 64 * 1024 * 1024  # unread bodies up to this size are discarded
+# before an early error response, so that the client can read the response
+
+STATUS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+          411: 'Length Required', 413: 'Payload Too Large', 422: 'Unprocessable Entity',
+          500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+
+class ApiError(Exception):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _jsonable(value):
+    # numpy arrays/scalars --> plain python for json.dumps
+    # non-finite floats (e.g. -inf LUFS of silence) --> null, strict json
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind != 'f':
+            return value.tolist()
+        values = value.astype(np.float64).astype(object)
+        values[~np.isfinite(value)] = None
+        return values.tolist()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _npz(result):
+    # arrays as binary numpy archive, scalars as 0-d arrays
+    buffer = io.BytesIO()
+    np.savez(buffer, **{k: np.asarray(v) for k, v in result.items()
+                        if isinstance(v, (np.ndarray, int, float, str))})
+    return buffer.getvalue()
+
+
+def _param(query, name, default):
+    return query.get(name, [default])[0]
+
+
+def feature_key(asset, audio_hash, query):
+    profile_type = _param(query, 'profile', 'diatonic')
+    if profile_type not in detect_keyscale.PROFILE_TYPES:
+        raise ApiError(422, f'unknown key profile {profile_type}')
+    key, scale, strength = analysis.key_scale(asset, audio_hash, profile_type)
+    return {'key': key, 'scale': scale, 'strength': strength, 'profile': profile_type}
+
+
+def feature_rhythm(asset, audio_hash, query):
+    method = _param(query, 'method', tempo.FULL_ENGINE)
+    if method not in ('degara', 'multifeature'):
+        raise ApiError(422, f'unknown rhythm method {method}')
+    return analysis.rhythm(asset, audio_hash, method)
+
+
+def feature_loudness(asset, audio_hash, query):
+    return analysis.loudness(asset, audio_hash)
+
+
+def feature_spectrogram(asset, audio_hash, query):
+    spectral = analysis.spectral(asset, audio_hash)
+    return {'rms': spectral['rms'][0], 'times': spectral['times'],
+            'mel_db': spectral['mel_db'], 'sr': spectral['sr'],
+            'hop_length': spectral['hop_length'], 'duration': spectral['duration']}
+
+
+FEATURES = {'/key': feature_key, '/rhythm': feature_rhythm,
+            '/loudness': feature_loudness, '/spectrogram': feature_spectrogram}
+BINARY_DEFAULT = {'/spectrogram'}  # too large for json by default
+
+
+def analyse(path, query, body):
+    # runs in the worker pool: decode the raw audio body, compute one feature
+    audio_hash = content_hash(body)  # same key as uploads in the UI
+    try:
+        asset = analysis.load_asset(audio_hash, io.BytesIO(body))
+    except Exception as e:
+        raise ApiError(422, f'cannot decode audio: {e}')
+    result = FEATURES[path](asset, audio_hash, query)
+
+    out_format = _param(query, 'format', 'npz' if path in BINARY_DEFAULT else 'json')
+    if out_format == 'npz':
+        return 'application/x-npz', _npz(result)
+    if out_format != 'json':
+        raise ApiError(422, f'unknown format {out_format}')
+    payload = dict(_jsonable(result), audio_hash=audio_hash)
+    return 'application/json', json.dumps(payload, allow_nan=False).encode()
+
+
+class AnalysisServer:
+    # asyncio http server, analyses run in a bounded worker pool
+    # backpressure: at most `workers` analyses run, at most `max_pending`
+    # further requests wait for a worker, everything above gets a 503
+
+    def __init__(self, workers=STAGE_THREADS, max_pending=MAX_PENDING,
+                 max_body=MAX_BODY_BYTES):
+        self.workers, self.max_pending, self.max_body = workers, max_pending, max_body
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='beatinspect_api')
+        self.slots = None  # asyncio.Semaphore, created inside the event loop
+        self.active = self.waiting = 0
+
+    async def handle(self, reader, writer):
+        request = {'unread': 0}  # body bytes the client still wants to send
+        try:
+            status, content_type, body = await self.respond(reader, writer, request)
+        except ApiError as e:
+            status, content_type = e.status, 'application/json'
+            body = json.dumps({'error': str(e)}).encode()
+            if 0 < request['unread'] <= DRAIN_LIMIT and not request.get('expect_continue'):
+                await self.discard(reader, request['unread'])
+        except Exception as e:  # never let one request kill the server
+            status, content_type = 500, 'application/json'
+            body = json.dumps({'error': f'{type(e).__name__}: {e}'}).encode()
+        headers = [f'HTTP/1.1 {status} {STATUS[status]}',
+                   f'Content-Type: {content_type}', f'Content-Length: {len(body)}',
+                   'Connection: close']
+        if status == 503:
+            headers.append('Retry-After: 1')
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode() + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def discard(self, reader, length):
+        # read & drop a request body that will not be analysed
+        try:
+            while length > 0:
+                chunk = await reader.read(min(length, HEADER_LIMIT))
+                if not chunk:
+                    break
+                length -= len(chunk)
+        except ConnectionError:
+            pass
+
+    async def respond(self, reader, writer, request):
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            raise ApiError(400, 'malformed request head')
+        request_line, *header_lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, _ = request_line.split(' ')
+        except ValueError:
+            raise ApiError(400, 'malformed request line')
+        headers = dict(line.split(':', 1) for line in header_lines if ':' in line)
+        headers = {k.strip().lower(): v.strip() for k, v in headers.items()}
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            raise ApiError(400, 'malformed content-length')
+        if length < 0:
+            raise ApiError(400, 'malformed content-length')
+        request['unread'] = length
+        # 'Expect: 100-continue' clients only send the body once it is accepted
+        request['expect_continue'] = headers.get('expect', '').lower() == '100-continue'
+
+        if url.path == '/health':
+            return 200, 'application/json', json.dumps(
+                {'workers': self.workers, 'active': self.active,
+                 'waiting': self.waiting, 'max_pending': self.max_pending}).encode()
+        if url.path not in FEATURES:
+            raise ApiError(404, f'unknown endpoint {url.path}')
+        if method != 'POST':
+            raise ApiError(405, 'send the raw audio file as POST body')
+        if 'content-length' not in headers:
+            raise ApiError(411, 'content-length required')
+        length = request['unread']
+        if length > self.max_body:
+            raise ApiError(413, f'audio body larger than {self.max_body} bytes')
+        if self.waiting >= self.max_pending:  # reject before reading the body
+            raise ApiError(503, 'analysis queue full, retry later')
+
+        try:
+            if request['expect_continue']:
+                writer.write(b'HTTP/1.1 100 Continue\r\n\r\n')
+            body = await reader.readexactly(length)
+            request['unread'] = 0
+        except asyncio.IncompleteReadError:
+            raise ApiError(400, 'audio body shorter than content-length')
+        # only requests that have to wait for a worker count as queued
+        if self.slots.locked() and self.waiting >= self.max_pending:
+            raise ApiError(503, 'analysis queue full, retry later')
+        self.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.active += 1
+        try:
+            loop = asyncio.get_running_loop()
+            content_type, payload = await loop.run_in_executor(
+                self.pool, analyse, url.path, query, body)
+        finally:
+            self.active -= 1
+            self.slots.release()
+        return 200, content_type, payload
+
+    async def serve(self, host, port):
+        self.slots = asyncio.Semaphore(self.workers)
+        server = await asyncio.start_server(self.handle, host, port, limit=HEADER_LIMIT)
+        print(f'beatinspect api listening on http://{host}:{port}', file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='beatinspect local HTTP analysis API')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=STAGE_THREADS,
+                        help='analyses running at the same time')
+    parser.add_argument('--max-pending', type=int, default=MAX_PENDING,
+                        help='requests waiting for a worker before 503')
+    args = parser.parse_args()
+    server = AnalysisServer(args.workers, args.max_pending)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
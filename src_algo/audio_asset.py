@@ -0,0 +1,165 @@
+# Audio Asset - decode an audio file once and share the buffer
+
+import threading
+
+import numpy as np
+import soundfile as sf
+import soxr
+import librosa
+
+from src_algo.wav_mmap import open_wav
+
+ESSENTIA_SR = 44100  # sample rate expected by essentia (MonoLoader default)
+# formats decoded natively by libsndfile --> no temporary wav conversion
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.mp3', '.aiff', '.aif', '.ogg')
+DECODE_BLOCK_FRAMES = 65536  # frames decoded per block
+MAPPED_BLOCK_FRAMES = 1 << 20  # frames converted per block of mapped wav files
+
+
+def decode(f, block_frames=DECODE_BLOCK_FRAMES):
+    # decode an open sf.SoundFile block by block straight into one float32
+    # buffer of shape (frames, channels), no intermediate float64/int copies
+    data = np.empty((max(f.frames, 0), f.channels), dtype=np.float32)
+    n = 0
+    while n < len(data):
+        out = data[n:n + block_frames]
+        read = len(f.read(len(out), dtype='float32', always_2d=True, out=out))
+        n += read
+        if read < len(out):
+            break  # stream ended before the reported frame count
+    # compressed formats (mp3, ogg) may report an inexact frame count
+    # --> decode whatever follows and append it once
+    tail = list(f.blocks(block_frames, dtype='float32', always_2d=True))
+    if tail:
+        return np.concatenate([data[:n]] + tail)
+    return data if n == len(data) else data[:n].copy()
+
+
+class AudioAsset:
+    # Holds the decoded float32 PCM buffer of one audio file and hands out
+    # views/derived variants (mono downmix, resampled, time slices) so that
+    # essentia, librosa and the loudness meter never have to decode it again
+    # uncompressed wav files are memory-mapped instead of decoded, only the
+    # ranges that are read get converted (self.mapped)
+
+    def __init__(self, source):
+        # Input: file path or file-like object (e.g. streamlit upload)
+        # wav, flac, mp3, aiff or ogg (vorbis/opus) encoded
+        self.source = source  # kept for chunked re-reads (src_algo.timeline)
+        mapped = open_wav(source)
+        if mapped is not None:  # specs from the wav header alone
+            self.sr, self.channels = mapped.sr, mapped.channels
+            self.format, self.subtype = 'WAV', mapped.subtype
+            self.data = mapped  # (frames, channels), converted on access
+            self.frames = len(mapped)
+        else:
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            with sf.SoundFile(source) as f:
+                self.sr = f.samplerate
+                self.channels = f.channels
+                self.format = f.format  # e.g. 'WAV', 'FLAC', 'MP3', 'AIFF', 'OGG'
+                self.subtype = f.subtype
+                # shape (frames, channels), decoded once as float32
+                self.data = decode(f)
+                self.frames = len(self.data)
+
+        self._mono = None  # lazily computed mono downmix
+        self._resampled = {}  # mono variants per target sample rate
+        self._lock = threading.Lock()  # stages may request variants concurrently
+        self.on_resize = None  # called when variants are added (analysis cache)
+
+    @property
+    def bit_depth(self):
+        try:  # e.g. 'PCM_24' --> 24
+            return int(str(self.subtype)[4:])
+        except ValueError:
+            return ''
+
+    @property
+    def mapped(self):
+        return not isinstance(self.data, np.ndarray)
+
+    @property
+    def duration(self):
+        return self.frames / self.sr
+
+    @property
+    def nbytes(self):
+        # memory held by the asset (see MappedWav.nbytes for mapped data)
+        resampled = sum(y.nbytes for y in self._resampled.values())
+        mono = self._mono.nbytes if self._mono is not None else 0
+        data = self.data.nbytes
+        return data + mono + resampled
+
+    def iter_mono(self, block_frames=MAPPED_BLOCK_FRAMES):
+        # mono downmix block by block, the full signal is never converted
+        for start in range(0, self.frames, block_frames):
+            block = self.data[start:start + block_frames]
+            yield block.mean(axis=1, dtype=np.float32)
+
+    def _resized(self):
+        if self.on_resize is not None:
+            self.on_resize()
+
+    def mono(self):
+        # mono downmix at the native sample rate (same as librosa.load)
+        with self._lock:
+            added = self._mono is None
+            if added:
+                if self.mapped:  # downmixed while converting block by block
+                    self._mono = np.empty(self.frames, dtype=np.float32)
+                    for i, y in enumerate(self.iter_mono()):
+                        self._mono[i * MAPPED_BLOCK_FRAMES:][:len(y)] = y
+                elif self.channels == 1:  # zero-copy view of the single channel
+                    self._mono = self.data[:, 0]
+                else:  # average all channels, computed once
+                    self._mono = self.data.mean(axis=1, dtype=np.float32)
+        if added:
+            self._resized()
+        return self._mono
+
+    def resampled(self, sr, keep=True):
+        # mono signal at the requested sample rate, computed once per rate
+        # keep=False: one-off variant (e.g. fingerprint), not held by the asset
+        if sr == self.sr:
+            return self.mono()
+        y = None if self.mapped else self.mono()
+        with self._lock:
+            if sr in self._resampled:
+                return self._resampled[sr]
+            if self.mapped:  # streamed, the native mono signal is not needed
+                stream = soxr.ResampleStream(self.sr, sr, 1, dtype='float32')
+                blocks = [stream.resample_chunk(block) for block in self.iter_mono()]
+                blocks.append(stream.resample_chunk(np.zeros(0, np.float32), last=True))
+                y = np.concatenate(blocks)
+            else:
+                y = librosa.resample(y, orig_sr=self.sr, target_sr=sr)
+            y = np.ascontiguousarray(y, dtype=np.float32)
+            if keep:
+                self._resampled[sr] = y
+        if keep:
+            self._resized()
+        return y
+
+    def essentia_mono(self):
+        # equivalent of essentia MonoLoader output (mono, 44100 Hz)
+        return self.resampled(ESSENTIA_SR)
+
+    def read(self, start_sec, end_sec):
+        # (frames, channels) float32 signal between two timestamps
+        # mapped wav files only convert this range (e.g. the time slider)
+        start = min(max(int(start_sec * self.sr), 0), self.frames)
+        end = min(max(int(end_sec * self.sr), start), self.frames)
+        return self.data[start:end]
+
+    def slice(self, start_sec, end_sec, sr=None):
+        # mono signal between two timestamps, a zero-copy view of an already
+        # computed mono variant or a range read of the mapped wav file
+        sr = self.sr if sr is None else sr
+        if self.mapped and sr == self.sr and self._mono is None:
+            return self.read(start_sec, end_sec).mean(axis=1, dtype=np.float32)
+        y = self.resampled(sr)
+        start = max(int(start_sec * sr), 0)
+        end = min(int(end_sec * sr), len(y))
+        return y[start:end]
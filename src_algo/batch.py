@@ -0,0 +1,134 @@
+# Headless Batch Analysis - key, BPM, specs & loudness for folders of beats
+# usage: python -m src_algo.batch <folder> [--out results.csv] [--workers N]
+
+import os
+import csv
+import sys
+import math
+import json
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import src_algo.analysis as analysis
+import src_algo.ingest as ingest
+from src_algo.audio_asset import AudioAsset, AUDIO_EXTENSIONS
+from src_algo.similarity import similarity_index
+
+INDEX_SAVE_EVERY = 50  # files added to the similarity index between saves
+FIELDS = ['file', 'audio_hash', 'sample_rate', 'bit_depth', 'channels',
+          'duration', 'key', 'scale', 'key_strength', 'bpm', 'loudness',
+          'loudness_lufs', 'loudness_range', 'true_peak', 'duplicate_of', 'error']
+
+
+def find_audio_files(folder):
+    # walk the folder recursively, sorted for a reproducible order
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(AUDIO_EXTENSIONS):
+                yield os.path.join(root, name)
+
+
+def _init_worker():
+    # keep stdout clean for the results (essentia & detect_ks print there)
+    sys.stdout = sys.stderr
+
+
+def _rounded(value):
+    # silent files measure -inf --> empty csv cell / json null
+    return round(value, 2) if math.isfinite(value) else None
+
+
+def loudness_columns(loudness):
+    # loudness of the peak normalized audio (as shown in the app) + EBU R128
+    return {'loudness': _rounded(loudness['integrated_normalized']),
+            'loudness_lufs': _rounded(loudness['integrated']),
+            'loudness_range': _rounded(loudness['lra']),
+            'true_peak': _rounded(loudness['true_peak_db'])}
+
+
+def analyse_file(path):
+    # runs inside a worker process, results also land in the feature store
+    row = {'file': path}
+    try:
+        audio_hash = ingest.file_hash(path)
+        asset = AudioAsset(path)  # not kept in the memory cache of the worker
+        # re-exports of an already analysed file reuse its results
+        original = analysis.find_original(asset, audio_hash, os.path.basename(path))
+        key, scale, key_strength = analysis.key_scale(asset, audio_hash, 'diatonic', original)
+        row.update(audio_hash=audio_hash, sample_rate=asset.sr,
+                   bit_depth=asset.bit_depth, channels=asset.channels,
+                   duration=round(asset.duration, 3), key=key, scale=scale,
+                   key_strength=round(float(key_strength), 4),
+                   bpm=round(analysis.bpm(asset, audio_hash, original=original), 2),
+                   **loudness_columns(analysis.loudness(asset, audio_hash)),
+                   duplicate_of=original['duplicate_of'])
+        # indexed by the parent process, not written to the results
+        row['embedding'] = analysis.embedding(asset, audio_hash, original=original)
+    except Exception as e:  # one broken file must not stop the catalogue
+        row['error'] = f'{type(e).__name__}: {e}'
+    return row
+
+
+class ResultWriter:
+    # streams one row per finished file to csv or jsonl
+
+    def __init__(self, out_file, out_format):
+        self.out_file, self.out_format = out_file, out_format
+        if out_format == 'csv':
+            self.writer = csv.DictWriter(out_file, fieldnames=FIELDS)
+            self.writer.writeheader()
+
+    def write(self, row):
+        if self.out_format == 'csv':
+            self.writer.writerow(row)
+        else:
+            self.out_file.write(json.dumps(row) + '\n')
+        self.out_file.flush()  # results are usable while the batch runs
+
+
+def run_batch(folder, out_file, out_format='csv', workers=None):
+    paths = list(find_audio_files(folder))
+    writer = ResultWriter(out_file, out_format)
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = [pool.submit(analyse_file, path) for path in paths]
+        for done, future in enumerate(as_completed(futures), start=1):
+            row = future.result()
+            vector = row.pop('embedding', None)
+            if vector is not None:  # single writer of the similarity index
+                similarity_index.add(row['audio_hash'], vector,
+                                     {'name': os.path.basename(row['file']), 'key': row['key'],
+                                      'scale': row['scale'], 'bpm': round(row['bpm'], 1)},
+                                     save=done % INDEX_SAVE_EVERY == 0)
+            writer.write(row)
+            print(f'[{done}/{len(paths)}] {row["file"]}', file=sys.stderr)
+    if paths:
+        similarity_index.save()
+    return len(paths)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='beat inspect batch analysis')
+    parser.add_argument('folder', help='folder that is searched for audio files')
+    parser.add_argument('--out', default='-', help='output file (default: stdout)')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default=None,
+                        help='output format (default: from --out extension, else csv)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: number of cores)')
+    args = parser.parse_args(argv)
+
+    out_format = args.format
+    if out_format is None:
+        out_format = 'jsonl' if args.out.endswith('.jsonl') else 'csv'
+    if args.out == '-':
+        run_batch(args.folder, sys.stdout, out_format, args.workers)
+    else:
+        with open(args.out, 'w', newline='') as out_file:
+            run_batch(args.folder, out_file, out_format, args.workers)
+
+
+if __name__ == '__main__':
+    main()
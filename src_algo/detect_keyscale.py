@@ -1,60 +1,131 @@
 # Function for the Analysis of musical Key and Scale
 
-import essentia.streaming as ess
-import essentia
+import numpy as np
+import essentia.standard as es
 
-def detect_ks(audio_file, profile_type):
-    # Input: Audio File Path
+# key profiles that can be scored against the same chroma (HPCP) features
+# https://essentia.upf.edu/reference/std_Key.html
+PROFILE_TYPES = ['diatonic', 'edma', 'krumhansl', 'temperley', 'bgate', 'shaath']
+HPCP_SIZE = 36  # We will need higher resolution for Key estimation.
+FRAME_SIZE, HOP_SIZE = 4096, 2048
+
+
+def _load(audio):
+    # Input: Audio File Path or decoded mono signal (float32, 44100 Hz)
+    if isinstance(audio, str):
+        return es.MonoLoader(filename=audio)()
+    return audio
+
+
+def _hpcp_algorithms():
+    # returns a function computing the HPCP of one audio frame
 
     # Initialize algorithms we will use.
-    loader = ess.MonoLoader(filename=audio_file)
-    framecutter = ess.FrameCutter(frameSize=4096, hopSize=2048, silentFrames='noise')
-    windowing = ess.Windowing(type='blackmanharris62')
-    spectrum = ess.Spectrum()
-    spectralpeaks = ess.SpectralPeaks(orderBy='magnitude',
-                                      magnitudeThreshold=0.00001,
-                                      minFrequency=20,
-                                      maxFrequency=5000,
-                                      maxPeaks=60)
-
-    # Use default HPCP parameters for plots.
-    # However we will need higher resolution and custom parameters for better Key estimation.
-    hpcp = ess.HPCP()
-    hpcp_key = ess.HPCP(size=36, # We will need higher resolution for Key estimation.
-                        referenceFrequency=440, # Assume tuning frequency is 44100.
-                        bandPreset=False,
-                        minFrequency=20,
-                        maxFrequency=5000,
-                        weightType='cosine',
-                        nonLinear=False,
-                        windowSize=1.)
-
-    key = ess.Key(profileType=profile_type,
-                  numHarmonics=4,
-                  pcpSize=36,
-                  slope=0.6,
-                  usePolyphony=True,
-                  useThreeChords=False)
-
-    # Use pool to store data.
-    pool = essentia.Pool()
-
-    # Connect streaming algorithms.
-    loader.audio >> framecutter.signal
-    framecutter.frame >> windowing.frame >> spectrum.frame
-    spectrum.spectrum >> spectralpeaks.spectrum
-    spectralpeaks.magnitudes >> hpcp.magnitudes
-    spectralpeaks.frequencies >> hpcp.frequencies
-    spectralpeaks.magnitudes >> hpcp_key.magnitudes
-    spectralpeaks.frequencies >> hpcp_key.frequencies
-    hpcp_key.hpcp >> key.pcp
-    hpcp.hpcp >> (pool, 'tonal.hpcp')
-    key.key >> (pool, 'tonal.key_key')
-    key.scale >> (pool, 'tonal.key_scale')
-    key.strength >> (pool, 'tonal.key_strength')
-
-    # Run streaming network.
-    essentia.run(loader)
-
-    print("Estimated key and scale:", pool['tonal.key_key'] + " " + pool['tonal.key_scale'])
-    return pool['tonal.key_key'], pool['tonal.key_scale'], pool['tonal.key_strength']
+    windowing = es.Windowing(type='blackmanharris62')
+    spectrum = es.Spectrum()
+    spectralpeaks = es.SpectralPeaks(orderBy='magnitude',
+                                     magnitudeThreshold=0.00001,
+                                     minFrequency=20,
+                                     maxFrequency=5000,
+                                     maxPeaks=60)
+
+    # We need higher resolution and custom parameters for better Key estimation.
+    hpcp_key = es.HPCP(size=HPCP_SIZE,
+                       referenceFrequency=440, # Assume tuning frequency is 44100.
+                       bandPreset=False,
+                       minFrequency=20,
+                       maxFrequency=5000,
+                       weightType='cosine',
+                       nonLinear=False,
+                       windowSize=1.)
+
+    def frame_hpcp(frame):
+        frequencies, magnitudes = spectralpeaks(spectrum(windowing(frame)))
+        return hpcp_key(frequencies, magnitudes)
+    return frame_hpcp
+
+
+def iter_hpcp(audio):
+    # lazily yields the 36-bin HPCP (chroma) of one frame after another
+    frame_hpcp = _hpcp_algorithms()
+    for frame in es.FrameGenerator(_load(audio), frameSize=FRAME_SIZE, hopSize=HOP_SIZE):
+        yield frame_hpcp(frame)
+
+
+def compute_hpcp(audio):
+    # 36-bin HPCP (chroma) frames of the whole signal, shape (frames, 36)
+    hpcp_frames = list(iter_hpcp(audio))
+    return np.array(hpcp_frames, dtype=np.float32).reshape(-1, HPCP_SIZE)
+
+
+def mean_hpcp(audio):
+    # chroma aggregated over all frames of the signal
+    return compute_hpcp(audio).mean(axis=0)
+
+
+def key_from_chroma(chroma, profile_type):
+    # key, scale, strength and margin over the runner-up for aggregated chroma
+    key = es.Key(profileType=profile_type,
+                 numHarmonics=4,
+                 pcpSize=HPCP_SIZE,
+                 slope=0.6,
+                 usePolyphony=True,
+                 useThreeChords=False)
+    return key(np.asarray(chroma, dtype=np.float32))
+
+
+def rank_profiles(chroma, profile_types=PROFILE_TYPES):
+    # score all key profiles against the same aggregated chroma vector
+    # returns list of (key, scale, strength, profile) sorted by strength
+    candidates = []
+    for profile_type in profile_types:
+        key, scale, strength, _ = key_from_chroma(chroma, profile_type)
+        candidates.append((key, scale, float(strength), profile_type))
+    return sorted(candidates, key=lambda c: c[2], reverse=True)
+
+
+def detect_ks_profiles(audio, profile_types=PROFILE_TYPES):
+    # one HPCP pass, several key profile opinions
+    return rank_profiles(mean_hpcp(audio), profile_types)
+
+
+def detect_ks_incremental(audio, profile_type='diatonic', chunk_sec=5.0,
+                          stable_sec=30.0, min_margin=0.02, sr=44100):
+    # accumulate chroma chunk by chunk and stop as soon as the top key has
+    # stayed the same (with a margin over the runner-up) for stable_sec
+    # returns key, scale, strength, consumed seconds, confidence (margin) and
+    # the chroma aggregated over the consumed part (e.g. for other profiles)
+    frames_per_chunk = max(int(chunk_sec * sr / HOP_SIZE), 1)
+    chroma_sum = np.zeros(HPCP_SIZE, dtype=np.float64)
+    previous, stable_frames, n_frames = None, 0, 0
+    result = ('', '', 0.0, 0.0)
+
+    for hpcp in iter_hpcp(audio):
+        chroma_sum += hpcp
+        n_frames += 1
+        if n_frames % frames_per_chunk:
+            continue  # only re-evaluate the key once per chunk
+
+        result = key_from_chroma(chroma_sum, profile_type)
+        key, scale, strength, margin = result
+        if (key, scale) == previous and margin >= min_margin:
+            stable_frames += frames_per_chunk
+        else:  # key changed or too close to the runner-up --> start over
+            stable_frames = 0
+        previous = (key, scale)
+        if stable_frames * HOP_SIZE / sr >= stable_sec:
+            break
+
+    if n_frames % frames_per_chunk and n_frames:  # signal ended mid-chunk
+        result = key_from_chroma(chroma_sum, profile_type)
+    key, scale, strength, margin = result
+    return (key, scale, float(strength), n_frames * HOP_SIZE / sr, float(margin),
+            chroma_sum / max(n_frames, 1))
+
+
+def detect_ks(audio, profile_type):
+    # Input: Audio File Path or decoded mono signal (float32, 44100 Hz)
+    key, scale, strength, _ = key_from_chroma(mean_hpcp(audio), profile_type)
+
+    print("Estimated key and scale:", key + " " + scale)
+    return key, scale, strength
@@ -0,0 +1,39 @@
+# Export Utilities - downloadable beat grid & onset lists (csv text)
+# and the audio of a selected timeframe (wav bytes)
+
+import io
+import csv
+
+import soundfile as sf
+
+BEATS_PER_BAR = 4  # assume 4/4 time signature for the bar numbering
+
+
+def beat_grid_csv(rhythm_data):
+    # one row per beat: position, bar/beat numbering and interval to the next
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['beat', 'time_sec', 'bar', 'beat_in_bar', 'interval_sec'])
+    beats, intervals = rhythm_data['beats'], rhythm_data['intervals']
+    for i, time_sec in enumerate(beats):
+        interval = f'{intervals[i]:.4f}' if i < len(intervals) else ''
+        writer.writerow([i + 1, f'{time_sec:.4f}', i // BEATS_PER_BAR + 1,
+                         i % BEATS_PER_BAR + 1, interval])
+    return buffer.getvalue()
+
+
+def onsets_csv(onset_data):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['onset', 'time_sec'])
+    for i, time_sec in enumerate(onset_data['onsets']):
+        writer.writerow([i + 1, f'{time_sec:.4f}'])
+    return buffer.getvalue()
+
+
+def timeframe_wav(asset, start_sec, end_sec):
+    # 16 bit wav of a time range, only this range is read from the asset
+    # (range read of memory-mapped wav files, no full signal conversion)
+    buffer = io.BytesIO()
+    sf.write(buffer, asset.read(start_sec, end_sec), asset.sr, format='WAV', subtype='PCM_16')
+    return buffer.getvalue()
@@ -0,0 +1,167 @@
+# Persistent Feature Store - SQLite metadata + compressed .npz feature arrays
+# survives streamlit server restarts and is shared between worker processes
+
+import os
+import io
+import json
+import time
+import sqlite3
+import hashlib
+import contextlib
+
+import numpy as np
+
+STORE_DIR = os.environ.get('BEATINSPECT_STORE', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'feature_store'))
+MAX_STORE_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB upper bound on disk
+
+_SCHEMA = '''CREATE TABLE IF NOT EXISTS features (
+                 audio_hash TEXT, stage TEXT, params TEXT, version INTEGER,
+                 meta TEXT, array_file TEXT, nbytes INTEGER, last_access REAL,
+                 PRIMARY KEY (audio_hash, stage, params))'''
+
+
+@contextlib.contextmanager
+def _connect(store_dir):
+    # short-lived connection per call --> safe across threads and processes
+    os.makedirs(store_dir, exist_ok=True)
+    con = sqlite3.connect(os.path.join(store_dir, 'features.sqlite'), timeout=30)
+    try:
+        con.execute('PRAGMA journal_mode=WAL')  # concurrent readers + one writer
+        con.execute(_SCHEMA)
+        with con:  # commit on success, rollback on error
+            yield con
+    finally:
+        con.close()
+
+
+def _params_key(params):
+    return json.dumps(sorted(params.items()), default=str)
+
+
+def _encode(value, float16_keys):
+    # split a result into json metadata and a dict of numpy arrays
+    if isinstance(value, dict):
+        arrays = {k: v for k, v in value.items() if isinstance(v, np.ndarray)}
+        for k in arrays:  # compact storage for plot-only feature matrices
+            # float16_keys may hold full keys or key prefixes (e.g. 'min_')
+            if k.startswith(tuple(float16_keys)) and arrays[k].dtype.kind == 'f':
+                arrays[k] = arrays[k].astype(np.float16)
+        meta = {k: v for k, v in value.items() if k not in arrays}
+        return {'type': 'dict', 'value': meta, 'arrays': sorted(arrays)}, arrays
+    if isinstance(value, tuple):
+        return {'type': 'tuple', 'value': list(value)}, {}
+    # scalars, strings and (nested) lists are stored as plain json
+    return {'type': 'scalar', 'value': value}, {}
+
+
+def _decode(meta, arrays):
+    if meta['type'] == 'tuple':
+        return tuple(meta['value'])
+    if meta['type'] == 'dict':
+        value = dict(meta['value'])
+        for k in meta['arrays']:  # features are used as float32 again
+            array = arrays[k]
+            value[k] = array.astype(np.float32) if array.dtype == np.float16 else array
+        return value
+    return meta['value']
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):  # numpy scalars (e.g. essentia floats)
+        return obj.item()
+    raise TypeError(f'{type(obj)} is not JSON serializable')
+
+
+class FeatureStore:
+    # on-disk feature store keyed by (content hash, stage, parameters)
+    # entries with an outdated analysis version are treated as stale
+
+    def __init__(self, store_dir=STORE_DIR, max_bytes=MAX_STORE_BYTES):
+        self.store_dir = store_dir
+        self.max_bytes = max_bytes
+
+    def get(self, audio_hash, stage, params, version):
+        params_key = _params_key(params)
+        with _connect(self.store_dir) as con:
+            row = con.execute('SELECT version, meta, array_file FROM features '
+                              'WHERE audio_hash=? AND stage=? AND params=?',
+                              (audio_hash, stage, params_key)).fetchone()
+            if row is None:
+                return None
+            if row[0] != version:  # analysis changed --> invalidate entry
+                self._delete(con, audio_hash, stage, params_key, row[2])
+                return None
+            con.execute('UPDATE features SET last_access=? WHERE audio_hash=? '
+                        'AND stage=? AND params=?',
+                        (time.time(), audio_hash, stage, params_key))
+        meta, arrays = json.loads(row[1]), {}
+        if row[2]:
+            try:
+                with np.load(os.path.join(self.store_dir, row[2])) as npz:
+                    arrays = {k: npz[k] for k in npz.files}
+            except (OSError, ValueError):  # array file vanished or corrupted
+                return None
+        return _decode(meta, arrays)
+
+    def put(self, audio_hash, stage, params, version, value, float16_keys=()):
+        params_key = _params_key(params)
+        meta, arrays = _encode(value, float16_keys)
+        meta = json.dumps(meta, default=_json_default)
+        array_file, nbytes = None, len(meta)
+        if arrays:
+            digest = hashlib.sha1(params_key.encode()).hexdigest()[:12]
+            array_file = f'{audio_hash}_{stage}_{digest}.npz'
+            buffer = io.BytesIO()
+            np.savez_compressed(buffer, **arrays)
+            # write to a temp file first, rename is atomic between processes
+            tmp_path = os.path.join(self.store_dir, array_file + f'.{os.getpid()}.tmp')
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+            os.replace(tmp_path, os.path.join(self.store_dir, array_file))
+            nbytes += buffer.getbuffer().nbytes
+        with _connect(self.store_dir) as con:
+            con.execute('INSERT OR REPLACE INTO features VALUES (?,?,?,?,?,?,?,?)',
+                        (audio_hash, stage, params_key, version, meta,
+                         array_file, nbytes, time.time()))
+            self._evict(con)
+        return value
+
+    def delete(self, audio_hash):
+        # drop every stored stage of one audio content
+        with _connect(self.store_dir) as con:
+            rows = con.execute('SELECT stage, params, array_file FROM features '
+                               'WHERE audio_hash=?', (audio_hash,)).fetchall()
+            for stage, params_key, array_file in rows:
+                self._delete(con, audio_hash, stage, params_key, array_file)
+
+    def total_bytes(self):
+        with _connect(self.store_dir) as con:
+            return con.execute('SELECT COALESCE(SUM(nbytes), 0) FROM features').fetchone()[0]
+
+    def _evict(self, con):
+        # drop least recently used entries until the store fits max_bytes
+        total = con.execute('SELECT COALESCE(SUM(nbytes), 0) FROM features').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = con.execute('SELECT audio_hash, stage, params, array_file, nbytes '
+                           'FROM features ORDER BY last_access ASC').fetchall()
+        for audio_hash, stage, params_key, array_file, nbytes in rows:
+            if total <= self.max_bytes:
+                break
+            self._delete(con, audio_hash, stage, params_key, array_file)
+            total -= nbytes
+
+    def _delete(self, con, audio_hash, stage, params_key, array_file):
+        con.execute('DELETE FROM features WHERE audio_hash=? AND stage=? AND params=?',
+                    (audio_hash, stage, params_key))
+        if array_file:
+            try:
+                os.remove(os.path.join(self.store_dir, array_file))
+            except FileNotFoundError:
+                pass
+
+
+# module level instance --> shared by the app, batch jobs and other processes
+feature_store = FeatureStore()
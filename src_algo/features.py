@@ -0,0 +1,172 @@
+# Spectral Feature Graph - one magnitude STFT per signal, every other
+# spectral feature (rms, dB scaling, mel projection) is derived from it
+
+from functools import cached_property
+
+import numpy as np
+import librosa
+
+N_FFT = 2048  # librosa.stft defaults
+HOP_LENGTH = 512
+MEL_BANDS = 300  # resolution of the 3D mel spectrogram
+MEL_FMAX = 32768  # Hz
+PYRAMID_MIN_MELS = 75  # frequency resolution is never pooled below this
+POINT_BUDGET = 150000  # max surface points shipped to the browser per plot
+ENVELOPE_BLOCK = 64  # samples per min/max bin on the finest envelope level
+ENVELOPE_FACTOR = 4  # decimation between two envelope levels
+STREAM_FRAMES = 2048  # STFT frames per block of the streamed spectral features
+
+
+def frame_range(start_sec, end_sec, sr, hop_length=HOP_LENGTH):
+    # STFT frame indices [start, end) covering a time range in seconds
+    start = int(librosa.time_to_frames(start_sec, sr=sr, hop_length=hop_length))
+    end = int(librosa.time_to_frames(end_sec, sr=sr, hop_length=hop_length))
+    return max(start, 0), max(end, start + 1)
+
+
+def _max_pool(data, freq_factor, time_factor):
+    # max pooling keeps the peaks, edge padding for non divisible shapes
+    pad_f = -data.shape[0] % freq_factor
+    pad_t = -data.shape[1] % time_factor
+    if pad_f or pad_t:
+        data = np.pad(data, ((0, pad_f), (0, pad_t)), mode='edge')
+    n_freq, n_time = data.shape[0] // freq_factor, data.shape[1] // time_factor
+    return data.reshape(n_freq, freq_factor, n_time, time_factor).max(axis=(1, 3))
+
+
+def mel_pyramid(mel_data, min_frames=64):
+    # level of detail pyramid of a mel spectrogram
+    # every level halves the time resolution, every second level also halves
+    # the frequency resolution (as long as PYRAMID_MIN_MELS bands remain)
+    # returns list of (time_factor, pooled mel data) starting at full detail
+    levels = [(1, mel_data)]
+    while levels[-1][1].shape[1] > min_frames:
+        time_factor, data = levels[-1]
+        pool_freq = len(levels) % 2 == 0 and data.shape[0] // 2 >= PYRAMID_MIN_MELS
+        freq_factor = 2 if pool_freq else 1
+        levels.append((time_factor * 2, _max_pool(data, freq_factor, 2)))
+    return levels
+
+
+def pyramid_slice(levels, frame_start, frame_end, point_budget=POINT_BUDGET):
+    # most detailed pyramid level whose selected range fits the point budget
+    # Input: frame range of the full resolution mel spectrogram
+    for time_factor, data in levels:
+        start = frame_start // time_factor
+        end = max(-(-frame_end // time_factor), start + 1)  # ceil division
+        if data.shape[0] * (end - start) <= point_budget:
+            break
+    return data[:, start:end]
+
+
+def _block_minmax(mins, maxs, factor):
+    # min/max over consecutive blocks of `factor` values, last block partial
+    n_full = len(mins) // factor
+    out_min = mins[:n_full * factor].reshape(n_full, factor).min(axis=1)
+    out_max = maxs[:n_full * factor].reshape(n_full, factor).max(axis=1)
+    if len(mins) % factor:
+        out_min = np.append(out_min, mins[n_full * factor:].min())
+        out_max = np.append(out_max, maxs[n_full * factor:].max())
+    return out_min, out_max
+
+
+def wave_envelope(y, min_bins=256):
+    # min/max peak envelope of a waveform at several decimation levels
+    # returns dict with 'blocks' (samples per bin) and 'min_i'/'max_i' arrays
+    mins, maxs = _block_minmax(y, y, ENVELOPE_BLOCK)
+    return _envelope_levels(mins, maxs, min_bins)
+
+
+def wave_envelope_blocks(blocks, min_bins=256):
+    # same envelope from consecutive signal blocks, every block except the
+    # last one has to be a multiple of ENVELOPE_BLOCK samples long
+    bins = [_block_minmax(y, y, ENVELOPE_BLOCK) for y in blocks]
+    return _envelope_levels(np.concatenate([mins for mins, _ in bins]),
+                            np.concatenate([maxs for _, maxs in bins]), min_bins)
+
+
+def _envelope_levels(mins, maxs, min_bins):
+    envelope, block, level = {'blocks': []}, ENVELOPE_BLOCK, 0
+    while True:
+        envelope['blocks'].append(block)
+        envelope[f'min_{level}'], envelope[f'max_{level}'] = mins, maxs
+        if len(mins) // ENVELOPE_FACTOR < min_bins:
+            return envelope
+        mins, maxs = _block_minmax(mins, maxs, ENVELOPE_FACTOR)
+        block, level = block * ENVELOPE_FACTOR, level + 1
+
+
+def envelope_level(envelope, pixel_width):
+    # coarsest envelope level that still has one bin per output pixel
+    # returns (samples per bin, mins, maxs)
+    level = 0
+    for i in range(len(envelope['blocks'])):
+        if len(envelope[f'min_{i}']) >= pixel_width:
+            level = i
+    return (envelope['blocks'][level],
+            envelope[f'min_{level}'], envelope[f'max_{level}'])
+
+
+def stream_spectral(read, n_samples, sr, n_fft=N_FFT, hop_length=HOP_LENGTH,
+                    n_mels=MEL_BANDS, fmax=MEL_FMAX, block_frames=STREAM_FRAMES):
+    # rms & mel spectrogram [dB] of a signal that is read range by range via
+    # read(start, end) --> same frames & values as FeatureGraph (centered,
+    # zero padded STFT), but only one block of the STFT exists at a time
+    n_frames = 1 + n_samples // hop_length
+    pad = n_fft // 2
+    mel_basis = librosa.filters.mel(sr=sr, n_fft=n_fft, n_mels=n_mels, fmax=fmax)
+    rms = np.empty((1, n_frames), dtype=np.float32)
+    mel = np.empty((n_mels, n_frames), dtype=np.float32)
+    for start in range(0, n_frames, block_frames):
+        end = min(start + block_frames, n_frames)
+        lo, hi = start * hop_length - pad, (end - 1) * hop_length + n_fft - pad
+        y = read(max(lo, 0), min(hi, n_samples))
+        y = np.pad(y, (max(-lo, 0), max(hi - n_samples, 0)))  # signal borders
+        magnitude = np.abs(librosa.stft(y, n_fft=n_fft, hop_length=hop_length, center=False))
+        rms[:, start:end] = librosa.feature.rms(S=magnitude, frame_length=n_fft,
+                                                hop_length=hop_length)
+        mel[:, start:end] = mel_basis @ np.square(magnitude)
+    return {'rms': rms, 'times': librosa.times_like(rms, sr=sr, hop_length=hop_length),
+            'mel_db': librosa.power_to_db(mel, ref=np.max), 'duration': n_samples / sr}
+
+
+class FeatureGraph:
+    # features are computed lazily on first access and then kept
+    # --> outputs that are never requested are never computed
+
+    def __init__(self, y, sr, n_fft=N_FFT, hop_length=HOP_LENGTH):
+        self.y, self.sr = y, sr
+        self.n_fft, self.hop_length = n_fft, hop_length
+        self._mel = {}  # mel projections per (n_mels, fmax)
+
+    @cached_property
+    def magnitude(self):
+        # the single STFT of the signal (magnitude only, phase is not needed)
+        return np.abs(librosa.stft(self.y, n_fft=self.n_fft, hop_length=self.hop_length))
+
+    @cached_property
+    def rms(self):
+        return librosa.feature.rms(S=self.magnitude, frame_length=self.n_fft,
+                                   hop_length=self.hop_length)
+
+    @cached_property
+    def times(self):
+        # timestamps of the STFT frames (e.g. for the rms energy)
+        return librosa.times_like(self.rms, sr=self.sr, hop_length=self.hop_length)
+
+    @cached_property
+    def duration(self):
+        return len(self.y) / self.sr
+
+    @cached_property
+    def amplitude_db(self):
+        # linear/log frequency spectrogram in dB, np.max as reference point
+        return librosa.amplitude_to_db(self.magnitude, ref=np.max)
+
+    def mel_db(self, n_mels=MEL_BANDS, fmax=MEL_FMAX):
+        # mel projection of the power spectrogram in dB, np.max as reference
+        if (n_mels, fmax) not in self._mel:
+            S = librosa.feature.melspectrogram(S=np.square(self.magnitude), sr=self.sr,
+                                               n_fft=self.n_fft, n_mels=n_mels, fmax=fmax)
+            self._mel[(n_mels, fmax)] = librosa.power_to_db(S, ref=np.max)
+        return self._mel[(n_mels, fmax)]
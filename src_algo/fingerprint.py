@@ -0,0 +1,203 @@
+# Audio Fingerprints - landmark pairs of spectral peaks (Shazam style)
+# computed on a canonical mono 11025 Hz signal --> re-exports of a beat
+# (other name, bit depth, sample rate or lossy format) get the same landmarks
+# and can be mapped to the already analysed original
+
+import os
+import sqlite3
+import contextlib
+
+import numpy as np
+import soxr
+import librosa
+from scipy.ndimage import maximum_filter
+
+from src_algo.feature_store import STORE_DIR, feature_store
+
+FP_SR = 11025  # canonical sample rate of the fingerprint
+FP_N_FFT = 1024
+FP_HOP = 256  # ~23 ms per frame
+PEAK_NEIGHBOURHOOD = (21, 15)  # (freq bins, frames) a peak has to dominate
+PEAK_FLOOR_DB = 40  # peaks quieter than the loudest one by this are ignored
+PEAKS_PER_SEC = 20  # strongest peaks kept per second of audio
+FAN_OUT = 10  # landmark pairs per anchor peak
+MAX_DT = 63  # max frames between the peaks of one pair (6 bits)
+QUERY_LANDMARKS = 4000  # landmarks of a track used for a lookup
+MIN_ALIGNED = 20  # matching landmarks at a consistent time offset
+MIN_RATIO = 0.1  # ... relative to the landmarks of the query
+DURATION_TOLERANCE = 0.02  # near-duplicates have (almost) the same length
+INDEX_PATH = os.path.join(STORE_DIR, 'fingerprints.sqlite')
+MAX_INDEX_BYTES = 1024 * 1024 * 1024  # 1 GB upper bound on disk (~ 2 days of audio)
+LANDMARK_BYTES = 32  # on disk per landmark row, hash index included
+EVICT_TO = 0.9  # evict down to this share of the bound --> one table scan per batch
+
+_SCHEMA = ['''CREATE TABLE IF NOT EXISTS tracks (
+                  track_id INTEGER PRIMARY KEY, audio_hash TEXT UNIQUE,
+                  name TEXT, duration REAL, landmarks INTEGER)''',
+           '''CREATE TABLE IF NOT EXISTS landmarks (
+                  hash INTEGER, track_id INTEGER, frame INTEGER)''',
+           'CREATE INDEX IF NOT EXISTS landmarks_hash ON landmarks (hash)']
+
+
+def peaks(y, sr):
+    # spectral peaks (frame, freq bin) of the canonical STFT, time sorted
+    y = soxr.resample(np.asarray(y, dtype=np.float32), sr, FP_SR) if sr != FP_SR else y
+    S = librosa.amplitude_to_db(np.abs(librosa.stft(y, n_fft=FP_N_FFT, hop_length=FP_HOP)),
+                                ref=np.max, top_db=None)
+    is_peak = (S == maximum_filter(S, size=PEAK_NEIGHBOURHOOD)) & (S > -PEAK_FLOOR_DB)
+    freqs, frames = np.nonzero(is_peak)
+    magnitudes = S[freqs, frames]
+
+    # strongest peaks per second --> evenly spread landmarks, bounded count
+    frames_per_sec = int(round(FP_SR / FP_HOP))
+    block = frames // frames_per_sec
+    order = np.lexsort((-magnitudes, block))
+    block = block[order]
+    rank = np.arange(len(order)) - np.searchsorted(block, block)
+    keep = order[rank < PEAKS_PER_SEC]
+    keep = keep[np.lexsort((freqs[keep], frames[keep]))]
+    return frames[keep], freqs[keep]
+
+
+def landmarks(y, sr):
+    # Input: mono signal, returns (hashes, anchor frames) as int64 arrays
+    # hash = anchor freq (10 bits) | target freq (10 bits) | frame delta (6 bits)
+    frames, freqs = peaks(y, sr)
+    hashes, anchors = [], []
+    for k in range(1, FAN_OUT + 1):  # pair every peak with the next peaks
+        dt = frames[k:] - frames[:-k]
+        valid = (dt > 0) & (dt <= MAX_DT)
+        f1, f2 = freqs[:-k][valid], freqs[k:][valid]
+        hashes.append((f1 << 16) | (f2 << 6) | dt[valid])
+        anchors.append(frames[:-k][valid])
+    hashes, anchors = np.concatenate(hashes), np.concatenate(anchors)
+    order = np.argsort(anchors, kind='stable')
+    return hashes[order].astype(np.int64), anchors[order].astype(np.int64)
+
+
+@contextlib.contextmanager
+def _connect(path, immediate=False):
+    # short-lived connection per call --> safe across threads and processes
+    # immediate: take the write lock up front, reads & writes are one transaction
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    con = sqlite3.connect(path, timeout=30)
+    try:
+        con.execute('PRAGMA journal_mode=WAL')
+        for statement in _SCHEMA:
+            con.execute(statement)
+        with con:  # commit on success, rollback on error
+            if immediate:
+                con.execute('BEGIN IMMEDIATE')
+            yield con
+    finally:
+        con.close()
+
+
+class FingerprintIndex:
+    # landmark hashes of all analysed originals, looked up at ingest
+
+    def __init__(self, path=INDEX_PATH, max_bytes=MAX_INDEX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+
+    def __contains__(self, audio_hash):
+        with _connect(self.path) as con:
+            return con.execute('SELECT 1 FROM tracks WHERE audio_hash=?',
+                               (audio_hash,)).fetchone() is not None
+
+    def add(self, audio_hash, fingerprint, duration, name=None):
+        # register a track as original (once per audio content)
+        with _connect(self.path) as con:
+            evicted = self._add(con, audio_hash, fingerprint, duration, name)
+        self._forget(evicted)
+
+    def lookup(self, fingerprint, duration, exclude=None):
+        # best matching original of similar length, None if there is none
+        with _connect(self.path) as con:
+            return self._lookup(con, fingerprint, duration, exclude)
+
+    def match_or_add(self, audio_hash, fingerprint, duration, name=None):
+        # lookup & registration as one transaction --> tracks analysed in
+        # parallel (batch workers) can't both become the original
+        with _connect(self.path, immediate=True) as con:
+            match = self._lookup(con, fingerprint, duration, exclude=audio_hash)
+            evicted = [] if match is not None else \
+                self._add(con, audio_hash, fingerprint, duration, name)
+        self._forget(evicted)
+        return match
+
+    def _add(self, con, audio_hash, fingerprint, duration, name):
+        cursor = con.execute('INSERT OR IGNORE INTO tracks (audio_hash, name, duration, '
+                             'landmarks) VALUES (?,?,?,?)',
+                             (audio_hash, name, duration, len(fingerprint['hashes'])))
+        if cursor.rowcount:
+            con.executemany('INSERT INTO landmarks VALUES (?,?,?)',
+                            zip(fingerprint['hashes'].tolist(), [cursor.lastrowid]
+                                * len(fingerprint['hashes']), fingerprint['frames'].tolist()))
+            return self._evict(con, keep=cursor.lastrowid)
+        return []
+
+    def _evict(self, con, keep):
+        # drop the oldest originals until the landmarks fit max_bytes again,
+        # the track just added (keep) stays --> returns the evicted hashes
+        total = con.execute('SELECT COALESCE(SUM(landmarks), 0) FROM tracks').fetchone()[0]
+        if total * LANDMARK_BYTES <= self.max_bytes:
+            return []
+        rows = con.execute('SELECT track_id, audio_hash, landmarks FROM tracks '
+                           'WHERE track_id != ? ORDER BY track_id ASC', (keep,)).fetchall()
+        evicted, cutoff = [], None
+        for track_id, audio_hash, count in rows:
+            if total * LANDMARK_BYTES <= EVICT_TO * self.max_bytes:
+                break
+            evicted.append(audio_hash)
+            cutoff, total = track_id, total - count
+        if evicted:
+            con.execute('DELETE FROM landmarks WHERE track_id <= ? AND track_id != ?',
+                        (cutoff, keep))
+            con.execute('DELETE FROM tracks WHERE track_id <= ? AND track_id != ?',
+                        (cutoff, keep))
+        return evicted
+
+    def _forget(self, evicted):
+        # evicted originals can't be matched anymore --> their stored
+        # features go with them, the fingerprint budget bounds both stores
+        for audio_hash in evicted:
+            feature_store.delete(audio_hash)
+
+    def _lookup(self, con, fingerprint, duration, exclude):
+        # matches have to agree on the time offset between both tracks
+        # offset: frames the original is ahead of the looked up track
+        hashes, frames = fingerprint['hashes'], fingerprint['frames']
+        if not len(hashes):
+            return None
+        step = max(1, len(hashes) // QUERY_LANDMARKS)
+        query = list(zip(hashes[::step].tolist(), frames[::step].tolist()))
+        con.execute('CREATE TEMP TABLE query (hash INTEGER, frame INTEGER)')
+        con.executemany('INSERT INTO query VALUES (?,?)', query)
+        rows = con.execute(
+            'SELECT t.audio_hash, t.name, t.duration, l.frame - q.frame, COUNT(*) '
+            'FROM query q JOIN landmarks l ON l.hash = q.hash '
+            'JOIN tracks t ON t.track_id = l.track_id '
+            'WHERE t.audio_hash IS NOT ? GROUP BY l.track_id, l.frame - q.frame',
+            (exclude,)).fetchall()
+        con.execute('DROP TABLE query')
+
+        # aligned matches per track, +-1 frame offset tolerance (encoder delay)
+        offsets = {}
+        for audio_hash, name, track_duration, offset, count in rows:
+            if abs(track_duration - duration) <= DURATION_TOLERANCE * max(duration, 1.0):
+                offsets.setdefault((audio_hash, name), {})[offset] = count
+        best = None
+        for (audio_hash, name), counts in offsets.items():
+            aligned, offset = max((sum(counts.get(o + d, 0) for d in (-1, 0, 1)), o)
+                                  for o in counts)
+            if best is None or aligned > best['aligned']:
+                best = {'audio_hash': audio_hash, 'name': name, 'aligned': aligned,
+                        'ratio': aligned / len(query), 'offset': offset}
+        if best is None or best['aligned'] < MIN_ALIGNED or best['ratio'] < MIN_RATIO:
+            return None
+        return best
+
+
+# module level instance --> shared by the app and batch jobs
+fingerprint_index = FingerprintIndex()
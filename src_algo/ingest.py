@@ -0,0 +1,119 @@
+# Upload Ingestion - stream the uploaded bytes once, hashing them on the way
+# small uploads are decoded straight from memory, large ones are spilled
+# to a temporary file named by the content hash (never to the cwd under the
+# user's filename) --> one spill file per audio content, shared by reruns
+
+import io
+import os
+import hashlib
+import tempfile
+import weakref
+
+from src_algo.analysis_cache import LRUCache
+
+SPILL_BYTES = 64 * 1024 * 1024  # uploads above this size go to a temp file
+CHUNK_BYTES = 1024 * 1024  # streaming granularity for hashing & spilling
+SPILL_DIR = os.path.join(tempfile.gettempdir(), 'beatinspect')
+
+# upload id --> (content hash, spill path or None), reruns skip the hashing
+_ingested = LRUCache(max_bytes=1024 * 1024)
+
+
+def iter_chunks(fileobj, chunk_bytes=CHUNK_BYTES):
+    # read a file-like object from the start in chunks of chunk_bytes
+    fileobj.seek(0)
+    while True:
+        chunk = fileobj.read(chunk_bytes)
+        if not chunk:
+            break
+        yield chunk
+    fileobj.seek(0)
+
+
+def file_hash(path):
+    # sha256 of a file on disk in chunks --> same key as an upload of the file
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter_chunks(f):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _stream(upload, spill_bytes):
+    # one pass over the upload: sha256 of the content + optional spill file
+    size = getattr(upload, 'size', None)
+    spill = None
+    if size is not None and size > spill_bytes:
+        os.makedirs(SPILL_DIR, exist_ok=True)
+        suffix = os.path.splitext(getattr(upload, 'name', ''))[1].lower()
+        spill = tempfile.NamedTemporaryFile(dir=SPILL_DIR, prefix='upload_',
+                                            suffix=suffix, delete=False)
+    digest = hashlib.sha256()
+    try:
+        for chunk in iter_chunks(upload):
+            digest.update(chunk)
+            if spill is not None:
+                spill.write(chunk)
+    except BaseException:
+        if spill is not None:  # never leave half written spill files behind
+            spill.close()
+            _remove(spill.name)
+        raise
+    audio_hash = digest.hexdigest()
+    if spill is None:
+        return audio_hash, None
+    spill.close()
+    # content already spilled (e.g. in use by its cached asset) --> reuse it
+    spill_path = os.path.join(SPILL_DIR, audio_hash + os.path.splitext(spill.name)[1])
+    if os.path.exists(spill_path):
+        _remove(spill.name)
+    else:
+        os.replace(spill.name, spill_path)
+    return audio_hash, spill_path
+
+
+def ingest(upload, spill_bytes=SPILL_BYTES):
+    # Input: file-like upload (e.g. streamlit UploadedFile)
+    # returns (content hash, decodable source), the source is an in-memory
+    # view of the upload bytes or the path of a temporary spill file
+    upload_id = getattr(upload, 'file_id', None)
+    key = (upload_id, spill_bytes)
+    if upload_id is None:  # unknown identity --> always stream again
+        audio_hash, spill_path = _stream(upload, spill_bytes)
+    else:
+        audio_hash, spill_path = _ingested.get_or_compute(
+            key, lambda: _stream(upload, spill_bytes))
+        if spill_path is not None and not os.path.exists(spill_path):
+            # spill file already released together with its asset
+            audio_hash, spill_path = _ingested.put(key, _stream(upload, spill_bytes))
+
+    if spill_path is not None:
+        return audio_hash, spill_path
+    if hasattr(upload, 'getvalue'):  # own file position, one copy of the bytes
+        return audio_hash, io.BytesIO(upload.getvalue())
+    return audio_hash, upload
+
+
+def _is_spill(source):
+    return isinstance(source, str) and os.path.dirname(source) == SPILL_DIR
+
+
+def release_with(owner, source):
+    # delete a spill file as soon as the object decoded from it is
+    # garbage collected (e.g. evicted from the analysis cache) or at exit
+    # later uploads of the cached content reuse the same file meanwhile
+    if _is_spill(source):
+        weakref.finalize(owner, _remove, source)
+
+
+def discard(source):
+    # delete a spill file nothing could be decoded from
+    if _is_spill(source):
+        _remove(source)
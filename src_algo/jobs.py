@@ -0,0 +1,190 @@
+# Analysis Jobs - the analysis of one audio content runs as a background job
+# on a local worker pool, the job id is the content hash of the audio
+# --> streamlit reruns (any widget interaction) attach to the running job
+# instead of throwing the work away and starting it all over again
+
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import src_algo.analysis as analysis
+from src_algo.similarity import similarity_index
+from src_algo.scheduler import executor
+
+JOB_WORKERS = 2  # tracks analysed at the same time, stages use the scheduler
+MAX_JOBS = 32  # finished jobs kept around for reruns to attach to
+LONG_TRACK_SEC = 300  # use early terminating key detection above 5 min
+POLL_SEC = 0.1
+SIMILAR_TRACKS = 5  # neighbours looked up in the similarity index
+
+# progress is reported per stage, stages are started in this order
+STAGES = ['decode', 'original', 'key', 'key_profiles', 'bpm', 'loudness',
+          'spectrogram', 'bpm_refined', 'timeline', 'similar']
+PENDING, RUNNING, DONE, FAILED = 'pending', 'running', 'done', 'failed'
+
+# job runners only orchestrate & wait --> separate from the stage threads
+job_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS,
+                                  thread_name_prefix='beatinspect_job')
+
+
+class Job:
+    # status & results of every analysis stage of one audio content
+
+    def __init__(self, job_id, name=None):
+        self.id = job_id  # content hash of the analysed audio
+        self.name = name  # file name shown for this track in similarity results
+        self.status = {stage: PENDING for stage in STAGES}
+        self.results = {}
+        self.errors = {}
+        self.submitted = time.time()
+        self._events = {stage: threading.Event() for stage in STAGES}
+
+    @property
+    def done(self):
+        return all(event.is_set() for event in self._events.values())
+
+    @property
+    def failed(self):
+        # the audio could not be decoded --> none of the stages has a result
+        # (other stages failing leaves the remaining results usable)
+        return 'decode' in self.errors
+
+    def progress(self):
+        # fraction of finished stages (done or failed)
+        return sum(status in (DONE, FAILED) for status in self.status.values()) / len(STAGES)
+
+    def wait(self, stage, timeout=None):
+        # block until a stage has finished and return its result
+        if not self._events[stage].wait(timeout):
+            raise TimeoutError(f'stage {stage} of job {self.id} still running')
+        if stage in self.errors:
+            raise self.errors[stage]
+        return self.results[stage]
+
+    def result(self, stage, timeout=None):
+        # like wait, but None for a failed stage (its error is in errors)
+        try:
+            return self.wait(stage, timeout)
+        except TimeoutError:
+            raise
+        except Exception:
+            return None
+
+    def as_completed(self, stages):
+        # poll the given stages, yields (stage, result) as each one finishes
+        # the result of a failed stage is None (see result)
+        remaining = list(stages)
+        while remaining:
+            for stage in [s for s in remaining if self._events[s].is_set()]:
+                remaining.remove(stage)
+                yield stage, self.result(stage)
+            if remaining:
+                time.sleep(POLL_SEC)
+
+    def _run_stage(self, stage, compute):
+        self.status[stage] = RUNNING
+        try:
+            self.results[stage] = compute()
+            self.status[stage] = DONE
+        except Exception as e:  # reported to whoever waits for the stage
+            self.errors[stage] = e
+            self.status[stage] = FAILED
+        finally:
+            self._events[stage].set()
+
+
+def _incremental(asset):
+    # long tracks & DJ mixes: early terminating key estimation, its chroma
+    # also feeds the key profiles & the embedding (no full track chroma)
+    return asset.duration > LONG_TRACK_SEC
+
+
+def _key(asset, audio_hash, original=None):
+    if _incremental(asset):
+        return analysis.key_scale_incremental(asset, audio_hash, original=original)
+    key, scale, strength = analysis.key_scale(asset, audio_hash, 'diatonic', original)
+    return {'key': key, 'scale': scale, 'strength': strength}
+
+
+def _spectrogram(asset, audio_hash):
+    # rms, mel spectrogram, waveform envelope & onsets for the plots
+    spectral = analysis.spectral(asset, audio_hash)
+    return {'spectral': spectral,
+            'envelope': analysis.waveform(asset, audio_hash),
+            'onsets': analysis.onsets(spectral, audio_hash)}
+
+
+def _similar(job, asset, audio_hash, original=None):
+    # add the track to the similarity index, then look up its neighbours
+    # runs after all other stages --> the embedding only reads cached results
+    meta = {'name': job.name}
+    if 'key' in job.results:
+        meta.update(key=job.results['key']['key'], scale=job.results['key']['scale'])
+    rhythm = job.results.get('bpm_refined', job.results.get('bpm'))
+    if rhythm is not None:
+        meta['bpm'] = round(rhythm['bpm'], 1)
+    vector = analysis.embedding(asset, audio_hash, original=original,
+                                incremental=_incremental(asset))
+    similarity_index.add(job.id, vector, meta)
+    return similarity_index.similar(job.id, SIMILAR_TRACKS)
+
+
+def _run(job, source):
+    # decode once, then all stages concurrently on the shared audio buffer
+    audio_hash = job.id
+    job._run_stage('decode', lambda: analysis.load_asset(audio_hash, source))
+    if job.status['decode'] == FAILED:
+        for stage in STAGES[1:]:  # nothing to analyse
+            job._run_stage(stage, lambda: job.wait('decode'))
+        return
+    asset = job.results['decode']
+
+    # near-duplicates (re-exports) of an analysed track reuse its key & bpm
+    # results, the landmark fingerprint is cheap next to those
+    # level dependent results (loudness, ...) are always of the audio itself
+    job._run_stage('original', lambda: analysis.find_original(asset, audio_hash, job.name))
+    original = job.results.get('original')
+
+    stages = {'key': lambda: _key(asset, audio_hash, original),
+              'key_profiles': lambda: analysis.key_profiles(
+                  asset, audio_hash, original=original, incremental=_incremental(asset)),
+              'bpm': lambda: analysis.rhythm_fast(asset, audio_hash, original),
+              'loudness': lambda: analysis.loudness(asset, audio_hash),
+              'spectrogram': lambda: _spectrogram(asset, audio_hash),
+              'bpm_refined': lambda: analysis.rhythm(asset, audio_hash, original=original),
+              'timeline': lambda: analysis.key_tempo_map(asset, audio_hash)}
+    futures = [executor.submit(job._run_stage, stage, stages[stage])
+               for stage in STAGES[2:-1]]
+    for future in futures:
+        future.result()
+    job._run_stage('similar', lambda: _similar(job, asset, audio_hash, original))
+
+
+# module level registry --> shared by all sessions of the streamlit server
+_jobs = OrderedDict()  # job id --> Job, oldest first
+_jobs_lock = threading.Lock()
+
+
+def submit(audio_hash, source, name=None):
+    # the job analysing this audio content, started if there is none yet
+    # finished jobs whose decoding failed are started again (e.g. after a
+    # temporary error), running jobs are never replaced
+    with _jobs_lock:
+        job = _jobs.get(audio_hash)
+        if job is not None and not (job.done and job.failed):
+            _jobs.move_to_end(audio_hash)
+            return job
+        job = _jobs[audio_hash] = Job(audio_hash, name)
+        for job_id in list(_jobs):  # forget the oldest finished jobs
+            if len(_jobs) <= MAX_JOBS:
+                break
+            if _jobs[job_id].done:
+                del _jobs[job_id]
+    job_executor.submit(_run, job, source)
+    return job
+
+
+def get(job_id):
+    with _jobs_lock:
+        return _jobs.get(job_id)
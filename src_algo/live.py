@@ -0,0 +1,152 @@
+# Live Analysis - online estimators fed with the PCM chunks of a running
+# recording --> rms, key and tempo metrics update while recording
+
+import numpy as np
+import soxr  # streaming resampler (librosa's default resampling backend)
+import librosa
+
+import src_algo.detect_keyscale as detect_keyscale
+from src_algo.features import N_FFT, HOP_LENGTH
+from src_algo.tempo import AUTOCORR_SR, AUTOCORR_HOP
+
+ESSENTIA_SR = 44100
+ONSET_N_FFT = 1024  # onset spectral flux on the 11025 Hz signal
+ONSET_MELS = 64
+MIN_TEMPO_SEC = 6.0  # no tempo estimate before this much audio was seen
+MIN_BPM, START_BPM = 40.0, 120.0  # autocorrelation lag range & tempo prior
+PCM_DTYPES = {16: '<i2', 32: '<i4'}
+
+
+def pcm_to_mono(pcm, channels, bits):
+    # interleaved little endian integer PCM bytes --> mono float32 [-1, 1]
+    y = np.frombuffer(pcm, dtype=PCM_DTYPES[bits]).reshape(-1, channels)
+    return y.mean(axis=1, dtype=np.float32) / float(2 ** (bits - 1))
+
+
+class _Framer:
+    # keeps the samples that do not yet fill a complete frame between chunks
+    # and hands out the part of the signal covering all complete frames
+
+    def __init__(self, frame_length, hop_length):
+        self.frame_length, self.hop_length = frame_length, hop_length
+        self.pending = np.zeros(0, dtype=np.float32)
+
+    def push(self, y):
+        buf = np.concatenate([self.pending, y])
+        if len(buf) < self.frame_length:
+            self.pending = buf
+            return buf[:0]
+        n_frames = 1 + (len(buf) - self.frame_length) // self.hop_length
+        self.pending = buf[n_frames * self.hop_length:]  # next frame start
+        return buf[:(n_frames - 1) * self.hop_length + self.frame_length]
+
+
+class LiveAnalysis:
+    # online rms, running chroma/key and onset based tempo of one recording
+
+    def __init__(self, sr, channels, bits, profile_type='diatonic'):
+        self.sr, self.channels, self.bits = sr, channels, bits
+        self.profile_type = profile_type
+        self.n_samples = 0
+
+        # rms energy frames (same frame/hop as the full spectral analysis)
+        self._rms_framer = _Framer(N_FFT, HOP_LENGTH)
+        self.rms = []
+
+        # running chroma sum of 44100 Hz HPCP frames
+        self._es_resampler = soxr.ResampleStream(sr, ESSENTIA_SR, 1, dtype='float32')
+        self._hpcp_framer = _Framer(detect_keyscale.FRAME_SIZE, detect_keyscale.HOP_SIZE)
+        self._frame_hpcp = detect_keyscale._hpcp_algorithms()
+        self.chroma_sum = np.zeros(detect_keyscale.HPCP_SIZE, dtype=np.float64)
+        self.n_hpcp = 0
+
+        # onset strength (mel spectral flux) of the 11025 Hz signal
+        self._onset_resampler = soxr.ResampleStream(sr, AUTOCORR_SR, 1, dtype='float32')
+        self._onset_framer = _Framer(ONSET_N_FFT, AUTOCORR_HOP)
+        self._last_mel = None
+
+        # running autocorrelation of the onset envelope, updated with the new
+        # frames only --> constant cost per chunk, however long the recording
+        frame_rate = AUTOCORR_SR / AUTOCORR_HOP
+        self._max_lag = int(60.0 / MIN_BPM * frame_rate)
+        self._lag_bpm = 60.0 * frame_rate / np.arange(1, self._max_lag + 1)
+        self._autocorr = np.zeros(self._max_lag + 1)
+        self._env_tail = np.zeros(self._max_lag)
+
+    @property
+    def duration(self):
+        return self.n_samples / self.sr
+
+    def feed(self, pcm):
+        # Input: raw PCM bytes of one chunk (complete frames only)
+        y = pcm_to_mono(pcm, self.channels, self.bits)
+        self.n_samples += len(y)
+        self._update_rms(y)
+        self._update_chroma(self._es_resampler.resample_chunk(y))
+        self._update_onsets(self._onset_resampler.resample_chunk(y))
+
+    def _update_rms(self, y):
+        block = self._rms_framer.push(y)
+        if len(block):
+            rms = librosa.feature.rms(y=block, frame_length=N_FFT,
+                                      hop_length=HOP_LENGTH, center=False)
+            self.rms.extend(rms[0])
+
+    def _update_chroma(self, y):
+        block = self._hpcp_framer.push(y)
+        if len(block):
+            for frame in librosa.util.frame(block, frame_length=detect_keyscale.FRAME_SIZE,
+                                            hop_length=detect_keyscale.HOP_SIZE, axis=0):
+                self.chroma_sum += self._frame_hpcp(np.ascontiguousarray(frame))
+                self.n_hpcp += 1
+
+    def _update_onsets(self, y):
+        block = self._onset_framer.push(y)
+        if not len(block):
+            return
+        mel = librosa.feature.melspectrogram(y=block, sr=AUTOCORR_SR, n_fft=ONSET_N_FFT,
+                                             hop_length=AUTOCORR_HOP, n_mels=ONSET_MELS,
+                                             center=False)
+        mel = librosa.power_to_db(mel, ref=1.0)  # fixed reference across chunks
+        if self._last_mel is not None:
+            mel = np.hstack([self._last_mel, mel])
+        else:  # first frame has no predecessor
+            mel = np.hstack([mel[:, :1], mel])
+        flux = np.maximum(0.0, np.diff(mel, axis=1)).mean(axis=0)
+        self._last_mel = mel[:, -1:]
+
+        # products of every new frame with its max_lag predecessors
+        history = np.concatenate([self._env_tail, flux])
+        windows = np.lib.stride_tricks.sliding_window_view(history, self._max_lag + 1)
+        self._autocorr += (windows[:, -1:] * windows[:, ::-1]).sum(axis=0)
+        self._env_tail = history[-self._max_lag:]
+
+    def metrics(self):
+        # current estimates, None while there is not enough audio yet
+        result = {'duration': self.duration, 'rms_db': None,
+                  'key': None, 'scale': None, 'strength': None, 'bpm': None}
+        if self.rms:
+            recent = np.asarray(self.rms[-int(self.sr / HOP_LENGTH):])  # last sec
+            result['rms_db'] = float(librosa.amplitude_to_db(
+                np.sqrt(np.mean(np.square(recent))), ref=1.0))
+        if self.n_hpcp:
+            key, scale, strength, _ = detect_keyscale.key_from_chroma(
+                self.chroma_sum, self.profile_type)
+            result.update(key=key, scale=scale, strength=float(strength))
+        if self.duration >= MIN_TEMPO_SEC:
+            result['bpm'] = self.tempo()
+        return result
+
+    def tempo(self):
+        # strongest autocorrelation lag weighted with a log-normal tempo prior
+        # around START_BPM (as librosa.feature.tempo), parabolic peak refinement
+        prior = np.exp(-0.5 * np.log2(self._lag_bpm / START_BPM) ** 2)
+        score = self._autocorr[1:] * prior
+        i = int(np.argmax(score))
+        lag = i + 1.0
+        if 0 < i < len(score) - 1:
+            left, peak, right = score[i - 1:i + 2]
+            denominator = left - 2 * peak + right
+            if denominator < 0:
+                lag += 0.5 * (left - right) / denominator
+        return float(60.0 * AUTOCORR_SR / AUTOCORR_HOP / lag)
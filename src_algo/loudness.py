@@ -0,0 +1,136 @@
+# Loudness Timeline - vectorized ITU-R BS.1770 / EBU R128 measurements
+# momentary & short-term loudness series, integrated loudness, loudness range
+# and true peak in ONE blockwise pass over the shared decoded audio buffer
+
+import numpy as np
+import scipy.signal
+
+STEP_SEC = 0.1  # hop of the momentary & short-term windows (75% overlap)
+MOMENTARY_STEPS = 4  # 400 ms
+SHORT_TERM_STEPS = 30  # 3 s
+BLOCK_STEPS = 100  # filter 10 sec of audio at a time --> bounded memory
+CHANNEL_GAINS = [1.0, 1.0, 1.0, 1.41, 1.41]  # L, R, C, Ls, Rs
+ABS_GATE = -70.0  # LUFS
+REL_GATE_INTEGRATED, REL_GATE_LRA = -10.0, -20.0  # LU
+LRA_PERCENTILES = (10, 95)
+TRUE_PEAK_OVERSAMPLING = 4
+TRUE_PEAK_CONTEXT = 32  # neighbour samples resampled with every block
+MIN_POWER = 1e-12  # floor of the series --> approx. -120 LUFS instead of -inf
+
+
+def _biquad(gain_db, q, fc, sr, filter_type):
+    # RBJ cookbook biquad as second order section (same design as pyloudnorm)
+    A = 10 ** (gain_db / 40.0)
+    w0 = 2.0 * np.pi * fc / sr
+    cos, alpha = np.cos(w0), np.sin(w0) / (2.0 * q)
+    if filter_type == 'high_shelf':
+        b = [A * ((A + 1) + (A - 1) * cos + 2 * np.sqrt(A) * alpha),
+             -2 * A * ((A - 1) + (A + 1) * cos),
+             A * ((A + 1) + (A - 1) * cos - 2 * np.sqrt(A) * alpha)]
+        a = [(A + 1) - (A - 1) * cos + 2 * np.sqrt(A) * alpha,
+             2 * ((A - 1) - (A + 1) * cos),
+             (A + 1) - (A - 1) * cos - 2 * np.sqrt(A) * alpha]
+    else:  # high_pass
+        b = [(1 + cos) / 2, -(1 + cos), (1 + cos) / 2]
+        a = [1 + alpha, -2 * cos, 1 - alpha]
+    return np.concatenate([b, a]) / a[0]
+
+
+def k_weighting(sr):
+    # head related high shelf followed by the RLB high pass, shape (2, 6)
+    return np.stack([_biquad(4.0, 1 / np.sqrt(2), 1500.0, sr, 'high_shelf'),
+                     _biquad(0.0, 0.5, 38.0, sr, 'high_pass')])
+
+
+def _to_lufs(power):
+    return -0.691 + 10.0 * np.log10(np.maximum(power, MIN_POWER))
+
+
+def _windowed(step_power, n_steps):
+    # mean power of all windows of n_steps consecutive steps (cumulative sum)
+    csum = np.concatenate([[0.0], np.cumsum(step_power)])
+    return (csum[n_steps:] - csum[:-n_steps]) / n_steps
+
+
+def _gated_mean(power, rel_gate):
+    # two stage gating of BS.1770: absolute threshold, then relative to the
+    # loudness of the blocks that passed the absolute one
+    loudness = _to_lufs(power)
+    above_abs = loudness > ABS_GATE
+    if not above_abs.any():
+        return above_abs
+    rel_threshold = _to_lufs(power[above_abs].mean()) + rel_gate
+    return above_abs & (loudness > rel_threshold)
+
+
+def _true_peak(data, start, end):
+    # max absolute value of the 4x oversampled block, context samples on both
+    # sides keep the resampling filter from ringing at the block borders
+    lo = max(start - TRUE_PEAK_CONTEXT, 0)
+    hi = min(end + TRUE_PEAK_CONTEXT, len(data))
+    oversampled = scipy.signal.resample_poly(data[lo:hi], TRUE_PEAK_OVERSAMPLING, 1, axis=0)
+    k = TRUE_PEAK_OVERSAMPLING
+    return np.abs(oversampled[(start - lo) * k:(end - lo) * k]).max()
+
+
+def _step_power(data, sr):
+    # channel weighted mean square of the K-weighted signal per 100 ms step
+    # plus sample & true peak, Input: shape (frames, channels) float32 buffer
+    # only one block at a time is filtered --> no full-signal copies
+    frames, channels = data.shape
+    step = int(round(sr * STEP_SEC))
+    block = step * BLOCK_STEPS
+    sos = k_weighting(sr)
+    zi = np.zeros((sos.shape[0], 2, channels))  # filter state between blocks
+    gains = np.array((CHANNEL_GAINS + [1.0] * channels)[:channels])
+
+    step_power = np.zeros(frames // step)
+    sample_peak = true_peak = 0.0
+    for start in range(0, frames, block):
+        end = min(start + block, frames)
+        x = data[start:end]  # view into the shared buffer
+        sample_peak = max(sample_peak, float(np.abs(x).max()))
+        true_peak = max(true_peak, float(_true_peak(data, start, end)))
+
+        y, zi = scipy.signal.sosfilt(sos, x, axis=0, zi=zi)
+        n_full = len(y) // step  # trailing partial step is not measured
+        mean_square = np.square(y[:n_full * step]).reshape(n_full, step, channels).mean(axis=1)
+        step_power[start // step:start // step + n_full] = mean_square @ gains
+    return step_power, sample_peak, true_peak
+
+
+def loudness_timeline(data, sr):
+    # momentary (400 ms) & short-term (3 s) loudness series in LUFS with a
+    # 100 ms hop, integrated loudness, loudness range (EBU Tech 3342) & peaks
+    step_power, sample_peak, true_peak = _step_power(data, sr)
+    momentary = _windowed(step_power, MOMENTARY_STEPS)
+    short_term = _windowed(step_power, SHORT_TERM_STEPS)
+
+    gated = _gated_mean(momentary, REL_GATE_INTEGRATED)
+    integrated = float(_to_lufs(momentary[gated].mean())) if gated.any() else -np.inf
+
+    # loudness range: the signal is followed by 1.5 sec of silence (Tech 3342)
+    padded = np.concatenate([step_power, np.zeros(SHORT_TERM_STEPS // 2)])
+    short_term_lra = _windowed(padded, SHORT_TERM_STEPS)
+    gated_lra = _to_lufs(short_term_lra[_gated_mean(short_term_lra, REL_GATE_LRA)])
+    lra = (float(np.diff(np.percentile(gated_lra, LRA_PERCENTILES))[0])
+           if len(gated_lra) else 0.0)
+
+    # peak normalization only shifts the loudness --> gain offset, no copy
+    peak_gain_db = -20.0 * np.log10(sample_peak) if sample_peak > 0 else 0.0
+    return {'momentary': _to_lufs(momentary).astype(np.float32),
+            'short_term': _to_lufs(short_term).astype(np.float32),
+            'step_sec': STEP_SEC, 'integrated': integrated,
+            'integrated_normalized': integrated + peak_gain_db,
+            'lra': lra, 'sample_peak_db': _to_db(sample_peak),
+            'true_peak_db': _to_db(true_peak)}
+
+
+def _to_db(peak):
+    # peak amplitude in dB(TP), digital silence --> -inf (no floor)
+    return float(20.0 * np.log10(peak)) if peak > 0 else -np.inf
+
+
+def series_times(series, window_steps, step_sec=STEP_SEC):
+    # end timestamps [sec] of the windows of a momentary/short-term series
+    return (np.arange(len(series)) + window_steps) * step_sec
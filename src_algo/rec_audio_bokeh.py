@@ -1,17 +1,69 @@
-import pydub
+import io
+import os
 import base64
-import ffmpeg
+import tempfile
 
-import base64
 from bokeh.io import curdoc
 from bokeh.themes import Theme
 from bokeh.models.widgets import Button
 from bokeh.models import CustomJS
 from streamlit_bokeh_events import streamlit_bokeh_events
 from pydub import AudioSegment
+import soundfile as sf
 
 import streamlit as st
 
+import src_algo.ingest as ingest
+from src_algo.analysis_cache import LRUCache, content_hash
+
+# recorded bytes hash --> wav spill path, reruns skip the conversion
+_saved = LRUCache(max_bytes=1024 * 1024)
+
+
+def _write_wav(decoded, path):
+    # MediaRecorder produces webm/ogg-opus, which libsndfile can't decode
+    # --> converted via pydub/ffmpeg, natively readable containers are kept
+    try:
+        info = sf.info(io.BytesIO(decoded))
+    except RuntimeError:  # not readable by libsndfile (e.g. webm)
+        AudioSegment.from_file(io.BytesIO(decoded)).export(path, format='wav')
+        return
+    if info.format == 'WAV':
+        with open(path, 'wb') as f:
+            f.write(decoded)
+    else:  # e.g. ogg vorbis, re-encoded without ffmpeg
+        data, sr = sf.read(io.BytesIO(decoded), dtype='float32')
+        sf.write(path, data, sr, format='WAV', subtype='FLOAT')
+
+
+def _spill(decoded):
+    # named like the spill files of ingest (<content hash>.wav) --> released
+    # together with the asset decoded from it (analysis.load_asset)
+    os.makedirs(ingest.SPILL_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=ingest.SPILL_DIR, prefix='recording_', suffix='.wav')
+    os.close(fd)
+    try:
+        _write_wav(decoded, tmp_path)
+        path = os.path.join(ingest.SPILL_DIR, ingest.file_hash(tmp_path) + '.wav')
+    except BaseException:  # never leave half written files behind
+        os.remove(tmp_path)
+        raise
+    if os.path.exists(path):  # content already spilled, e.g. in use by its asset
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, path)
+    return path
+
+
+def save_recording(decoded):
+    # write the recorded bytes to a wav file, returns its path
+    key = content_hash(decoded)
+    path = _saved.get_or_compute(key, lambda: _spill(decoded))
+    if not os.path.exists(path):  # already released together with its asset
+        path = _saved.put(key, _spill(decoded))
+    return path
+
+
 def rec_bokeh():
 
     audiofile_name = None
@@ -75,18 +127,8 @@ def rec_bokeh():
                 st.write('Captured audio recording from web browser:')
                 st.audio(decoded)
 
-                #save it server side if needed
-                uploaded_file = 'test.wav'
-                with open(uploaded_file,'wb') as f:
-                    f.write(decoded)
-
-                #convert File to wav and save it again
-                wav = AudioSegment.from_file(uploaded_file)
-                getaudio = wav.export(uploaded_file, format="wav")
-
-                # st.write("Read sound by saving in server and reloading file")
-                # st.audio(uploaded_file)
-
-                audiofile_name = uploaded_file
+                # converted to a wav spill file (not in the cwd), deleted
+                # with its asset, same file for every rerun meanwhile
+                audiofile_name = save_recording(decoded)
 
     return audiofile_name
@@ -0,0 +1,86 @@
+# Recorder Transfer - raw PCM chunks sent by the st_audiorec component are
+# assembled into an in-memory wav buffer (no base64, no files on disk)
+
+import io
+import time
+import wave
+import struct
+
+from src_algo.live import LiveAnalysis
+
+# chunk layout: magic, recording id, sequence number, sample rate, channels,
+# bits per sample, last chunk flag, followed by little endian PCM bytes
+CHUNK_HEADER = struct.Struct('<4sIIIHHB')
+CHUNK_MAGIC = b'BIPC'
+
+
+def parse_chunk(payload):
+    # split one binary component value into its header fields and PCM bytes
+    magic, rec_id, seq, sr, channels, bits, last = CHUNK_HEADER.unpack_from(payload)
+    if magic != CHUNK_MAGIC:
+        raise ValueError('not a beatinspect PCM chunk')
+    return {'rec_id': rec_id, 'seq': seq, 'sr': sr, 'channels': channels, 'bits': bits,
+            'last': bool(last), 'pcm': memoryview(payload)[CHUNK_HEADER.size:]}
+
+
+class RecordingAssembler:
+    # collects the PCM chunks of one recording in order, kept per session
+    # the component sends chunk n only after next_seq == n was acknowledged
+    # --> chunks can neither be lost nor duplicated by streamlit reruns
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.pcm = bytearray()
+        self.rec_id = None
+        self.next_seq = 0
+        self.sr = self.channels = self.bits = None
+        self.complete = False
+        self.name = None
+        self.live = None  # online rms/key/tempo while the recording runs
+        self._buffer = None
+
+    @property
+    def duration(self):
+        if not self.sr:
+            return 0.0
+        return len(self.pcm) / (self.sr * self.channels * self.bits // 8)
+
+    def feed(self, payload):
+        # Input: current component value, returns True if a chunk was added
+        if payload == '':  # recording (re)started or reset in the frontend
+            self.reset()
+            return False
+        if not isinstance(payload, (bytes, bytearray, memoryview)):
+            return False
+        chunk = parse_chunk(payload)
+        if chunk['rec_id'] != self.rec_id and chunk['seq'] == 0:
+            self.reset()  # first chunk of a new recording
+            self.rec_id = chunk['rec_id']
+        if chunk['rec_id'] != self.rec_id or chunk['seq'] != self.next_seq:
+            return False  # value repeated by a rerun, already assembled
+
+        if chunk['seq'] == 0:
+            self.sr, self.channels, self.bits = chunk['sr'], chunk['channels'], chunk['bits']
+            self.live = LiveAnalysis(self.sr, self.channels, self.bits)
+        self.pcm += chunk['pcm']
+        self.live.feed(chunk['pcm'])
+        self.next_seq += 1
+        if chunk['last']:
+            self.complete = True
+            self.name = time.strftime('beatinspect_rec_%Y%m%d%H%M%S.wav')
+        return True
+
+    def wav_buffer(self):
+        # complete recording as in-memory wav file, built once
+        if self._buffer is None:
+            buffer = io.BytesIO()
+            with wave.open(buffer, 'wb') as w:
+                w.setnchannels(self.channels)
+                w.setsampwidth(self.bits // 8)
+                w.setframerate(self.sr)
+                w.writeframes(self.pcm)
+            self._buffer = buffer
+        self._buffer.seek(0)
+        return self._buffer
@@ -0,0 +1,53 @@
+# Analysis Scheduler - run independent analysis stages concurrently
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+MAX_WORKERS = os.cpu_count() or 1  # processes for cpu-heavy computations
+STAGE_THREADS = 8  # threads mostly wait on cache, disk and worker processes
+
+# module level pool --> shared by all sessions of the streamlit server
+# stages are orchestrated in threads (cache lookups, numpy/scipy work)
+executor = ThreadPoolExecutor(max_workers=STAGE_THREADS,
+                              thread_name_prefix='beatinspect_stage')
+
+# essentia keeps the GIL while computing --> its algorithms run in processes
+# spawn instead of fork bc the streamlit server process is multi-threaded
+_process_executor = None
+_process_lock = threading.Lock()
+
+
+def process_executor():
+    global _process_executor
+    with _process_lock:
+        if _process_executor is None:
+            _process_executor = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'))
+    return _process_executor
+
+
+def _replace_broken(broken):
+    # a worker died (OOM, segfault) --> the pool is unusable, start a new one
+    global _process_executor
+    with _process_lock:
+        if _process_executor is broken:
+            _process_executor = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+def run_in_process(function, *args):
+    # run a GIL-bound computation in the shared process pool and wait for it
+    # Input: picklable module level function and its arguments
+    # retried once on a fresh pool if the pool broke (e.g. a crashed worker)
+    if multiprocessing.parent_process() is not None:
+        return function(*args)  # already inside a worker process (e.g. batch)
+    pool = process_executor()
+    try:
+        return pool.submit(function, *args).result()
+    except BrokenProcessPool:
+        _replace_broken(pool)
+    return process_executor().submit(function, *args).result()
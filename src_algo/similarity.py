@@ -0,0 +1,206 @@
+# Similarity Index - compact per-track embedding of the cached analysis
+# results (HPCP chroma, mel spectrogram, rms, tempo) in an in-process
+# approximate nearest neighbour index --> "show me beats like this one"
+# random hyperplane LSH (cosine similarity), candidates reranked exactly
+
+import os
+import json
+import threading
+
+import numpy as np
+
+from src_algo.feature_store import STORE_DIR
+
+EMBEDDING_VERSION = 1  # bump when the embedding layout changes --> rebuilt
+EMBEDDING_MELS = 30  # mel bands are pooled down to this resolution
+N_TABLES = 8  # independent hash tables, more tables --> higher recall
+N_BITS = 12  # hyperplanes per table, more bits --> smaller buckets
+SEED = 2022  # hyperplanes are derived from the seed, not stored
+INDEX_PATH = os.path.join(STORE_DIR, 'similarity_index.npz')
+
+# weight of every feature group in the cosine similarity
+GROUP_WEIGHTS = {'chroma': 1.0, 'mel_mean': 1.0, 'mel_std': 0.5,
+                 'rms': 0.5, 'tempo': 0.75}
+
+
+def _unit(v):
+    norm = np.linalg.norm(v)
+    return v / norm if norm > 0 else v
+
+
+def _centered(v):
+    # spectral shape without the overall level
+    return _unit(v - v.mean())
+
+
+def embedding(hpcp, mel_db, rms, bpm):
+    # Input: mean HPCP (36 bins), mel spectrogram [dB] (mels x frames),
+    # rms frames and bpm of one track --> float32 unit vector
+    mel_db = np.asarray(mel_db, dtype=np.float32)
+    bands = mel_db[:len(mel_db) // EMBEDDING_MELS * EMBEDDING_MELS]
+    bands = bands.reshape(EMBEDDING_MELS, -1, bands.shape[1]).mean(axis=1)
+    rms_db = 20 * np.log10(np.maximum(np.asarray(rms, dtype=np.float32).ravel(), 1e-5))
+    # tempo on a log scale, half/double time end up close to each other
+    octave = np.log2(bpm / 120.0) if bpm > 0 else 0.0
+    groups = {
+        'chroma': _unit(np.asarray(hpcp, dtype=np.float32)),
+        'mel_mean': _centered(bands.mean(axis=1)),
+        'mel_std': _centered(bands.std(axis=1)),
+        'rms': _unit(np.array([np.percentile(rms_db, 50) / 60 + 1, rms_db.std() / 20,
+                               (np.percentile(rms_db, 95) - np.percentile(rms_db, 5)) / 40])),
+        'tempo': np.array([np.cos(2 * np.pi * octave), np.sin(2 * np.pi * octave),
+                           np.clip(octave, -2, 2)]) / np.sqrt(1 + min(octave ** 2, 4))}
+    vector = np.concatenate([GROUP_WEIGHTS[name] * group for name, group in groups.items()])
+    return _unit(vector).astype(np.float32)
+
+
+def _hyperplanes(dim):
+    rng = np.random.default_rng(SEED)
+    return rng.standard_normal((N_TABLES, N_BITS, dim)).astype(np.float32)
+
+
+class SimilarityIndex:
+    # embeddings of all analysed tracks + LSH buckets, grows incrementally
+    # saved as one npz file, reloaded when another process has written it
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._loaded_mtime = None
+        self._clear()
+
+    def _clear(self, dim=None):
+        self.ids = []  # audio hashes, row i of vectors
+        self.meta = []  # json metadata per track (name, key, bpm, ...)
+        self._data = np.zeros((0, dim or 0), dtype=np.float32)  # grows by doubling
+        self._rows = {}  # audio hash --> row
+        self._planes = _hyperplanes(dim) if dim else None
+        self._buckets = [{} for _ in range(N_TABLES)]  # code --> rows
+
+    @property
+    def vectors(self):
+        return self._data[:len(self.ids)]
+
+    def __len__(self):
+        with self._lock:
+            self._refresh()
+            return len(self.ids)
+
+    def __contains__(self, audio_hash):
+        with self._lock:
+            self._refresh()
+            return audio_hash in self._rows
+
+    def _codes(self, vectors):
+        # one N_BITS code per table and vector --> (N_TABLES, n) ints
+        bits = np.einsum('tbd,nd->tnb', self._planes, vectors) > 0
+        return bits.astype(np.int64) @ (1 << np.arange(N_BITS))
+
+    def _insert(self, audio_hashes, vectors, metas):
+        # append new tracks (known ones only get their metadata replaced)
+        if self._planes is None:
+            self._clear(vectors.shape[1])
+        new, seen = [], set()
+        for i, (audio_hash, meta) in enumerate(zip(audio_hashes, metas)):
+            if audio_hash in self._rows:  # re-analysed --> replace the metadata
+                self.meta[self._rows[audio_hash]] = meta
+            elif audio_hash not in seen:
+                new.append(i)
+                seen.add(audio_hash)
+        if not new:
+            return
+        start, end = len(self.ids), len(self.ids) + len(new)
+        if end > len(self._data):
+            data = np.zeros((max(end, 2 * len(self._data), 64), self._data.shape[1]),
+                            dtype=np.float32)
+            data[:start] = self._data[:start]
+            self._data = data
+        self._data[start:end] = vectors[new]
+        for row, i in enumerate(new, start):
+            self.ids.append(audio_hashes[i])
+            self.meta.append(metas[i])
+            self._rows[audio_hashes[i]] = row
+        for table, codes in enumerate(self._codes(vectors[new])):
+            bucket = self._buckets[table]
+            for row, code in enumerate(codes.tolist(), start):
+                bucket.setdefault(code, []).append(row)
+
+    def add(self, audio_hash, vector, meta=None, save=True):
+        # add one track (no-op for known tracks apart from the metadata)
+        with self._lock:
+            self._refresh()
+            self._insert([audio_hash], np.asarray(vector, dtype=np.float32)[None, :],
+                         [meta or {}])
+            if save:
+                self.save()
+
+    def query(self, vector, k=10, exclude=None, probe=True):
+        # k most similar tracks as (audio hash, similarity, meta), best first
+        # candidates: same bucket in any table (+ buckets one bit away)
+        with self._lock:
+            self._refresh()
+            if not self.ids:
+                return []
+            vector = np.asarray(vector, dtype=np.float32)
+            codes = self._codes(vector[None, :])[:, 0]
+            candidates = set()
+            for table, code in enumerate(codes):
+                probes = [code] + ([code ^ (1 << b) for b in range(N_BITS)] if probe else [])
+                for c in probes:
+                    candidates.update(self._buckets[table].get(int(c), ()))
+            candidates.discard(self._rows.get(exclude))
+            if len(candidates) < k:  # sparse buckets --> exact search
+                candidates = set(range(len(self.ids))) - {self._rows.get(exclude)}
+            rows = np.fromiter(candidates, dtype=np.int64)
+            scores = self.vectors[rows] @ vector
+            best = np.argsort(-scores)[:k]
+            return [(self.ids[rows[i]], float(scores[i]), self.meta[rows[i]]) for i in best]
+
+    def similar(self, audio_hash, k=10):
+        # neighbours of an already indexed track
+        with self._lock:
+            self._refresh()
+            if audio_hash not in self._rows:
+                return []
+            return self.query(self.vectors[self._rows[audio_hash]], k, exclude=audio_hash)
+
+    def save(self):
+        # atomic replace, the buckets are rebuilt from the vectors on load
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f'{self.path}.{os.getpid()}.tmp.npz'
+            np.savez(tmp_path, vectors=self.vectors, ids=np.asarray(self.ids, dtype=str),
+                     meta=np.asarray(json.dumps(self.meta)), version=EMBEDDING_VERSION)
+            os.replace(tmp_path, self.path)
+            self._loaded_mtime = os.path.getmtime(self.path)
+
+    def _refresh(self):
+        # (re)load the index file if it was written by another process,
+        # entries only known in this process are kept
+        try:
+            mtime = os.path.getmtime(self.path)
+        except FileNotFoundError:
+            return
+        if mtime == self._loaded_mtime:
+            return
+        try:
+            with np.load(self.path) as npz:
+                if int(npz['version']) != EMBEDDING_VERSION:
+                    return  # outdated layout --> rebuilt as tracks are analysed
+                vectors, ids = npz['vectors'], npz['ids'].tolist()
+                meta = json.loads(str(npz['meta']))
+        except (OSError, ValueError, KeyError):  # corrupted index file
+            return
+        local_ids, local_vectors, local_meta = self.ids, self.vectors.copy(), self.meta
+        self._clear()
+        if ids:
+            self._insert(ids, vectors.astype(np.float32), meta)
+        unsaved = [i for i, audio_hash in enumerate(local_ids) if audio_hash not in self._rows]
+        if unsaved:
+            self._insert([local_ids[i] for i in unsaved], local_vectors[unsaved],
+                         [local_meta[i] for i in unsaved])
+        self._loaded_mtime = mtime
+
+
+# module level instance --> shared by the app, the api and batch jobs
+similarity_index = SimilarityIndex()
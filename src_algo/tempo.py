@@ -0,0 +1,88 @@
+# Tempo Engine - fast provisional BPM with optional full multifeature result
+# benchmark: python -m src_algo.tempo <folder> (speed & agreement of engines)
+
+import sys
+import time
+import argparse
+
+import librosa
+import essentia.standard as es
+
+from src_algo.audio_asset import AudioAsset
+
+ENGINES = ['autocorr', 'degara', 'multifeature']
+FAST_ENGINE = 'degara'  # provisional BPM, also yields a beat grid
+FULL_ENGINE = 'multifeature'  # refined BPM, slowest stage per upload
+AUTOCORR_SR = 11025  # onset envelope of a downsampled mono signal
+AUTOCORR_HOP = 128
+
+
+def autocorr_bpm(y, sr):
+    # onset envelope autocorrelation on the downsampled signal
+    if sr != AUTOCORR_SR:
+        y = librosa.resample(y, orig_sr=sr, target_sr=AUTOCORR_SR)
+    onset_env = librosa.onset.onset_strength(y=y, sr=AUTOCORR_SR, hop_length=AUTOCORR_HOP)
+    tempo = librosa.feature.tempo(onset_envelope=onset_env, sr=AUTOCORR_SR,
+                                  hop_length=AUTOCORR_HOP)
+    return float(tempo[0])
+
+
+def estimate_bpm(es_audio, engine=FAST_ENGINE, sr=44100):
+    # Input: mono float32 signal (44100 Hz for the essentia engines)
+    if engine == 'autocorr':
+        return autocorr_bpm(es_audio, sr)
+    bpm, _, _, _, _ = es.RhythmExtractor2013(method=engine)(es_audio)
+    return float(bpm)
+
+
+def bpm_agreement(bpm, reference, tolerance=0.02):
+    # 'exact' within tolerance, 'octave' for double/half tempo, else 'none'
+    if reference <= 0 or bpm <= 0:
+        return 'none'
+    if abs(bpm - reference) / reference <= tolerance:
+        return 'exact'
+    for factor in (2.0, 0.5, 3.0, 1 / 3):
+        if abs(bpm * factor - reference) / reference <= tolerance:
+            return 'octave'
+    return 'none'
+
+
+def benchmark(paths, engines=ENGINES, reference=FULL_ENGINE):
+    # runtime and agreement of every engine vs the reference engine
+    stats = {engine: {'seconds': 0.0, 'exact': 0, 'octave': 0, 'none': 0}
+             for engine in engines}
+    for path in paths:
+        try:
+            es_audio = AudioAsset(path).essentia_mono()
+        except Exception as e:  # unreadable file --> not part of the benchmark
+            print(f'skipped {path}: {e}', file=sys.stderr)
+            continue
+        results = {}
+        for engine in engines:
+            start = time.perf_counter()
+            results[engine] = estimate_bpm(es_audio, engine)
+            stats[engine]['seconds'] += time.perf_counter() - start
+        for engine in engines:
+            stats[engine][bpm_agreement(results[engine], results[reference])] += 1
+        print(path, {e: round(b, 1) for e, b in results.items()}, file=sys.stderr)
+    return stats
+
+
+def main(argv=None):
+    from src_algo.batch import find_audio_files  # same file discovery as batch
+
+    parser = argparse.ArgumentParser(description='beat inspect tempo benchmark')
+    parser.add_argument('folder', help='folder that is searched for audio files')
+    args = parser.parse_args(argv)
+
+    paths = list(find_audio_files(args.folder))
+    stats = benchmark(paths)
+    print(f'{"engine":<14}{"sec/file":>10}{"exact":>8}{"octave":>8}{"none":>8}')
+    for engine, s in stats.items():
+        analysed = max(s['exact'] + s['octave'] + s['none'], 1)
+        print(f'{engine:<14}{s["seconds"] / analysed:>10.3f}'
+              f'{s["exact"]:>8}{s["octave"]:>8}{s["none"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
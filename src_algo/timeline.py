@@ -0,0 +1,77 @@
+# Time-resolved Key & Tempo Map - analysis over overlapping windows of the
+# already decoded mono signal, or streamed from the source (the whole
+# decoded signal is then never held in memory)
+
+import numpy as np
+import soundfile as sf
+import librosa
+import essentia.standard as es
+
+import src_algo.detect_keyscale as detect_keyscale
+
+ESSENTIA_SR = 44100
+WINDOW_SEC = 20.0  # analysis window length
+HOP_SEC = 10.0  # window step --> 50% overlap
+
+
+def signal_windows(y, window_sec=WINDOW_SEC, hop_sec=HOP_SEC, sr=ESSENTIA_SR):
+    # Input: mono float32 signal at sr
+    # yields (start sec, window) as zero-copy views, same windows as iter_windows
+    blocksize, hop = int(window_sec * sr), int(hop_sec * sr)
+    start = 0
+    while True:
+        yield start / sr, y[start:start + blocksize]
+        if start + blocksize >= len(y):
+            break  # last (partial) window reached
+        start += hop
+
+
+def iter_windows(source, window_sec=WINDOW_SEC, hop_sec=HOP_SEC, sr=ESSENTIA_SR):
+    # Input: file path or file-like object
+    # yields (start sec, mono float32 window at sr) block by block
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    info = sf.info(source)
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    blocksize = int(window_sec * info.samplerate)
+    overlap = blocksize - int(hop_sec * info.samplerate)
+    start = 0
+    for block in sf.blocks(source, blocksize=blocksize, overlap=overlap,
+                           dtype='float32', always_2d=True):
+        y = block.mean(axis=1, dtype=np.float32)  # mono downmix per window
+        if info.samplerate != sr:
+            y = librosa.resample(y, orig_sr=info.samplerate, target_sr=sr)
+        yield start / info.samplerate, np.ascontiguousarray(y, dtype=np.float32)
+        if len(block) < blocksize:
+            break  # last (partial) window reached
+        start += blocksize - overlap
+
+
+def analyse_window(y, profile_type='diatonic', sr=ESSENTIA_SR):
+    # local key, key strength and tempo of one window
+    chroma = detect_keyscale.mean_hpcp(y)
+    key, scale, strength, _ = detect_keyscale.key_from_chroma(chroma, profile_type)
+    bpm = 0.0
+    if len(y) >= 4 * sr:  # tempo needs a few beats
+        bpm, _, _, _, _ = es.RhythmExtractor2013(method='degara')(y)
+    return key, scale, float(strength), float(bpm)
+
+
+def key_tempo_map(windows, profile_type='diatonic', analyse=analyse_window):
+    # per segment key, key strength and local tempo of the whole track
+    # Input: (start sec, mono window) pairs (signal_windows or iter_windows)
+    # analyse: runs analyse_window, e.g. in a worker process
+    segments = {'start': [], 'end': [], 'key': [], 'scale': [],
+                'strength': [], 'bpm': []}
+    for start, y in windows:
+        key, scale, strength, bpm = analyse(y, profile_type)
+        segments['start'].append(start)
+        segments['end'].append(start + len(y) / ESSENTIA_SR)
+        segments['key'].append(key)
+        segments['scale'].append(scale)
+        segments['strength'].append(strength)
+        segments['bpm'].append(bpm)
+    for name in ('start', 'end', 'strength', 'bpm'):  # compact numeric arrays
+        segments[name] = np.array(segments[name], dtype=np.float32)
+    return segments
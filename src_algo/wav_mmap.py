@@ -0,0 +1,155 @@
+# Memory-mapped WAV - uncompressed WAV/PCM files are not decoded up front,
+# the data chunk is mapped and only the requested frame ranges are converted
+# to float32 --> specs come from the header, pages are loaded on access
+# (np.frombuffer on an mmap of the file, so converted pages can be released)
+
+import os
+import mmap
+import struct
+
+import numpy as np
+
+WAVE_FORMAT_PCM, WAVE_FORMAT_FLOAT, WAVE_FORMAT_EXTENSIBLE = 0x0001, 0x0003, 0xFFFE
+# (format tag, bits per sample) --> (soundfile subtype, numpy sample dtype)
+SAMPLE_FORMATS = {(WAVE_FORMAT_PCM, 8): ('PCM_U8', 'u1'),
+                  (WAVE_FORMAT_PCM, 16): ('PCM_16', '<i2'),
+                  (WAVE_FORMAT_PCM, 24): ('PCM_24', None),  # 3 byte samples
+                  (WAVE_FORMAT_PCM, 32): ('PCM_32', '<i4'),
+                  (WAVE_FORMAT_FLOAT, 32): ('FLOAT', '<f4'),
+                  (WAVE_FORMAT_FLOAT, 64): ('DOUBLE', '<f8')}
+CHUNK = struct.Struct('<4sI')
+
+
+def _parse_header(f):
+    # walk the RIFF/RF64 chunks up to the data chunk
+    # returns (format tag, channels, sample rate, bits, data offset, data bytes)
+    head = f.read(12)
+    if len(head) < 12:
+        return None
+    riff, _, wave = struct.unpack('<4sI4s', head)
+    if riff not in (b'RIFF', b'RF64') or wave != b'WAVE':
+        return None
+    fmt, rf64_data_bytes = None, None
+    while True:
+        header = f.read(CHUNK.size)
+        if len(header) < CHUNK.size:
+            return None  # no data chunk
+        chunk_id, size = CHUNK.unpack(header)
+        if chunk_id == b'data':
+            if fmt is None:
+                return None
+            if rf64_data_bytes is not None and size == 0xFFFFFFFF:
+                size = rf64_data_bytes  # > 4 GB data chunk of RF64 files
+            return fmt + (f.tell(), size)
+        body = f.read(size + size % 2)  # chunks are padded to even sizes
+        if chunk_id == b'fmt ' and size >= 16:
+            tag, channels, sr, _, _, bits = struct.unpack_from('<HHIIHH', body)
+            if tag == WAVE_FORMAT_EXTENSIBLE and size >= 40:
+                tag = struct.unpack_from('<H', body, 24)[0]  # sub format guid
+            fmt = (tag, channels, sr, bits)
+        elif chunk_id == b'ds64' and size >= 16:
+            rf64_data_bytes = struct.unpack_from('<Q', body, 8)[0]
+
+
+class MappedWav:
+    # (frames, channels) float32 signal backed by the mapped data chunk
+    # row slices data[start:end] convert just that range --> usable in place
+    # of the decoded buffer by blockwise consumers (e.g. src_algo.loudness)
+
+    ndim = 2
+    dtype = np.dtype(np.float32)
+
+    def __init__(self, raw, sr, channels, subtype, mapping=None, offset=0):
+        self.raw, self.sr, self.channels, self.subtype = raw, sr, channels, subtype
+        self.frames = len(raw)
+        self._mapping, self._offset = mapping, offset  # mmap of the whole file
+        self._frame_bytes = raw.itemsize * int(np.prod(raw.shape[1:]))
+
+    def __len__(self):
+        return self.frames
+
+    @property
+    def shape(self):
+        return (self.frames, self.channels)
+
+    @property
+    def nbytes(self):
+        # process memory held by the signal: the upload buffer it views,
+        # pages of a mapped file belong to the page cache instead
+        return 0 if self._mapping is not None else self.raw.nbytes
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice) or index.step not in (None, 1):
+            raise TypeError('mapped wav data only supports contiguous row slices')
+        start, stop, _ = index.indices(self.frames)
+        return self.read(start, stop)
+
+    def read(self, start, stop):
+        # frames [start, stop) as float32 (frames, channels), same scaling
+        # as soundfile: integer samples / 2 ** (bits - 1)
+        stop = max(start, stop)
+        y = self._convert(self.raw[start:stop])
+        self._release(start, stop)
+        return y
+
+    def _convert(self, raw):
+        if self.subtype == 'PCM_24':  # 3 little endian bytes, sign extended
+            b = raw.astype(np.int32)
+            x = ((b[..., 0] << 8) | (b[..., 1] << 16) | (b[..., 2] << 24)) >> 8
+            return x.astype(np.float32) * np.float32(2.0 ** -23)
+        if self.subtype == 'PCM_U8':
+            return (raw.astype(np.float32) - 128.0) * np.float32(2.0 ** -7)
+        if raw.dtype.kind == 'i':
+            return raw.astype(np.float32) * np.float32(2.0 ** (1 - 8 * raw.dtype.itemsize))
+        return raw.astype(np.float32)
+
+    def _release(self, start, stop):
+        # drop the converted pages from the process again (they stay in the
+        # page cache) --> resident memory stays at a few blocks for any length
+        if self._mapping is None or not hasattr(mmap, 'MADV_DONTNEED'):
+            return
+        lo = self._offset + start * self._frame_bytes
+        hi = self._offset + stop * self._frame_bytes
+        lo -= lo % mmap.PAGESIZE
+        if hi > lo:
+            self._mapping.madvise(mmap.MADV_DONTNEED, lo, hi - lo)
+
+
+def open_wav(source):
+    # Input: file path or in-memory file-like (BytesIO), None for anything
+    # that is not an uncompressed WAV --> decoded by libsndfile instead
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            header = _parse_header(f)
+            file_bytes = os.fstat(f.fileno()).st_size
+    elif hasattr(source, 'getbuffer'):
+        source.seek(0)
+        header = _parse_header(source)
+        file_bytes = source.getbuffer().nbytes
+        source.seek(0)
+    else:
+        return None
+    if header is None:
+        return None
+    tag, channels, sr, bits, offset, data_bytes = header
+    if (tag, bits) not in SAMPLE_FORMATS or not channels:
+        return None
+    subtype, dtype = SAMPLE_FORMATS[(tag, bits)]
+    frame_bytes = channels * bits // 8
+    frames = min(data_bytes, file_bytes - offset) // frame_bytes  # truncated files
+    if frames <= 0:
+        return None
+
+    if dtype is None:  # 24 bit --> bytes per sample as last axis
+        dtype, shape = np.uint8, (frames, channels, 3)
+    else:
+        shape = (frames, channels)
+    count = int(np.prod(shape))
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:  # the mapping stays valid after close
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        raw = np.frombuffer(mapping, dtype=dtype, offset=offset, count=count).reshape(shape)
+        return MappedWav(raw, sr, channels, subtype, mapping, offset)
+    # upload already in memory --> zero-copy view of its bytes
+    raw = np.frombuffer(source.getbuffer(), dtype=dtype, offset=offset, count=count)
+    return MappedWav(raw.reshape(shape), sr, channels, subtype)
@@ -9,26 +9,68 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as tkr
 # has classes for tick-locating and -formatting
 
+import io
+
+import src_algo.features as features  # min/max waveform envelope levels
+import src_algo.loudness as bs1770  # loudness series window sizes
+from src_algo.analysis_cache import LRUCache, content_hash
+
 streamlit_dark = 'rgb(15,17,22)'  # #0F1116' default dark theme
 
-def numfmt(x, pos):
-    # your custom formatter function: divide by 2
-    s = '{}'.format(x / 2)
-    return s
+# plotting style, applied per figure instead of mutating global rcParams
+PLOT_THEME = 'dark'
+PLOT_SIZE = (8, 3)  # inches
+PLOT_STYLE = {'xtick.labelsize': 9, 'ytick.labelsize': 9, 'axes.labelsize': 10,
+              'figure.dpi': 400, 'text.color': 'white'}
+
+# rendered png bytes per (track hash, plot type, size, theme)
+plot_cache = LRUCache(max_bytes=64 * 1024 * 1024)
+
+
+def _render_png(build_figure, *args, style=PLOT_STYLE):
+    # build a figure using the shared style and rasterize it to png bytes
+    with plt.rc_context(style):
+        fig = build_figure(*args)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', transparent=True)
+    plt.close(fig)  # free the figure, only the png bytes are kept
+    return buffer.getvalue()
+
+
+def _show_cached(plot_type, audio_hash, build_figure, *args):
+    # serve the rendered image from the plot cache on streamlit reruns
+    key = (audio_hash, plot_type, PLOT_SIZE, PLOT_STYLE['figure.dpi'], PLOT_THEME)
+    if audio_hash is None:  # unknown content --> render without caching
+        png = _render_png(build_figure, *args)
+    else:
+        png = plot_cache.get_or_compute(key, lambda: _render_png(build_figure, *args))
+    st.image(png, width='stretch')
 
-def rms_spectrum(times, rms):
 
-    # global plotting settings
-    plt.rc('xtick', labelsize=9)
-    plt.rc('ytick', labelsize=9)
-    plt.rc('axes', labelsize=10)
-    plt.rcParams['figure.dpi'] = 400
-    plt.rcParams['text.color'] = 'white'
+def rms_spectrum(times, rms, audio_hash=None):
+    _show_cached('rms', audio_hash, _rms_figure, times, rms)
+
+
+def amp_spectrum(envelope, audio_hash=None, beats=None):
+    # Input: min/max envelope pyramid (src_algo.features.wave_envelope)
+    # optional beat positions [sec] drawn as beat grid markers
+    # the beat grid is part of the key (provisional vs refined rhythm)
+    plot_type = 'amp' if beats is None else (
+        'amp_beats', content_hash(np.ascontiguousarray(beats, dtype=np.float32)))
+    _show_cached(plot_type, audio_hash, _amp_figure, envelope, beats)
+
+
+def lufs_spectrum(loudness, audio_hash=None):
+    # Input: BS.1770 loudness timeline (src_algo.loudness.loudness_timeline)
+    _show_cached('lufs', audio_hash, _lufs_figure, loudness)
+
+
+def _rms_figure(times, rms):
 
     fig, ax2 = plt.subplots(1)
     fig.patch.set_facecolor('black')
     fig.patch.set_alpha(0.0)
-    fig.set_size_inches(8, 3, forward=True)
+    fig.set_size_inches(*PLOT_SIZE, forward=True)
 
     ax2.vlines(x=[0], ymin=-1, ymax=1, colors='lightgrey', ls='--', lw=0.75)
     ax2.axhline(y=1, color='#e3fc03', linestyle='--', lw=0.75)
@@ -56,28 +98,16 @@ def rms_spectrum(times, rms):
     ax2.spines['right'].set_visible(False)      # Hide the right and top spines
     # ax2.spines['bottom'].set_visible(False)     # Hide the right and bottom spines
 
-    # change ax2 xlabels to be half the value
-    yfmt = tkr.FuncFormatter(numfmt)
-    # create your custom formatter function
-    ax2.xaxis.set_major_formatter(yfmt)
-
     plt.tight_layout()
-    st.pyplot(fig)
+    return fig
 
 
-def amp_spectrum(y, sr):
-
-    # global plotting settings
-    plt.rc('xtick', labelsize=9)
-    plt.rc('ytick', labelsize=9)
-    plt.rc('axes', labelsize=10)
-    plt.rcParams['figure.dpi'] = 400
-    plt.rcParams['text.color'] = 'white'
+def _amp_figure(envelope, beats=None):
 
     fig, ax1 = plt.subplots(1)
     fig.patch.set_facecolor('black')
     fig.patch.set_alpha(0.0)
-    fig.set_size_inches(8, 3, forward=True)
+    fig.set_size_inches(*PLOT_SIZE, forward=True)
 
     # GUIDELINES multiple lines all full height
     ax1.vlines(x=[0], ymin=-1, ymax=1, colors='lightgrey', ls='--', lw=0.75)
@@ -86,13 +116,21 @@ def amp_spectrum(y, sr):
     ax1.axhline(y=1.0, color='#e3fc03', linestyle='--', lw=0.75)
     ax1.axhline(y=-1.0, color='#e3fc03', linestyle='--', lw=0.75)
 
-    # AX1 wavshow overview spectrogram
-    librosa.display.waveshow(y, sr, ax=ax1, color='lightgrey', x_axis='time', label='Time [min]')
+    # AX1 waveform overview drawn from the envelope level matching the
+    # output pixel width --> render time independent of the track length
+    pixel_width = int(fig.get_figwidth() * plt.rcParams['figure.dpi'])
+    block, mins, maxs = features.envelope_level(envelope, pixel_width)
+    times = (np.arange(len(mins)) + 0.5) * block / envelope['sr']
+    ax1.fill_between(times, mins, maxs, color='lightgrey', lw=0, label='Time [min]')
+    ax1.xaxis.set_major_formatter(librosa.display.TimeFormatter(lag=False))
+    if beats is not None and len(beats):  # beat grid from the rhythm extraction
+        ax1.vlines(x=beats, ymin=-1.05, ymax=1.05, colors='#e3fc03', lw=0.2, alpha=0.6)
 
     ax1.patch.set_facecolor('black')
     ax1.patch.set_alpha(0.0)
     ax1.set_ylabel('Amplitude')
     ax1.set_xlabel('Time [minutes:sec]')
+    ax1.set_xlim([0, len(mins) * block / envelope['sr']])
     ax1.set_ylim([-1.1, 1.1])
     ax1.xaxis.label.set_color('white')        #setting up X-axis label color to yellow
     ax1.yaxis.label.set_color('white')          #setting up Y-axis label color to blue
@@ -106,17 +144,62 @@ def amp_spectrum(y, sr):
     ax1.spines['top'].set_visible(False)     # Hide the right and top spines
 
     plt.tight_layout()
-    st.pyplot(fig)
+    return fig
+
+
+def _lufs_figure(loudness):
+
+    fig, ax3 = plt.subplots(1)
+    fig.patch.set_facecolor('black')
+    fig.patch.set_alpha(0.0)
+    fig.set_size_inches(*PLOT_SIZE, forward=True)
+
+    # GUIDELINES integrated loudness & EBU R128 target level
+    if np.isfinite(loudness['integrated']):  # -inf for silence
+        ax3.axhline(y=loudness['integrated'], color='#e3fc03', linestyle='--', lw=0.75)
+    ax3.axhline(y=-23, color='lightgrey', linestyle='--', lw=0.75)
+
+    # AX3 momentary (400 ms) & short-term (3 sec) loudness over time
+    # clips shorter than a window have no (momentary/short-term) values
+    momentary, short_term = loudness['momentary'], loudness['short_term']
+    if len(momentary):
+        ax3.plot(bs1770.series_times(momentary, bs1770.MOMENTARY_STEPS, loudness['step_sec']),
+                 momentary, label='Momentary', color='lightgrey', lw=0.5)
+    if len(short_term):
+        ax3.plot(bs1770.series_times(short_term, bs1770.SHORT_TERM_STEPS, loudness['step_sec']),
+                 short_term, label='Short-term', color='#e3fc03', lw=1)
+    ax3.xaxis.set_major_formatter(librosa.display.TimeFormatter(lag=False))
+
+    ax3.patch.set_facecolor('black')
+    ax3.patch.set_alpha(0.0)
+    ax3.set_ylabel('Loudness [LUFS]')
+    ax3.set_xlabel('Time [minutes:sec]')
+    lowest = momentary.min() if len(momentary) else -30
+    ax3.set_ylim(bottom=max(min(lowest, -30) - 3, -60), top=0)
+    if len(momentary) or len(short_term):
+        ax3.legend(loc='lower right', fontsize=7, frameon=False)
+    ax3.xaxis.label.set_color('white')        #setting up X-axis label color to yellow
+    ax3.yaxis.label.set_color('white')          #setting up Y-axis label color to blue
+    ax3.tick_params(axis='x', colors='white')    #setting up X-axis tick color to red
+    ax3.tick_params(axis='y', colors='white')  #setting up Y-axis tick color to black
+    ax3.spines['left'].set_color('white')        # setting up Y-axis tick color to red
+    ax3.spines['top'].set_color('white')         #setting up above X-axis tick color to red
+    ax3.spines['right'].set_color('white')        # setting up Y-axis tick color to red
+    ax3.spines['bottom'].set_color('white')         #setting up above X-axis tick color to red
+    ax3.spines['right'].set_visible(False)   # Hide the right and top spines
+    ax3.spines['top'].set_visible(False)     # Hide the right and top spines
+
+    plt.tight_layout()
+    return fig
 
 
 def amprms_spectrum(y, sr, times, rms):
+    png = _render_png(_amprms_figure, y, sr, times, rms,
+                      style={**PLOT_STYLE, 'axes.labelsize': 9})
+    st.image(png, width='stretch')
+
 
-    # global plotting settings
-    plt.rc('xtick', labelsize=9)
-    plt.rc('ytick', labelsize=9)
-    plt.rc('axes', labelsize=9)
-    plt.rcParams['figure.dpi'] = 400
-    plt.rcParams['text.color'] = 'white'
+def _amprms_figure(y, sr, times, rms):
 
     fig, (ax1, ax2) = plt.subplots(2)
     fig.patch.set_facecolor('black')
@@ -175,4 +258,4 @@ def amprms_spectrum(y, sr, times, rms):
     ax2.spines['bottom'].set_visible(False)     # Hide the right and bottom spines
 
     plt.tight_layout()
-    st.pyplot(fig)
+    return fig
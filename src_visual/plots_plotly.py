@@ -12,30 +12,20 @@ import plotly.graph_objects as go
 
 streamlit_dark = 'rgb(15,17,22)'  # #0F1116' default dark theme
 
-def melspectrogram_plotly3d(y, sr, sec_offset, mark_peaks, camera_mode_3d, zvalue_treshold):
-
-    mels_count = 300
-    max_freq = 32768  # Hz
+def melspectrogram_plotly3d(mel_data, duration, sec_offset, mark_peaks, camera_mode_3d, zvalue_treshold):
+    # Input: mel spectrogram in dB (src_algo.features.FeatureGraph.mel_db)
+    # already reduced to the point budget (src_algo.features.pyramid_slice)
+    mel_data = np.asarray(mel_data, dtype=np.float32)
     # zvalue_treshold = -15  # dB
     # mark_peaks = False
     # camera_mode_3d = False
 
-    # calc playtime duration in seconds
-    duration = librosa.get_duration(y=y, sr=sr)
-
-    # Passing through arguments to the Mel filters
-    S = librosa.feature.melspectrogram(y=y, sr=sr, n_mels=mels_count, fmax=max_freq)
-    # decibel is measured using the np.max(S) value as a reference point
-    mel_data = librosa.power_to_db(S, ref=np.max) # convert spectrum to dB
-
-    # data for plotting spectrogram with log scale instead of mel
-    log_data = librosa.amplitude_to_db(np.abs(librosa.stft(y)), ref=np.max)
-
     # caculate sample points for adequate tick labels in plot
     xvalues_count, yvalues_count = len(mel_data[0]), len(mel_data)  # 764, 200
 
-    # flat surface on level of zvalue treshold
-    flat_data = np.full((len(mel_data), len(mel_data[0])), zvalue_treshold)
+    # flat surface on level of zvalue treshold (4 corner points are enough)
+    flat_data = np.full((2, 2), zvalue_treshold)
+    flat_x, flat_y = [0, xvalues_count - 1], [0, yvalues_count - 1]
 
 
     # PLOT CONFIG
@@ -105,7 +95,7 @@ def melspectrogram_plotly3d(y, sr, sec_offset, mark_peaks, camera_mode_3d, zvalu
                                          #hovertemplate='<br>%{x} sec<br>%{y} Hz<br>%{z} dB<extra></extra>',
                                          hovertemplate='<br>%{z} dB<extra></extra>',
                                          opacity=1, contours=contours), # colormapped opaque surface
-                              go.Surface(z=flat_data, name=f'<br>amplitude<br>treshold',
+                              go.Surface(z=flat_data, x=flat_x, y=flat_y, name=f'<br>amplitude<br>treshold',
                                          # name=f'<br>amplitude<br>treshold<br>{zvalue_treshold} dB',
                                          showscale=False, colorscale=colorscale_flat,
                                          # hovertemplate='<br>%{x} sec<br>%{y} Hz<br>%{z} dB',
@@ -171,3 +161,33 @@ def melspectrogram_plotly3d(y, sr, sec_offset, mark_peaks, camera_mode_3d, zvalu
     fig.data[0].colorbar.len = 0.6  # colorbar length
 
     st.plotly_chart(fig, use_container_width=True, config=config)
+
+
+def key_tempo_timeline(segments):
+    # Input: per segment key & tempo map (src_algo.timeline.key_tempo_map)
+    mids = (np.asarray(segments['start']) + np.asarray(segments['end'])) / 2
+    labels = [f'{k}-{s}' for k, s in zip(segments['key'], segments['scale'])]
+    bpms = np.round(np.asarray(segments['bpm'], dtype=np.float32), 1)
+
+    # only annotate the segments where the detected key changes
+    changes = [i for i in range(len(labels)) if i == 0 or labels[i] != labels[i - 1]]
+
+    fig = go.Figure(data=[go.Scatter(x=mids, y=bpms, mode='lines+markers',
+                                     line=dict(color='#e3fc03', shape='spline'),
+                                     text=labels,
+                                     hovertemplate='%{x:.0f} sec<br>%{y} BPM'
+                                                   '<br>%{text}<extra></extra>'),
+                          go.Scatter(x=mids[changes], y=bpms[changes], mode='text',
+                                     text=[labels[i] for i in changes],
+                                     textposition='top center', hoverinfo='skip',
+                                     textfont=dict(color='white'))])
+
+    fig.update_layout(autosize=True, height=220, showlegend=False,
+                      margin=dict(t=10, r=10, l=10, b=10),
+                      paper_bgcolor=streamlit_dark, plot_bgcolor=streamlit_dark,
+                      font_family='Arial', font_color='white',
+                      xaxis=dict(title='Time [secs]', gridcolor='rgb(055, 055, 055)'),
+                      yaxis=dict(title='Tempo [BPM]', gridcolor='rgb(055, 055, 055)'))
+
+    config = {'displayModeBar': False, 'displaylogo': False}
+    st.plotly_chart(fig, use_container_width=True, config=config)
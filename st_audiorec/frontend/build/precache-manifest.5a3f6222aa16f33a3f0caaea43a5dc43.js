@@ -1,23 +1,23 @@
 self.__precacheManifest = (self.__precacheManifest || []).concat([
   {
-    "revision": "320d2a61b8ae35ac24d954cf8d0f64b2",
+    "revision": "c619dd6b6e0bff286504887b7bcb933f",
     "url": "./index.html"
   },
   {
-    "revision": "76ee6ece73a0c7699273",
+    "revision": "134343d66ee3c26054e2",
     "url": "./static/css/2.bfbf028b.chunk.css"
   },
   {
-    "revision": "76ee6ece73a0c7699273",
-    "url": "./static/js/2.0c513dfc.chunk.js"
+    "revision": "134343d66ee3c26054e2",
+    "url": "./static/js/2.240923d3.chunk.js"
   },
   {
     "revision": "3fc7fb5bfeeec1534560a2c962e360a7",
-    "url": "./static/js/2.0c513dfc.chunk.js.LICENSE.txt"
+    "url": "./static/js/2.240923d3.chunk.js.LICENSE.txt"
   },
   {
-    "revision": "191ef136966bea176fd9",
-    "url": "./static/js/main.2991aee0.chunk.js"
+    "revision": "dbe612113d6af6342736",
+    "url": "./static/js/main.4006c3e4.chunk.js"
   },
   {
     "revision": "7c26bca7e16783d14d15",
@@ -14,7 +14,7 @@
 importScripts("https://storage.googleapis.com/workbox-cdn/releases/4.3.1/workbox-sw.js");
 
 importScripts(
-  "./precache-manifest.08a3c4d6ab059a0ce1480031e6a8cc50.js"
+  "./precache-manifest.5a3f6222aa16f33a3f0caaea43a5dc43.js"
 );
 
 self.addEventListener('message', (event) => {
@@ -0,0 +1,3 @@
+/*! For license information please see 2.240923d3.chunk.js.LICENSE.txt */
+(this.webpackJsonpstreamlit_component_template=this.webpackJsonpstreamlit_component_template||[]).push([[2],[function(e,t,n){"use strict";function r(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}n.d(t,"a",(function(){return r}))},function(e,t,n){"use strict";function r(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}function i(e,t,n){return t&&r(e.prototype,t),n&&r(e,n),e}n.d(t,"a",(function(){return i}))},function(e,t,n){"use strict";n.d(t,"a",(function(){return i}));var r=n(13);function i(e,t){if("function"!==typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=Object.create(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&Object(r.a)(e,t)}},function(e,t,n){"use strict";n.d(t,"a",(function(){return o}));var r=n(5),i=n(14),a=n(11);function o(e){return function(){var t,n=Object(r.a)(e);if(Object(i.a)()){var o=Object(r.a)(this).constructor;t=Reflect.construct(n,arguments,o)}else t=n.apply(this,arguments);return Object(a.a)(this,t)}}},function(e,t,n){e.exports=n(25)},function(e,t,n){"use strict";function r(e){return(r=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}n.d(t,"a",(function(){return r}))},function(e,t,n){"use strict";n.d(t,"a",(function(){return i}));var r=n(5);function i(e,t,n){return(i="undefined"!==typeof Reflect&&Reflect.get?Reflect.get:function(e,t,n){var i=function(e,t){for(;!Object.prototype.hasOwnProperty.call(e,t)&&null!==(e=Object(r.a)(e)););return e}(e,t);if(i){var a=Object.getOwnPropertyDescriptor(i,t);return a.get?a.get.call(n):a.value}})(e,t,n||e)}},function(e,t,n){"use strict";e.exports=n(19)},function(e,t,n){e.exports=n(26)()},function(e,t,n){"use strict";n.d(t,"b",(function(){return Sl})),n.d(t,"c",(function(){return Tl})),n.d(t,"a",(function(){return Ol}));var r={};n.r(r),n.d(r,"memcpy",(function(){return Fe})),n.d(r,"joinUint8Arrays",(function(){return Me})),n.d(r,"toArrayBufferView",(function(){return Ne})),n.d(r,"toInt8Array",(function(){return Ue})),n.d(r,"toInt16Array",(function(){return Pe})),n.d(r,"toInt32Array",(function(){return Re})),n.d(r,"toBigInt64Array",(function(){return ze})),n.d(r,"toUint8Array",(function(){return Ve})),n.d(r,"toUint16Array",(function(){return We})),n.d(r,"toUint32Array",(function(){return He})),n.d(r,"toBigUint64Array",(function(){return Ye})),n.d(r,"toFloat32Array",(function(){return $e})),n.d(r,"toFloat64Array",(function(){return Ke})),n.d(r,"toUint8ClampedArray",(function(){return Qe})),n.d(r,"toArrayBufferViewIterator",(function(){return Ge})),n.d(r,"toInt8ArrayIterator",(function(){return Je})),n.d(r,"toInt16ArrayIterator",(function(){return Ze})),n.d(r,"toInt32ArrayIterator",(function(){return Xe})),n.d(r,"toUint8ArrayIterator",(function(){return et})),n.d(r,"toUint16ArrayIterator",(function(){return tt})),n.d(r,"toUint32ArrayIterator",(function(){return nt})),n.d(r,"toFloat32ArrayIterator",(function(){return rt})),n.d(r,"toFloat64ArrayIterator",(function(){return it})),n.d(r,"toUint8ClampedArrayIterator",(function(){return at})),n.d(r,"toArrayBufferViewAsyncIterator",(function(){return ot})),n.d(r,"toInt8ArrayAsyncIterator",(function(){return st})),n.d(r,"toInt16ArrayAsyncIterator",(function(){return ct})),n.d(r,"toInt32ArrayAsyncIterator",(function(){return lt})),n.d(r,"toUint8ArrayAsyncIterator",(function(){return ft})),n.d(r,"toUint16ArrayAsyncIterator",(function(){return ht})),n.d(r,"toUint32ArrayAsyncIterator",(function(){return dt})),n.d(r,"toFloat32ArrayAsyncIterator",(function(){return pt})),n.d(r,"toFloat64ArrayAsyncIterator",(function(){return yt})),n.d(r,"toUint8ClampedArrayAsyncIterator",(function(){return vt})),n.d(r,"rebaseValueOffsets",(function(){return bt})),n.d(r,"compareArrayLike",(function(){return mt}));var i={};n.r(i),n.d(i,"getBool",(function(){return Zt})),n.d(i,"getBit",(function(){return Xt})),n.d(i,"setBool",(function(){return en})),n.d(i,"truncateBitmap",(function(){return tn})),n.d(i,"packBools",(function(){return nn})),n.d(i,"iterateBits",(function(){return rn})),n.d(i,"popcnt_bit_range",(function(){return an})),n.d(i,"popcnt_array",(function(){return on})),n.d(i,"popcnt_uint32",(function(){return un}));var a={};n.r(a),n.d(a,"uint16ToFloat64",(function(){return Ar})),n.d(a,"float64ToUint16",(function(){return Br}));var o={};n.r(o),n.d(o,"isArrowBigNumSymbol",(function(){return zr})),n.d(o,"bignumToString",(function(){return Pr})),n.d(o,"bignumToBigInt",(function(){return Rr})),n.d(o,"BN",(function(){return qr}));var u={};n.r(u),n.d(u,"clampIndex",(function(){return Fi})),n.d(u,"clampRange",(function(){return Mi})),n.d(u,"createElementComparator",(function(){return Pi}));var s={};n.r(s),n.d(s,"BaseInt64",(function(){return no})),n.d(s,"Uint64",(function(){return ro})),n.d(s,"Int64",(function(){return io})),n.d(s,"Int128",(function(){return ao}));var c=n(17),l=n.n(c),f=n(7),h=n.n(f),d=new WeakMap,p=new WeakMap;function y(e){var t=d.get(e);return console.assert(null!=t,"'this' is expected an Event object, but got",e),t}function v(e){null==e.passiveListener?e.event.cancelable&&(e.canceled=!0,"function"===typeof e.event.preventDefault&&e.event.preventDefault()):"undefined"!==typeof console&&"function"===typeof console.error&&console.error("Unable to preventDefault inside passive event listener invocation.",e.passiveListener)}function b(e,t){d.set(this,{eventTarget:e,event:t,eventPhase:2,currentTarget:e,canceled:!1,stopped:!1,immediateStopped:!1,passiveListener:null,timeStamp:t.timeStamp||Date.now()}),Object.defineProperty(this,"isTrusted",{value:!1,enumerable:!0});for(var n=Object.keys(t),r=0;r<n.length;++r){var i=n[r];i in this||Object.defineProperty(this,i,m(i))}}function m(e){return{get:function(){return y(this).event[e]},set:function(t){y(this).event[e]=t},configurable:!0,enumerable:!0}}function g(e){return{value:function(){var t=y(this).event;return t[e].apply(t,arguments)},configurable:!0,enumerable:!0}}function k(e){if(null==e||e===Object.prototype)return b;var t=p.get(e);return null==t&&(t=function(e,t){var n=Object.keys(t);if(0===n.length)return e;function r(t,n){e.call(this,t,n)}r.prototype=Object.create(e.prototype,{constructor:{value:r,configurable:!0,writable:!0}});for(var i=0;i<n.length;++i){var a=n[i];if(!(a in e.prototype)){var o="function"===typeof Object.getOwnPropertyDescriptor(t,a).value;Object.defineProperty(r.prototype,a,o?g(a):m(a))}}return r}(k(Object.getPrototypeOf(e)),e),p.set(e,t)),t}function w(e){return y(e).immediateStopped}function _(e,t){y(e).passiveListener=t}b.prototype={get type(){return y(this).event.type},get target(){return y(this).eventTarget},get currentTarget(){return y(this).currentTarget},composedPath:function(){var e=y(this).currentTarget;return null==e?[]:[e]},get NONE(){return 0},get CAPTURING_PHASE(){return 1},get AT_TARGET(){return 2},get BUBBLING_PHASE(){return 3},get eventPhase(){return y(this).eventPhase},stopPropagation:function(){var e=y(this);e.stopped=!0,"function"===typeof e.event.stopPropagation&&e.event.stopPropagation()},stopImmediatePropagation:function(){var e=y(this);e.stopped=!0,e.immediateStopped=!0,"function"===typeof e.event.stopImmediatePropagation&&e.event.stopImmediatePropagation()},get bubbles(){return Boolean(y(this).event.bubbles)},get cancelable(){return Boolean(y(this).event.cancelable)},preventDefault:function(){v(y(this))},get defaultPrevented(){return y(this).canceled},get composed(){return Boolean(y(this).event.composed)},get timeStamp(){return y(this).timeStamp},get srcElement(){return y(this).eventTarget},get cancelBubble(){return y(this).stopped},set cancelBubble(e){if(e){var t=y(this);t.stopped=!0,"boolean"===typeof t.event.cancelBubble&&(t.event.cancelBubble=!0)}},get returnValue(){return!y(this).canceled},set returnValue(e){e||v(y(this))},initEvent:function(){}},Object.defineProperty(b.prototype,"constructor",{value:b,configurable:!0,writable:!0}),"undefined"!==typeof window&&"undefined"!==typeof window.Event&&(Object.setPrototypeOf(b.prototype,window.Event.prototype),p.set(window.Event.prototype,b));var O=new WeakMap;function x(e){return null!==e&&"object"===typeof e}function j(e){var t=O.get(e);if(null==t)throw new TypeError("'this' is expected an EventTarget object, but got another value.");return t}function S(e,t){Object.defineProperty(e,"on".concat(t),function(e){return{get:function(){for(var t=j(this).get(e);null!=t;){if(3===t.listenerType)return t.listener;t=t.next}return null},set:function(t){"function"===typeof t||x(t)||(t=null);for(var n=j(this),r=null,i=n.get(e);null!=i;)3===i.listenerType?null!==r?r.next=i.next:null!==i.next?n.set(e,i.next):n.delete(e):r=i,i=i.next;if(null!==t){var a={listener:t,listenerType:3,passive:!1,once:!1,next:null};null===r?n.set(e,a):r.next=a}},configurable:!0,enumerable:!0}}(t))}function T(e){function t(){I.call(this)}t.prototype=Object.create(I.prototype,{constructor:{value:t,configurable:!0,writable:!0}});for(var n=0;n<e.length;++n)S(t.prototype,e[n]);return t}function I(){if(!(this instanceof I)){if(1===arguments.length&&Array.isArray(arguments[0]))return T(arguments[0]);if(arguments.length>0){for(var e=new Array(arguments.length),t=0;t<arguments.length;++t)e[t]=arguments[t];return T(e)}throw new TypeError("Cannot call a class as a function")}O.set(this,new Map)}I.prototype={addEventListener:function(e,t,n){if(null!=t){if("function"!==typeof t&&!x(t))throw new TypeError("'listener' should be a function or an object.");var r=j(this),i=x(n),a=(i?Boolean(n.capture):Boolean(n))?1:2,o={listener:t,listenerType:a,passive:i&&Boolean(n.passive),once:i&&Boolean(n.once),next:null},u=r.get(e);if(void 0!==u){for(var s=null;null!=u;){if(u.listener===t&&u.listenerType===a)return;s=u,u=u.next}s.next=o}else r.set(e,o)}},removeEventListener:function(e,t,n){if(null!=t)for(var r=j(this),i=(x(n)?Boolean(n.capture):Boolean(n))?1:2,a=null,o=r.get(e);null!=o;){if(o.listener===t&&o.listenerType===i)return void(null!==a?a.next=o.next:null!==o.next?r.set(e,o.next):r.delete(e));a=o,o=o.next}},dispatchEvent:function(e){if(null==e||"string"!==typeof e.type)throw new TypeError('"event.type" should be a string.');var t=j(this),n=e.type,r=t.get(n);if(null==r)return!0;for(var i=function(e,t){return new(k(Object.getPrototypeOf(t)))(e,t)}(this,e),a=null;null!=r;){if(r.once?null!==a?a.next=r.next:null!==r.next?t.set(n,r.next):t.delete(n):a=r,_(i,r.passive?r.listener:null),"function"===typeof r.listener)try{r.listener.call(this,i)}catch(o){"undefined"!==typeof console&&"function"===typeof console.error&&console.error(o)}else 3!==r.listenerType&&"function"===typeof r.listener.handleEvent&&r.listener.handleEvent(i);if(w(i))break;r=r.next}return _(i,null),function(e,t){y(e).eventPhase=t}(i,0),function(e,t){y(e).currentTarget=t}(i,null),!i.defaultPrevented}},Object.defineProperty(I.prototype,"constructor",{value:I,configurable:!0,writable:!0}),"undefined"!==typeof window&&"undefined"!==typeof window.EventTarget&&Object.setPrototypeOf(I.prototype,window.EventTarget.prototype);function E(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}function A(e,t){if(e){if("string"===typeof e)return E(e,t);var n=Object.prototype.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(n):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?E(e,t):void 0}}function B(e){if("undefined"===typeof Symbol||null==e[Symbol.iterator]){if(Array.isArray(e)||(e=A(e))){var t=0,n=function(){};return{s:n,n:function(){return t>=e.length?{done:!0}:{done:!1,value:e[t++]}},e:function(e){throw e},f:n}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var r,i,a=!0,o=!1;return{s:function(){r=e[Symbol.iterator]()},n:function(){var e=r.next();return a=e.done,e},e:function(e){o=!0,i=e},f:function(){try{a||null==r.return||r.return()}finally{if(o)throw i}}}}function D(e,t,n,r,i,a,o){try{var u=e[a](o),s=u.value}catch(c){return void n(c)}u.done?t(s):Promise.resolve(s).then(r,i)}function L(e){return function(){var t=this,n=arguments;return new Promise((function(r,i){var a=e.apply(t,n);function o(e){D(a,r,i,o,u,"next",e)}function u(e){D(a,r,i,o,u,"throw",e)}o(void 0)}))}}var C=n(0),F=n(1),M=n(4);function N(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e)){var n=[],r=!0,i=!1,a=void 0;try{for(var o,u=e[Symbol.iterator]();!(r=(o=u.next()).done)&&(n.push(o.value),!t||n.length!==t);r=!0);}catch(s){i=!0,a=s}finally{try{r||null==u.return||u.return()}finally{if(i)throw a}}return n}}(e,t)||A(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}function U(e){this.wrapped=e}function P(e){return new U(e)}function R(e){var t,n;function r(t,n){try{var a=e[t](n),o=a.value,u=o instanceof U;Promise.resolve(u?o.wrapped:o).then((function(e){u?r("return"===t?"return":"next",e):i(a.done?"return":"normal",e)}),(function(e){r("throw",e)}))}catch(s){i("throw",s)}}function i(e,i){switch(e){case"return":t.resolve({value:i,done:!0});break;case"throw":t.reject(i);break;default:t.resolve({value:i,done:!1})}(t=t.next)?r(t.key,t.arg):n=null}this._invoke=function(e,i){return new Promise((function(a,o){var u={key:e,arg:i,resolve:a,reject:o,next:null};n?n=n.next=u:(t=n=u,r(e,i))}))},"function"!==typeof e.return&&(this.return=void 0)}function z(e){return function(){return new R(e.apply(this,arguments))}}function V(e,t){var n={},r=!1;function i(n,i){return r=!0,i=new Promise((function(t){t(e[n](i))})),{done:!1,value:t(i)}}return"function"===typeof Symbol&&Symbol.iterator&&(n[Symbol.iterator]=function(){return this}),n.next=function(e){return r?(r=!1,e):i("next",e)},"function"===typeof e.throw&&(n.throw=function(e){if(r)throw r=!1,e;return i("throw",e)}),"function"===typeof e.return&&(n.return=function(e){return r?(r=!1,e):i("return",e)}),n}"function"===typeof Symbol&&Symbol.asyncIterator&&(R.prototype[Symbol.asyncIterator]=function(){return this}),R.prototype.next=function(e){return this._invoke("next",e)},R.prototype.throw=function(e){return this._invoke("throw",e)},R.prototype.return=function(e){return this._invoke("return",e)};var W={};function H(e,t,n){return t<=e&&e<=n}function Y(e){if(void 0===e)return{};if(e===Object(e))return e;throw TypeError("Could not convert argument to dictionary")}W.Offset,W.Table,W.SIZEOF_SHORT=2,W.SIZEOF_INT=4,W.FILE_IDENTIFIER_LENGTH=4,W.Encoding={UTF8_BYTES:1,UTF16_STRING:2},W.int32=new Int32Array(2),W.float32=new Float32Array(W.int32.buffer),W.float64=new Float64Array(W.int32.buffer),W.isLittleEndian=1===new Uint16Array(new Uint8Array([1,0]).buffer)[0],W.Long=function(e,t){this.low=0|e,this.high=0|t},W.Long.create=function(e,t){return 0==e&&0==t?W.Long.ZERO:new W.Long(e,t)},W.Long.prototype.toFloat64=function(){return(this.low>>>0)+4294967296*this.high},W.Long.prototype.equals=function(e){return this.low==e.low&&this.high==e.high},W.Long.ZERO=new W.Long(0,0),W.Builder=function(e){if(e)t=e;else var t=1024;this.bb=W.ByteBuffer.allocate(t),this.space=t,this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1},W.Builder.prototype.clear=function(){this.bb.clear(),this.space=this.bb.capacity(),this.minalign=1,this.vtable=null,this.vtable_in_use=0,this.isNested=!1,this.object_start=0,this.vtables=[],this.vector_num_elems=0,this.force_defaults=!1},W.Builder.prototype.forceDefaults=function(e){this.force_defaults=e},W.Builder.prototype.dataBuffer=function(){return this.bb},W.Builder.prototype.asUint8Array=function(){return this.bb.bytes().subarray(this.bb.position(),this.bb.position()+this.offset())},W.Builder.prototype.prep=function(e,t){e>this.minalign&&(this.minalign=e);for(var n=1+~(this.bb.capacity()-this.space+t)&e-1;this.space<n+e+t;){var r=this.bb.capacity();this.bb=W.Builder.growByteBuffer(this.bb),this.space+=this.bb.capacity()-r}this.pad(n)},W.Builder.prototype.pad=function(e){for(var t=0;t<e;t++)this.bb.writeInt8(--this.space,0)},W.Builder.prototype.writeInt8=function(e){this.bb.writeInt8(this.space-=1,e)},W.Builder.prototype.writeInt16=function(e){this.bb.writeInt16(this.space-=2,e)},W.Builder.prototype.writeInt32=function(e){this.bb.writeInt32(this.space-=4,e)},W.Builder.prototype.writeInt64=function(e){this.bb.writeInt64(this.space-=8,e)},W.Builder.prototype.writeFloat32=function(e){this.bb.writeFloat32(this.space-=4,e)},W.Builder.prototype.writeFloat64=function(e){this.bb.writeFloat64(this.space-=8,e)},W.Builder.prototype.addInt8=function(e){this.prep(1,0),this.writeInt8(e)},W.Builder.prototype.addInt16=function(e){this.prep(2,0),this.writeInt16(e)},W.Builder.prototype.addInt32=function(e){this.prep(4,0),this.writeInt32(e)},W.Builder.prototype.addInt64=function(e){this.prep(8,0),this.writeInt64(e)},W.Builder.prototype.addFloat32=function(e){this.prep(4,0),this.writeFloat32(e)},W.Builder.prototype.addFloat64=function(e){this.prep(8,0),this.writeFloat64(e)},W.Builder.prototype.addFieldInt8=function(e,t,n){(this.force_defaults||t!=n)&&(this.addInt8(t),this.slot(e))},W.Builder.prototype.addFieldInt16=function(e,t,n){(this.force_defaults||t!=n)&&(this.addInt16(t),this.slot(e))},W.Builder.prototype.addFieldInt32=function(e,t,n){(this.force_defaults||t!=n)&&(this.addInt32(t),this.slot(e))},W.Builder.prototype.addFieldInt64=function(e,t,n){!this.force_defaults&&t.equals(n)||(this.addInt64(t),this.slot(e))},W.Builder.prototype.addFieldFloat32=function(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat32(t),this.slot(e))},W.Builder.prototype.addFieldFloat64=function(e,t,n){(this.force_defaults||t!=n)&&(this.addFloat64(t),this.slot(e))},W.Builder.prototype.addFieldOffset=function(e,t,n){(this.force_defaults||t!=n)&&(this.addOffset(t),this.slot(e))},W.Builder.prototype.addFieldStruct=function(e,t,n){t!=n&&(this.nested(t),this.slot(e))},W.Builder.prototype.nested=function(e){if(e!=this.offset())throw new Error("FlatBuffers: struct must be serialized inline.")},W.Builder.prototype.notNested=function(){if(this.isNested)throw new Error("FlatBuffers: object serialization must not be nested.")},W.Builder.prototype.slot=function(e){this.vtable[e]=this.offset()},W.Builder.prototype.offset=function(){return this.bb.capacity()-this.space},W.Builder.growByteBuffer=function(e){var t=e.capacity();if(3221225472&t)throw new Error("FlatBuffers: cannot grow buffer beyond 2 gigabytes.");var n=t<<1,r=W.ByteBuffer.allocate(n);return r.setPosition(n-t),r.bytes().set(e.bytes(),n-t),r},W.Builder.prototype.addOffset=function(e){this.prep(W.SIZEOF_INT,0),this.writeInt32(this.offset()-e+W.SIZEOF_INT)},W.Builder.prototype.startObject=function(e){this.notNested(),null==this.vtable&&(this.vtable=[]),this.vtable_in_use=e;for(var t=0;t<e;t++)this.vtable[t]=0;this.isNested=!0,this.object_start=this.offset()},W.Builder.prototype.endObject=function(){if(null==this.vtable||!this.isNested)throw new Error("FlatBuffers: endObject called without startObject");this.addInt32(0);for(var e=this.offset(),t=this.vtable_in_use-1;t>=0&&0==this.vtable[t];t--);for(var n=t+1;t>=0;t--)this.addInt16(0!=this.vtable[t]?e-this.vtable[t]:0);this.addInt16(e-this.object_start);var r=(n+2)*W.SIZEOF_SHORT;this.addInt16(r);var i=0,a=this.space;e:for(t=0;t<this.vtables.length;t++){var o=this.bb.capacity()-this.vtables[t];if(r==this.bb.readInt16(o)){for(var u=W.SIZEOF_SHORT;u<r;u+=W.SIZEOF_SHORT)if(this.bb.readInt16(a+u)!=this.bb.readInt16(o+u))continue e;i=this.vtables[t];break}}return i?(this.space=this.bb.capacity()-e,this.bb.writeInt32(this.space,i-e)):(this.vtables.push(this.offset()),this.bb.writeInt32(this.bb.capacity()-e,this.offset()-e)),this.isNested=!1,e},W.Builder.prototype.finish=function(e,t){if(t){var n=t;if(this.prep(this.minalign,W.SIZEOF_INT+W.FILE_IDENTIFIER_LENGTH),n.length!=W.FILE_IDENTIFIER_LENGTH)throw new Error("FlatBuffers: file identifier must be length "+W.FILE_IDENTIFIER_LENGTH);for(var r=W.FILE_IDENTIFIER_LENGTH-1;r>=0;r--)this.writeInt8(n.charCodeAt(r))}this.prep(this.minalign,W.SIZEOF_INT),this.addOffset(e),this.bb.setPosition(this.space)},W.Builder.prototype.requiredField=function(e,t){var n=this.bb.capacity()-e,r=n-this.bb.readInt32(n);if(!(0!=this.bb.readInt16(r+t)))throw new Error("FlatBuffers: field "+t+" must be set")},W.Builder.prototype.startVector=function(e,t,n){this.notNested(),this.vector_num_elems=t,this.prep(W.SIZEOF_INT,e*t),this.prep(n,e*t)},W.Builder.prototype.endVector=function(){return this.writeInt32(this.vector_num_elems),this.offset()},W.Builder.prototype.createString=function(e){if(e instanceof Uint8Array)var t=e;else{t=[];for(var n=0;n<e.length;){var r,i=e.charCodeAt(n++);if(i<55296||i>=56320)r=i;else r=(i<<10)+e.charCodeAt(n++)+-56613888;r<128?t.push(r):(r<2048?t.push(r>>6&31|192):(r<65536?t.push(r>>12&15|224):t.push(r>>18&7|240,r>>12&63|128),t.push(r>>6&63|128)),t.push(63&r|128))}}this.addInt8(0),this.startVector(1,t.length,1),this.bb.setPosition(this.space-=t.length);n=0;for(var a=this.space,o=this.bb.bytes();n<t.length;n++)o[a++]=t[n];return this.endVector()},W.Builder.prototype.createLong=function(e,t){return W.Long.create(e,t)},W.ByteBuffer=function(e){this.bytes_=e,this.position_=0},W.ByteBuffer.allocate=function(e){return new W.ByteBuffer(new Uint8Array(e))},W.ByteBuffer.prototype.clear=function(){this.position_=0},W.ByteBuffer.prototype.bytes=function(){return this.bytes_},W.ByteBuffer.prototype.position=function(){return this.position_},W.ByteBuffer.prototype.setPosition=function(e){this.position_=e},W.ByteBuffer.prototype.capacity=function(){return this.bytes_.length},W.ByteBuffer.prototype.readInt8=function(e){return this.readUint8(e)<<24>>24},W.ByteBuffer.prototype.readUint8=function(e){return this.bytes_[e]},W.ByteBuffer.prototype.readInt16=function(e){return this.readUint16(e)<<16>>16},W.ByteBuffer.prototype.readUint16=function(e){return this.bytes_[e]|this.bytes_[e+1]<<8},W.ByteBuffer.prototype.readInt32=function(e){return this.bytes_[e]|this.bytes_[e+1]<<8|this.bytes_[e+2]<<16|this.bytes_[e+3]<<24},W.ByteBuffer.prototype.readUint32=function(e){return this.readInt32(e)>>>0},W.ByteBuffer.prototype.readInt64=function(e){return new W.Long(this.readInt32(e),this.readInt32(e+4))},W.ByteBuffer.prototype.readUint64=function(e){return new W.Long(this.readUint32(e),this.readUint32(e+4))},W.ByteBuffer.prototype.readFloat32=function(e){return W.int32[0]=this.readInt32(e),W.float32[0]},W.ByteBuffer.prototype.readFloat64=function(e){return W.int32[W.isLittleEndian?0:1]=this.readInt32(e),W.int32[W.isLittleEndian?1:0]=this.readInt32(e+4),W.float64[0]},W.ByteBuffer.prototype.writeInt8=function(e,t){this.bytes_[e]=t},W.ByteBuffer.prototype.writeUint8=function(e,t){this.bytes_[e]=t},W.ByteBuffer.prototype.writeInt16=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8},W.ByteBuffer.prototype.writeUint16=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8},W.ByteBuffer.prototype.writeInt32=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24},W.ByteBuffer.prototype.writeUint32=function(e,t){this.bytes_[e]=t,this.bytes_[e+1]=t>>8,this.bytes_[e+2]=t>>16,this.bytes_[e+3]=t>>24},W.ByteBuffer.prototype.writeInt64=function(e,t){this.writeInt32(e,t.low),this.writeInt32(e+4,t.high)},W.ByteBuffer.prototype.writeUint64=function(e,t){this.writeUint32(e,t.low),this.writeUint32(e+4,t.high)},W.ByteBuffer.prototype.writeFloat32=function(e,t){W.float32[0]=t,this.writeInt32(e,W.int32[0])},W.ByteBuffer.prototype.writeFloat64=function(e,t){W.float64[0]=t,this.writeInt32(e,W.int32[W.isLittleEndian?0:1]),this.writeInt32(e+4,W.int32[W.isLittleEndian?1:0])},W.ByteBuffer.prototype.getBufferIdentifier=function(){if(this.bytes_.length<this.position_+W.SIZEOF_INT+W.FILE_IDENTIFIER_LENGTH)throw new Error("FlatBuffers: ByteBuffer is too short to contain an identifier.");for(var e="",t=0;t<W.FILE_IDENTIFIER_LENGTH;t++)e+=String.fromCharCode(this.readInt8(this.position_+W.SIZEOF_INT+t));return e},W.ByteBuffer.prototype.__offset=function(e,t){var n=e-this.readInt32(e);return t<this.readInt16(n)?this.readInt16(n+t):0},W.ByteBuffer.prototype.__union=function(e,t){return e.bb_pos=t+this.readInt32(t),e.bb=this,e},W.ByteBuffer.prototype.__string=function(e,t){e+=this.readInt32(e);var n=this.readInt32(e),r="",i=0;if(e+=W.SIZEOF_INT,t===W.Encoding.UTF8_BYTES)return this.bytes_.subarray(e,e+n);for(;i<n;){var a,o=this.readUint8(e+i++);if(o<192)a=o;else{var u=this.readUint8(e+i++);if(o<224)a=(31&o)<<6|63&u;else{var s=this.readUint8(e+i++);if(o<240)a=(15&o)<<12|(63&u)<<6|63&s;else a=(7&o)<<18|(63&u)<<12|(63&s)<<6|63&this.readUint8(e+i++)}}a<65536?r+=String.fromCharCode(a):(a-=65536,r+=String.fromCharCode(55296+(a>>10),56320+(1023&a)))}return r},W.ByteBuffer.prototype.__indirect=function(e){return e+this.readInt32(e)},W.ByteBuffer.prototype.__vector=function(e){return e+this.readInt32(e)+W.SIZEOF_INT},W.ByteBuffer.prototype.__vector_len=function(e){return this.readInt32(e+this.readInt32(e))},W.ByteBuffer.prototype.__has_identifier=function(e){if(e.length!=W.FILE_IDENTIFIER_LENGTH)throw new Error("FlatBuffers: file identifier must be length "+W.FILE_IDENTIFIER_LENGTH);for(var t=0;t<W.FILE_IDENTIFIER_LENGTH;t++)if(e.charCodeAt(t)!=this.readInt8(this.position_+W.SIZEOF_INT+t))return!1;return!0},W.ByteBuffer.prototype.createLong=function(e,t){return W.Long.create(e,t)};function $(e){this.tokens=[].slice.call(e)}$.prototype={endOfStream:function(){return!this.tokens.length},read:function(){return this.tokens.length?this.tokens.shift():-1},prepend:function(e){if(Array.isArray(e))for(var t=e;t.length;)this.tokens.unshift(t.pop());else this.tokens.unshift(e)},push:function(e){if(Array.isArray(e))for(var t=e;t.length;)this.tokens.push(t.shift());else this.tokens.push(e)}};function K(e,t){if(e)throw TypeError("Decoder error");return t||65533}function Q(e,t){if(!(this instanceof Q))return new Q(e,t);if("utf-8"!==(e=void 0!==e?String(e).toLowerCase():"utf-8"))throw new Error("Encoding not supported. Only utf-8 is supported");t=Y(t),this._streaming=!1,this._BOMseen=!1,this._decoder=null,this._fatal=Boolean(t.fatal),this._ignoreBOM=Boolean(t.ignoreBOM),Object.defineProperty(this,"encoding",{value:"utf-8"}),Object.defineProperty(this,"fatal",{value:this._fatal}),Object.defineProperty(this,"ignoreBOM",{value:this._ignoreBOM})}function q(e,t){if(!(this instanceof q))return new q(e,t);if("utf-8"!==(e=void 0!==e?String(e).toLowerCase():"utf-8"))throw new Error("Encoding not supported. Only utf-8 is supported");t=Y(t),this._streaming=!1,this._encoder=null,this._options={fatal:Boolean(t.fatal)},Object.defineProperty(this,"encoding",{value:"utf-8"})}function G(e){var t=e.fatal,n=0,r=0,i=0,a=128,o=191;this.handler=function(e,u){if(-1===u&&0!==i)return i=0,K(t);if(-1===u)return-1;if(0===i){if(H(u,0,127))return u;if(H(u,194,223))i=1,n=u-192;else if(H(u,224,239))224===u&&(a=160),237===u&&(o=159),i=2,n=u-224;else{if(!H(u,240,244))return K(t);240===u&&(a=144),244===u&&(o=143),i=3,n=u-240}return n<<=6*i,null}if(!H(u,a,o))return n=i=r=0,a=128,o=191,e.prepend(u),K(t);if(a=128,o=191,n+=u-128<<6*(i-(r+=1)),r!==i)return null;var s=n;return n=i=r=0,s}}function J(e){e.fatal;this.handler=function(e,t){if(-1===t)return-1;if(H(t,0,127))return t;var n,r;H(t,128,2047)?(n=1,r=192):H(t,2048,65535)?(n=2,r=224):H(t,65536,1114111)&&(n=3,r=240);for(var i=[(t>>6*n)+r];n>0;){var a=t>>6*(n-1);i.push(128|63&a),n-=1}return i}}Q.prototype={decode:function(e,t){var n;n="object"===typeof e&&e instanceof ArrayBuffer?new Uint8Array(e):"object"===typeof e&&"buffer"in e&&e.buffer instanceof ArrayBuffer?new Uint8Array(e.buffer,e.byteOffset,e.byteLength):new Uint8Array(0),t=Y(t),this._streaming||(this._decoder=new G({fatal:this._fatal}),this._BOMseen=!1),this._streaming=Boolean(t.stream);for(var r,i=new $(n),a=[];!i.endOfStream()&&-1!==(r=this._decoder.handler(i,i.read()));)null!==r&&(Array.isArray(r)?a.push.apply(a,r):a.push(r));if(!this._streaming){do{if(-1===(r=this._decoder.handler(i,i.read())))break;null!==r&&(Array.isArray(r)?a.push.apply(a,r):a.push(r))}while(!i.endOfStream());this._decoder=null}return a.length&&(-1===["utf-8"].indexOf(this.encoding)||this._ignoreBOM||this._BOMseen||(65279===a[0]?(this._BOMseen=!0,a.shift()):this._BOMseen=!0)),function(e){for(var t="",n=0;n<e.length;++n){var r=e[n];r<=65535?t+=String.fromCharCode(r):(r-=65536,t+=String.fromCharCode(55296+(r>>10),56320+(1023&r)))}return t}(a)}},q.prototype={encode:function(e,t){e=e?String(e):"",t=Y(t),this._streaming||(this._encoder=new J(this._options)),this._streaming=Boolean(t.stream);for(var n,r=[],i=new $(function(e){for(var t=String(e),n=t.length,r=0,i=[];r<n;){var a=t.charCodeAt(r);if(a<55296||a>57343)i.push(a);else if(56320<=a&&a<=57343)i.push(65533);else if(55296<=a&&a<=56319)if(r===n-1)i.push(65533);else{var o=e.charCodeAt(r+1);if(56320<=o&&o<=57343){var u=1023&a,s=1023&o;i.push(65536+(u<<10)+s),r+=1}else i.push(65533)}r+=1}return i}(e));!i.endOfStream()&&-1!==(n=this._encoder.handler(i,i.read()));)Array.isArray(n)?r.push.apply(r,n):r.push(n);if(!this._streaming){for(;-1!==(n=this._encoder.handler(i,i.read()));)Array.isArray(n)?r.push.apply(r,n):r.push(n);this._encoder=null}return new Uint8Array(r)}};var Z="function"===typeof Buffer?Buffer:null,X="function"===typeof TextDecoder&&"function"===typeof TextEncoder,ee=function(e){if(X||!Z){var t=new e("utf-8");return function(e){return t.decode(e)}}return function(e){var t=Ve(e),n=t.buffer,r=t.byteOffset,i=t.length;return Z.from(n,r,i).toString()}}("undefined"!==typeof TextDecoder?TextDecoder:Q),te=function(e){if(X||!Z){var t=new e;return function(e){return t.encode(e)}}return function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"";return Ve(Z.from(e,"utf8"))}}("undefined"!==typeof TextEncoder?TextEncoder:q),ne=n(2),re=n(3),ie=Object.freeze({done:!0,value:void 0}),ae=function(){function e(t){Object(C.a)(this,e),this._json=t}return Object(F.a)(e,[{key:"schema",get:function(){return this._json.schema}},{key:"batches",get:function(){return this._json.batches||[]}},{key:"dictionaries",get:function(){return this._json.dictionaries||[]}}]),e}(),oe=function(){function e(){Object(C.a)(this,e)}return Object(F.a)(e,[{key:"tee",value:function(){return this._getDOMStream().tee()}},{key:"pipe",value:function(e,t){return this._getNodeStream().pipe(e,t)}},{key:"pipeTo",value:function(e,t){return this._getDOMStream().pipeTo(e,t)}},{key:"pipeThrough",value:function(e,t){return this._getDOMStream().pipeThrough(e,t)}},{key:"_getDOMStream",value:function(){return this._DOMStream||(this._DOMStream=this.toDOMStream())}},{key:"_getNodeStream",value:function(){return this._nodeStream||(this._nodeStream=this.toNodeStream())}}]),e}(),ue=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(){var e;return Object(C.a)(this,r),(e=n.call(this))._values=[],e.resolvers=[],e._closedPromise=new Promise((function(t){return e._closedPromiseResolve=t})),e}return Object(F.a)(r,[{key:"closed",get:function(){return this._closedPromise}},{key:"cancel",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.return(t);case 2:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"write",value:function(e){this._ensureOpen()&&(this.resolvers.length<=0?this._values.push(e):this.resolvers.shift().resolve({done:!1,value:e}))}},{key:"abort",value:function(e){this._closedPromiseResolve&&(this.resolvers.length<=0?this._error={error:e}:this.resolvers.shift().reject({done:!0,value:e}))}},{key:"close",value:function(){if(this._closedPromiseResolve){for(var e=this.resolvers;e.length>0;)e.shift().resolve(ie);this._closedPromiseResolve(),this._closedPromiseResolve=void 0}}},{key:t,value:function(){return this}},{key:"toDOMStream",value:function(e){return kt.toDOMStream(this._closedPromiseResolve||this._error?this:this._values,e)}},{key:"toNodeStream",value:function(e){return kt.toNodeStream(this._closedPromiseResolve||this._error?this:this._values,e)}},{key:"throw",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.abort(t);case 2:return e.abrupt("return",ie);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"return",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.close();case 2:return e.abrupt("return",ie);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"read",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.next(t,"read");case 2:return e.abrupt("return",e.sent.value);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"peek",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.next(t,"peek");case 2:return e.abrupt("return",e.sent.value);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"next",value:function(){var e=this;return this._values.length>0?Promise.resolve({done:!1,value:this._values.shift()}):this._error?Promise.reject({done:!0,value:this._error.error}):this._closedPromiseResolve?new Promise((function(t,n){e.resolvers.push({resolve:t,reject:n})})):Promise.resolve(ie)}},{key:"_ensureOpen",value:function(){if(this._closedPromiseResolve)return!0;throw new Error("".concat(this," is closed"))}}]),r}(oe,Symbol.asyncIterator),se=N(function(){var e=function(){throw new Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=function(){throw e()},t.asUintN=function(){throw e()},"undefined"!==typeof BigInt?[BigInt,!0]:[t,!1]}(),2),ce=se[0],le=se[1],fe=N(function(){var e=function(){throw new Error("BigInt64Array is not available in this environment")};return"undefined"!==typeof BigInt64Array?[BigInt64Array,!0]:[function(){function t(){throw Object(C.a)(this,t),e()}return Object(F.a)(t,null,[{key:"BYTES_PER_ELEMENT",get:function(){return 8}},{key:"of",value:function(){throw e()}},{key:"from",value:function(){throw e()}}]),t}(),!1]}(),2),he=fe[0],de=(fe[1],N(function(){var e=function(){throw new Error("BigUint64Array is not available in this environment")};return"undefined"!==typeof BigUint64Array?[BigUint64Array,!0]:[function(){function t(){throw Object(C.a)(this,t),e()}return Object(F.a)(t,null,[{key:"BYTES_PER_ELEMENT",get:function(){return 8}},{key:"of",value:function(){throw e()}},{key:"from",value:function(){throw e()}}]),t}(),!1]}(),2)),pe=de[0],ye=(de[1],function(e){return"number"===typeof e}),ve=function(e){return"boolean"===typeof e},be=function(e){return"function"===typeof e},me=function(e){return null!=e&&Object(e)===e},ge=function(e){return me(e)&&be(e.then)},ke=function(e){return me(e)&&be(e[Symbol.iterator])},we=function(e){return me(e)&&be(e[Symbol.asyncIterator])},_e=function(e){return me(e)&&me(e.schema)},Oe=function(e){return me(e)&&"done"in e&&"value"in e},xe=function(e){return me(e)&&be(e.stat)&&ye(e.fd)},je=function(e){return me(e)&&Te(e.body)},Se=function(e){return me(e)&&be(e.abort)&&be(e.getWriter)&&!(e instanceof oe)},Te=function(e){return me(e)&&be(e.cancel)&&be(e.getReader)&&!(e instanceof oe)},Ie=function(e){return me(e)&&be(e.end)&&be(e.write)&&ve(e.writable)&&!(e instanceof oe)},Ee=function(e){return me(e)&&be(e.read)&&be(e.pipe)&&ve(e.readable)&&!(e instanceof oe)},Ae=M.mark(Ge);function Be(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new De(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function De(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return(De=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new De(e)}var Le=W.ByteBuffer,Ce="undefined"!==typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function Fe(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:0,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:t.byteLength,i=e.byteLength,a=new Uint8Array(e.buffer,e.byteOffset,i),o=new Uint8Array(t.buffer,t.byteOffset,Math.min(r,i));return a.set(o,n),e}function Me(e,t){for(var n,r,i,a=function(e){for(var t,n,r,i,a,o,u=e[0]?[e[0]]:[],s=0,c=0,l=e.length;++s<l;)if(a=u[c],o=e[s],!a||!o||a.buffer!==o.buffer||o.byteOffset<a.byteOffset)o&&(u[++c]=o);else{var f=a;t=f.byteOffset,r=f.byteLength;var h=o;n=h.byteOffset,i=h.byteLength,t+r<n||n+i<t?o&&(u[++c]=o):u[c]=new Uint8Array(a.buffer,t,n-t+i)}return u}(e),o=a.reduce((function(e,t){return e+t.byteLength}),0),u=0,s=-1,c=Math.min(t||1/0,o),l=a.length;++s<l;){if(c<=u+(r=(n=a[s]).subarray(0,Math.min(n.length,c-u))).length){r.length<n.length?a[s]=n.subarray(r.length):r.length===n.length&&s++,i?Fe(i,r,u):i=r;break}Fe(i||(i=new Uint8Array(c)),r,u),u+=r.length}return[i||new Uint8Array(0),a.slice(s),o-(i?i.byteLength:0)]}function Ne(e,t){var n=Oe(t)?t.value:t;return n instanceof e?e===Uint8Array?new e(n.buffer,n.byteOffset,n.byteLength):n:n?("string"===typeof n&&(n=te(n)),n instanceof ArrayBuffer||n instanceof Ce?new e(n):n instanceof Le?Ne(e,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new e(0):new e(n.buffer,n.byteOffset,n.byteLength/e.BYTES_PER_ELEMENT):e.from(n)):new e(0)}var Ue=function(e){return Ne(Int8Array,e)},Pe=function(e){return Ne(Int16Array,e)},Re=function(e){return Ne(Int32Array,e)},ze=function(e){return Ne(he,e)},Ve=function(e){return Ne(Uint8Array,e)},We=function(e){return Ne(Uint16Array,e)},He=function(e){return Ne(Uint32Array,e)},Ye=function(e){return Ne(pe,e)},$e=function(e){return Ne(Float32Array,e)},Ke=function(e){return Ne(Float64Array,e)},Qe=function(e){return Ne(Uint8ClampedArray,e)},qe=function(e){return e.next(),e};function Ge(e,t){var n,r;return M.wrap((function(i){for(;;)switch(i.prev=i.next){case 0:return n=M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,t;case 2:case"end":return e.stop()}}),e)})),r="string"===typeof t||ArrayBuffer.isView(t)||t instanceof ArrayBuffer||t instanceof Ce?n(t):ke(t)?t:n(t),i.delegateYield(qe(M.mark((function t(n){var r;return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:r=null;case 1:return t.t0=n,t.next=4,Ne(e,r);case 4:t.t1=t.sent,r=t.t0.next.call(t.t0,t.t1);case 6:if(!r.done){t.next=1;break}case 7:case"end":return t.stop()}}),t)}))(r[Symbol.iterator]())),"t0",3);case 3:case"end":return i.stop()}}),Ae)}var Je=function(e){return Ge(Int8Array,e)},Ze=function(e){return Ge(Int16Array,e)},Xe=function(e){return Ge(Int32Array,e)},et=function(e){return Ge(Uint8Array,e)},tt=function(e){return Ge(Uint16Array,e)},nt=function(e){return Ge(Uint32Array,e)},rt=function(e){return Ge(Float32Array,e)},it=function(e){return Ge(Float64Array,e)},at=function(e){return Ge(Uint8ClampedArray,e)};function ot(e,t){return ut.apply(this,arguments)}function ut(){return(ut=z(M.mark((function e(t,n){var r,i,a;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!ge(n)){e.next=13;break}return e.t0=V,e.t1=Be,e.t2=ot,e.t3=t,e.next=7,P(n);case 7:return e.t4=e.sent,e.t5=(0,e.t2)(e.t3,e.t4),e.t6=(0,e.t1)(e.t5),e.t7=P,e.delegateYield((0,e.t0)(e.t6,e.t7),"t8",12);case 12:return e.abrupt("return",e.t8);case 13:return r=function(){var e=z(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,P(t);case 2:return e.next=4,e.sent;case 4:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}(),i=function(){var e=z(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.delegateYield(V(Be(qe(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:n=null;case 1:return e.t0=t,e.next=4,n&&n.value;case 4:e.t1=e.sent,n=e.t0.next.call(e.t0,e.t1);case 6:if(!n.done){e.next=1;break}case 7:case"end":return e.stop()}}),e)}))(t[Symbol.iterator]()))),P),"t0",1);case 1:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}(),a="string"===typeof n||ArrayBuffer.isView(n)||n instanceof ArrayBuffer||n instanceof Ce?r(n):ke(n)?i(n):we(n)?n:r(n),e.delegateYield(V(Be(qe(function(){var e=z(M.mark((function e(n){var r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:r=null;case 1:return e.t0=P,e.t1=n,e.next=5,Ne(t,r);case 5:return e.t2=e.sent,e.t3=e.t1.next.call(e.t1,e.t2),e.next=9,(0,e.t0)(e.t3);case 9:r=e.sent;case 10:if(!r.done){e.next=1;break}case 11:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}()(a[Symbol.asyncIterator]()))),P),"t9",17);case 17:case"end":return e.stop()}}),e)})))).apply(this,arguments)}var st=function(e){return ot(Int8Array,e)},ct=function(e){return ot(Int16Array,e)},lt=function(e){return ot(Int32Array,e)},ft=function(e){return ot(Uint8Array,e)},ht=function(e){return ot(Uint16Array,e)},dt=function(e){return ot(Uint32Array,e)},pt=function(e){return ot(Float32Array,e)},yt=function(e){return ot(Float64Array,e)},vt=function(e){return ot(Uint8ClampedArray,e)};function bt(e,t,n){if(0!==e){n=n.slice(0,t+1);for(var r=-1;++r<=t;)n[r]+=e}return n}function mt(e,t){var n=0,r=e.length;if(r!==t.length)return!1;if(r>0)do{if(e[n]!==t[n])return!1}while(++n<r);return!0}var gt=M.mark(_t),kt={fromIterable:function(e){return wt(_t(e))},fromAsyncIterable:function(e){return wt(function(e){return Ot.apply(this,arguments)}(e))},fromDOMStream:function(e){return wt(function(e){return xt.apply(this,arguments)}(e))},fromNodeStream:function(e){return wt(function(e){return Et.apply(this,arguments)}(e))},toDOMStream:function(e,t){throw new Error('"toDOMStream" not available in this environment')},toNodeStream:function(e,t){throw new Error('"toNodeStream" not available in this environment')}},wt=function(e){return e.next(),e};function _t(e){var t,n,r,i,a,o,u,s,c,l,f,h;return M.wrap((function(d){for(;;)switch(d.prev=d.next){case 0:return s=function(){if("peek"===a)return Me(r,o)[0];var e=N(Me(r,o),3);return i=e[0],r=e[1],u=e[2],i},n=!1,r=[],u=0,d.next=6,null;case 6:c=d.sent,a=c.cmd,o=c.size,l=et(e)[Symbol.iterator](),d.prev=10;case 11:if(f=isNaN(o-u)?l.next(void 0):l.next(o-u),t=f.done,i=f.value,!t&&i.byteLength>0&&(r.push(i),u+=i.byteLength),!(t||o<=u)){d.next=22;break}case 16:return d.next=18,s();case 18:h=d.sent,a=h.cmd,o=h.size;case 21:if(o<u){d.next=16;break}case 22:if(!t){d.next=11;break}case 23:d.next=28;break;case 25:d.prev=25,d.t0=d.catch(10),(n=!0)&&"function"===typeof l.throw&&l.throw(d.t0);case 28:return d.prev=28,!1===n&&"function"===typeof l.return&&l.return(),d.finish(28);case 31:case"end":return d.stop()}}),gt,null,[[10,25,28,31]])}function Ot(){return(Ot=z(M.mark((function e(t){var n,r,i,a,o,u,s,c,l,f,h,d;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return c=function(){if("peek"===o)return Me(i,u)[0];var e=N(Me(i,u),3);return a=e[0],i=e[1],s=e[2],a},r=!1,i=[],s=0,e.next=6,null;case 6:l=e.sent,o=l.cmd,u=l.size,f=ft(t)[Symbol.asyncIterator](),e.prev=10;case 11:if(!isNaN(u-s)){e.next=17;break}return e.next=14,P(f.next(void 0));case 14:e.t0=e.sent,e.next=20;break;case 17:return e.next=19,P(f.next(u-s));case 19:e.t0=e.sent;case 20:if(h=e.t0,n=h.done,a=h.value,!n&&a.byteLength>0&&(i.push(a),s+=a.byteLength),!(n||u<=s)){e.next=31;break}case 25:return e.next=27,c();case 27:d=e.sent,o=d.cmd,u=d.size;case 30:if(u<s){e.next=25;break}case 31:if(!n){e.next=11;break}case 32:e.next=40;break;case 34:if(e.prev=34,e.t1=e.catch(10),e.t2=(r=!0)&&"function"===typeof f.throw,!e.t2){e.next=40;break}return e.next=40,P(f.throw(e.t1));case 40:if(e.prev=40,e.t3=!1===r&&"function"===typeof f.return,!e.t3){e.next=45;break}return e.next=45,P(f.return());case 45:return e.finish(40);case 46:case"end":return e.stop()}}),e,null,[[10,34,40,46]])})))).apply(this,arguments)}function xt(){return(xt=z(M.mark((function e(t){var n,r,i,a,o,u,s,c,l,f,h,d;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return c=function(){if("peek"===o)return Me(i,u)[0];var e=N(Me(i,u),3);return a=e[0],i=e[1],s=e[2],a},n=!1,r=!1,i=[],s=0,e.next=6,null;case 6:l=e.sent,o=l.cmd,u=l.size,f=new jt(t),e.prev=10;case 11:if(!isNaN(u-s)){e.next=17;break}return e.next=14,P(f.read(void 0));case 14:e.t0=e.sent,e.next=20;break;case 17:return e.next=19,P(f.read(u-s));case 19:e.t0=e.sent;case 20:if(h=e.t0,n=h.done,a=h.value,!n&&a.byteLength>0&&(i.push(Ve(a)),s+=a.byteLength),!(n||u<=s)){e.next=31;break}case 25:return e.next=27,c();case 27:d=e.sent,o=d.cmd,u=d.size;case 30:if(u<s){e.next=25;break}case 31:if(!n){e.next=11;break}case 32:e.next=40;break;case 34:if(e.prev=34,e.t1=e.catch(10),e.t2=r=!0,!e.t2){e.next=40;break}return e.next=40,P(f.cancel(e.t1));case 40:if(e.prev=40,!1!==r){e.next=46;break}return e.next=44,P(f.cancel());case 44:e.next=47;break;case 46:t.locked&&f.releaseLock();case 47:return e.finish(40);case 48:case"end":return e.stop()}}),e,null,[[10,34,40,48]])})))).apply(this,arguments)}var jt=function(){function e(t){Object(C.a)(this,e),this.source=t,this.byobReader=null,this.defaultReader=null;try{this.supportsBYOB=!!(this.reader=this.getBYOBReader())}catch(n){this.supportsBYOB=!(this.reader=this.getDefaultReader())}}return Object(F.a)(e,[{key:"closed",get:function(){return this.reader?this.reader.closed.catch((function(){})):Promise.resolve()}},{key:"releaseLock",value:function(){this.reader&&this.reader.releaseLock(),this.reader=this.byobReader=this.defaultReader=null}},{key:"cancel",value:function(){var e=L(M.mark((function e(t){var n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(n=this.reader,r=this.source,e.t0=n,!e.t0){e.next=5;break}return e.next=5,n.cancel(t).catch((function(){}));case 5:r&&r.locked&&this.releaseLock();case 6:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"read",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(0!==t){e.next=2;break}return e.abrupt("return",{done:null==this.reader,value:new Uint8Array(0)});case 2:if(this.supportsBYOB&&"number"===typeof t){e.next=8;break}return e.next=5,this.getDefaultReader().read();case 5:e.t0=e.sent,e.next=11;break;case 8:return e.next=10,this.readFromBYOBReader(t);case 10:e.t0=e.sent;case 11:return!(n=e.t0).done&&(n.value=Ve(n)),e.abrupt("return",n);case 14:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"getDefaultReader",value:function(){return this.byobReader&&this.releaseLock(),this.defaultReader||(this.defaultReader=this.source.getReader(),this.defaultReader.closed.catch((function(){}))),this.reader=this.defaultReader}},{key:"getBYOBReader",value:function(){return this.defaultReader&&this.releaseLock(),this.byobReader||(this.byobReader=this.source.getReader({mode:"byob"}),this.byobReader.closed.catch((function(){}))),this.reader=this.byobReader}},{key:"readFromBYOBReader",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,St(this.getBYOBReader(),new ArrayBuffer(t),0,t);case 2:return e.abrupt("return",e.sent);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()}]),e}();function St(e,t,n,r){return Tt.apply(this,arguments)}function Tt(){return(Tt=L(M.mark((function e(t,n,r,i){var a,o,u;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!(r>=i)){e.next=2;break}return e.abrupt("return",{done:!1,value:new Uint8Array(n,0,i)});case 2:return e.next=4,t.read(new Uint8Array(n,r,i-r));case 4:if(a=e.sent,o=a.done,u=a.value,!((r+=u.byteLength)<i)||o){e.next=11;break}return e.next=10,St(t,u.buffer,r,i);case 10:return e.abrupt("return",e.sent);case 11:return e.abrupt("return",{done:o,value:new Uint8Array(u.buffer,0,r)});case 12:case"end":return e.stop()}}),e)})))).apply(this,arguments)}var It=function(e,t){var n,r=function(e){return n([t,e])};return[t,r,new Promise((function(i){return(n=i)&&e.once(t,r)}))]};function Et(){return(Et=z(M.mark((function e(t){var n,r,i,a,o,u,s,c,l,f,h,d,p,y,v;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return v=function(e,n){return l=c=null,new Promise(function(){var r=L(M.mark((function r(i,a){var o,u,s,c,l,f;return M.wrap((function(r){for(;;)switch(r.prev=r.next){case 0:o=B(e);try{for(o.s();!(u=o.n()).done;)s=N(u.value,2),c=s[0],l=s[1],t.off(c,l)}catch(n){o.e(n)}finally{o.f()}try{(f=t.destroy)&&f.call(t,n),n=void 0}catch(h){n=h||n}finally{null!=n?a(n):i()}case 3:case"end":return r.stop()}}),r)})));return function(e,t){return r.apply(this,arguments)}}())},f=function(){if("peek"===o)return Me(c,u)[0];var e=N(Me(c,u),3);return l=e[0],c=e[1],s=e[2],l},n=[],r="error",i=!1,a=null,s=0,c=[],e.next=9,null;case 9:if(h=e.sent,o=h.cmd,u=h.size,!t.isTTY){e.next=16;break}return e.next=15,new Uint8Array(0);case 15:return e.abrupt("return",e.sent);case 16:e.prev=16,n[0]=It(t,"end"),n[1]=It(t,"error");case 19:return n[2]=It(t,"readable"),e.next=22,P(Promise.race(n.map((function(e){return e[2]}))));case 22:if(d=e.sent,p=N(d,2),r=p[0],a=p[1],"error"!==r){e.next=28;break}return e.abrupt("break",37);case 28:if((i="end"===r)||(isFinite(u-s)?(l=Ve(t.read(u-s))).byteLength<u-s&&(l=Ve(t.read(void 0))):l=Ve(t.read(void 0)),l.byteLength>0&&(c.push(l),s+=l.byteLength)),!(i||u<=s)){e.next=36;break}case 30:return e.next=32,f();case 32:y=e.sent,o=y.cmd,u=y.size;case 35:if(u<s){e.next=30;break}case 36:if(!i){e.next=19;break}case 37:return e.prev=37,e.next=40,P(v(n,"error"===r?a:null));case 40:return e.finish(37);case 41:case"end":return e.stop()}}),e,null,[[16,,37,41]])})))).apply(this,arguments)}function At(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function Bt(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function Dt(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?Bt(Object(n),!0).forEach((function(t){At(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):Bt(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}var Lt,Ct,Ft,Mt,Nt,Ut,Pt=n(6),Rt=n(5),zt=Object(F.a)((function e(){Object(C.a)(this,e)}));Nt=Lt||(Lt={}),Mt=Nt.apache||(Nt.apache={}),Ft=Mt.arrow||(Mt.arrow={}),function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4"}((Ct=Ft.flatbuf||(Ft.flatbuf={})).MetadataVersion||(Ct.MetadataVersion={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(e.UnionMode||(e.UnionMode={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(e.Precision||(e.Precision={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(e.DateUnit||(e.DateUnit={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(e.TimeUnit||(e.TimeUnit={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME"}(e.IntervalUnit||(e.IntervalUnit={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.FloatingPoint=3]="FloatingPoint",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct_=13]="Struct_",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Duration=18]="Duration",e[e.LargeBinary=19]="LargeBinary",e[e.LargeUtf8=20]="LargeUtf8",e[e.LargeList=21]="LargeList"}(e.Type||(e.Type={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.Little=0]="Little",e[e.Big=1]="Big"}(e.Endianness||(e.Endianness={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsNull",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startNull",value:function(e){e.startObject(0)}},{key:"endNull",value:function(e){return e.endObject()}},{key:"createNull",value:function(t){return e.startNull(t),e.endNull(t)}}]),e}();e.Null=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsStruct_",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startStruct_",value:function(e){e.startObject(0)}},{key:"endStruct_",value:function(e){return e.endObject()}},{key:"createStruct_",value:function(t){return e.startStruct_(t),e.endStruct_(t)}}]),e}();e.Struct_=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsList",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startList",value:function(e){e.startObject(0)}},{key:"endList",value:function(e){return e.endObject()}},{key:"createList",value:function(t){return e.startList(t),e.endList(t)}}]),e}();e.List=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsLargeList",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startLargeList",value:function(e){e.startObject(0)}},{key:"endLargeList",value:function(e){return e.endObject()}},{key:"createLargeList",value:function(t){return e.startLargeList(t),e.endLargeList(t)}}]),e}();e.LargeList=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"listSize",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}}],[{key:"getRootAsFixedSizeList",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startFixedSizeList",value:function(e){e.startObject(1)}},{key:"addListSize",value:function(e,t){e.addFieldInt32(0,t,0)}},{key:"endFixedSizeList",value:function(e){return e.endObject()}},{key:"createFixedSizeList",value:function(t,n){return e.startFixedSizeList(t),e.addListSize(t,n),e.endFixedSizeList(t)}}]),e}();e.FixedSizeList=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"keysSorted",value:function(){var e=this.bb.__offset(this.bb_pos,4);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}}],[{key:"getRootAsMap",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startMap",value:function(e){e.startObject(1)}},{key:"addKeysSorted",value:function(e,t){e.addFieldInt8(0,+t,0)}},{key:"endMap",value:function(e){return e.endObject()}},{key:"createMap",value:function(t,n){return e.startMap(t),e.addKeysSorted(t,n),e.endMap(t)}}]),e}();e.Map=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"mode",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.UnionMode.Sparse}},{key:"typeIds",value:function(e){var t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readInt32(this.bb.__vector(this.bb_pos+t)+4*e):0}},{key:"typeIdsLength",value:function(){var e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}},{key:"typeIdsArray",value:function(){var e=this.bb.__offset(this.bb_pos,6);return e?new Int32Array(this.bb.bytes().buffer,this.bb.bytes().byteOffset+this.bb.__vector(this.bb_pos+e),this.bb.__vector_len(this.bb_pos+e)):null}}],[{key:"getRootAsUnion",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startUnion",value:function(e){e.startObject(2)}},{key:"addMode",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.UnionMode.Sparse)}},{key:"addTypeIds",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"createTypeIdsVector",value:function(e,t){e.startVector(4,t.length,4);for(var n=t.length-1;n>=0;n--)e.addInt32(t[n]);return e.endVector()}},{key:"startTypeIdsVector",value:function(e,t){e.startVector(4,t,4)}},{key:"endUnion",value:function(e){return e.endObject()}},{key:"createUnion",value:function(e,n,r){return t.startUnion(e),t.addMode(e,n),t.addTypeIds(e,r),t.endUnion(e)}}]),t}();t.Union=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"bitWidth",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}},{key:"isSigned",value:function(){var e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}}],[{key:"getRootAsInt",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startInt",value:function(e){e.startObject(2)}},{key:"addBitWidth",value:function(e,t){e.addFieldInt32(0,t,0)}},{key:"addIsSigned",value:function(e,t){e.addFieldInt8(1,+t,0)}},{key:"endInt",value:function(e){return e.endObject()}},{key:"createInt",value:function(t,n,r){return e.startInt(t),e.addBitWidth(t,n),e.addIsSigned(t,r),e.endInt(t)}}]),e}();e.Int=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"precision",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.Precision.HALF}}],[{key:"getRootAsFloatingPoint",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startFloatingPoint",value:function(e){e.startObject(1)}},{key:"addPrecision",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.Precision.HALF)}},{key:"endFloatingPoint",value:function(e){return e.endObject()}},{key:"createFloatingPoint",value:function(e,n){return t.startFloatingPoint(e),t.addPrecision(e,n),t.endFloatingPoint(e)}}]),t}();t.FloatingPoint=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsUtf8",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startUtf8",value:function(e){e.startObject(0)}},{key:"endUtf8",value:function(e){return e.endObject()}},{key:"createUtf8",value:function(t){return e.startUtf8(t),e.endUtf8(t)}}]),e}();e.Utf8=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsBinary",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startBinary",value:function(e){e.startObject(0)}},{key:"endBinary",value:function(e){return e.endObject()}},{key:"createBinary",value:function(t){return e.startBinary(t),e.endBinary(t)}}]),e}();e.Binary=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsLargeUtf8",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startLargeUtf8",value:function(e){e.startObject(0)}},{key:"endLargeUtf8",value:function(e){return e.endObject()}},{key:"createLargeUtf8",value:function(t){return e.startLargeUtf8(t),e.endLargeUtf8(t)}}]),e}();e.LargeUtf8=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsLargeBinary",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startLargeBinary",value:function(e){e.startObject(0)}},{key:"endLargeBinary",value:function(e){return e.endObject()}},{key:"createLargeBinary",value:function(t){return e.startLargeBinary(t),e.endLargeBinary(t)}}]),e}();e.LargeBinary=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"byteWidth",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}}],[{key:"getRootAsFixedSizeBinary",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startFixedSizeBinary",value:function(e){e.startObject(1)}},{key:"addByteWidth",value:function(e,t){e.addFieldInt32(0,t,0)}},{key:"endFixedSizeBinary",value:function(e){return e.endObject()}},{key:"createFixedSizeBinary",value:function(t,n){return e.startFixedSizeBinary(t),e.addByteWidth(t,n),e.endFixedSizeBinary(t)}}]),e}();e.FixedSizeBinary=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}}],[{key:"getRootAsBool",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startBool",value:function(e){e.startObject(0)}},{key:"endBool",value:function(e){return e.endObject()}},{key:"createBool",value:function(t){return e.startBool(t),e.endBool(t)}}]),e}();e.Bool=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"precision",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt32(this.bb_pos+e):0}},{key:"scale",value:function(){var e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):0}}],[{key:"getRootAsDecimal",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startDecimal",value:function(e){e.startObject(2)}},{key:"addPrecision",value:function(e,t){e.addFieldInt32(0,t,0)}},{key:"addScale",value:function(e,t){e.addFieldInt32(1,t,0)}},{key:"endDecimal",value:function(e){return e.endObject()}},{key:"createDecimal",value:function(t,n,r){return e.startDecimal(t),e.addPrecision(t,n),e.addScale(t,r),e.endDecimal(t)}}]),e}();e.Decimal=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"unit",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.DateUnit.MILLISECOND}}],[{key:"getRootAsDate",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startDate",value:function(e){e.startObject(1)}},{key:"addUnit",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.DateUnit.MILLISECOND)}},{key:"endDate",value:function(e){return e.endObject()}},{key:"createDate",value:function(e,n){return t.startDate(e),t.addUnit(e,n),t.endDate(e)}}]),t}();t.Date=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"unit",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.TimeUnit.MILLISECOND}},{key:"bitWidth",value:function(){var e=this.bb.__offset(this.bb_pos,6);return e?this.bb.readInt32(this.bb_pos+e):32}}],[{key:"getRootAsTime",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startTime",value:function(e){e.startObject(2)}},{key:"addUnit",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.TimeUnit.MILLISECOND)}},{key:"addBitWidth",value:function(e,t){e.addFieldInt32(1,t,32)}},{key:"endTime",value:function(e){return e.endObject()}},{key:"createTime",value:function(e,n,r){return t.startTime(e),t.addUnit(e,n),t.addBitWidth(e,r),t.endTime(e)}}]),t}();t.Time=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"unit",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.TimeUnit.SECOND}},{key:"timezone",value:function(e){var t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}}],[{key:"getRootAsTimestamp",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startTimestamp",value:function(e){e.startObject(2)}},{key:"addUnit",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.TimeUnit.SECOND)}},{key:"addTimezone",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"endTimestamp",value:function(e){return e.endObject()}},{key:"createTimestamp",value:function(e,n,r){return t.startTimestamp(e),t.addUnit(e,n),t.addTimezone(e,r),t.endTimestamp(e)}}]),t}();t.Timestamp=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"unit",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.IntervalUnit.YEAR_MONTH}}],[{key:"getRootAsInterval",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startInterval",value:function(e){e.startObject(1)}},{key:"addUnit",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.IntervalUnit.YEAR_MONTH)}},{key:"endInterval",value:function(e){return e.endObject()}},{key:"createInterval",value:function(e,n){return t.startInterval(e),t.addUnit(e,n),t.endInterval(e)}}]),t}();t.Interval=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"unit",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.TimeUnit.MILLISECOND}}],[{key:"getRootAsDuration",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startDuration",value:function(e){e.startObject(1)}},{key:"addUnit",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.TimeUnit.MILLISECOND)}},{key:"endDuration",value:function(e){return e.endObject()}},{key:"createDuration",value:function(e,n){return t.startDuration(e),t.addUnit(e,n),t.endDuration(e)}}]),t}();t.Duration=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"key",value:function(e){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}},{key:"value",value:function(e){var t=this.bb.__offset(this.bb_pos,6);return t?this.bb.__string(this.bb_pos+t,e):null}}],[{key:"getRootAsKeyValue",value:function(t,n){return(n||new e).__init(t.readInt32(t.position())+t.position(),t)}},{key:"startKeyValue",value:function(e){e.startObject(2)}},{key:"addKey",value:function(e,t){e.addFieldOffset(0,t,0)}},{key:"addValue",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"endKeyValue",value:function(e){return e.endObject()}},{key:"createKeyValue",value:function(t,n,r){return e.startKeyValue(t),e.addKey(t,n),e.addValue(t,r),e.endKeyValue(t)}}]),e}();e.KeyValue=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"id",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}},{key:"indexType",value:function(t){var n=this.bb.__offset(this.bb_pos,6);return n?(t||new e.apache.arrow.flatbuf.Int).__init(this.bb.__indirect(this.bb_pos+n),this.bb):null}},{key:"isOrdered",value:function(){var e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}}],[{key:"getRootAsDictionaryEncoding",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startDictionaryEncoding",value:function(e){e.startObject(3)}},{key:"addId",value:function(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}},{key:"addIndexType",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"addIsOrdered",value:function(e,t){e.addFieldInt8(2,+t,0)}},{key:"endDictionaryEncoding",value:function(e){return e.endObject()}},{key:"createDictionaryEncoding",value:function(e,n,r,i){return t.startDictionaryEncoding(e),t.addId(e,n),t.addIndexType(e,r),t.addIsOrdered(e,i),t.endDictionaryEncoding(e)}}]),t}();t.DictionaryEncoding=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"name",value:function(e){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.__string(this.bb_pos+t,e):null}},{key:"nullable",value:function(){var e=this.bb.__offset(this.bb_pos,6);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}},{key:"typeType",value:function(){var t=this.bb.__offset(this.bb_pos,8);return t?this.bb.readUint8(this.bb_pos+t):e.apache.arrow.flatbuf.Type.NONE}},{key:"type",value:function(e){var t=this.bb.__offset(this.bb_pos,10);return t?this.bb.__union(e,this.bb_pos+t):null}},{key:"dictionary",value:function(t){var n=this.bb.__offset(this.bb_pos,12);return n?(t||new e.apache.arrow.flatbuf.DictionaryEncoding).__init(this.bb.__indirect(this.bb_pos+n),this.bb):null}},{key:"children",value:function(t,n){var r=this.bb.__offset(this.bb_pos,14);return r?(n||new e.apache.arrow.flatbuf.Field).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+4*t),this.bb):null}},{key:"childrenLength",value:function(){var e=this.bb.__offset(this.bb_pos,14);return e?this.bb.__vector_len(this.bb_pos+e):0}},{key:"customMetadata",value:function(t,n){var r=this.bb.__offset(this.bb_pos,16);return r?(n||new e.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+4*t),this.bb):null}},{key:"customMetadataLength",value:function(){var e=this.bb.__offset(this.bb_pos,16);return e?this.bb.__vector_len(this.bb_pos+e):0}}],[{key:"getRootAsField",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startField",value:function(e){e.startObject(7)}},{key:"addName",value:function(e,t){e.addFieldOffset(0,t,0)}},{key:"addNullable",value:function(e,t){e.addFieldInt8(1,+t,0)}},{key:"addTypeType",value:function(t,n){t.addFieldInt8(2,n,e.apache.arrow.flatbuf.Type.NONE)}},{key:"addType",value:function(e,t){e.addFieldOffset(3,t,0)}},{key:"addDictionary",value:function(e,t){e.addFieldOffset(4,t,0)}},{key:"addChildren",value:function(e,t){e.addFieldOffset(5,t,0)}},{key:"createChildrenVector",value:function(e,t){e.startVector(4,t.length,4);for(var n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}},{key:"startChildrenVector",value:function(e,t){e.startVector(4,t,4)}},{key:"addCustomMetadata",value:function(e,t){e.addFieldOffset(6,t,0)}},{key:"createCustomMetadataVector",value:function(e,t){e.startVector(4,t.length,4);for(var n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}},{key:"startCustomMetadataVector",value:function(e,t){e.startVector(4,t,4)}},{key:"endField",value:function(e){return e.endObject()}},{key:"createField",value:function(e,n,r,i,a,o,u,s){return t.startField(e),t.addName(e,n),t.addNullable(e,r),t.addTypeType(e,i),t.addType(e,a),t.addDictionary(e,o),t.addChildren(e,u),t.addCustomMetadata(e,s),t.endField(e)}}]),t}();t.Field=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"offset",value:function(){return this.bb.readInt64(this.bb_pos)}},{key:"length",value:function(){return this.bb.readInt64(this.bb_pos+8)}}],[{key:"createBuffer",value:function(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}]),e}();e.Buffer=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"endianness",value:function(){var t=this.bb.__offset(this.bb_pos,4);return t?this.bb.readInt16(this.bb_pos+t):e.apache.arrow.flatbuf.Endianness.Little}},{key:"fields",value:function(t,n){var r=this.bb.__offset(this.bb_pos,6);return r?(n||new e.apache.arrow.flatbuf.Field).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+4*t),this.bb):null}},{key:"fieldsLength",value:function(){var e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}},{key:"customMetadata",value:function(t,n){var r=this.bb.__offset(this.bb_pos,8);return r?(n||new e.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+r)+4*t),this.bb):null}},{key:"customMetadataLength",value:function(){var e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}}],[{key:"getRootAsSchema",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startSchema",value:function(e){e.startObject(3)}},{key:"addEndianness",value:function(t,n){t.addFieldInt16(0,n,e.apache.arrow.flatbuf.Endianness.Little)}},{key:"addFields",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"createFieldsVector",value:function(e,t){e.startVector(4,t.length,4);for(var n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}},{key:"startFieldsVector",value:function(e,t){e.startVector(4,t,4)}},{key:"addCustomMetadata",value:function(e,t){e.addFieldOffset(2,t,0)}},{key:"createCustomMetadataVector",value:function(e,t){e.startVector(4,t.length,4);for(var n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}},{key:"startCustomMetadataVector",value:function(e,t){e.startVector(4,t,4)}},{key:"endSchema",value:function(e){return e.endObject()}},{key:"finishSchemaBuffer",value:function(e,t){e.finish(t)}},{key:"createSchema",value:function(e,n,r,i){return t.startSchema(e),t.addEndianness(e,n),t.addFields(e,r),t.addCustomMetadata(e,i),t.endSchema(e)}}]),t}();t.Schema=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Lt||(Lt={})),function(e){!function(e){!function(e){!function(e){e.Schema=Lt.apache.arrow.flatbuf.Schema}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Ut||(Ut={})),function(e){!function(e){!function(e){!function(e){!function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(e.MessageHeader||(e.MessageHeader={}))}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Ut||(Ut={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"length",value:function(){return this.bb.readInt64(this.bb_pos)}},{key:"nullCount",value:function(){return this.bb.readInt64(this.bb_pos+8)}}],[{key:"createFieldNode",value:function(e,t,n){return e.prep(8,16),e.writeInt64(n),e.writeInt64(t),e.offset()}}]),e}();e.FieldNode=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Ut||(Ut={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"length",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}},{key:"nodes",value:function(t,n){var r=this.bb.__offset(this.bb_pos,6);return r?(n||new e.apache.arrow.flatbuf.FieldNode).__init(this.bb.__vector(this.bb_pos+r)+16*t,this.bb):null}},{key:"nodesLength",value:function(){var e=this.bb.__offset(this.bb_pos,6);return e?this.bb.__vector_len(this.bb_pos+e):0}},{key:"buffers",value:function(e,t){var n=this.bb.__offset(this.bb_pos,8);return n?(t||new Lt.apache.arrow.flatbuf.Buffer).__init(this.bb.__vector(this.bb_pos+n)+16*e,this.bb):null}},{key:"buffersLength",value:function(){var e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}}],[{key:"getRootAsRecordBatch",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startRecordBatch",value:function(e){e.startObject(3)}},{key:"addLength",value:function(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}},{key:"addNodes",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"startNodesVector",value:function(e,t){e.startVector(16,t,8)}},{key:"addBuffers",value:function(e,t){e.addFieldOffset(2,t,0)}},{key:"startBuffersVector",value:function(e,t){e.startVector(16,t,8)}},{key:"endRecordBatch",value:function(e){return e.endObject()}},{key:"createRecordBatch",value:function(e,n,r,i){return t.startRecordBatch(e),t.addLength(e,n),t.addNodes(e,r),t.addBuffers(e,i),t.endRecordBatch(e)}}]),t}();t.RecordBatch=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Ut||(Ut={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"id",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}},{key:"data",value:function(t){var n=this.bb.__offset(this.bb_pos,6);return n?(t||new e.apache.arrow.flatbuf.RecordBatch).__init(this.bb.__indirect(this.bb_pos+n),this.bb):null}},{key:"isDelta",value:function(){var e=this.bb.__offset(this.bb_pos,8);return!!e&&!!this.bb.readInt8(this.bb_pos+e)}}],[{key:"getRootAsDictionaryBatch",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startDictionaryBatch",value:function(e){e.startObject(3)}},{key:"addId",value:function(e,t){e.addFieldInt64(0,t,e.createLong(0,0))}},{key:"addData",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"addIsDelta",value:function(e,t){e.addFieldInt8(2,+t,0)}},{key:"endDictionaryBatch",value:function(e){return e.endObject()}},{key:"createDictionaryBatch",value:function(e,n,r,i){return t.startDictionaryBatch(e),t.addId(e,n),t.addData(e,r),t.addIsDelta(e,i),t.endDictionaryBatch(e)}}]),t}();t.DictionaryBatch=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Ut||(Ut={})),function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"version",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Lt.apache.arrow.flatbuf.MetadataVersion.V1}},{key:"headerType",value:function(){var t=this.bb.__offset(this.bb_pos,6);return t?this.bb.readUint8(this.bb_pos+t):e.apache.arrow.flatbuf.MessageHeader.NONE}},{key:"header",value:function(e){var t=this.bb.__offset(this.bb_pos,8);return t?this.bb.__union(e,this.bb_pos+t):null}},{key:"bodyLength",value:function(){var e=this.bb.__offset(this.bb_pos,10);return e?this.bb.readInt64(this.bb_pos+e):this.bb.createLong(0,0)}},{key:"customMetadata",value:function(e,t){var n=this.bb.__offset(this.bb_pos,12);return n?(t||new Lt.apache.arrow.flatbuf.KeyValue).__init(this.bb.__indirect(this.bb.__vector(this.bb_pos+n)+4*e),this.bb):null}},{key:"customMetadataLength",value:function(){var e=this.bb.__offset(this.bb_pos,12);return e?this.bb.__vector_len(this.bb_pos+e):0}}],[{key:"getRootAsMessage",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startMessage",value:function(e){e.startObject(5)}},{key:"addVersion",value:function(e,t){e.addFieldInt16(0,t,Lt.apache.arrow.flatbuf.MetadataVersion.V1)}},{key:"addHeaderType",value:function(t,n){t.addFieldInt8(1,n,e.apache.arrow.flatbuf.MessageHeader.NONE)}},{key:"addHeader",value:function(e,t){e.addFieldOffset(2,t,0)}},{key:"addBodyLength",value:function(e,t){e.addFieldInt64(3,t,e.createLong(0,0))}},{key:"addCustomMetadata",value:function(e,t){e.addFieldOffset(4,t,0)}},{key:"createCustomMetadataVector",value:function(e,t){e.startVector(4,t.length,4);for(var n=t.length-1;n>=0;n--)e.addOffset(t[n]);return e.endVector()}},{key:"startCustomMetadataVector",value:function(e,t){e.startVector(4,t,4)}},{key:"endMessage",value:function(e){return e.endObject()}},{key:"finishMessageBuffer",value:function(e,t){e.finish(t)}},{key:"createMessage",value:function(e,n,r,i,a,o){return t.startMessage(e),t.addVersion(e,n),t.addHeaderType(e,r),t.addHeader(e,i),t.addBodyLength(e,a),t.addCustomMetadata(e,o),t.endMessage(e)}}]),t}();t.Message=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Ut||(Ut={}));Lt.apache.arrow.flatbuf.Type;var Vt,Wt,Ht=Lt.apache.arrow.flatbuf.DateUnit,Yt=Lt.apache.arrow.flatbuf.TimeUnit,$t=Lt.apache.arrow.flatbuf.Precision,Kt=Lt.apache.arrow.flatbuf.UnionMode,Qt=Lt.apache.arrow.flatbuf.IntervalUnit,qt=Ut.apache.arrow.flatbuf.MessageHeader,Gt=Lt.apache.arrow.flatbuf.MetadataVersion;!function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.Float=3]="Float",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct=13]="Struct",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Dictionary=-1]="Dictionary",e[e.Int8=-2]="Int8",e[e.Int16=-3]="Int16",e[e.Int32=-4]="Int32",e[e.Int64=-5]="Int64",e[e.Uint8=-6]="Uint8",e[e.Uint16=-7]="Uint16",e[e.Uint32=-8]="Uint32",e[e.Uint64=-9]="Uint64",e[e.Float16=-10]="Float16",e[e.Float32=-11]="Float32",e[e.Float64=-12]="Float64",e[e.DateDay=-13]="DateDay",e[e.DateMillisecond=-14]="DateMillisecond",e[e.TimestampSecond=-15]="TimestampSecond",e[e.TimestampMillisecond=-16]="TimestampMillisecond",e[e.TimestampMicrosecond=-17]="TimestampMicrosecond",e[e.TimestampNanosecond=-18]="TimestampNanosecond",e[e.TimeSecond=-19]="TimeSecond",e[e.TimeMillisecond=-20]="TimeMillisecond",e[e.TimeMicrosecond=-21]="TimeMicrosecond",e[e.TimeNanosecond=-22]="TimeNanosecond",e[e.DenseUnion=-23]="DenseUnion",e[e.SparseUnion=-24]="SparseUnion",e[e.IntervalDayTime=-25]="IntervalDayTime",e[e.IntervalYearMonth=-26]="IntervalYearMonth"}(Vt||(Vt={})),function(e){e[e.OFFSET=0]="OFFSET",e[e.DATA=1]="DATA",e[e.VALIDITY=2]="VALIDITY",e[e.TYPE=3]="TYPE"}(Wt||(Wt={}));var Jt=M.mark(rn);function Zt(e,t,n,r){return 0!==(n&1<<r)}function Xt(e,t,n,r){return(n&1<<r)>>r}function en(e,t,n){return n?!!(e[t>>3]|=1<<t%8)||!0:!(e[t>>3]&=~(1<<t%8))&&!1}function tn(e,t,n){var r=n.byteLength+7&-8;if(e>0||n.byteLength<r){var i=new Uint8Array(r);return i.set(e%8===0?n.subarray(e>>3):nn(rn(n,e,t,null,Zt)).subarray(0,r)),i}return n}function nn(e){var t,n=[],r=0,i=0,a=0,o=B(e);try{for(o.s();!(t=o.n()).done;){t.value&&(a|=1<<i),8===++i&&(n[r++]=a,a=i=0)}}catch(s){o.e(s)}finally{o.f()}(0===r||i>0)&&(n[r++]=a);var u=new Uint8Array(n.length+7&-8);return u.set(n),u}function rn(e,t,n,r,i){var a,o,u,s,c;return M.wrap((function(l){for(;;)switch(l.prev=l.next){case 0:a=t%8,o=t>>3,u=0,s=n;case 3:if(!(s>0)){l.next=11;break}c=e[o++];case 5:return l.next=7,i(r,u++,c,a);case 7:if(--s>0&&++a<8){l.next=5;break}case 8:a=0,l.next=3;break;case 11:case"end":return l.stop()}}),Jt)}function an(e,t,n){if(n-t<=0)return 0;if(n-t<8){var r,i=0,a=B(rn(e,t,n-t,e,Xt));try{for(a.s();!(r=a.n()).done;){i+=r.value}}catch(s){a.e(s)}finally{a.f()}return i}var o=n>>3<<3,u=t+(t%8===0?0:8-t%8);return an(e,t,u)+an(e,o,n)+on(e,u>>3,o-u>>3)}function on(e,t,n){for(var r=0,i=0|t,a=new DataView(e.buffer,e.byteOffset,e.byteLength),o=void 0===n?e.byteLength:i+n;o-i>=4;)r+=un(a.getUint32(i)),i+=4;for(;o-i>=2;)r+=un(a.getUint16(i)),i+=2;for(;o-i>=1;)r+=un(a.getUint8(i)),i+=1;return r}function un(e){var t=0|e;return 16843009*((t=(858993459&(t-=t>>>1&1431655765))+(t>>>2&858993459))+(t>>>4)&252645135)>>>24}function sn(e){return function(e){if(Array.isArray(e))return E(e)}(e)||function(e){if("undefined"!==typeof Symbol&&Symbol.iterator in Object(e))return Array.from(e)}(e)||A(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}var cn=function(){function e(){Object(C.a)(this,e)}return Object(F.a)(e,[{key:"visitMany",value:function(e){for(var t=this,n=arguments.length,r=new Array(n>1?n-1:0),i=1;i<n;i++)r[i-1]=arguments[i];return e.map((function(e,n){return t.visit.apply(t,[e].concat(sn(r.map((function(e){return e[n]})))))}))}},{key:"visit",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.getVisitFn(t[0],!1).apply(this,t)}},{key:"getVisitFn",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];return ln(this,e,t)}},{key:"visitNull",value:function(e){return null}},{key:"visitBool",value:function(e){return null}},{key:"visitInt",value:function(e){return null}},{key:"visitFloat",value:function(e){return null}},{key:"visitUtf8",value:function(e){return null}},{key:"visitBinary",value:function(e){return null}},{key:"visitFixedSizeBinary",value:function(e){return null}},{key:"visitDate",value:function(e){return null}},{key:"visitTimestamp",value:function(e){return null}},{key:"visitTime",value:function(e){return null}},{key:"visitDecimal",value:function(e){return null}},{key:"visitList",value:function(e){return null}},{key:"visitStruct",value:function(e){return null}},{key:"visitUnion",value:function(e){return null}},{key:"visitDictionary",value:function(e){return null}},{key:"visitInterval",value:function(e){return null}},{key:"visitFixedSizeList",value:function(e){return null}},{key:"visitMap",value:function(e){return null}}]),e}();function ln(e,t){var n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],r=null,i=Vt.NONE;switch(t instanceof ar||t instanceof zt?i=fn(t.type):t instanceof xn?i=fn(t):"number"!==typeof(i=t)&&(i=Vt[t]),i){case Vt.Null:r=e.visitNull;break;case Vt.Bool:r=e.visitBool;break;case Vt.Int:r=e.visitInt;break;case Vt.Int8:r=e.visitInt8||e.visitInt;break;case Vt.Int16:r=e.visitInt16||e.visitInt;break;case Vt.Int32:r=e.visitInt32||e.visitInt;break;case Vt.Int64:r=e.visitInt64||e.visitInt;break;case Vt.Uint8:r=e.visitUint8||e.visitInt;break;case Vt.Uint16:r=e.visitUint16||e.visitInt;break;case Vt.Uint32:r=e.visitUint32||e.visitInt;break;case Vt.Uint64:r=e.visitUint64||e.visitInt;break;case Vt.Float:r=e.visitFloat;break;case Vt.Float16:r=e.visitFloat16||e.visitFloat;break;case Vt.Float32:r=e.visitFloat32||e.visitFloat;break;case Vt.Float64:r=e.visitFloat64||e.visitFloat;break;case Vt.Utf8:r=e.visitUtf8;break;case Vt.Binary:r=e.visitBinary;break;case Vt.FixedSizeBinary:r=e.visitFixedSizeBinary;break;case Vt.Date:r=e.visitDate;break;case Vt.DateDay:r=e.visitDateDay||e.visitDate;break;case Vt.DateMillisecond:r=e.visitDateMillisecond||e.visitDate;break;case Vt.Timestamp:r=e.visitTimestamp;break;case Vt.TimestampSecond:r=e.visitTimestampSecond||e.visitTimestamp;break;case Vt.TimestampMillisecond:r=e.visitTimestampMillisecond||e.visitTimestamp;break;case Vt.TimestampMicrosecond:r=e.visitTimestampMicrosecond||e.visitTimestamp;break;case Vt.TimestampNanosecond:r=e.visitTimestampNanosecond||e.visitTimestamp;break;case Vt.Time:r=e.visitTime;break;case Vt.TimeSecond:r=e.visitTimeSecond||e.visitTime;break;case Vt.TimeMillisecond:r=e.visitTimeMillisecond||e.visitTime;break;case Vt.TimeMicrosecond:r=e.visitTimeMicrosecond||e.visitTime;break;case Vt.TimeNanosecond:r=e.visitTimeNanosecond||e.visitTime;break;case Vt.Decimal:r=e.visitDecimal;break;case Vt.List:r=e.visitList;break;case Vt.Struct:r=e.visitStruct;break;case Vt.Union:r=e.visitUnion;break;case Vt.DenseUnion:r=e.visitDenseUnion||e.visitUnion;break;case Vt.SparseUnion:r=e.visitSparseUnion||e.visitUnion;break;case Vt.Dictionary:r=e.visitDictionary;break;case Vt.Interval:r=e.visitInterval;break;case Vt.IntervalDayTime:r=e.visitIntervalDayTime||e.visitInterval;break;case Vt.IntervalYearMonth:r=e.visitIntervalYearMonth||e.visitInterval;break;case Vt.FixedSizeList:r=e.visitFixedSizeList;break;case Vt.Map:r=e.visitMap}if("function"===typeof r)return r;if(!n)return function(){return null};throw new Error("Unrecognized type '".concat(Vt[i],"'"))}function fn(e){switch(e.typeId){case Vt.Null:return Vt.Null;case Vt.Int:var t=e.bitWidth,n=e.isSigned;switch(t){case 8:return n?Vt.Int8:Vt.Uint8;case 16:return n?Vt.Int16:Vt.Uint16;case 32:return n?Vt.Int32:Vt.Uint32;case 64:return n?Vt.Int64:Vt.Uint64}return Vt.Int;case Vt.Float:switch(e.precision){case $t.HALF:return Vt.Float16;case $t.SINGLE:return Vt.Float32;case $t.DOUBLE:return Vt.Float64}return Vt.Float;case Vt.Binary:return Vt.Binary;case Vt.Utf8:return Vt.Utf8;case Vt.Bool:return Vt.Bool;case Vt.Decimal:return Vt.Decimal;case Vt.Time:switch(e.unit){case Yt.SECOND:return Vt.TimeSecond;case Yt.MILLISECOND:return Vt.TimeMillisecond;case Yt.MICROSECOND:return Vt.TimeMicrosecond;case Yt.NANOSECOND:return Vt.TimeNanosecond}return Vt.Time;case Vt.Timestamp:switch(e.unit){case Yt.SECOND:return Vt.TimestampSecond;case Yt.MILLISECOND:return Vt.TimestampMillisecond;case Yt.MICROSECOND:return Vt.TimestampMicrosecond;case Yt.NANOSECOND:return Vt.TimestampNanosecond}return Vt.Timestamp;case Vt.Date:switch(e.unit){case Ht.DAY:return Vt.DateDay;case Ht.MILLISECOND:return Vt.DateMillisecond}return Vt.Date;case Vt.Interval:switch(e.unit){case Qt.DAY_TIME:return Vt.IntervalDayTime;case Qt.YEAR_MONTH:return Vt.IntervalYearMonth}return Vt.Interval;case Vt.Map:return Vt.Map;case Vt.List:return Vt.List;case Vt.Struct:return Vt.Struct;case Vt.Union:switch(e.mode){case Kt.Dense:return Vt.DenseUnion;case Kt.Sparse:return Vt.SparseUnion}return Vt.Union;case Vt.FixedSizeBinary:return Vt.FixedSizeBinary;case Vt.FixedSizeList:return Vt.FixedSizeList;case Vt.Dictionary:return Vt.Dictionary}throw new Error("Unrecognized type '".concat(Vt[e.typeId],"'"))}cn.prototype.visitInt8=null,cn.prototype.visitInt16=null,cn.prototype.visitInt32=null,cn.prototype.visitInt64=null,cn.prototype.visitUint8=null,cn.prototype.visitUint16=null,cn.prototype.visitUint32=null,cn.prototype.visitUint64=null,cn.prototype.visitFloat16=null,cn.prototype.visitFloat32=null,cn.prototype.visitFloat64=null,cn.prototype.visitDateDay=null,cn.prototype.visitDateMillisecond=null,cn.prototype.visitTimestampSecond=null,cn.prototype.visitTimestampMillisecond=null,cn.prototype.visitTimestampMicrosecond=null,cn.prototype.visitTimestampNanosecond=null,cn.prototype.visitTimeSecond=null,cn.prototype.visitTimeMillisecond=null,cn.prototype.visitTimeMicrosecond=null,cn.prototype.visitTimeNanosecond=null,cn.prototype.visitDenseUnion=null,cn.prototype.visitSparseUnion=null,cn.prototype.visitIntervalDayTime=null,cn.prototype.visitIntervalYearMonth=null;var hn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"compareSchemas",value:function(e,t){return e===t||t instanceof e.constructor&&On.compareFields(e.fields,t.fields)}},{key:"compareFields",value:function(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((function(e,n){return On.compareField(e,t[n])}))}},{key:"compareField",value:function(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&On.visit(e.type,t.type)}}]),n}(cn);function dn(e,t){return t instanceof e.constructor}function pn(e,t){return e===t||dn(e,t)}function yn(e,t){return e===t||dn(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function vn(e,t){return e===t||dn(e,t)&&e.precision===t.precision}function bn(e,t){return e===t||dn(e,t)&&e.unit===t.unit}function mn(e,t){return e===t||dn(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function gn(e,t){return e===t||dn(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function kn(e,t){return e===t||dn(e,t)&&e.mode===t.mode&&e.typeIds.every((function(e,n){return e===t.typeIds[n]}))&&On.compareFields(e.children,t.children)}function wn(e,t){return e===t||dn(e,t)&&e.unit===t.unit}hn.prototype.visitNull=pn,hn.prototype.visitBool=pn,hn.prototype.visitInt=yn,hn.prototype.visitInt8=yn,hn.prototype.visitInt16=yn,hn.prototype.visitInt32=yn,hn.prototype.visitInt64=yn,hn.prototype.visitUint8=yn,hn.prototype.visitUint16=yn,hn.prototype.visitUint32=yn,hn.prototype.visitUint64=yn,hn.prototype.visitFloat=vn,hn.prototype.visitFloat16=vn,hn.prototype.visitFloat32=vn,hn.prototype.visitFloat64=vn,hn.prototype.visitUtf8=pn,hn.prototype.visitBinary=pn,hn.prototype.visitFixedSizeBinary=function(e,t){return e===t||dn(e,t)&&e.byteWidth===t.byteWidth},hn.prototype.visitDate=bn,hn.prototype.visitDateDay=bn,hn.prototype.visitDateMillisecond=bn,hn.prototype.visitTimestamp=mn,hn.prototype.visitTimestampSecond=mn,hn.prototype.visitTimestampMillisecond=mn,hn.prototype.visitTimestampMicrosecond=mn,hn.prototype.visitTimestampNanosecond=mn,hn.prototype.visitTime=gn,hn.prototype.visitTimeSecond=gn,hn.prototype.visitTimeMillisecond=gn,hn.prototype.visitTimeMicrosecond=gn,hn.prototype.visitTimeNanosecond=gn,hn.prototype.visitDecimal=pn,hn.prototype.visitList=function(e,t){return e===t||dn(e,t)&&e.children.length===t.children.length&&On.compareFields(e.children,t.children)},hn.prototype.visitStruct=function(e,t){return e===t||dn(e,t)&&e.children.length===t.children.length&&On.compareFields(e.children,t.children)},hn.prototype.visitUnion=kn,hn.prototype.visitDenseUnion=kn,hn.prototype.visitSparseUnion=kn,hn.prototype.visitDictionary=function(e,t){return e===t||dn(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&On.visit(e.indices,t.indices)&&On.visit(e.dictionary,t.dictionary)},hn.prototype.visitInterval=wn,hn.prototype.visitIntervalDayTime=wn,hn.prototype.visitIntervalYearMonth=wn,hn.prototype.visitFixedSizeList=function(e,t){return e===t||dn(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&On.compareFields(e.children,t.children)},hn.prototype.visitMap=function(e,t){return e===t||dn(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&On.compareFields(e.children,t.children)};var _n,On=new hn,xn=function(){function e(){Object(C.a)(this,e)}return Object(F.a)(e,[{key:"typeId",get:function(){return Vt.NONE}},{key:"compareTo",value:function(e){return On.visit(this,e)}}],[{key:"isNull",value:function(e){return e&&e.typeId===Vt.Null}},{key:"isInt",value:function(e){return e&&e.typeId===Vt.Int}},{key:"isFloat",value:function(e){return e&&e.typeId===Vt.Float}},{key:"isBinary",value:function(e){return e&&e.typeId===Vt.Binary}},{key:"isUtf8",value:function(e){return e&&e.typeId===Vt.Utf8}},{key:"isBool",value:function(e){return e&&e.typeId===Vt.Bool}},{key:"isDecimal",value:function(e){return e&&e.typeId===Vt.Decimal}},{key:"isDate",value:function(e){return e&&e.typeId===Vt.Date}},{key:"isTime",value:function(e){return e&&e.typeId===Vt.Time}},{key:"isTimestamp",value:function(e){return e&&e.typeId===Vt.Timestamp}},{key:"isInterval",value:function(e){return e&&e.typeId===Vt.Interval}},{key:"isList",value:function(e){return e&&e.typeId===Vt.List}},{key:"isStruct",value:function(e){return e&&e.typeId===Vt.Struct}},{key:"isUnion",value:function(e){return e&&e.typeId===Vt.Union}},{key:"isFixedSizeBinary",value:function(e){return e&&e.typeId===Vt.FixedSizeBinary}},{key:"isFixedSizeList",value:function(e){return e&&e.typeId===Vt.FixedSizeList}},{key:"isMap",value:function(e){return e&&e.typeId===Vt.Map}},{key:"isDictionary",value:function(e){return e&&e.typeId===Vt.Dictionary}}]),e}();xn[Symbol.toStringTag]=((_n=xn.prototype).children=null,_n.ArrayType=Array,_n[Symbol.toStringTag]="DataType");var jn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"toString",value:function(){return"Null"}},{key:"typeId",get:function(){return Vt.Null}}]),n}(xn);jn[Symbol.toStringTag]=function(e){return e[Symbol.toStringTag]="Null"}(jn.prototype);var Sn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).isSigned=e,i.bitWidth=r,i}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Int}},{key:"ArrayType",get:function(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:case 64:return this.isSigned?Int32Array:Uint32Array}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}},{key:"toString",value:function(){return"".concat(this.isSigned?"I":"Ui","nt").concat(this.bitWidth)}}]),n}(xn);Sn[Symbol.toStringTag]=function(e){return e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"}(Sn.prototype);var Tn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!0,8)}return Object(F.a)(n)}(Sn),In=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!0,16)}return Object(F.a)(n)}(Sn),En=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!0,32)}return Object(F.a)(n)}(Sn),An=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!0,64)}return Object(F.a)(n)}(Sn),Bn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!1,8)}return Object(F.a)(n)}(Sn),Dn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!1,16)}return Object(F.a)(n)}(Sn),Ln=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!1,32)}return Object(F.a)(n)}(Sn),Cn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,!1,64)}return Object(F.a)(n)}(Sn);Object.defineProperty(Tn.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(In.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(En.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(An.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(Bn.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(Dn.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(Ln.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(Cn.prototype,"ArrayType",{value:Uint32Array});var Fn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).precision=e,r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Float}},{key:"ArrayType",get:function(){switch(this.precision){case $t.HALF:return Uint16Array;case $t.SINGLE:return Float32Array;case $t.DOUBLE:return Float64Array}throw new Error("Unrecognized ".concat(this[Symbol.toStringTag]," type"))}},{key:"toString",value:function(){return"Float".concat(this.precision<<5||16)}}]),n}(xn);Fn[Symbol.toStringTag]=function(e){return e.precision=null,e[Symbol.toStringTag]="Float"}(Fn.prototype);var Mn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,$t.HALF)}return Object(F.a)(n)}(Fn),Nn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,$t.SINGLE)}return Object(F.a)(n)}(Fn),Un=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,$t.DOUBLE)}return Object(F.a)(n)}(Fn);Object.defineProperty(Mn.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(Nn.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(Un.prototype,"ArrayType",{value:Float64Array});var Pn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this)}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Binary}},{key:"toString",value:function(){return"Binary"}}]),n}(xn);Pn[Symbol.toStringTag]=function(e){return e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"}(Pn.prototype);var Rn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this)}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Utf8}},{key:"toString",value:function(){return"Utf8"}}]),n}(xn);Rn[Symbol.toStringTag]=function(e){return e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"}(Rn.prototype);var zn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this)}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Bool}},{key:"toString",value:function(){return"Bool"}}]),n}(xn);zn[Symbol.toStringTag]=function(e){return e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"}(zn.prototype);var Vn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).scale=e,i.precision=r,i}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Decimal}},{key:"toString",value:function(){return"Decimal[".concat(this.precision,"e").concat(this.scale>0?"+":"").concat(this.scale,"]")}}]),n}(xn);Vn[Symbol.toStringTag]=function(e){return e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"}(Vn.prototype);var Wn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).unit=e,r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Date}},{key:"toString",value:function(){return"Date".concat(32*(this.unit+1),"<").concat(Ht[this.unit],">")}}]),n}(xn);Wn[Symbol.toStringTag]=function(e){return e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"}(Wn.prototype);var Hn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,Ht.DAY)}return Object(F.a)(n)}(Wn),Yn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.call(this,Ht.MILLISECOND)}return Object(F.a)(n)}(Wn),$n=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).unit=e,i.bitWidth=r,i}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Time}},{key:"toString",value:function(){return"Time".concat(this.bitWidth,"<").concat(Yt[this.unit],">")}}]),n}(xn);$n[Symbol.toStringTag]=function(e){return e.unit=null,e.bitWidth=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Time"}($n.prototype);var Kn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).unit=e,i.timezone=r,i}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Timestamp}},{key:"toString",value:function(){return"Timestamp<".concat(Yt[this.unit]).concat(this.timezone?", ".concat(this.timezone):"",">")}}]),n}(xn);Kn[Symbol.toStringTag]=function(e){return e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"}(Kn.prototype);var Qn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).unit=e,r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Interval}},{key:"toString",value:function(){return"Interval<".concat(Qt[this.unit],">")}}]),n}(xn);Qn[Symbol.toStringTag]=function(e){return e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"}(Qn.prototype);var qn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).children=[e],r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.List}},{key:"toString",value:function(){return"List<".concat(this.valueType,">")}},{key:"valueType",get:function(){return this.children[0].type}},{key:"valueField",get:function(){return this.children[0]}},{key:"ArrayType",get:function(){return this.valueType.ArrayType}}]),n}(xn);qn[Symbol.toStringTag]=function(e){return e.children=null,e[Symbol.toStringTag]="List"}(qn.prototype);var Gn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).children=e,r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Struct}},{key:"toString",value:function(){return"Struct<{".concat(this.children.map((function(e){return"".concat(e.name,":").concat(e.type)})).join(", "),"}>")}}]),n}(xn);Gn[Symbol.toStringTag]=function(e){return e.children=null,e[Symbol.toStringTag]="Struct"}(Gn.prototype);var Jn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r,i){var a;return Object(C.a)(this,n),(a=t.call(this)).mode=e,a.children=i,a.typeIds=r=Int32Array.from(r),a.typeIdToChildIndex=r.reduce((function(e,t,n){return(e[t]=n)&&e||e}),Object.create(null)),a}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Union}},{key:"toString",value:function(){return"".concat(this[Symbol.toStringTag],"<").concat(this.children.map((function(e){return"".concat(e.type)})).join(" | "),">")}}]),n}(xn);Jn[Symbol.toStringTag]=function(e){return e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"}(Jn.prototype);var Zn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).byteWidth=e,r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.FixedSizeBinary}},{key:"toString",value:function(){return"FixedSizeBinary[".concat(this.byteWidth,"]")}}]),n}(xn);Zn[Symbol.toStringTag]=function(e){return e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"}(Zn.prototype);var Xn=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).listSize=e,i.children=[r],i}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.FixedSizeList}},{key:"valueType",get:function(){return this.children[0].type}},{key:"valueField",get:function(){return this.children[0]}},{key:"ArrayType",get:function(){return this.valueType.ArrayType}},{key:"toString",value:function(){return"FixedSizeList[".concat(this.listSize,"]<").concat(this.valueType,">")}}]),n}(xn);Xn[Symbol.toStringTag]=function(e){return e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"}(Xn.prototype);var er=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r,i=arguments.length>1&&void 0!==arguments[1]&&arguments[1];return Object(C.a)(this,n),(r=t.call(this)).children=[e],r.keysSorted=i,r}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Map}},{key:"keyType",get:function(){return this.children[0].type.children[0].type}},{key:"valueType",get:function(){return this.children[0].type.children[1].type}},{key:"toString",value:function(){return"Map<{".concat(this.children[0].type.children.map((function(e){return"".concat(e.name,":").concat(e.type)})).join(", "),"}>")}}]),n}(xn);er[Symbol.toStringTag]=function(e){return e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"}(er.prototype);var tr,nr=(tr=-1,function(){return++tr}),rr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r,i,a){var o;return Object(C.a)(this,n),(o=t.call(this)).indices=r,o.dictionary=e,o.isOrdered=a||!1,o.id=null==i?nr():"number"===typeof i?i:i.low,o}return Object(F.a)(n,[{key:"typeId",get:function(){return Vt.Dictionary}},{key:"children",get:function(){return this.dictionary.children}},{key:"valueType",get:function(){return this.dictionary}},{key:"ArrayType",get:function(){return this.dictionary.ArrayType}},{key:"toString",value:function(){return"Dictionary<".concat(this.indices,", ").concat(this.dictionary,">")}}]),n}(xn);function ir(e){var t=e;switch(e.typeId){case Vt.Decimal:return 4;case Vt.Timestamp:return 2;case Vt.Date:case Vt.Interval:return 1+t.unit;case Vt.Int:case Vt.Time:return+(t.bitWidth>32)+1;case Vt.FixedSizeList:return t.listSize;case Vt.FixedSizeBinary:return t.byteWidth;default:return 1}}rr[Symbol.toStringTag]=function(e){return e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"}(rr.prototype);var ar=function(){function e(t,n,r,i,a,o,u){var s;Object(C.a)(this,e),this.type=t,this.dictionary=u,this.offset=Math.floor(Math.max(n||0,0)),this.length=Math.floor(Math.max(r||0,0)),this._nullCount=Math.floor(Math.max(i||0,-1)),this.childData=(o||[]).map((function(t){return t instanceof e?t:t.data})),a instanceof e?(this.stride=a.stride,this.values=a.values,this.typeIds=a.typeIds,this.nullBitmap=a.nullBitmap,this.valueOffsets=a.valueOffsets):(this.stride=ir(t),a&&((s=a[0])&&(this.valueOffsets=s),(s=a[1])&&(this.values=s),(s=a[2])&&(this.nullBitmap=s),(s=a[3])&&(this.typeIds=s)))}return Object(F.a)(e,[{key:"typeId",get:function(){return this.type.typeId}},{key:"ArrayType",get:function(){return this.type.ArrayType}},{key:"buffers",get:function(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}},{key:"byteLength",get:function(){var e=0,t=this.valueOffsets,n=this.values,r=this.nullBitmap,i=this.typeIds;return t&&(e+=t.byteLength),n&&(e+=n.byteLength),r&&(e+=r.byteLength),i&&(e+=i.byteLength),this.childData.reduce((function(e,t){return e+t.byteLength}),e)}},{key:"nullCount",get:function(){var e,t=this._nullCount;return t<=-1&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-an(e,this.offset,this.offset+this.length)),t}},{key:"clone",value:function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.offset,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.length,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:this._nullCount,a=arguments.length>4&&void 0!==arguments[4]?arguments[4]:this,o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:this.childData;return new e(t,n,r,i,a,o,this.dictionary)}},{key:"slice",value:function(e,t){var n=this.stride,r=this.typeId,i=this.childData,a=+(0===this._nullCount)-1,o=16===r?n:1,u=this._sliceBuffers(e,t,n,r);return this.clone(this.type,this.offset+e,t,a,u,!i.length||this.valueOffsets?i:this._sliceChildren(i,o*e,o*t))}},{key:"_changeLengthAndBackfillNullBitmap",value:function(e){if(this.typeId===Vt.Null)return this.clone(this.type,0,e,0);var t=this.length,n=this.nullCount,r=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);r[t>>3]=(1<<t-(-8&t))-1,n>0&&r.set(tn(this.offset,t,this.nullBitmap),0);var i=this.buffers;return i[Wt.VALIDITY]=r,this.clone(this.type,0,e,n+(e-t),i)}},{key:"_sliceBuffers",value:function(e,t,n,r){var i,a=this.buffers;return(i=a[Wt.TYPE])&&(a[Wt.TYPE]=i.subarray(e,e+t)),(i=a[Wt.OFFSET])&&(a[Wt.OFFSET]=i.subarray(e,e+t+1))||(i=a[Wt.DATA])&&(a[Wt.DATA]=6===r?i:i.subarray(n*e,n*(e+t))),a}},{key:"_sliceChildren",value:function(e,t,n){return e.map((function(e){return e.slice(t,n)}))}}],[{key:"new",value:function(t,n,r,i,a,o,u){switch(a instanceof e?a=a.buffers:a||(a=[]),t.typeId){case Vt.Null:return e.Null(t,n,r);case Vt.Int:return e.Int(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Dictionary:return e.Dictionary(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[],u);case Vt.Float:return e.Float(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Bool:return e.Bool(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Decimal:return e.Decimal(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Date:return e.Date(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Time:return e.Time(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Timestamp:return e.Timestamp(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Interval:return e.Interval(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.FixedSizeBinary:return e.FixedSizeBinary(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.DATA]||[]);case Vt.Binary:return e.Binary(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.OFFSET]||[],a[Wt.DATA]||[]);case Vt.Utf8:return e.Utf8(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.OFFSET]||[],a[Wt.DATA]||[]);case Vt.List:return e.List(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.OFFSET]||[],(o||[])[0]);case Vt.FixedSizeList:return e.FixedSizeList(t,n,r,i||0,a[Wt.VALIDITY],(o||[])[0]);case Vt.Struct:return e.Struct(t,n,r,i||0,a[Wt.VALIDITY],o||[]);case Vt.Map:return e.Map(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.OFFSET]||[],(o||[])[0]);case Vt.Union:return e.Union(t,n,r,i||0,a[Wt.VALIDITY],a[Wt.TYPE]||[],a[Wt.OFFSET]||o,o)}throw new Error("Unrecognized typeId ".concat(t.typeId))}},{key:"Null",value:function(t,n,r){return new e(t,n,r,0)}},{key:"Int",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Dictionary",value:function(t,n,r,i,a,o,u){return new e(t,n,r,i,[void 0,Ne(t.indices.ArrayType,o),Ve(a)],[],u)}},{key:"Float",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Bool",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Decimal",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Date",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Time",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Timestamp",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Interval",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"FixedSizeBinary",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,Ne(t.ArrayType,o),Ve(a)])}},{key:"Binary",value:function(t,n,r,i,a,o,u){return new e(t,n,r,i,[Re(o),Ve(u),Ve(a)])}},{key:"Utf8",value:function(t,n,r,i,a,o,u){return new e(t,n,r,i,[Re(o),Ve(u),Ve(a)])}},{key:"List",value:function(t,n,r,i,a,o,u){return new e(t,n,r,i,[Re(o),void 0,Ve(a)],[u])}},{key:"FixedSizeList",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,void 0,Ve(a)],[o])}},{key:"Struct",value:function(t,n,r,i,a,o){return new e(t,n,r,i,[void 0,void 0,Ve(a)],o)}},{key:"Map",value:function(t,n,r,i,a,o,u){return new e(t,n,r,i,[Re(o),void 0,Ve(a)],[u])}},{key:"Union",value:function(t,n,r,i,a,o,u,s){var c=[void 0,void 0,Ve(a),Ne(t.ArrayType,o)];return t.mode===Kt.Sparse?new e(t,n,r,i,c,u):(c[Wt.OFFSET]=Re(u),new e(t,n,r,i,c,s))}}]),e}();ar.prototype.childData=Object.freeze([]);function or(e){if(null===e)return"null";if(void 0===e)return"undefined";switch(typeof e){case"number":case"bigint":return"".concat(e);case"string":return'"'.concat(e,'"')}return"function"===typeof e[Symbol.toPrimitive]?e[Symbol.toPrimitive]("string"):ArrayBuffer.isView(e)?"[".concat(e,"]"):JSON.stringify(e)}function ur(e){if(!e||e.length<=0)return function(e){return!0};var t="",n=e.filter((function(e){return e===e}));return n.length>0&&(t="\n    switch (x) {".concat(n.map((function(e){return"\n        case ".concat(function(e){if("bigint"!==typeof e)return or(e);if(le)return"".concat(or(e),"n");return'"'.concat(or(e),'"')}(e),":")})).join(""),"\n            return false;\n    }")),e.length!==n.length&&(t="if (x !== x) return false;\n".concat(t)),new Function("x","".concat(t,"\nreturn true;"))}var sr=function(e,t){return(e*t+63&-64||64)/t},cr=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return e.length>=t?e.subarray(0,t):Fe(new e.constructor(t),e,0)},lr=function(){function e(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1;Object(C.a)(this,e),this.buffer=t,this.stride=n,this.BYTES_PER_ELEMENT=t.BYTES_PER_ELEMENT,this.ArrayType=t.constructor,this._resize(this.length=t.length/n|0)}return Object(F.a)(e,[{key:"byteLength",get:function(){return this.length*this.stride*this.BYTES_PER_ELEMENT|0}},{key:"reservedLength",get:function(){return this.buffer.length/this.stride}},{key:"reservedByteLength",get:function(){return this.buffer.byteLength}},{key:"set",value:function(e,t){return this}},{key:"append",value:function(e){return this.set(this.length,e)}},{key:"reserve",value:function(e){if(e>0){this.length+=e;var t=this.stride,n=this.length*t,r=this.buffer.length;n>=r&&this._resize(sr(0===r?1*n:2*n,this.BYTES_PER_ELEMENT))}return this}},{key:"flush",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.length;e=sr(e*this.stride,this.BYTES_PER_ELEMENT);var t=cr(this.buffer,e);return this.clear(),t}},{key:"clear",value:function(){return this.length=0,this._resize(0),this}},{key:"_resize",value:function(e){return this.buffer=Fe(new this.ArrayType(e),this.buffer)}}]),e}();lr.prototype.offset=0;var fr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"last",value:function(){return this.get(this.length-1)}},{key:"get",value:function(e){return this.buffer[e]}},{key:"set",value:function(e,t){return this.reserve(e-this.length+1),this.buffer[e*this.stride]=t,this}}]),n}(lr),hr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e,r=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new Uint8Array(0);return Object(C.a)(this,n),(e=t.call(this,r,1/8)).numValid=0,e}return Object(F.a)(n,[{key:"numInvalid",get:function(){return this.length-this.numValid}},{key:"get",value:function(e){return this.buffer[e>>3]>>e%8&1}},{key:"set",value:function(e,t){var n=this.reserve(e-this.length+1).buffer,r=e>>3,i=e%8,a=n[r]>>i&1;return t?0===a&&(n[r]|=1<<i,++this.numValid):1===a&&(n[r]&=~(1<<i),--this.numValid),this}},{key:"clear",value:function(){return this.numValid=0,Object(Pt.a)(Object(Rt.a)(n.prototype),"clear",this).call(this)}}]),n}(fr),dr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new Int32Array(1);return Object(C.a)(this,n),t.call(this,e,1)}return Object(F.a)(n,[{key:"append",value:function(e){return this.set(this.length-1,e)}},{key:"set",value:function(e,t){var n=this.length-1,r=this.reserve(e-n+1).buffer;return n<e++&&r.fill(r[n],n,e),r[e]=r[e-1]+t,this}},{key:"flush",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.length-1;return e>this.length&&this.set(e-1,0),Object(Pt.a)(Object(Rt.a)(n.prototype),"flush",this).call(this,e+1)}}]),n}(fr),pr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"ArrayType64",get:function(){return this._ArrayType64||(this._ArrayType64=this.buffer instanceof Int32Array?he:pe)}},{key:"set",value:function(e,t){switch(this.reserve(e-this.length+1),typeof t){case"bigint":this.buffer64[e]=t;break;case"number":this.buffer[e*this.stride]=t;break;default:this.buffer.set(t,e*this.stride)}return this}},{key:"_resize",value:function(e){var t=Object(Pt.a)(Object(Rt.a)(n.prototype),"_resize",this).call(this,e),r=t.byteLength/(this.BYTES_PER_ELEMENT*this.stride);return le&&(this.buffer64=new this.ArrayType64(t.buffer,t.byteOffset,r)),t}}]),n}(lr);function yr(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new vr(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function vr(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return(vr=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new vr(e)}var br=function(){function e(t){var n=t.type,r=t.nullValues;Object(C.a)(this,e),this.length=0,this.finished=!1,this.type=n,this.children=[],this.nullValues=r,this.stride=ir(n),this._nulls=new hr,r&&r.length>0&&(this._isValid=ur(r))}return Object(F.a)(e,[{key:"toVector",value:function(){return zt.new(this.flush())}},{key:"ArrayType",get:function(){return this.type.ArrayType}},{key:"nullCount",get:function(){return this._nulls.numInvalid}},{key:"numChildren",get:function(){return this.children.length}},{key:"byteLength",get:function(){var e=0;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),this._typeIds&&(e+=this._typeIds.byteLength),this.children.reduce((function(e,t){return e+t.byteLength}),e)}},{key:"reservedLength",get:function(){return this._nulls.reservedLength}},{key:"reservedByteLength",get:function(){var e=0;return this._offsets&&(e+=this._offsets.reservedByteLength),this._values&&(e+=this._values.reservedByteLength),this._nulls&&(e+=this._nulls.reservedByteLength),this._typeIds&&(e+=this._typeIds.reservedByteLength),this.children.reduce((function(e,t){return e+t.reservedByteLength}),e)}},{key:"valueOffsets",get:function(){return this._offsets?this._offsets.buffer:null}},{key:"values",get:function(){return this._values?this._values.buffer:null}},{key:"nullBitmap",get:function(){return this._nulls?this._nulls.buffer:null}},{key:"typeIds",get:function(){return this._typeIds?this._typeIds.buffer:null}},{key:"append",value:function(e){return this.set(this.length,e)}},{key:"isValid",value:function(e){return this._isValid(e)}},{key:"set",value:function(e,t){return this.setValid(e,this.isValid(t))&&this.setValue(e,t),this}},{key:"setValue",value:function(e,t){this._setValue(this,e,t)}},{key:"setValid",value:function(e,t){return this.length=this._nulls.set(e,+t).length,t}},{key:"addChild",value:function(e){arguments.length>1&&void 0!==arguments[1]||"".concat(this.numChildren);throw new Error('Cannot append children to non-nested type "'.concat(this.type,'"'))}},{key:"getChildAt",value:function(e){return this.children[e]||null}},{key:"flush",value:function(){var e=[],t=this._values,n=this._offsets,r=this._typeIds,i=this.length,a=this.nullCount;r?(e[Wt.TYPE]=r.flush(i),n&&(e[Wt.OFFSET]=n.flush(i))):n?(t&&(e[Wt.DATA]=t.flush(n.last())),e[Wt.OFFSET]=n.flush(i)):t&&(e[Wt.DATA]=t.flush(i)),a>0&&(e[Wt.VALIDITY]=this._nulls.flush(i));var o=ar.new(this.type,0,i,a,e,this.children.map((function(e){return e.flush()})));return this.clear(),o}},{key:"finish",value:function(){return this.finished=!0,this.children.forEach((function(e){return e.finish()})),this}},{key:"clear",value:function(){return this.length=0,this._offsets&&this._offsets.clear(),this._values&&this._values.clear(),this._nulls&&this._nulls.clear(),this._typeIds&&this._typeIds.clear(),this.children.forEach((function(e){return e.clear()})),this}}],[{key:"new",value:function(e){}},{key:"throughNode",value:function(e){throw new Error('"throughNode" not available in this environment')}},{key:"throughDOM",value:function(e){throw new Error('"throughDOM" not available in this environment')}},{key:"throughIterable",value:function(e){return function(e){var t=e.queueingStrategy,n=void 0===t?"count":t,r=e.highWaterMark,i=void 0===r?"bytes"!==n?1e3:Math.pow(2,14):r,a="bytes"!==n?"length":"byteLength";return M.mark((function t(n){var r,o,u,s,c;return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:r=0,o=br.new(e),u=B(n),t.prev=3,u.s();case 5:if((s=u.n()).done){t.next=14;break}if(c=s.value,!(o.append(c)[a]>=i)){t.next=12;break}if(t.t0=++r,!t.t0){t.next=12;break}return t.next=12,o.toVector();case 12:t.next=5;break;case 14:t.next=19;break;case 16:t.prev=16,t.t1=t.catch(3),u.e(t.t1);case 19:return t.prev=19,u.f(),t.finish(19);case 22:if(!(o.finish().length>0||0===r)){t.next=25;break}return t.next=25,o.toVector();case 25:case"end":return t.stop()}}),t,null,[[3,16,19,22]])}))}(e)}},{key:"throughAsyncIterable",value:function(e){return function(e){var t=e.queueingStrategy,n=void 0===t?"count":t,r=e.highWaterMark,i=void 0===r?"bytes"!==n?1e3:Math.pow(2,14):r,a="bytes"!==n?"length":"byteLength";return function(){var t=z(M.mark((function t(n){var r,o,u,s,c,l,f,h;return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:r=0,o=br.new(e),u=!1,s=!1,t.prev=4,l=yr(n);case 6:return t.next=8,P(l.next());case 8:if(!(u=!(f=t.sent).done)){t.next=18;break}if(h=f.value,!(o.append(h)[a]>=i)){t.next=15;break}if(t.t0=++r,!t.t0){t.next=15;break}return t.next=15,o.toVector();case 15:u=!1,t.next=6;break;case 18:t.next=24;break;case 20:t.prev=20,t.t1=t.catch(4),s=!0,c=t.t1;case 24:if(t.prev=24,t.prev=25,!u||null==l.return){t.next=29;break}return t.next=29,P(l.return());case 29:if(t.prev=29,!s){t.next=32;break}throw c;case 32:return t.finish(29);case 33:return t.finish(24);case 34:if(!(o.finish().length>0||0===r)){t.next=37;break}return t.next=37,o.toVector();case 37:case"end":return t.stop()}}),t,null,[[4,20,24,34],[25,,29,33]])})));return function(e){return t.apply(this,arguments)}}()}(e)}}]),e}();br.prototype.length=1,br.prototype.stride=1,br.prototype.children=null,br.prototype.finished=!1,br.prototype.nullValues=null,br.prototype._isValid=function(){return!0};var mr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._values=new fr(new r.ArrayType(0),r.stride),r}return Object(F.a)(n,[{key:"setValue",value:function(e,t){var r=this._values;return r.reserve(e-r.length+1),Object(Pt.a)(Object(Rt.a)(n.prototype),"setValue",this).call(this,e,t)}}]),n}(br),gr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._pendingLength=0,r._offsets=new dr,r}return Object(F.a)(n,[{key:"setValue",value:function(e,t){var n=this._pending||(this._pending=new Map),r=n.get(e);r&&(this._pendingLength-=r.length),this._pendingLength+=t.length,n.set(e,t)}},{key:"setValid",value:function(e,t){return!!Object(Pt.a)(Object(Rt.a)(n.prototype),"setValid",this).call(this,e,t)||((this._pending||(this._pending=new Map)).set(e,void 0),!1)}},{key:"clear",value:function(){return this._pendingLength=0,this._pending=void 0,Object(Pt.a)(Object(Rt.a)(n.prototype),"clear",this).call(this)}},{key:"flush",value:function(){return this._flush(),Object(Pt.a)(Object(Rt.a)(n.prototype),"flush",this).call(this)}},{key:"finish",value:function(){return this._flush(),Object(Pt.a)(Object(Rt.a)(n.prototype),"finish",this).call(this)}},{key:"_flush",value:function(){var e=this._pending,t=this._pendingLength;return this._pendingLength=0,this._pending=void 0,e&&e.size>0&&this._flushPending(e,t),this}}]),n}(br);var kr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._values=new hr,r}return Object(F.a)(n,[{key:"setValue",value:function(e,t){this._values.set(e,+t)}}]),n}(br),wr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"setValue",value:function(e,t){}},{key:"setValid",value:function(e,t){return this.length=Math.max(e+1,this.length),t}}]),n}(br),_r=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),Or=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(_r),xr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(_r),jr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),Sr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r,i=e.type,a=e.nullValues,o=e.dictionaryHashFunction;return Object(C.a)(this,n),(r=t.call(this,{type:new rr(i.dictionary,i.indices,i.id,i.isOrdered)}))._nulls=null,r._dictionaryOffset=0,r._keysToIndices=Object.create(null),r.indices=br.new({type:r.type.indices,nullValues:a}),r.dictionary=br.new({type:r.type.dictionary,nullValues:null}),"function"===typeof o&&(r.valueToKey=o),r}return Object(F.a)(n,[{key:"values",get:function(){return this.indices.values}},{key:"nullCount",get:function(){return this.indices.nullCount}},{key:"nullBitmap",get:function(){return this.indices.nullBitmap}},{key:"byteLength",get:function(){return this.indices.byteLength+this.dictionary.byteLength}},{key:"reservedLength",get:function(){return this.indices.reservedLength+this.dictionary.reservedLength}},{key:"reservedByteLength",get:function(){return this.indices.reservedByteLength+this.dictionary.reservedByteLength}},{key:"isValid",value:function(e){return this.indices.isValid(e)}},{key:"setValid",value:function(e,t){var n=this.indices;return t=n.setValid(e,t),this.length=n.length,t}},{key:"setValue",value:function(e,t){var n=this._keysToIndices,r=this.valueToKey(t),i=n[r];return void 0===i&&(n[r]=i=this._dictionaryOffset+this.dictionary.append(t).length-1),this.indices.setValue(e,i)}},{key:"flush",value:function(){var e=this.type,t=this._dictionary,n=this.dictionary.toVector(),r=this.indices.flush().clone(e);return r.dictionary=t?t.concat(n):n,this.finished||(this._dictionaryOffset+=n.length),this._dictionary=r.dictionary,this.clear(),r}},{key:"finish",value:function(){return this.indices.finish(),this.dictionary.finish(),this._dictionaryOffset=0,this._keysToIndices=Object.create(null),Object(Pt.a)(Object(Rt.a)(n.prototype),"finish",this).call(this)}},{key:"clear",value:function(){return this.indices.clear(),this.dictionary.clear(),Object(Pt.a)(Object(Rt.a)(n.prototype),"clear",this).call(this)}},{key:"valueToKey",value:function(e){return"string"===typeof e?e:"".concat(e)}}]),n}(br),Tr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),Ir=new Float64Array(1),Er=new Uint32Array(Ir.buffer);function Ar(e){var t=(31744&e)>>10,n=(1023&e)/1024,r=Math.pow(-1,(32768&e)>>15);switch(t){case 31:return r*(n?NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,t-15)*(1+n)}function Br(e){if(e!==e)return 32256;Ir[0]=e;var t=(2147483648&Er[1])>>16&65535,n=2146435072&Er[1],r=0;return n>=1089470464?Er[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&Er[1])>>10):n<=1056964608?(r=1048576+((r=1048576+(1048575&Er[1]))<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&Er[1])>>10),t|n|65535&r}var Dr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),Lr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"setValue",value:function(e,t){this._values.set(e,Br(t))}}]),n}(Dr),Cr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"setValue",value:function(e,t){this._values.set(e,t)}}]),n}(Dr),Fr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"setValue",value:function(e,t){this._values.set(e,t)}}]),n}(Dr),Mr=n(13),Nr=n(14);function Ur(e,t,n){return(Ur=Object(Nr.a)()?Reflect.construct:function(e,t,n){var r=[null];r.push.apply(r,t);var i=new(Function.bind.apply(e,r));return n&&Object(Mr.a)(i,n.prototype),i}).apply(null,arguments)}var Pr,Rr,zr=Symbol.for("isArrowBigNum");function Vr(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return 0===n.length?Object.setPrototypeOf(Ne(this.TypedArray,e),this.constructor.prototype):Object.setPrototypeOf(Ur(this.TypedArray,[e].concat(n)),this.constructor.prototype)}function Wr(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Vr.apply(this,t)}function Hr(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Vr.apply(this,t)}function Yr(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Vr.apply(this,t)}function $r(e){for(var t,n,r=e.buffer,i=e.byteOffset,a=e.length,o=e.signed,u=new Int32Array(r,i,a),s=0,c=0,l=u.length;c<l;)n=u[c++],t=u[c++],o||(t>>>=0),s+=(n>>>0)+t*Math.pow(c,32);return s}function Kr(e){var t="",n=new Uint32Array(2),r=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2),i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer),a=-1,o=r.length-1;do{for(n[0]=r[a=0];a<o;)r[a++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[a];r[a]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],t="".concat(n[0]).concat(t)}while(i[0]||i[1]||i[2]||i[3]);return t||"0"}Vr.prototype[zr]=!0,Vr.prototype.toJSON=function(){return'"'.concat(Pr(this),'"')},Vr.prototype.valueOf=function(){return $r(this)},Vr.prototype.toString=function(){return Pr(this)},Vr.prototype[Symbol.toPrimitive]=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"default";switch(e){case"number":return $r(this);case"string":return Pr(this);case"default":return Rr(this)}return Pr(this)},Object.setPrototypeOf(Wr.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(Hr.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(Yr.prototype,Object.create(Uint32Array.prototype)),Object.assign(Wr.prototype,Vr.prototype,{constructor:Wr,signed:!0,TypedArray:Int32Array,BigIntArray:he}),Object.assign(Hr.prototype,Vr.prototype,{constructor:Hr,signed:!1,TypedArray:Uint32Array,BigIntArray:pe}),Object.assign(Yr.prototype,Vr.prototype,{constructor:Yr,signed:!0,TypedArray:Uint32Array,BigIntArray:pe}),le?(Rr=function(e){return 8===e.byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:Kr(e)},Pr=function(e){return 8===e.byteLength?"".concat(new e.BigIntArray(e.buffer,e.byteOffset,1)[0]):Kr(e)}):Rr=Pr=Kr;var Qr,qr=function(){function e(t,n){return Object(C.a)(this,e),e.new(t,n)}return Object(F.a)(e,null,[{key:"new",value:function(e,t){switch(t){case!0:return new Wr(e);case!1:return new Hr(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case he:return new Wr(e)}return 16===e.byteLength?new Yr(e):new Hr(e)}},{key:"signed",value:function(e){return new Wr(e)}},{key:"unsigned",value:function(e){return new Hr(e)}},{key:"decimal",value:function(e){return new Yr(e)}}]),e}(),Gr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"setValue",value:function(e,t){this._values.set(e,t)}}]),n}(mr),Jr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Gr),Zr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Gr),Xr=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Gr),ei=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),e.nullValues&&(e.nullValues=e.nullValues.map(ai)),(r=t.call(this,e))._values=new pr(new Int32Array(0),2),r}return Object(F.a)(n,[{key:"values64",get:function(){return this._values.buffer64}},{key:"isValid",value:function(e){return Object(Pt.a)(Object(Rt.a)(n.prototype),"isValid",this).call(this,ai(e))}}]),n}(Gr),ti=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Gr),ni=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Gr),ri=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Gr),ii=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),e.nullValues&&(e.nullValues=e.nullValues.map(ai)),(r=t.call(this,e))._values=new pr(new Uint32Array(0),2),r}return Object(F.a)(n,[{key:"values64",get:function(){return this._values.buffer64}},{key:"isValid",value:function(e){return Object(Pt.a)(Object(Rt.a)(n.prototype),"isValid",this).call(this,ai(e))}}]),n}(Gr),ai=(Qr={BigIntArray:he},function(e){return ArrayBuffer.isView(e)&&(Qr.buffer=e.buffer,Qr.byteOffset=e.byteOffset,Qr.byteLength=e.byteLength,e=Rr(Qr),Qr.buffer=null),e}),oi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),ui=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(oi),si=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(oi),ci=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(oi),li=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(oi),fi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),hi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(fi),di=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(fi),pi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(fi),yi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(fi),vi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(mr),bi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(vi),mi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(vi),gi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._values=new lr(new Uint8Array(0)),r}return Object(F.a)(n,[{key:"byteLength",get:function(){var e=this._pendingLength+4*this.length;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}},{key:"setValue",value:function(e,t){return Object(Pt.a)(Object(Rt.a)(n.prototype),"setValue",this).call(this,e,Ve(t))}},{key:"_flushPending",value:function(e,t){var n,r,i=this._offsets,a=this._values.reserve(t).buffer,o=0,u=0,s=0,c=B(e);try{for(c.s();!(r=c.n()).done;){var l=N(r.value,2);o=l[0],void 0===(n=l[1])?i.set(o,0):(u=n.length,a.set(n,s),i.set(o,u),s+=u)}}catch(f){c.e(f)}finally{c.f()}}}]),n}(gr),ki=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._values=new lr(new Uint8Array(0)),r}return Object(F.a)(n,[{key:"byteLength",get:function(){var e=this._pendingLength+4*this.length;return this._offsets&&(e+=this._offsets.byteLength),this._values&&(e+=this._values.byteLength),this._nulls&&(e+=this._nulls.byteLength),e}},{key:"setValue",value:function(e,t){return Object(Pt.a)(Object(Rt.a)(n.prototype),"setValue",this).call(this,e,te(t))}},{key:"_flushPending",value:function(e,t){}}]),n}(gr);ki.prototype._flushPending=gi.prototype._flushPending;var wi=function(){function e(){Object(C.a)(this,e)}return Object(F.a)(e,[{key:"length",get:function(){return this._values.length}},{key:"get",value:function(e){return this._values[e]}},{key:"clear",value:function(){return this._values=null,this}},{key:"bind",value:function(e){return e instanceof zt?e:(this._values=e,this)}}]),e}(),_i=n(11),Oi=n(10),xi=Symbol.for("parent"),ji=Symbol.for("rowIndex"),Si=Symbol.for("keyToIdx"),Ti=Symbol.for("idxToVal"),Ii=Symbol.for("nodejs.util.inspect.custom"),Ei=function(e){function t(e,n){Object(C.a)(this,t),this[xi]=e,this.size=n}return Object(F.a)(t,[{key:"entries",value:function(){return this[Symbol.iterator]()}},{key:"has",value:function(e){return void 0!==this.get(e)}},{key:"get",value:function(e){var t=void 0;if(null!==e&&void 0!==e){var n=this[Si]||(this[Si]=new Map),r=n.get(e);if(void 0!==r){var i=this[Ti]||(this[Ti]=new Array(this.size));void 0!==(t=i[r])||(i[r]=t=this.getValue(r))}else if((r=this.getIndex(e))>-1){n.set(e,r);var a=this[Ti]||(this[Ti]=new Array(this.size));void 0!==(t=a[r])||(a[r]=t=this.getValue(r))}}return t}},{key:"set",value:function(e,t){if(null!==e&&void 0!==e){var n=this[Si]||(this[Si]=new Map),r=n.get(e);if(void 0===r&&n.set(e,r=this.getIndex(e)),r>-1)(this[Ti]||(this[Ti]=new Array(this.size)))[r]=this.setValue(r,t)}return this}},{key:"clear",value:function(){throw new Error("Clearing ".concat(this[Symbol.toStringTag]," not supported."))}},{key:"delete",value:function(e){throw new Error("Deleting ".concat(this[Symbol.toStringTag]," values not supported."))}},{key:e,value:M.mark((function e(){var t,n,r,i,a,o,u,s,c;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=this.keys(),n=this.values(),r=this[Si]||(this[Si]=new Map),i=this[Ti]||(this[Ti]=new Array(this.size)),u=0;case 5:if((s=t.next()).done||(c=n.next()).done){e.next=15;break}return a=s.value,o=c.value,i[u]=o,r.has(a)||r.set(a,u),e.next=12,[a,o];case 12:++u,e.next=5;break;case 15:case"end":return e.stop()}}),e,this)}))},{key:"forEach",value:function(e,t){for(var n,r,i,a,o=this.keys(),u=this.values(),s=void 0===t?e:function(n,r,i){return e.call(t,n,r,i)},c=this[Si]||(this[Si]=new Map),l=this[Ti]||(this[Ti]=new Array(this.size)),f=0;!(i=o.next()).done&&!(a=u.next()).done;++f)n=i.value,r=a.value,l[f]=r,c.has(n)||c.set(n,f),s(r,n,this)}},{key:"toArray",value:function(){return sn(this.values())}},{key:"toJSON",value:function(){var e={};return this.forEach((function(t,n){return e[n]=t})),e}},{key:"inspect",value:function(){return this.toString()}},{key:Ii,value:function(){return this.toString()}},{key:"toString",value:function(){var e=[];return this.forEach((function(t,n){n=or(n),t=or(t),e.push("".concat(n,": ").concat(t))})),"{ ".concat(e.join(", ")," }")}}]),t}(Symbol.iterator);Ei[Symbol.toStringTag]=function(e){var t;return Object.defineProperties(e,(At(t={size:{writable:!0,enumerable:!1,configurable:!1,value:0}},xi,{writable:!0,enumerable:!1,configurable:!1,value:null}),At(t,ji,{writable:!0,enumerable:!1,configurable:!1,value:-1}),t)),e[Symbol.toStringTag]="Row"}(Ei.prototype);var Ai=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),r=t.call(this,e,e.length),Object(_i.a)(r,Ci(Object(Oi.a)(r)))}return Object(F.a)(n,[{key:"keys",value:function(){return this[xi].getChildAt(0)[Symbol.iterator]()}},{key:"values",value:function(){return this[xi].getChildAt(1)[Symbol.iterator]()}},{key:"getKey",value:function(e){return this[xi].getChildAt(0).get(e)}},{key:"getIndex",value:function(e){return this[xi].getChildAt(0).indexOf(e)}},{key:"getValue",value:function(e){return this[xi].getChildAt(1).get(e)}},{key:"setValue",value:function(e,t){this[xi].getChildAt(1).set(e,t)}}]),n}(Ei),Bi=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),r=t.call(this,e,e.type.children.length),Object(_i.a)(r,Li(Object(Oi.a)(r)))}return Object(F.a)(n,[{key:"keys",value:M.mark((function e(){var t,n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=B(this[xi].type.children),e.prev=1,t.s();case 3:if((n=t.n()).done){e.next=9;break}return r=n.value,e.next=7,r.name;case 7:e.next=3;break;case 9:e.next=14;break;case 11:e.prev=11,e.t0=e.catch(1),t.e(e.t0);case 14:return e.prev=14,t.f(),e.finish(14);case 17:case"end":return e.stop()}}),e,this,[[1,11,14,17]])}))},{key:"values",value:M.mark((function e(){var t,n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=B(this[xi].type.children),e.prev=1,t.s();case 3:if((n=t.n()).done){e.next=9;break}return r=n.value,e.next=7,this[r.name];case 7:e.next=3;break;case 9:e.next=14;break;case 11:e.prev=11,e.t0=e.catch(1),t.e(e.t0);case 14:return e.prev=14,t.f(),e.finish(14);case 17:case"end":return e.stop()}}),e,this,[[1,11,14,17]])}))},{key:"getKey",value:function(e){return this[xi].type.children[e].name}},{key:"getIndex",value:function(e){return this[xi].type.children.findIndex((function(t){return t.name===e}))}},{key:"getValue",value:function(e){return this[xi].getChildAt(e).get(this[ji])}},{key:"setValue",value:function(e,t){return this[xi].getChildAt(e).set(this[ji],t)}}]),n}(Ei);Object.setPrototypeOf(Ei.prototype,Map.prototype);var Di,Li=function(){var e={enumerable:!0,configurable:!1,get:null,set:null};return function(t){var n,r=-1,i=t[Si]||(t[Si]=new Map),a=function(e){return function(){return this.get(e)}},o=function(e){return function(t){return this.set(e,t)}},u=B(t.keys());try{for(u.s();!(n=u.n()).done;){var s=n.value;i.set(s,++r),e.get=a(s),e.set=o(s),t.hasOwnProperty(s)||(e.enumerable=!0,Object.defineProperty(t,s,e)),t.hasOwnProperty(r)||(e.enumerable=!1,Object.defineProperty(t,r,e))}}catch(c){u.e(c)}finally{u.f()}return e.get=e.set=null,t}}(),Ci=function(){if("undefined"===typeof Proxy)return Li;var e=Ei.prototype.has,t=Ei.prototype.get,n=Ei.prototype.set,r=Ei.prototype.getKey,i={isExtensible:function(){return!1},deleteProperty:function(){return!1},preventExtensions:function(){return!0},ownKeys:function(e){return sn(e.keys()).map((function(e){return"".concat(e)}))},has:function(e,t){switch(t){case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:case xi:case ji:case Ti:case Si:case Ii:return!0}return"number"!==typeof t||e.has(t)||(t=e.getKey(t)),e.has(t)},get:function(n,i,a){switch(i){case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:case xi:case ji:case Ti:case Si:case Ii:return Reflect.get(n,i,a)}return"number"!==typeof i||e.call(a,i)||(i=r.call(a,i)),t.call(a,i)},set:function(t,i,a,o){switch(i){case xi:case ji:case Ti:case Si:return Reflect.set(t,i,a,o);case"getKey":case"getIndex":case"getValue":case"setValue":case"toArray":case"toJSON":case"inspect":case"constructor":case"isPrototypeOf":case"propertyIsEnumerable":case"toString":case"toLocaleString":case"valueOf":case"size":case"has":case"get":case"set":case"clear":case"delete":case"keys":case"values":case"entries":case"forEach":case"__proto__":case"__defineGetter__":case"__defineSetter__":case"hasOwnProperty":case"__lookupGetter__":case"__lookupSetter__":case Symbol.iterator:case Symbol.toStringTag:return!1}return"number"!==typeof i||e.call(o,i)||(i=r.call(o,i)),!!e.call(o,i)&&!!n.call(o,i,a)}};return function(e){return new Proxy(e,i)}}();function Fi(e,t,n){var r=e.length,i=t>-1?t:r+t%r;return n?n(e,i):i}function Mi(e,t,n,r){var i=e.length,a=void 0===i?0:i,o="number"!==typeof t?0:t,u="number"!==typeof n?a:n;return o<0&&(o=(o%a+a)%a),u<0&&(u=(u%a+a)%a),u<o&&(Di=o,o=u,u=Di),u>a&&(u=a),r?r(e,o,u):[o,u]}var Ni=le?ce(0):0,Ui=function(e){return e!==e};function Pi(e){var t=typeof e;if("object"!==t||null===e)return Ui(e)?Ui:"bigint"!==t?function(t){return t===e}:function(t){return Ni+t===e};if(e instanceof Date){var n=e.valueOf();return function(e){return e instanceof Date&&e.valueOf()===n}}return ArrayBuffer.isView(e)?function(t){return!!t&&mt(e,t)}:e instanceof Map?function(e){var t=-1,n=[];return e.forEach((function(e){return n[++t]=Pi(e)})),Ri(n)}(e):Array.isArray(e)?function(e){for(var t=[],n=-1,r=e.length;++n<r;)t[n]=Pi(e[n]);return Ri(t)}(e):e instanceof zt?function(e){for(var t=[],n=-1,r=e.length;++n<r;)t[n]=Pi(e.get(n));return Ri(t)}(e):function(e){var t=Object.keys(e);if(0===t.length)return function(){return!1};for(var n=[],r=-1,i=t.length;++r<i;)n[r]=Pi(e[t[r]]);return Ri(n,t)}(e)}function Ri(e,t){return function(n){if(!n||"object"!==typeof n)return!1;switch(n.constructor){case Array:return function(e,t){var n=e.length;if(t.length!==n)return!1;for(var r=-1;++r<n;)if(!e[r](t[r]))return!1;return!0}(e,n);case Map:case Ai:case Bi:return zi(e,n,n.keys());case Object:case void 0:return zi(e,n,t||Object.keys(n))}return n instanceof zt&&function(e,t){var n=e.length;if(t.length!==n)return!1;for(var r=-1;++r<n;)if(!e[r](t.get(r)))return!1;return!0}(e,n)}}function zi(e,t,n){for(var r=n[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),a=t instanceof Map?t.values():Object.values(t)[Symbol.iterator](),o=0,u=e.length,s=a.next(),c=r.next(),l=i.next();o<u&&!c.done&&!l.done&&!s.done&&(c.value===l.value&&e[o](s.value));++o,c=r.next(),l=i.next(),s=a.next());return!!(o===u&&c.done&&l.done&&s.done)||(r.return&&r.return(),i.return&&i.return(),a.return&&a.return(),!1)}var Vi=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(e){var t,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],a=arguments.length>2&&void 0!==arguments[2]?arguments[2]:Wi(i);return Object(C.a)(this,r),(t=n.call(this))._nullCount=-1,t._type=e,t._chunks=i,t._chunkOffsets=a,t._length=a[a.length-1],t._numChildren=(t._type.children||[]).length,t}return Object(F.a)(r,[{key:"type",get:function(){return this._type}},{key:"length",get:function(){return this._length}},{key:"chunks",get:function(){return this._chunks}},{key:"typeId",get:function(){return this._type.typeId}},{key:"VectorName",get:function(){return"Chunked<".concat(this._type,">")}},{key:"data",get:function(){return this._chunks[0]?this._chunks[0].data:null}},{key:"ArrayType",get:function(){return this._type.ArrayType}},{key:"numChildren",get:function(){return this._numChildren}},{key:"stride",get:function(){return this._chunks[0]?this._chunks[0].stride:1}},{key:"byteLength",get:function(){return this._chunks.reduce((function(e,t){return e+t.byteLength}),0)}},{key:"nullCount",get:function(){var e=this._nullCount;return e<0&&(this._nullCount=e=this._chunks.reduce((function(e,t){return e+t.nullCount}),0)),e}},{key:"indices",get:function(){if(xn.isDictionary(this._type)){if(!this._indices){var e=this._chunks;this._indices=1===e.length?e[0].indices:r.concat.apply(r,sn(e.map((function(e){return e.indices}))))}return this._indices}return null}},{key:"dictionary",get:function(){return xn.isDictionary(this._type)?this._chunks[this._chunks.length-1].data.dictionary:null}},{key:t,value:M.mark((function e(){var t,n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=B(this._chunks),e.prev=1,t.s();case 3:if((n=t.n()).done){e.next=8;break}return r=n.value,e.delegateYield(r,"t0",6);case 6:e.next=3;break;case 8:e.next=13;break;case 10:e.prev=10,e.t1=e.catch(1),t.e(e.t1);case 13:return e.prev=13,t.f(),e.finish(13);case 16:case"end":return e.stop()}}),e,this,[[1,10,13,16]])}))},{key:"clone",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._chunks;return new r(this._type,e)}},{key:"concat",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.clone(r.flatten.apply(r,[this].concat(t)))}},{key:"slice",value:function(e,t){return Mi(this,e,t,this._sliceInternal)}},{key:"getChildAt",value:function(e){if(e<0||e>=this._numChildren)return null;var t,n,i,a=this._children||(this._children=[]);return(t=a[e])?t:(n=(this._type.children||[])[e])&&(i=this._chunks.map((function(t){return t.getChildAt(e)})).filter((function(e){return null!=e}))).length>0?a[e]=new r(n.type,i):null}},{key:"search",value:function(e,t){var n=e,r=this._chunkOffsets,i=r.length-1;if(n<0)return null;if(n>=r[i])return null;if(i<=1)return t?t(this,0,n):[0,n];var a=0,o=0,u=0;do{if(a+1===i)return t?t(this,a,n-o):[a,n-o];n>=r[u=a+(i-a)/2|0]?a=u:i=u}while(n<r[i]&&n>=(o=r[a]));return null}},{key:"isValid",value:function(e){return!!this.search(e,this.isValidInternal)}},{key:"get",value:function(e){return this.search(e,this.getInternal)}},{key:"set",value:function(e,t){this.search(e,(function(e,n,r){return e.chunks[n].set(r,t)}))}},{key:"indexOf",value:function(e,t){var n=this;return t&&"number"===typeof t?this.search(t,(function(t,r,i){return n.indexOfInternal(t,r,i,e)})):this.indexOfInternal(this,0,Math.max(0,t||0),e)}},{key:"toArray",value:function(){var e=this.chunks,t=e.length,n=this._type.ArrayType;if(t<=0)return new n(0);if(t<=1)return e[0].toArray();for(var r=0,i=new Array(t),a=-1;++a<t;)r+=(i[a]=e[a].toArray()).length;n!==i[0].constructor&&(n=i[0].constructor);for(var o=new n(r),u=n===Array?Yi:Hi,s=-1,c=0;++s<t;)c=u(i[s],o,c);return o}},{key:"getInternal",value:function(e,t,n){return e._chunks[t].get(n)}},{key:"isValidInternal",value:function(e,t,n){return e._chunks[t].isValid(n)}},{key:"indexOfInternal",value:function(e,t,n,r){for(var i=e._chunks,a=t-1,o=i.length,u=n,s=0,c=-1;++a<o;){if(~(c=i[a].indexOf(r,u)))return s+c;u=0,s+=i[a].length}return-1}},{key:"_sliceInternal",value:function(e,t,n){for(var r=[],i=e.chunks,a=e._chunkOffsets,o=-1,u=i.length;++o<u;){var s=i[o],c=s.length,l=a[o];if(l>=n)break;if(!(t>=l+c))if(l>=t&&l+c<=n)r.push(s);else{var f=Math.max(0,t-l),h=Math.min(n-l,c);r.push(s.slice(f,h))}}return e.clone(r)}}],[{key:"flatten",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Zi(zt,t)}},{key:"concat",value:function(){var e=r.flatten.apply(r,arguments);return new r(e[0].type,e)}}]),r}(zt,Symbol.iterator);function Wi(e){for(var t=new Uint32Array((e||[]).length+1),n=t[0]=0,r=t.length,i=0;++i<r;)t[i]=n+=e[i-1].length;return t}var Hi=function(e,t,n){return t.set(e,n),n+e.length},Yi=function(e,t,n){for(var r=n,i=-1,a=e.length;++i<a;)t[r++]=e[i];return r},$i=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],a=arguments.length>2?arguments[2]:void 0;return Object(C.a)(this,n),i=Vi.flatten.apply(Vi,sn(i)),(r=t.call(this,e.type,i,a))._field=e,1!==i.length||Object(Oi.a)(r)instanceof Ki?r:Object(_i.a)(r,new Ki(e,i[0],r._chunkOffsets))}return Object(F.a)(n,[{key:"field",get:function(){return this._field}},{key:"name",get:function(){return this._field.name}},{key:"nullable",get:function(){return this._field.nullable}},{key:"metadata",get:function(){return this._field.metadata}},{key:"clone",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._chunks;return new n(this._field,e)}},{key:"getChildAt",value:function(e){if(e<0||e>=this.numChildren)return null;var t,r,i,a=this._children||(this._children=[]);return(t=a[e])?t:(r=(this.type.children||[])[e])&&(i=this._chunks.map((function(t){return t.getChildAt(e)})).filter((function(e){return null!=e}))).length>0?a[e]=new n(r,i):null}}],[{key:"new",value:function(e,t){for(var r=arguments.length,i=new Array(r>2?r-2:0),a=2;a<r;a++)i[a-2]=arguments[a];var o=Vi.flatten(Array.isArray(t)?[].concat(sn(t),i):t instanceof zt?[t].concat(i):[zt.new.apply(zt,[t].concat(i))]);if("string"===typeof e){var u=o[0].data.type;e=new ia(e,u,!0)}else!e.nullable&&o.some((function(e){return e.nullCount>0}))&&(e=e.clone({nullable:!0}));return new n(e,o)}}]),n}(Vi),Ki=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r,i){var a;return Object(C.a)(this,n),(a=t.call(this,e,[r],i))._chunk=r,a}return Object(F.a)(n,[{key:"search",value:function(e,t){return t?t(this,0,e):[0,e]}},{key:"isValid",value:function(e){return this._chunk.isValid(e)}},{key:"get",value:function(e){return this._chunk.get(e)}},{key:"set",value:function(e,t){this._chunk.set(e,t)}},{key:"indexOf",value:function(e,t){return this._chunk.indexOf(e,t)}}]),n}($i),Qi=Array.isArray,qi=function(e,t){return ea(e,t,[],0)},Gi=function(e){var t=N(na(e,[[],[]]),2),n=t[0];return t[1].map((function(e,t){return e instanceof $i?$i.new(e.field.clone(n[t]),e):e instanceof zt?$i.new(n[t],e):$i.new(n[t],[])}))},Ji=function(e){return na(e,[[],[]])},Zi=function(e,t){return function e(t,n,r,i){var a,o=i,u=-1,s=n.length;for(;++u<s;)Qi(a=n[u])?o=e(t,a,r,o).length:a instanceof Vi?o=e(t,a.chunks,r,o).length:a instanceof t&&(r[o++]=a);return r}(e,t,[],0)},Xi=function(e,t){return function e(t,n,r,i){var a,o=i,u=-1,s=n.length;for(;++u<s;)Qi(a=n[u])?o=e(t,a,r,o).length:a instanceof t?o=ea(zt,a.schema.fields.map((function(e,t){return a.getChildAt(t)})),r,o).length:a instanceof zt&&(r[o++]=a);return r}(e,t,[],0)};function ea(e,t,n,r){for(var i,a=r,o=-1,u=t.length;++o<u;)Qi(i=t[o])?a=ea(e,i,n,a).length:i instanceof e&&(n[a++]=i);return n}var ta=function(e,t,n){var r=N(t,2),i=r[0],a=r[1];return e[0][n]=i,e[1][n]=a,e};function na(e,t){var n,r;switch(r=e.length){case 0:return t;case 1:if(n=t[0],!e[0])return t;if(Qi(e[0]))return na(e[0],t);if(!(e[0]instanceof ar||e[0]instanceof zt||e[0]instanceof xn)){var i=N(Object.entries(e[0]).reduce(ta,t),2);n=i[0],e=i[1]}break;default:Qi(n=e[r-1])?e=Qi(e[0])?e[0]:e.slice(0,r-1):(e=Qi(e[0])?e[0]:e,n=[])}for(var a,o,u=-1,s=-1,c=-1,l=e.length,f=N(t,2),h=f[0],d=f[1];++c<l;)if((o=e[c])instanceof $i&&(d[++s]=o))h[++u]=o.field.clone(n[c],o.type,!0);else{var p=n[c];a=void 0===p?c:p,o instanceof xn&&(d[++s]=o)?h[++u]=ia.new(a,o,!0):o&&o.type&&(d[++s]=o)&&(o instanceof ar&&(d[s]=o=zt.new(o)),h[++u]=ia.new(a,o.type,!0))}return t}var ra=function(e){function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],n=arguments.length>1?arguments[1]:void 0,r=arguments.length>2?arguments[2]:void 0;Object(C.a)(this,t),this.fields=e||[],this.metadata=n||new Map,r||(r=oa(e)),this.dictionaries=r}return Object(F.a)(t,[{key:e,get:function(){return"Schema"}},{key:"toString",value:function(){return"Schema<{ ".concat(this.fields.map((function(e,t){return"".concat(t,": ").concat(e)})).join(", ")," }>")}},{key:"compareTo",value:function(e){return On.compareSchemas(this,e)}},{key:"select",value:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];var i=n.reduce((function(e,t){return(e[t]=!0)&&e}),Object.create(null));return new t(this.fields.filter((function(e){return i[e.name]})),this.metadata)}},{key:"selectAt",value:function(){for(var e=this,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];return new t(r.map((function(t){return e.fields[t]})).filter(Boolean),this.metadata)}},{key:"assign",value:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];var i=n[0]instanceof t?n[0]:new t(qi(ia,n)),a=sn(this.fields),o=aa(aa(new Map,this.metadata),i.metadata),u=i.fields.filter((function(e){var t=a.findIndex((function(t){return t.name===e.name}));return!~t||(a[t]=e.clone({metadata:aa(aa(new Map,a[t].metadata),e.metadata)}))&&!1})),s=oa(u,new Map);return new t([].concat(sn(a),sn(u)),o,new Map([].concat(sn(this.dictionaries),sn(s))))}}],[{key:"from",value:function(){return t.new(arguments.length<=0?void 0:arguments[0],arguments.length<=1?void 0:arguments[1])}},{key:"new",value:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return new t(Ji(n)[0])}}]),t}(Symbol.toStringTag),ia=function(e){function t(e,n){var r=arguments.length>2&&void 0!==arguments[2]&&arguments[2],i=arguments.length>3?arguments[3]:void 0;Object(C.a)(this,t),this.name=e,this.type=n,this.nullable=r,this.metadata=i||new Map}return Object(F.a)(t,[{key:"typeId",get:function(){return this.type.typeId}},{key:e,get:function(){return"Field"}},{key:"toString",value:function(){return"".concat(this.name,": ").concat(this.type)}},{key:"compareTo",value:function(e){return On.compareField(this,e)}},{key:"clone",value:function(){for(var e,n,r,i,a,o,u,s,c,l,f=arguments.length,h=new Array(f),d=0;d<f;d++)h[d]=arguments[d];var p=h[0],y=h[1],v=h[2],b=h[3];return h[0]&&"object"===typeof h[0]?(p=void 0===(u=(o=h[0]).name)?this.name:u,y=void 0===(s=o.type)?this.type:s,v=void 0===(c=o.nullable)?this.nullable:c,b=void 0===(l=o.metadata)?this.metadata:l):(p=void 0===(n=(e=N(h,4))[0])?this.name:n,y=void 0===(r=e[1])?this.type:r,v=void 0===(i=e[2])?this.nullable:i,b=void 0===(a=e[3])?this.metadata:a),t.new(p,y,v,b)}}],[{key:"new",value:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];var i=n[0],a=n[1],o=n[2],u=n[3];return n[0]&&"object"===typeof n[0]&&(i=n[0].name,void 0===a&&(a=n[0].type),void 0===o&&(o=n[0].nullable),void 0===u&&(u=n[0].metadata)),new t("".concat(i),a,o,u)}}]),t}(Symbol.toStringTag);function aa(e,t){return new Map([].concat(sn(e||new Map),sn(t||new Map)))}function oa(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map,n=-1,r=e.length;++n<r;){var i=e[n],a=i.type;if(xn.isDictionary(a))if(t.has(a.id)){if(t.get(a.id)!==a.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else t.set(a.id,a.dictionary);a.children&&a.children.length>0&&oa(a.children,t)}return t}ra.prototype.fields=null,ra.prototype.metadata=null,ra.prototype.dictionaries=null,ia.prototype.type=null,ia.prototype.name=null,ia.prototype.nullable=null,ia.prototype.metadata=null;var ua=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._run=new wi,r._offsets=new dr,r}return Object(F.a)(n,[{key:"addChild",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"0";if(this.numChildren>0)throw new Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new qn(new ia(t,e.type,!0)),this.numChildren-1}},{key:"clear",value:function(){return this._run.clear(),Object(Pt.a)(Object(Rt.a)(n.prototype),"clear",this).call(this)}},{key:"_flushPending",value:function(e){var t,n,r=this._run,i=this._offsets,a=this._setValue,o=0,u=B(e);try{for(u.s();!(n=u.n()).done;){var s=N(n.value,2);o=s[0],void 0===(t=s[1])?i.set(o,0):(i.set(o,t.length),a(this,o,r.bind(t)))}}catch(c){u.e(c)}finally{u.f()}}}]),n}(gr),sa=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e;return Object(C.a)(this,n),(e=t.apply(this,arguments))._run=new wi,e}return Object(F.a)(n,[{key:"setValue",value:function(e,t){Object(Pt.a)(Object(Rt.a)(n.prototype),"setValue",this).call(this,e,this._run.bind(t))}},{key:"addChild",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"0";if(this.numChildren>0)throw new Error("FixedSizeListBuilder can only have one child.");var n=this.children.push(e);return this.type=new Xn(this.type.listSize,new ia(t,e.type,!0)),n}},{key:"clear",value:function(){return this._run.clear(),Object(Pt.a)(Object(Rt.a)(n.prototype),"clear",this).call(this)}}]),n}(br),ca=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"set",value:function(e,t){return Object(Pt.a)(Object(Rt.a)(n.prototype),"set",this).call(this,e,t)}},{key:"setValue",value:function(e,t){t=t instanceof Map?t:new Map(Object.entries(t));var n=this._pending||(this._pending=new Map),r=n.get(e);r&&(this._pendingLength-=r.size),this._pendingLength+=t.size,n.set(e,t)}},{key:"addChild",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"".concat(this.numChildren);if(this.numChildren>0)throw new Error("ListBuilder can only have one child.");return this.children[this.numChildren]=e,this.type=new er(new ia(t,e.type,!0),this.type.keysSorted),this.numChildren-1}},{key:"_flushPending",value:function(e){var t=this,n=this._offsets,r=this._setValue;e.forEach((function(e,i){void 0===e?n.set(i,0):(n.set(i,e.size),r(t,i,e))}))}}]),n}(gr),la=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"addChild",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"".concat(this.numChildren),n=this.children.push(e);return this.type=new Gn([].concat(sn(this.type.children),[new ia(t,e.type,!0)])),n}}]),n}(br),fa=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._typeIds=new fr(new Int8Array(0),1),"function"===typeof e.valueToChildTypeId&&(r._valueToChildTypeId=e.valueToChildTypeId),r}return Object(F.a)(n,[{key:"typeIdToChildIndex",get:function(){return this.type.typeIdToChildIndex}},{key:"append",value:function(e,t){return this.set(this.length,e,t)}},{key:"set",value:function(e,t,n){return void 0===n&&(n=this._valueToChildTypeId(this,t,e)),this.setValid(e,this.isValid(t))&&this.setValue(e,t,n),this}},{key:"setValue",value:function(e,t,r){this._typeIds.set(e,r),Object(Pt.a)(Object(Rt.a)(n.prototype),"setValue",this).call(this,e,t)}},{key:"addChild",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"".concat(this.children.length),n=this.children.push(e),r=this.type,i=r.children,a=r.mode,o=r.typeIds,u=[].concat(sn(i),[new ia(t,e.type)]);return this.type=new Jn(a,[].concat(sn(o),[n]),u),n}},{key:"_valueToChildTypeId",value:function(e,t,n){throw new Error("Cannot map UnionBuilder value to child typeId. Pass the `childTypeId` as the second argument to unionBuilder.append(), or supply a `valueToChildTypeId` function as part of the UnionBuilder constructor options.")}}]),n}(br),ha=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(fa),da=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._offsets=new fr(new Int32Array(0)),r}return Object(F.a)(n,[{key:"setValue",value:function(e,t,r){var i=this.type.typeIdToChildIndex[r];return this._offsets.set(e,this.getChildAt(i).length),Object(Pt.a)(Object(Rt.a)(n.prototype),"setValue",this).call(this,e,t,r)}}]),n}(fa),pa=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(cn),ya=function(e,t,n){e[t]=n%4294967296|0,e[t+1]=n/4294967296|0},va=function(e,t,n,r){var i=t[n],a=t[n+1];null!=i&&null!=a&&e.set(r.subarray(0,a-i),i)},ba=function(e,t,n){!function(e,t,n){e[t]=n/864e5|0}(e.values,t,n.valueOf())},ma=function(e,t,n){var r=e.values;ya(r,2*t,n.valueOf())},ga=function(e,t,n){var r=e.stride;e.values[r*t]=n},ka=function(e,t,n){var r=e.stride;e.values[r*t]=Br(n)},wa=function(e,t,n){switch(typeof n){case"bigint":e.values64[t]=n;break;case"number":e.values[t*e.stride]=n;break;default:var r=n,i=e.stride,a=Ne(e.ArrayType,r);e.values.set(a.subarray(0,i),i*t)}},_a=function(e,t,n){var r=e.values;return ya(r,2*t,n/1e3)},Oa=function(e,t,n){var r=e.values;return ya(r,2*t,n)},xa=function(e,t,n){return function(e,t,n){e[t]=1e3*n%4294967296|0,e[t+1]=1e3*n/4294967296|0}(e.values,2*t,n)},ja=function(e,t,n){return function(e,t,n){e[t]=1e6*n%4294967296|0,e[t+1]=1e6*n/4294967296|0}(e.values,2*t,n)},Sa=function(e,t,n){e.values[e.stride*t]=n},Ta=function(e,t,n){e.values[e.stride*t]=n},Ia=function(e,t,n){e.values.set(n.subarray(0,2),2*t)},Ea=function(e,t,n){e.values.set(n.subarray(0,2),2*t)},Aa=function(e,t,n){var r=e.typeIdToChildIndex[e.typeIds[t]],i=e.getChildAt(r);i&&i.set(e.valueOffsets[t],n)},Ba=function(e,t,n){var r=e.typeIdToChildIndex[e.typeIds[t]],i=e.getChildAt(r);i&&i.set(t,n)},Da=function(e,t,n){e.values.set(n.subarray(0,2),2*t)},La=function(e,t,n){e.values[t]=12*n[0]+n[1]%12};pa.prototype.visitBool=function(e,t,n){var r=e.offset,i=e.values,a=r+t;n?i[a>>3]|=1<<a%8:i[a>>3]&=~(1<<a%8)},pa.prototype.visitInt=function(e,t,n){e.type.bitWidth<64?ga(e,t,n):wa(e,t,n)},pa.prototype.visitInt8=ga,pa.prototype.visitInt16=ga,pa.prototype.visitInt32=ga,pa.prototype.visitInt64=wa,pa.prototype.visitUint8=ga,pa.prototype.visitUint16=ga,pa.prototype.visitUint32=ga,pa.prototype.visitUint64=wa,pa.prototype.visitFloat=function(e,t,n){e.type.precision!==$t.HALF?ga(e,t,n):ka(e,t,n)},pa.prototype.visitFloat16=ka,pa.prototype.visitFloat32=ga,pa.prototype.visitFloat64=ga,pa.prototype.visitUtf8=function(e,t,n){var r=e.values,i=e.valueOffsets;va(r,i,t,te(n))},pa.prototype.visitBinary=function(e,t,n){var r=e.values,i=e.valueOffsets;return va(r,i,t,n)},pa.prototype.visitFixedSizeBinary=function(e,t,n){var r=e.stride;e.values.set(n.subarray(0,r),r*t)},pa.prototype.visitDate=function(e,t,n){e.type.unit===Ht.DAY?ba(e,t,n):ma(e,t,n)},pa.prototype.visitDateDay=ba,pa.prototype.visitDateMillisecond=ma,pa.prototype.visitTimestamp=function(e,t,n){switch(e.type.unit){case Yt.SECOND:return _a(e,t,n);case Yt.MILLISECOND:return Oa(e,t,n);case Yt.MICROSECOND:return xa(e,t,n);case Yt.NANOSECOND:return ja(e,t,n)}},pa.prototype.visitTimestampSecond=_a,pa.prototype.visitTimestampMillisecond=Oa,pa.prototype.visitTimestampMicrosecond=xa,pa.prototype.visitTimestampNanosecond=ja,pa.prototype.visitTime=function(e,t,n){switch(e.type.unit){case Yt.SECOND:return Sa(e,t,n);case Yt.MILLISECOND:return Ta(e,t,n);case Yt.MICROSECOND:return Ia(e,t,n);case Yt.NANOSECOND:return Ea(e,t,n)}},pa.prototype.visitTimeSecond=Sa,pa.prototype.visitTimeMillisecond=Ta,pa.prototype.visitTimeMicrosecond=Ia,pa.prototype.visitTimeNanosecond=Ea,pa.prototype.visitDecimal=function(e,t,n){e.values.set(n.subarray(0,4),4*t)},pa.prototype.visitList=function(e,t,n){for(var r=e.getChildAt(0),i=e.valueOffsets,a=-1,o=i[t],u=i[t+1];o<u;)r.set(o++,n.get(++a))},pa.prototype.visitStruct=function(e,t,n){var r,i,a=n instanceof Map?(r=t,i=n,function(e,t,n){return e&&e.set(r,i.get(t.name))}):n instanceof zt?function(e,t){return function(n,r,i){return n&&n.set(e,t.get(i))}}(t,n):Array.isArray(n)?function(e,t){return function(n,r,i){return n&&n.set(e,t[i])}}(t,n):function(e,t){return function(n,r,i){return n&&n.set(e,t[r.name])}}(t,n);e.type.children.forEach((function(t,n){return a(e.getChildAt(n),t,n)}))},pa.prototype.visitUnion=function(e,t,n){e.type.mode===Kt.Dense?Aa(e,t,n):Ba(e,t,n)},pa.prototype.visitDenseUnion=Aa,pa.prototype.visitSparseUnion=Ba,pa.prototype.visitDictionary=function(e,t,n){var r=e.getKey(t);null!==r&&e.setValue(r,n)},pa.prototype.visitInterval=function(e,t,n){e.type.unit===Qt.DAY_TIME?Da(e,t,n):La(e,t,n)},pa.prototype.visitIntervalDayTime=Da,pa.prototype.visitIntervalYearMonth=La,pa.prototype.visitFixedSizeList=function(e,t,n){for(var r=e.getChildAt(0),i=e.stride,a=-1,o=t*i;++a<i;)r.set(o+a,n.get(a))},pa.prototype.visitMap=function(e,t,n){for(var r=e.getChildAt(0),i=e.valueOffsets,a=n instanceof Map?sn(n):Object.entries(n),o=-1,u=i[t],s=i[t+1];u<s;)r.set(u++,a[++o])};var Ca,Fa=new pa,Ma=new(function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"visitNull",value:function(){return wr}},{key:"visitBool",value:function(){return kr}},{key:"visitInt",value:function(){return Gr}},{key:"visitInt8",value:function(){return Jr}},{key:"visitInt16",value:function(){return Zr}},{key:"visitInt32",value:function(){return Xr}},{key:"visitInt64",value:function(){return ei}},{key:"visitUint8",value:function(){return ti}},{key:"visitUint16",value:function(){return ni}},{key:"visitUint32",value:function(){return ri}},{key:"visitUint64",value:function(){return ii}},{key:"visitFloat",value:function(){return Dr}},{key:"visitFloat16",value:function(){return Lr}},{key:"visitFloat32",value:function(){return Cr}},{key:"visitFloat64",value:function(){return Fr}},{key:"visitUtf8",value:function(){return ki}},{key:"visitBinary",value:function(){return gi}},{key:"visitFixedSizeBinary",value:function(){return Tr}},{key:"visitDate",value:function(){return _r}},{key:"visitDateDay",value:function(){return Or}},{key:"visitDateMillisecond",value:function(){return xr}},{key:"visitTimestamp",value:function(){return fi}},{key:"visitTimestampSecond",value:function(){return hi}},{key:"visitTimestampMillisecond",value:function(){return di}},{key:"visitTimestampMicrosecond",value:function(){return pi}},{key:"visitTimestampNanosecond",value:function(){return yi}},{key:"visitTime",value:function(){return oi}},{key:"visitTimeSecond",value:function(){return ui}},{key:"visitTimeMillisecond",value:function(){return si}},{key:"visitTimeMicrosecond",value:function(){return ci}},{key:"visitTimeNanosecond",value:function(){return li}},{key:"visitDecimal",value:function(){return jr}},{key:"visitList",value:function(){return ua}},{key:"visitStruct",value:function(){return la}},{key:"visitUnion",value:function(){return fa}},{key:"visitDenseUnion",value:function(){return da}},{key:"visitSparseUnion",value:function(){return ha}},{key:"visitDictionary",value:function(){return Sr}},{key:"visitInterval",value:function(){return vi}},{key:"visitIntervalDayTime",value:function(){return bi}},{key:"visitIntervalYearMonth",value:function(){return mi}},{key:"visitFixedSizeList",value:function(){return sa}},{key:"visitMap",value:function(){return ca}}]),n}(cn));br.new=function e(t){var n=t.type,r=new(Ma.getVisitFn(n)())(t);if(n.children&&n.children.length>0){var i=t.children||[],a={nullValues:t.nullValues},o=Array.isArray(i)?function(e,t){return i[t]||a}:function(e){var t=e.name;return i[t]||a};n.children.forEach((function(t,n){var i=t.type,a=o(t,n);r.children.push(e(Dt(Dt({},a),{},{type:i})))}))}return r},Object.keys(Vt).map((function(e){return Vt[e]})).filter((function(e){return"number"===typeof e&&e!==Vt.NONE})).forEach((function(e){Ma.visit(e).prototype._setValue=Fa.getVisitFn(e)})),ki.prototype._setValue=Fa.visitBinary,function(e){!function(t){!function(t){!function(t){var n=function(){function t(){Object(C.a)(this,t),this.bb=null,this.bb_pos=0}return Object(F.a)(t,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"version",value:function(){var e=this.bb.__offset(this.bb_pos,4);return e?this.bb.readInt16(this.bb_pos+e):Lt.apache.arrow.flatbuf.MetadataVersion.V1}},{key:"schema",value:function(e){var t=this.bb.__offset(this.bb_pos,6);return t?(e||new Lt.apache.arrow.flatbuf.Schema).__init(this.bb.__indirect(this.bb_pos+t),this.bb):null}},{key:"dictionaries",value:function(t,n){var r=this.bb.__offset(this.bb_pos,8);return r?(n||new e.apache.arrow.flatbuf.Block).__init(this.bb.__vector(this.bb_pos+r)+24*t,this.bb):null}},{key:"dictionariesLength",value:function(){var e=this.bb.__offset(this.bb_pos,8);return e?this.bb.__vector_len(this.bb_pos+e):0}},{key:"recordBatches",value:function(t,n){var r=this.bb.__offset(this.bb_pos,10);return r?(n||new e.apache.arrow.flatbuf.Block).__init(this.bb.__vector(this.bb_pos+r)+24*t,this.bb):null}},{key:"recordBatchesLength",value:function(){var e=this.bb.__offset(this.bb_pos,10);return e?this.bb.__vector_len(this.bb_pos+e):0}}],[{key:"getRootAsFooter",value:function(e,n){return(n||new t).__init(e.readInt32(e.position())+e.position(),e)}},{key:"startFooter",value:function(e){e.startObject(4)}},{key:"addVersion",value:function(e,t){e.addFieldInt16(0,t,Lt.apache.arrow.flatbuf.MetadataVersion.V1)}},{key:"addSchema",value:function(e,t){e.addFieldOffset(1,t,0)}},{key:"addDictionaries",value:function(e,t){e.addFieldOffset(2,t,0)}},{key:"startDictionariesVector",value:function(e,t){e.startVector(24,t,8)}},{key:"addRecordBatches",value:function(e,t){e.addFieldOffset(3,t,0)}},{key:"startRecordBatchesVector",value:function(e,t){e.startVector(24,t,8)}},{key:"endFooter",value:function(e){return e.endObject()}},{key:"finishFooterBuffer",value:function(e,t){e.finish(t)}},{key:"createFooter",value:function(e,n,r,i,a){return t.startFooter(e),t.addVersion(e,n),t.addSchema(e,r),t.addDictionaries(e,i),t.addRecordBatches(e,a),t.endFooter(e)}}]),t}();t.Footer=n}(t.flatbuf||(t.flatbuf={}))}(t.arrow||(t.arrow={}))}(e.apache||(e.apache={}))}(Ca||(Ca={})),function(e){!function(e){!function(e){!function(e){var t=function(){function e(){Object(C.a)(this,e),this.bb=null,this.bb_pos=0}return Object(F.a)(e,[{key:"__init",value:function(e,t){return this.bb_pos=e,this.bb=t,this}},{key:"offset",value:function(){return this.bb.readInt64(this.bb_pos)}},{key:"metaDataLength",value:function(){return this.bb.readInt32(this.bb_pos+8)}},{key:"bodyLength",value:function(){return this.bb.readInt64(this.bb_pos+16)}}],[{key:"createBlock",value:function(e,t,n,r){return e.prep(8,24),e.writeInt64(r),e.pad(4),e.writeInt32(n),e.writeInt64(t),e.offset()}}]),e}();e.Block=t}(e.flatbuf||(e.flatbuf={}))}(e.arrow||(e.arrow={}))}(e.apache||(e.apache={}))}(Ca||(Ca={}));var Na=W.Long,Ua=W.Builder,Pa=W.ByteBuffer,Ra=Ca.apache.arrow.flatbuf.Block,za=Ca.apache.arrow.flatbuf.Footer,Va=function(){function e(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Gt.V4,r=arguments.length>2?arguments[2]:void 0,i=arguments.length>3?arguments[3]:void 0;Object(C.a)(this,e),this.schema=t,this.version=n,r&&(this._recordBatches=r),i&&(this._dictionaryBatches=i)}return Object(F.a)(e,[{key:"numRecordBatches",get:function(){return this._recordBatches.length}},{key:"numDictionaries",get:function(){return this._dictionaryBatches.length}},{key:"recordBatches",value:M.mark((function e(){var t,n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:n=-1,r=this.numRecordBatches;case 1:if(!(++n<r)){e.next=7;break}if(!(t=this.getRecordBatch(n))){e.next=5;break}return e.next=5,t;case 5:e.next=1;break;case 7:case"end":return e.stop()}}),e,this)}))},{key:"dictionaryBatches",value:M.mark((function e(){var t,n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:n=-1,r=this.numDictionaries;case 1:if(!(++n<r)){e.next=7;break}if(!(t=this.getDictionaryBatch(n))){e.next=5;break}return e.next=5,t;case 5:e.next=1;break;case 7:case"end":return e.stop()}}),e,this)}))},{key:"getRecordBatch",value:function(e){return e>=0&&e<this.numRecordBatches&&this._recordBatches[e]||null}},{key:"getDictionaryBatch",value:function(e){return e>=0&&e<this.numDictionaries&&this._dictionaryBatches[e]||null}}],[{key:"decode",value:function(e){e=new Pa(Ve(e));var t=za.getRootAsFooter(e),n=ra.decode(t.schema());return new Wa(n,t)}},{key:"encode",value:function(e){var t=new Ua,n=ra.encode(t,e.schema);za.startRecordBatchesVector(t,e.numRecordBatches),sn(e.recordBatches()).slice().reverse().forEach((function(e){return Ha.encode(t,e)}));var r=t.endVector();za.startDictionariesVector(t,e.numDictionaries),sn(e.dictionaryBatches()).slice().reverse().forEach((function(e){return Ha.encode(t,e)}));var i=t.endVector();return za.startFooter(t),za.addSchema(t,n),za.addVersion(t,Gt.V4),za.addRecordBatches(t,r),za.addDictionaries(t,i),za.finishFooterBuffer(t,za.endFooter(t)),t.asUint8Array()}}]),e}(),Wa=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this,e,r.version()))._footer=r,i}return Object(F.a)(n,[{key:"numRecordBatches",get:function(){return this._footer.recordBatchesLength()}},{key:"numDictionaries",get:function(){return this._footer.dictionariesLength()}},{key:"getRecordBatch",value:function(e){if(e>=0&&e<this.numRecordBatches){var t=this._footer.recordBatches(e);if(t)return Ha.decode(t)}return null}},{key:"getDictionaryBatch",value:function(e){if(e>=0&&e<this.numDictionaries){var t=this._footer.dictionaries(e);if(t)return Ha.decode(t)}return null}}]),n}(Va),Ha=function(){function e(t,n,r){Object(C.a)(this,e),this.metaDataLength=t,this.offset="number"===typeof r?r:r.low,this.bodyLength="number"===typeof n?n:n.low}return Object(F.a)(e,null,[{key:"decode",value:function(t){return new e(t.metaDataLength(),t.bodyLength(),t.offset())}},{key:"encode",value:function(e,t){var n=t.metaDataLength,r=new Na(t.offset,0),i=new Na(t.bodyLength,0);return Ra.createBlock(e,r,n,i)}}]),e}();function Ya(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new $a(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function $a(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return($a=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new $a(e)}var Ka=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"write",value:function(e){if((e=Ve(e)).byteLength>0)return Object(Pt.a)(Object(Rt.a)(n.prototype),"write",this).call(this,e)}},{key:"toString",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return e?ee(this.toUint8Array(!0)):this.toUint8Array(!1).then(ee)}},{key:"toUint8Array",value:function(){var e=this,t=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return t?Me(this._values)[0]:L(M.mark((function t(){var n,r,i,a,o,u,s,c;return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:n=[],r=0,i=!1,a=!1,t.prev=3,u=Ya(e);case 5:return t.next=7,u.next();case 7:if(!(i=!(s=t.sent).done)){t.next=14;break}c=s.value,n.push(c),r+=c.byteLength;case 11:i=!1,t.next=5;break;case 14:t.next=20;break;case 16:t.prev=16,t.t0=t.catch(3),a=!0,o=t.t0;case 20:if(t.prev=20,t.prev=21,!i||null==u.return){t.next=25;break}return t.next=25,u.return();case 25:if(t.prev=25,!a){t.next=28;break}throw o;case 28:return t.finish(25);case 29:return t.finish(20);case 30:return t.abrupt("return",Me(n,r)[0]);case 31:case"end":return t.stop()}}),t,null,[[3,16,20,30],[21,,25,29]])})))()}}]),n}(ue),Qa=function(e){function t(e){Object(C.a)(this,t),e&&(this.source=new Ga(kt.fromIterable(e)))}return Object(F.a)(t,[{key:e,value:function(){return this}},{key:"next",value:function(e){return this.source.next(e)}},{key:"throw",value:function(e){return this.source.throw(e)}},{key:"return",value:function(e){return this.source.return(e)}},{key:"peek",value:function(e){return this.source.peek(e)}},{key:"read",value:function(e){return this.source.read(e)}}]),t}(Symbol.iterator),qa=function(e){function t(e){Object(C.a)(this,t),e instanceof t?this.source=e.source:e instanceof Ka?this.source=new Ja(kt.fromAsyncIterable(e)):Ee(e)?this.source=new Ja(kt.fromNodeStream(e)):Te(e)?this.source=new Ja(kt.fromDOMStream(e)):je(e)?this.source=new Ja(kt.fromDOMStream(e.body)):ke(e)?this.source=new Ja(kt.fromIterable(e)):(ge(e)||we(e))&&(this.source=new Ja(kt.fromAsyncIterable(e)))}return Object(F.a)(t,[{key:e,value:function(){return this}},{key:"next",value:function(e){return this.source.next(e)}},{key:"throw",value:function(e){return this.source.throw(e)}},{key:"return",value:function(e){return this.source.return(e)}},{key:"closed",get:function(){return this.source.closed}},{key:"cancel",value:function(e){return this.source.cancel(e)}},{key:"peek",value:function(e){return this.source.peek(e)}},{key:"read",value:function(e){return this.source.read(e)}}]),t}(Symbol.asyncIterator),Ga=function(){function e(t){Object(C.a)(this,e),this.source=t}return Object(F.a)(e,[{key:"cancel",value:function(e){this.return(e)}},{key:"peek",value:function(e){return this.next(e,"peek").value}},{key:"read",value:function(e){return this.next(e,"read").value}},{key:"next",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"read";return this.source.next({cmd:t,size:e})}},{key:"throw",value:function(e){return Object.create(this.source.throw&&this.source.throw(e)||ie)}},{key:"return",value:function(e){return Object.create(this.source.return&&this.source.return(e)||ie)}}]),e}(),Ja=function(){function e(t){var n=this;Object(C.a)(this,e),this.source=t,this._closedPromise=new Promise((function(e){return n._closedPromiseResolve=e}))}return Object(F.a)(e,[{key:"cancel",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.return(t);case 2:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"closed",get:function(){return this._closedPromise}},{key:"read",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.next(t,"read");case 2:return e.abrupt("return",e.sent.value);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"peek",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.next(t,"peek");case 2:return e.abrupt("return",e.sent.value);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"next",value:function(){var e=L(M.mark((function e(t){var n,r=arguments;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return n=r.length>1&&void 0!==r[1]?r[1]:"read",e.next=3,this.source.next({cmd:n,size:t});case 3:return e.abrupt("return",e.sent);case 4:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"throw",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.t1=this.source.throw,!e.t1){e.next=5;break}return e.next=4,this.source.throw(t);case 4:e.t1=e.sent;case 5:if(e.t0=e.t1,e.t0){e.next=8;break}e.t0=ie;case 8:return n=e.t0,this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,e.abrupt("return",Object.create(n));case 12:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"return",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.t1=this.source.return,!e.t1){e.next=5;break}return e.next=4,this.source.return(t);case 4:e.t1=e.sent;case 5:if(e.t0=e.t1,e.t0){e.next=8;break}e.t0=ie;case 8:return n=e.t0,this._closedPromiseResolve&&this._closedPromiseResolve(),this._closedPromiseResolve=void 0,e.abrupt("return",Object.create(n));case 12:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()}]),e}(),Za=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).position=0,i.buffer=Ve(e),i.size="undefined"===typeof r?i.buffer.byteLength:r,i}return Object(F.a)(n,[{key:"readInt32",value:function(e){var t=this.readAt(e,4),n=t.buffer,r=t.byteOffset;return new DataView(n,r).getInt32(0,!0)}},{key:"seek",value:function(e){return this.position=Math.min(e,this.size),e<this.size}},{key:"read",value:function(e){var t=this.buffer,n=this.size,r=this.position;return t&&r<n?("number"!==typeof e&&(e=1/0),this.position=Math.min(n,r+Math.min(n-r,e)),t.subarray(r,this.position)):null}},{key:"readAt",value:function(e,t){var n=this.buffer,r=Math.min(this.size,e+t);return n?n.subarray(e,r):new Uint8Array(t)}},{key:"close",value:function(){this.buffer&&(this.buffer=null)}},{key:"throw",value:function(e){return this.close(),{done:!0,value:e}}},{key:"return",value:function(e){return this.close(),{done:!0,value:e}}}]),n}(Qa),Xa=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).position=0,i._handle=e,"number"===typeof r?i.size=r:i._pending=L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,e.stat();case 2:i.size=t.sent.size,delete i._pending;case 4:case"end":return t.stop()}}),t)})))(),i}return Object(F.a)(n,[{key:"readInt32",value:function(){var e=L(M.mark((function e(t){var n,r,i;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.readAt(t,4);case 2:return n=e.sent,r=n.buffer,i=n.byteOffset,e.abrupt("return",new DataView(r,i).getInt32(0,!0));case 6:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"seek",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.t0=this._pending,!e.t0){e.next=4;break}return e.next=4,this._pending;case 4:return this.position=Math.min(t,this.size),e.abrupt("return",t<this.size);case 6:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"read",value:function(){var e=L(M.mark((function e(t){var n,r,i,a,o,u,s,c,l;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.t0=this._pending,!e.t0){e.next=4;break}return e.next=4,this._pending;case 4:if(n=this._handle,r=this.size,i=this.position,!(n&&i<r)){e.next=18;break}"number"!==typeof t&&(t=1/0),a=i,o=0,u=0,s=Math.min(r,a+Math.min(r-a,t)),c=new Uint8Array(Math.max(0,(this.position=s)-a));case 10:if(!((a+=u)<s&&(o+=u)<c.byteLength)){e.next=17;break}return e.next=13,n.read(c,o,c.byteLength-o,a);case 13:l=e.sent,u=l.bytesRead,e.next=10;break;case 17:return e.abrupt("return",c);case 18:return e.abrupt("return",null);case 19:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"readAt",value:function(){var e=L(M.mark((function e(t,n){var r,i,a,o;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.t0=this._pending,!e.t0){e.next=4;break}return e.next=4,this._pending;case 4:if(r=this._handle,i=this.size,!(r&&t+n<i)){e.next=11;break}return a=Math.min(i,t+n),o=new Uint8Array(a-t),e.next=10,r.read(o,0,n,t);case 10:return e.abrupt("return",e.sent.buffer);case 11:return e.abrupt("return",new Uint8Array(n));case 12:case"end":return e.stop()}}),e,this)})));return function(t,n){return e.apply(this,arguments)}}()},{key:"close",value:function(){var e=L(M.mark((function e(){var t;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t=this._handle,this._handle=null,e.t0=t,!e.t0){e.next=6;break}return e.next=6,t.close();case 6:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"throw",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.close();case 2:return e.abrupt("return",{done:!0,value:t});case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"return",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.close();case 2:return e.abrupt("return",{done:!0,value:t});case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()}]),n}(qa);function eo(e){return e<0&&(e=4294967295+e+1),"0x".concat(e.toString(16))}var to=[1,10,100,1e3,1e4,1e5,1e6,1e7,1e8],no=function(){function e(t){Object(C.a)(this,e),this.buffer=t}return Object(F.a)(e,[{key:"high",value:function(){return this.buffer[1]}},{key:"low",value:function(){return this.buffer[0]}},{key:"_times",value:function(e){var t=new Uint32Array([this.buffer[1]>>>16,65535&this.buffer[1],this.buffer[0]>>>16,65535&this.buffer[0]]),n=new Uint32Array([e.buffer[1]>>>16,65535&e.buffer[1],e.buffer[0]>>>16,65535&e.buffer[0]]),r=t[3]*n[3];this.buffer[0]=65535&r;var i=r>>>16;return i+=r=t[2]*n[3],i+=r=t[3]*n[2]>>>0,this.buffer[0]+=i<<16,this.buffer[1]=i>>>0<r?65536:0,this.buffer[1]+=i>>>16,this.buffer[1]+=t[1]*n[3]+t[2]*n[2]+t[3]*n[1],this.buffer[1]+=t[0]*n[3]+t[1]*n[2]+t[2]*n[1]+t[3]*n[0]<<16,this}},{key:"_plus",value:function(e){var t=this.buffer[0]+e.buffer[0]>>>0;this.buffer[1]+=e.buffer[1],t<this.buffer[0]>>>0&&++this.buffer[1],this.buffer[0]=t}},{key:"lessThan",value:function(e){return this.buffer[1]<e.buffer[1]||this.buffer[1]===e.buffer[1]&&this.buffer[0]<e.buffer[0]}},{key:"equals",value:function(e){return this.buffer[1]===e.buffer[1]&&this.buffer[0]==e.buffer[0]}},{key:"greaterThan",value:function(e){return e.lessThan(this)}},{key:"hex",value:function(){return"".concat(eo(this.buffer[1])," ").concat(eo(this.buffer[0]))}}]),e}(),ro=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"times",value:function(e){return this._times(e),this}},{key:"plus",value:function(e){return this._plus(e),this}}],[{key:"from",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return n.fromString("string"===typeof e?e:e.toString(),t)}},{key:"fromNumber",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return n.fromString(e.toString(),t)}},{key:"fromString",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2),r=e.length,i=new n(t),a=0;a<r;){var o=8<r-a?8:r-a,u=new n(new Uint32Array([parseInt(e.substr(a,o),10),0])),s=new n(new Uint32Array([to[o],0]));i.times(s),i.plus(u),a+=o}return i}},{key:"convertArray",value:function(e){for(var t=new Uint32Array(2*e.length),r=-1,i=e.length;++r<i;)n.from(e[r],new Uint32Array(t.buffer,t.byteOffset+2*r*4,2));return t}},{key:"multiply",value:function(e,t){return new n(new Uint32Array(e.buffer)).times(t)}},{key:"add",value:function(e,t){return new n(new Uint32Array(e.buffer)).plus(t)}}]),n}(no),io=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"negate",value:function(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],0==this.buffer[0]&&++this.buffer[1],this}},{key:"times",value:function(e){return this._times(e),this}},{key:"plus",value:function(e){return this._plus(e),this}},{key:"lessThan",value:function(e){var t=this.buffer[1]<<0,n=e.buffer[1]<<0;return t<n||t===n&&this.buffer[0]<e.buffer[0]}}],[{key:"from",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return n.fromString("string"===typeof e?e:e.toString(),t)}},{key:"fromNumber",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2);return n.fromString(e.toString(),t)}},{key:"fromString",value:function(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(2),r=e.startsWith("-"),i=e.length,a=new n(t),o=r?1:0;o<i;){var u=8<i-o?8:i-o,s=new n(new Uint32Array([parseInt(e.substr(o,u),10),0])),c=new n(new Uint32Array([to[u],0]));a.times(c),a.plus(s),o+=u}return r?a.negate():a}},{key:"convertArray",value:function(e){for(var t=new Uint32Array(2*e.length),r=-1,i=e.length;++r<i;)n.from(e[r],new Uint32Array(t.buffer,t.byteOffset+2*r*4,2));return t}},{key:"multiply",value:function(e,t){return new n(new Uint32Array(e.buffer)).times(t)}},{key:"add",value:function(e,t){return new n(new Uint32Array(e.buffer)).plus(t)}}]),n}(no),ao=function(){function e(t){Object(C.a)(this,e),this.buffer=t}return Object(F.a)(e,[{key:"high",value:function(){return new io(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2))}},{key:"low",value:function(){return new io(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset,2))}},{key:"negate",value:function(){return this.buffer[0]=1+~this.buffer[0],this.buffer[1]=~this.buffer[1],this.buffer[2]=~this.buffer[2],this.buffer[3]=~this.buffer[3],0==this.buffer[0]&&++this.buffer[1],0==this.buffer[1]&&++this.buffer[2],0==this.buffer[2]&&++this.buffer[3],this}},{key:"times",value:function(e){var t=new ro(new Uint32Array([this.buffer[3],0])),n=new ro(new Uint32Array([this.buffer[2],0])),r=new ro(new Uint32Array([this.buffer[1],0])),i=new ro(new Uint32Array([this.buffer[0],0])),a=new ro(new Uint32Array([e.buffer[3],0])),o=new ro(new Uint32Array([e.buffer[2],0])),u=new ro(new Uint32Array([e.buffer[1],0])),s=new ro(new Uint32Array([e.buffer[0],0])),c=ro.multiply(i,s);this.buffer[0]=c.low();var l=new ro(new Uint32Array([c.high(),0]));return c=ro.multiply(r,s),l.plus(c),c=ro.multiply(i,u),l.plus(c),this.buffer[1]=l.low(),this.buffer[3]=l.lessThan(c)?1:0,this.buffer[2]=l.high(),new ro(new Uint32Array(this.buffer.buffer,this.buffer.byteOffset+8,2)).plus(ro.multiply(n,s)).plus(ro.multiply(r,u)).plus(ro.multiply(i,o)),this.buffer[3]+=ro.multiply(t,s).plus(ro.multiply(n,u)).plus(ro.multiply(r,o)).plus(ro.multiply(i,a)).low(),this}},{key:"plus",value:function(e){var t=new Uint32Array(4);return t[3]=this.buffer[3]+e.buffer[3]>>>0,t[2]=this.buffer[2]+e.buffer[2]>>>0,t[1]=this.buffer[1]+e.buffer[1]>>>0,t[0]=this.buffer[0]+e.buffer[0]>>>0,t[0]<this.buffer[0]>>>0&&++t[1],t[1]<this.buffer[1]>>>0&&++t[2],t[2]<this.buffer[2]>>>0&&++t[3],this.buffer[3]=t[3],this.buffer[2]=t[2],this.buffer[1]=t[1],this.buffer[0]=t[0],this}},{key:"hex",value:function(){return"".concat(eo(this.buffer[3])," ").concat(eo(this.buffer[2])," ").concat(eo(this.buffer[1])," ").concat(eo(this.buffer[0]))}}],[{key:"multiply",value:function(t,n){return new e(new Uint32Array(t.buffer)).times(n)}},{key:"add",value:function(t,n){return new e(new Uint32Array(t.buffer)).plus(n)}},{key:"from",value:function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);return e.fromString("string"===typeof t?t:t.toString(),n)}},{key:"fromNumber",value:function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4);return e.fromString(t.toString(),n)}},{key:"fromString",value:function(t){for(var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Uint32Array(4),r=t.startsWith("-"),i=t.length,a=new e(n),o=r?1:0;o<i;){var u=8<i-o?8:i-o,s=new e(new Uint32Array([parseInt(t.substr(o,u),10),0,0,0])),c=new e(new Uint32Array([to[u],0,0,0]));a.times(c),a.plus(s),o+=u}return r?a.negate():a}},{key:"convertArray",value:function(t){for(var n=new Uint32Array(4*t.length),r=-1,i=t.length;++r<i;)e.from(t[r],new Uint32Array(n.buffer,n.byteOffset+16*r,4));return n}}]),e}(),oo=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r,i,a){var o;return Object(C.a)(this,n),(o=t.call(this)).nodesIndex=-1,o.buffersIndex=-1,o.bytes=e,o.nodes=r,o.buffers=i,o.dictionaries=a,o}return Object(F.a)(n,[{key:"visit",value:function(e){return Object(Pt.a)(Object(Rt.a)(n.prototype),"visit",this).call(this,e instanceof ia?e.type:e)}},{key:"visitNull",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length;return ar.Null(e,0,n)}},{key:"visitBool",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Bool(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitInt",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Int(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitFloat",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Float(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitUtf8",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Utf8(e,0,n,r,this.readNullBitmap(e,r),this.readOffsets(e),this.readData(e))}},{key:"visitBinary",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Binary(e,0,n,r,this.readNullBitmap(e,r),this.readOffsets(e),this.readData(e))}},{key:"visitFixedSizeBinary",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.FixedSizeBinary(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitDate",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Date(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitTimestamp",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Timestamp(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitTime",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Time(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitDecimal",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Decimal(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitList",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.List(e,0,n,r,this.readNullBitmap(e,r),this.readOffsets(e),this.visit(e.children[0]))}},{key:"visitStruct",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Struct(e,0,n,r,this.readNullBitmap(e,r),this.visitMany(e.children))}},{key:"visitUnion",value:function(e){return e.mode===Kt.Sparse?this.visitSparseUnion(e):this.visitDenseUnion(e)}},{key:"visitDenseUnion",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Union(e,0,n,r,this.readNullBitmap(e,r),this.readTypeIds(e),this.readOffsets(e),this.visitMany(e.children))}},{key:"visitSparseUnion",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Union(e,0,n,r,this.readNullBitmap(e,r),this.readTypeIds(e),this.visitMany(e.children))}},{key:"visitDictionary",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Dictionary(e,0,n,r,this.readNullBitmap(e,r),this.readData(e.indices),this.readDictionary(e))}},{key:"visitInterval",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Interval(e,0,n,r,this.readNullBitmap(e,r),this.readData(e))}},{key:"visitFixedSizeList",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.FixedSizeList(e,0,n,r,this.readNullBitmap(e,r),this.visit(e.children[0]))}},{key:"visitMap",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextFieldNode(),n=t.length,r=t.nullCount;return ar.Map(e,0,n,r,this.readNullBitmap(e,r),this.readOffsets(e),this.visit(e.children[0]))}},{key:"nextFieldNode",value:function(){return this.nodes[++this.nodesIndex]}},{key:"nextBufferRange",value:function(){return this.buffers[++this.buffersIndex]}},{key:"readNullBitmap",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.nextBufferRange();return t>0&&this.readData(e,n)||new Uint8Array(0)}},{key:"readOffsets",value:function(e,t){return this.readData(e,t)}},{key:"readTypeIds",value:function(e,t){return this.readData(e,t)}},{key:"readData",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange(),n=t.length,r=t.offset;return this.bytes.subarray(r,r+n)}},{key:"readDictionary",value:function(e){return this.dictionaries.get(e.id)}}]),n}(cn),uo=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r,i,a){var o;return Object(C.a)(this,n),(o=t.call(this,new Uint8Array(0),r,i,a)).sources=e,o}return Object(F.a)(n,[{key:"readNullBitmap",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.nextBufferRange(),r=n.offset;return t<=0?new Uint8Array(0):nn(this.sources[r])}},{key:"readOffsets",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange(),n=t.offset;return Ne(Uint8Array,Ne(Int32Array,this.sources[n]))}},{key:"readTypeIds",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange(),n=t.offset;return Ne(Uint8Array,Ne(e.ArrayType,this.sources[n]))}},{key:"readData",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.nextBufferRange(),n=t.offset,r=this.sources;return xn.isTimestamp(e)||(xn.isInt(e)||xn.isTime(e))&&64===e.bitWidth||xn.isDate(e)&&e.unit===Ht.MILLISECOND?Ne(Uint8Array,io.convertArray(r[n])):xn.isDecimal(e)?Ne(Uint8Array,ao.convertArray(r[n])):xn.isBinary(e)||xn.isFixedSizeBinary(e)?so(r[n]):xn.isBool(e)?nn(r[n]):xn.isUtf8(e)?te(r[n].join("")):Ne(Uint8Array,Ne(e.ArrayType,r[n].map((function(e){return+e}))))}}]),n}(oo);function so(e){for(var t=e.join(""),n=new Uint8Array(t.length/2),r=0;r<t.length;r+=2)n[r>>1]=parseInt(t.substr(r,2),16);return n}var co=W.Long,lo=Lt.apache.arrow.flatbuf.Null,fo=Lt.apache.arrow.flatbuf.Int,ho=Lt.apache.arrow.flatbuf.FloatingPoint,po=Lt.apache.arrow.flatbuf.Binary,yo=Lt.apache.arrow.flatbuf.Bool,vo=Lt.apache.arrow.flatbuf.Utf8,bo=Lt.apache.arrow.flatbuf.Decimal,mo=Lt.apache.arrow.flatbuf.Date,go=Lt.apache.arrow.flatbuf.Time,ko=Lt.apache.arrow.flatbuf.Timestamp,wo=Lt.apache.arrow.flatbuf.Interval,_o=Lt.apache.arrow.flatbuf.List,Oo=Lt.apache.arrow.flatbuf.Struct_,xo=Lt.apache.arrow.flatbuf.Union,jo=Lt.apache.arrow.flatbuf.DictionaryEncoding,So=Lt.apache.arrow.flatbuf.FixedSizeBinary,To=Lt.apache.arrow.flatbuf.FixedSizeList,Io=Lt.apache.arrow.flatbuf.Map,Eo=new(function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"visit",value:function(e,t){return null==e||null==t?void 0:Object(Pt.a)(Object(Rt.a)(n.prototype),"visit",this).call(this,e,t)}},{key:"visitNull",value:function(e,t){return lo.startNull(t),lo.endNull(t)}},{key:"visitInt",value:function(e,t){return fo.startInt(t),fo.addBitWidth(t,e.bitWidth),fo.addIsSigned(t,e.isSigned),fo.endInt(t)}},{key:"visitFloat",value:function(e,t){return ho.startFloatingPoint(t),ho.addPrecision(t,e.precision),ho.endFloatingPoint(t)}},{key:"visitBinary",value:function(e,t){return po.startBinary(t),po.endBinary(t)}},{key:"visitBool",value:function(e,t){return yo.startBool(t),yo.endBool(t)}},{key:"visitUtf8",value:function(e,t){return vo.startUtf8(t),vo.endUtf8(t)}},{key:"visitDecimal",value:function(e,t){return bo.startDecimal(t),bo.addScale(t,e.scale),bo.addPrecision(t,e.precision),bo.endDecimal(t)}},{key:"visitDate",value:function(e,t){return mo.startDate(t),mo.addUnit(t,e.unit),mo.endDate(t)}},{key:"visitTime",value:function(e,t){return go.startTime(t),go.addUnit(t,e.unit),go.addBitWidth(t,e.bitWidth),go.endTime(t)}},{key:"visitTimestamp",value:function(e,t){var n=e.timezone&&t.createString(e.timezone)||void 0;return ko.startTimestamp(t),ko.addUnit(t,e.unit),void 0!==n&&ko.addTimezone(t,n),ko.endTimestamp(t)}},{key:"visitInterval",value:function(e,t){return wo.startInterval(t),wo.addUnit(t,e.unit),wo.endInterval(t)}},{key:"visitList",value:function(e,t){return _o.startList(t),_o.endList(t)}},{key:"visitStruct",value:function(e,t){return Oo.startStruct_(t),Oo.endStruct_(t)}},{key:"visitUnion",value:function(e,t){xo.startTypeIdsVector(t,e.typeIds.length);var n=xo.createTypeIdsVector(t,e.typeIds);return xo.startUnion(t),xo.addMode(t,e.mode),xo.addTypeIds(t,n),xo.endUnion(t)}},{key:"visitDictionary",value:function(e,t){var n=this.visit(e.indices,t);return jo.startDictionaryEncoding(t),jo.addId(t,new co(e.id,0)),jo.addIsOrdered(t,e.isOrdered),void 0!==n&&jo.addIndexType(t,n),jo.endDictionaryEncoding(t)}},{key:"visitFixedSizeBinary",value:function(e,t){return So.startFixedSizeBinary(t),So.addByteWidth(t,e.byteWidth),So.endFixedSizeBinary(t)}},{key:"visitFixedSizeList",value:function(e,t){return To.startFixedSizeList(t),To.addListSize(t,e.listSize),To.endFixedSizeList(t)}},{key:"visitMap",value:function(e,t){return Io.startMap(t),Io.addKeysSorted(t,e.keysSorted),Io.endMap(t)}}]),n}(cn));function Ao(e){return new Go(e.count,function e(t){return(t||[]).reduce((function(t,n){return[].concat(sn(t),[new Xo(n.count,(r=n.VALIDITY,(r||[]).reduce((function(e,t){return e+ +(0===t)}),0)))],sn(e(n.children)));var r}),[])}(e.columns),function e(t){for(var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],r=-1,i=(t||[]).length;++r<i;){var a=t[r];a.VALIDITY&&n.push(new Zo(n.length,a.VALIDITY.length)),a.TYPE&&n.push(new Zo(n.length,a.TYPE.length)),a.OFFSET&&n.push(new Zo(n.length,a.OFFSET.length)),a.DATA&&n.push(new Zo(n.length,a.DATA.length)),n=e(a.children,n)}return n}(e.columns))}function Bo(e,t){return(e.fields||[]).filter(Boolean).map((function(e){return ia.fromJSON(e,t)}))}function Do(e,t){return(e.children||[]).filter(Boolean).map((function(e){return ia.fromJSON(e,t)}))}function Lo(e){return new Map(Object.entries(e||{}))}function Co(e){return new Sn(e.isSigned,e.bitWidth)}function Fo(e,t){var n=e.type.name;switch(n){case"NONE":case"null":return new jn;case"binary":return new Pn;case"utf8":return new Rn;case"bool":return new zn;case"list":return new qn((t||[])[0]);case"struct":case"struct_":return new Gn(t||[])}switch(n){case"int":var r=e.type;return new Sn(r.isSigned,r.bitWidth);case"floatingpoint":var i=e.type;return new Fn($t[i.precision]);case"decimal":var a=e.type;return new Vn(a.scale,a.precision);case"date":var o=e.type;return new Wn(Ht[o.unit]);case"time":var u=e.type;return new $n(Yt[u.unit],u.bitWidth);case"timestamp":var s=e.type;return new Kn(Yt[s.unit],s.timezone);case"interval":var c=e.type;return new Qn(Qt[c.unit]);case"union":var l=e.type;return new Jn(Kt[l.mode],l.typeIds||[],t||[]);case"fixedsizebinary":var f=e.type;return new Zn(f.byteWidth);case"fixedsizelist":var h=e.type;return new Xn(h.listSize,(t||[])[0]);case"map":var d=e.type;return new er((t||[])[0],d.keysSorted)}throw new Error('Unrecognized type: "'.concat(n,'"'))}var Mo=W.Long,No=W.Builder,Uo=W.ByteBuffer,Po=Lt.apache.arrow.flatbuf.Type,Ro=Lt.apache.arrow.flatbuf.Field,zo=Lt.apache.arrow.flatbuf.Schema,Vo=Lt.apache.arrow.flatbuf.Buffer,Wo=Ut.apache.arrow.flatbuf.Message,Ho=Lt.apache.arrow.flatbuf.KeyValue,Yo=Ut.apache.arrow.flatbuf.FieldNode,$o=Lt.apache.arrow.flatbuf.Endianness,Ko=Ut.apache.arrow.flatbuf.RecordBatch,Qo=Ut.apache.arrow.flatbuf.DictionaryBatch,qo=function(){function e(t,n,r,i){Object(C.a)(this,e),this._version=n,this._headerType=r,this.body=new Uint8Array(0),i&&(this._createHeader=function(){return i}),this._bodyLength="number"===typeof t?t:t.low}return Object(F.a)(e,[{key:"type",get:function(){return this.headerType}},{key:"version",get:function(){return this._version}},{key:"headerType",get:function(){return this._headerType}},{key:"bodyLength",get:function(){return this._bodyLength}},{key:"header",value:function(){return this._createHeader()}},{key:"isSchema",value:function(){return this.headerType===qt.Schema}},{key:"isRecordBatch",value:function(){return this.headerType===qt.RecordBatch}},{key:"isDictionaryBatch",value:function(){return this.headerType===qt.DictionaryBatch}}],[{key:"fromJSON",value:function(t,n){var r=new e(0,Gt.V4,n);return r._createHeader=function(e,t){return function(){switch(t){case qt.Schema:return ra.fromJSON(e);case qt.RecordBatch:return Go.fromJSON(e);case qt.DictionaryBatch:return Jo.fromJSON(e)}throw new Error("Unrecognized Message type: { name: ".concat(qt[t],", type: ").concat(t," }"))}}(t,n),r}},{key:"decode",value:function(t){t=new Uo(Ve(t));var n=Wo.getRootAsMessage(t),r=n.bodyLength(),i=n.version(),a=n.headerType(),o=new e(r,i,a);return o._createHeader=function(e,t){return function(){switch(t){case qt.Schema:return ra.decode(e.header(new zo));case qt.RecordBatch:return Go.decode(e.header(new Ko),e.version());case qt.DictionaryBatch:return Jo.decode(e.header(new Qo),e.version())}throw new Error("Unrecognized Message type: { name: ".concat(qt[t],", type: ").concat(t," }"))}}(n,a),o}},{key:"encode",value:function(e){var t=new No,n=-1;return e.isSchema()?n=ra.encode(t,e.header()):e.isRecordBatch()?n=Go.encode(t,e.header()):e.isDictionaryBatch()&&(n=Jo.encode(t,e.header())),Wo.startMessage(t),Wo.addVersion(t,Gt.V4),Wo.addHeader(t,n),Wo.addHeaderType(t,e.headerType),Wo.addBodyLength(t,new Mo(e.bodyLength,0)),Wo.finishMessageBuffer(t,Wo.endMessage(t)),t.asUint8Array()}},{key:"from",value:function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;if(t instanceof ra)return new e(0,Gt.V4,qt.Schema,t);if(t instanceof Go)return new e(n,Gt.V4,qt.RecordBatch,t);if(t instanceof Jo)return new e(n,Gt.V4,qt.DictionaryBatch,t);throw new Error("Unrecognized Message header: ".concat(t))}}]),e}(),Go=function(){function e(t,n,r){Object(C.a)(this,e),this._nodes=n,this._buffers=r,this._length="number"===typeof t?t:t.low}return Object(F.a)(e,[{key:"nodes",get:function(){return this._nodes}},{key:"length",get:function(){return this._length}},{key:"buffers",get:function(){return this._buffers}}]),e}(),Jo=function(){function e(t,n){var r=arguments.length>2&&void 0!==arguments[2]&&arguments[2];Object(C.a)(this,e),this._data=t,this._isDelta=r,this._id="number"===typeof n?n:n.low}return Object(F.a)(e,[{key:"id",get:function(){return this._id}},{key:"data",get:function(){return this._data}},{key:"isDelta",get:function(){return this._isDelta}},{key:"length",get:function(){return this.data.length}},{key:"nodes",get:function(){return this.data.nodes}},{key:"buffers",get:function(){return this.data.buffers}}]),e}(),Zo=Object(F.a)((function e(t,n){Object(C.a)(this,e),this.offset="number"===typeof t?t:t.low,this.length="number"===typeof n?n:n.low})),Xo=Object(F.a)((function e(t,n){Object(C.a)(this,e),this.length="number"===typeof t?t:t.low,this.nullCount="number"===typeof n?n:n.low}));function eu(e){for(var t,n=[],r=-1,i=-1,a=e.nodesLength();++r<a;)(t=e.nodes(r))&&(n[++i]=Xo.decode(t));return n}function tu(e,t){for(var n,r=[],i=-1,a=-1,o=e.buffersLength();++i<o;)(n=e.buffers(i))&&(t<Gt.V4&&(n.bb_pos+=8*(i+1)),r[++a]=Zo.decode(n));return r}function nu(e,t){for(var n,r=[],i=-1,a=-1,o=e.fieldsLength();++i<o;)(n=e.fields(i))&&(r[++a]=ia.decode(n,t));return r}function ru(e,t){for(var n,r=[],i=-1,a=-1,o=e.childrenLength();++i<o;)(n=e.children(i))&&(r[++a]=ia.decode(n,t));return r}function iu(e){var t=new Map;if(e)for(var n,r,i=-1,a=0|e.customMetadataLength();++i<a;)(n=e.customMetadata(i))&&null!=(r=n.key())&&t.set(r,n.value());return t}function au(e){return new Sn(e.isSigned(),e.bitWidth())}function ou(e,t){var n=e.typeType();switch(n){case Po.NONE:case Po.Null:return new jn;case Po.Binary:return new Pn;case Po.Utf8:return new Rn;case Po.Bool:return new zn;case Po.List:return new qn((t||[])[0]);case Po.Struct_:return new Gn(t||[])}switch(n){case Po.Int:var r=e.type(new Lt.apache.arrow.flatbuf.Int);return new Sn(r.isSigned(),r.bitWidth());case Po.FloatingPoint:var i=e.type(new Lt.apache.arrow.flatbuf.FloatingPoint);return new Fn(i.precision());case Po.Decimal:var a=e.type(new Lt.apache.arrow.flatbuf.Decimal);return new Vn(a.scale(),a.precision());case Po.Date:var o=e.type(new Lt.apache.arrow.flatbuf.Date);return new Wn(o.unit());case Po.Time:var u=e.type(new Lt.apache.arrow.flatbuf.Time);return new $n(u.unit(),u.bitWidth());case Po.Timestamp:var s=e.type(new Lt.apache.arrow.flatbuf.Timestamp);return new Kn(s.unit(),s.timezone());case Po.Interval:var c=e.type(new Lt.apache.arrow.flatbuf.Interval);return new Qn(c.unit());case Po.Union:var l=e.type(new Lt.apache.arrow.flatbuf.Union);return new Jn(l.mode(),l.typeIdsArray()||[],t||[]);case Po.FixedSizeBinary:var f=e.type(new Lt.apache.arrow.flatbuf.FixedSizeBinary);return new Zn(f.byteWidth());case Po.FixedSizeList:var h=e.type(new Lt.apache.arrow.flatbuf.FixedSizeList);return new Xn(h.listSize(),(t||[])[0]);case Po.Map:var d=e.type(new Lt.apache.arrow.flatbuf.Map);return new er((t||[])[0],d.keysSorted())}throw new Error('Unrecognized type: "'.concat(Po[n],'" (').concat(n,")"))}ia.encode=function(e,t){var n=-1,r=-1,i=-1,a=t.type,o=t.typeId;xn.isDictionary(a)?(o=a.dictionary.typeId,i=Eo.visit(a,e),r=Eo.visit(a.dictionary,e)):r=Eo.visit(a,e);var u=(a.children||[]).map((function(t){return ia.encode(e,t)})),s=Ro.createChildrenVector(e,u),c=t.metadata&&t.metadata.size>0?Ro.createCustomMetadataVector(e,sn(t.metadata).map((function(t){var n=N(t,2),r=n[0],i=n[1],a=e.createString("".concat(r)),o=e.createString("".concat(i));return Ho.startKeyValue(e),Ho.addKey(e,a),Ho.addValue(e,o),Ho.endKeyValue(e)}))):-1;t.name&&(n=e.createString(t.name));Ro.startField(e),Ro.addType(e,r),Ro.addTypeType(e,o),Ro.addChildren(e,s),Ro.addNullable(e,!!t.nullable),-1!==n&&Ro.addName(e,n);-1!==i&&Ro.addDictionary(e,i);-1!==c&&Ro.addCustomMetadata(e,c);return Ro.endField(e)},ia.decode=function(e,t){var n,r,i,a,o,u;t&&(u=e.dictionary())?t.has(n=u.id().low)?(a=(a=u.indexType())?au(a):new En,o=new rr(t.get(n),a,n,u.isOrdered()),r=new ia(e.name(),o,e.nullable(),iu(e))):(a=(a=u.indexType())?au(a):new En,t.set(n,i=ou(e,ru(e,t))),o=new rr(i,a,n,u.isOrdered()),r=new ia(e.name(),o,e.nullable(),iu(e))):(i=ou(e,ru(e,t)),r=new ia(e.name(),i,e.nullable(),iu(e)));return r||null},ia.fromJSON=function(e,t){var n,r,i,a,o,u;return t&&(a=e.dictionary)?t.has(n=a.id)?(r=(r=a.indexType)?Co(r):new En,u=new rr(t.get(n),r,n,a.isOrdered),i=new ia(e.name,u,e.nullable,Lo(e.customMetadata))):(r=(r=a.indexType)?Co(r):new En,t.set(n,o=Fo(e,Do(e,t))),u=new rr(o,r,n,a.isOrdered),i=new ia(e.name,u,e.nullable,Lo(e.customMetadata))):(o=Fo(e,Do(e,t)),i=new ia(e.name,o,e.nullable,Lo(e.customMetadata))),i||null},ra.encode=function(e,t){var n=t.fields.map((function(t){return ia.encode(e,t)}));zo.startFieldsVector(e,n.length);var r=zo.createFieldsVector(e,n),i=t.metadata&&t.metadata.size>0?zo.createCustomMetadataVector(e,sn(t.metadata).map((function(t){var n=N(t,2),r=n[0],i=n[1],a=e.createString("".concat(r)),o=e.createString("".concat(i));return Ho.startKeyValue(e),Ho.addKey(e,a),Ho.addValue(e,o),Ho.endKeyValue(e)}))):-1;zo.startSchema(e),zo.addFields(e,r),zo.addEndianness(e,uu?$o.Little:$o.Big),-1!==i&&zo.addCustomMetadata(e,i);return zo.endSchema(e)},ra.decode=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map,n=nu(e,t);return new ra(n,iu(e),t)},ra.fromJSON=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;return new ra(Bo(e,t),Lo(e.customMetadata),t)},Go.encode=function(e,t){var n=t.nodes||[],r=t.buffers||[];Ko.startNodesVector(e,n.length),n.slice().reverse().forEach((function(t){return Xo.encode(e,t)}));var i=e.endVector();Ko.startBuffersVector(e,r.length),r.slice().reverse().forEach((function(t){return Zo.encode(e,t)}));var a=e.endVector();return Ko.startRecordBatch(e),Ko.addLength(e,new Mo(t.length,0)),Ko.addNodes(e,i),Ko.addBuffers(e,a),Ko.endRecordBatch(e)},Go.decode=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Gt.V4;return new Go(e.length(),eu(e),tu(e,t))},Go.fromJSON=Ao,Jo.encode=function(e,t){var n=Go.encode(e,t.data);return Qo.startDictionaryBatch(e),Qo.addId(e,new Mo(t.id,0)),Qo.addIsDelta(e,t.isDelta),Qo.addData(e,n),Qo.endDictionaryBatch(e)},Jo.decode=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Gt.V4;return new Jo(Go.decode(e.data(),t),e.id(),e.isDelta())},Jo.fromJSON=function(e){return new Jo(Ao(e.data),e.id,e.isDelta)},Xo.encode=function(e,t){return Yo.createFieldNode(e,new Mo(t.length,0),new Mo(t.nullCount,0))},Xo.decode=function(e){return new Xo(e.length(),e.nullCount())},Zo.encode=function(e,t){return Vo.createBuffer(e,new Mo(t.offset,0),new Mo(t.length,0))},Zo.decode=function(e){return new Zo(e.offset(),e.length())};for(var uu=function(){var e=new ArrayBuffer(2);return new DataView(e).setInt16(0,256,!0),256===new Int16Array(e)[0]}(),su=W.ByteBuffer,cu=function(e){return"Expected ".concat(qt[e]," Message in stream, but was null or length 0.")},lu=function(e){return"Header pointer of flatbuffer-encoded ".concat(qt[e]," Message is null or length 0.")},fu=function(e,t){return"Expected to read ".concat(e," metadata bytes, but only read ").concat(t,".")},hu=function(e,t){return"Expected to read ".concat(e," bytes for message body, but only read ").concat(t,".")},du=function(e){function t(e){Object(C.a)(this,t),this.source=e instanceof Qa?e:new Qa(e)}return Object(F.a)(t,[{key:e,value:function(){return this}},{key:"next",value:function(){var e;return(e=this.readMetadataLength()).done||-1===e.value&&(e=this.readMetadataLength()).done||(e=this.readMetadata(e.value)).done?ie:e}},{key:"throw",value:function(e){return this.source.throw(e)}},{key:"return",value:function(e){return this.source.return(e)}},{key:"readMessage",value:function(e){var t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(cu(e));return t.value}},{key:"readMessageBody",value:function(e){if(e<=0)return new Uint8Array(0);var t=Ve(this.source.read(e));if(t.byteLength<e)throw new Error(hu(e,t.byteLength));return t.byteOffset%8===0&&t.byteOffset+t.byteLength<=t.buffer.byteLength?t:t.slice()}},{key:"readSchema",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0],t=qt.Schema,n=this.readMessage(t),r=n&&n.header();if(e&&!r)throw new Error(lu(t));return r}},{key:"readMetadataLength",value:function(){var e=this.source.read(vu),t=e&&new su(e),n=t&&t.readInt32(0)||0;return{done:0===n,value:n}}},{key:"readMetadata",value:function(e){var t=this.source.read(e);if(!t)return ie;if(t.byteLength<e)throw new Error(fu(e,t.byteLength));return{done:!1,value:qo.decode(t)}}}]),t}(Symbol.iterator),pu=function(e){function t(e,n){Object(C.a)(this,t),this.source=e instanceof qa?e:xe(e)?new Xa(e,n):new qa(e)}return Object(F.a)(t,[{key:e,value:function(){return this}},{key:"next",value:function(){var e=L(M.mark((function e(){var t;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.readMetadataLength();case 2:if(!(t=e.sent).done){e.next=4;break}return e.abrupt("return",ie);case 4:if(e.t0=-1===t.value,!e.t0){e.next=9;break}return e.next=8,this.readMetadataLength();case 8:e.t0=(t=e.sent).done;case 9:if(!e.t0){e.next=11;break}return e.abrupt("return",ie);case 11:return e.next=13,this.readMetadata(t.value);case 13:if(!(t=e.sent).done){e.next=15;break}return e.abrupt("return",ie);case 15:return e.abrupt("return",t);case 16:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"throw",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.source.throw(t);case 2:return e.abrupt("return",e.sent);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"return",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.source.return(t);case 2:return e.abrupt("return",e.sent);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"readMessage",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.next();case 2:if(!(n=e.sent).done){e.next=4;break}return e.abrupt("return",null);case 4:if(null==t||n.value.headerType===t){e.next=6;break}throw new Error(cu(t));case 6:return e.abrupt("return",n.value);case 7:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"readMessageBody",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!(t<=0)){e.next=2;break}return e.abrupt("return",new Uint8Array(0));case 2:return e.t0=Ve,e.next=5,this.source.read(t);case 5:if(e.t1=e.sent,!((n=(0,e.t0)(e.t1)).byteLength<t)){e.next=9;break}throw new Error(hu(t,n.byteLength));case 9:return e.abrupt("return",n.byteOffset%8===0&&n.byteOffset+n.byteLength<=n.buffer.byteLength?n:n.slice());case 10:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"readSchema",value:function(){var e=L(M.mark((function e(){var t,n,r,i,a=arguments;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return t=a.length>0&&void 0!==a[0]&&a[0],n=qt.Schema,e.next=4,this.readMessage(n);case 4:if(r=e.sent,i=r&&r.header(),!t||i){e.next=8;break}throw new Error(lu(n));case 8:return e.abrupt("return",i);case 9:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"readMetadataLength",value:function(){var e=L(M.mark((function e(){var t,n,r;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.source.read(vu);case 2:return t=e.sent,n=t&&new su(t),r=n&&n.readInt32(0)||0,e.abrupt("return",{done:0===r,value:r});case 6:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"readMetadata",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this.source.read(t);case 2:if(n=e.sent){e.next=5;break}return e.abrupt("return",ie);case 5:if(!(n.byteLength<t)){e.next=7;break}throw new Error(fu(t,n.byteLength));case 7:return e.abrupt("return",{done:!1,value:qo.decode(n)});case 8:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()}]),t}(Symbol.asyncIterator),yu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,new Uint8Array(0)))._schema=!1,r._body=[],r._batchIndex=0,r._dictionaryIndex=0,r._json=e instanceof ae?e:new ae(e),r}return Object(F.a)(n,[{key:"next",value:function(){var e=this._json;if(!this._schema)return this._schema=!0,{done:!1,value:qo.fromJSON(e.schema,qt.Schema)};if(this._dictionaryIndex<e.dictionaries.length){var t=e.dictionaries[this._dictionaryIndex++];return this._body=t.data.columns,{done:!1,value:qo.fromJSON(t,qt.DictionaryBatch)}}if(this._batchIndex<e.batches.length){var n=e.batches[this._batchIndex++];return this._body=n.columns,{done:!1,value:qo.fromJSON(n,qt.RecordBatch)}}return this._body=[],ie}},{key:"readMessageBody",value:function(e){return function e(t){return(t||[]).reduce((function(t,n){return[].concat(sn(t),sn(n.VALIDITY&&[n.VALIDITY]||[]),sn(n.TYPE&&[n.TYPE]||[]),sn(n.OFFSET&&[n.OFFSET]||[]),sn(n.DATA&&[n.DATA]||[]),sn(e(n.children)))}),[])}(this._body)}},{key:"readMessage",value:function(e){var t;if((t=this.next()).done)return null;if(null!=e&&t.value.headerType!==e)throw new Error(cu(e));return t.value}},{key:"readSchema",value:function(){var e=qt.Schema,t=this.readMessage(e),n=t&&t.header();if(!t||!n)throw new Error(lu(e));return n}}]),n}(du),vu=4,bu=new Uint8Array("ARROW1".length),mu=0;mu<"ARROW1".length;mu+=1)bu[mu]="ARROW1".charCodeAt(mu);function gu(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=-1,r=bu.length;++n<r;)if(bu[n]!==e[t+n])return!1;return!0}var ku=bu.length,wu=ku+vu,_u=2*ku+vu,Ou=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e;return Object(C.a)(this,n),(e=t.call(this))._byteLength=0,e._nodes=[],e._buffers=[],e._bufferRegions=[],e}return Object(F.a)(n,[{key:"visit",value:function(e){if(!xn.isDictionary(e.type)){var t=e.data,r=e.length,i=e.nullCount;if(r>2147483647)throw new RangeError("Cannot write arrays larger than 2^31 - 1 in length");xn.isNull(e.type)||xu.call(this,i<=0?new Uint8Array(0):tn(t.offset,r,t.nullBitmap)),this.nodes.push(new Xo(r,i))}return Object(Pt.a)(Object(Rt.a)(n.prototype),"visit",this).call(this,e)}},{key:"visitNull",value:function(e){return this}},{key:"visitDictionary",value:function(e){return this.visit(e.indices)}},{key:"nodes",get:function(){return this._nodes}},{key:"buffers",get:function(){return this._buffers}},{key:"byteLength",get:function(){return this._byteLength}},{key:"bufferRegions",get:function(){return this._bufferRegions}}],[{key:"assemble",value:function(){for(var e=new n,t=arguments.length,r=new Array(t),i=0;i<t;i++)r[i]=arguments[i];var a=Xi(Dc,r),o=e.visitMany(a),u=N(o,1),s=u[0],c=void 0===s?e:s;return c}}]),n}(cn);function xu(e){var t=e.byteLength+7&-8;return this.buffers.push(e),this.bufferRegions.push(new Zo(this._byteLength,t)),this._byteLength+=t,this}function ju(e){return xu.call(this,e.values.subarray(0,e.length*e.stride))}function Su(e){var t=e.length,n=e.values,r=e.valueOffsets,i=r[0],a=r[t],o=Math.min(a-i,n.byteLength-i);return xu.call(this,bt(-r[0],t,r)),xu.call(this,n.subarray(i,i+o)),this}function Tu(e){var t=e.length,n=e.valueOffsets;return n&&xu.call(this,bt(n[0],t,n)),this.visit(e.getChildAt(0))}function Iu(e){return this.visitMany(e.type.children.map((function(t,n){return e.getChildAt(n)})).filter(Boolean))[0]}Ou.prototype.visitBool=function(e){var t;return e.nullCount>=e.length?xu.call(this,new Uint8Array(0)):(t=e.values)instanceof Uint8Array?xu.call(this,tn(e.offset,e.length,t)):xu.call(this,nn(e))},Ou.prototype.visitInt=ju,Ou.prototype.visitFloat=ju,Ou.prototype.visitUtf8=Su,Ou.prototype.visitBinary=Su,Ou.prototype.visitFixedSizeBinary=ju,Ou.prototype.visitDate=ju,Ou.prototype.visitTimestamp=ju,Ou.prototype.visitTime=ju,Ou.prototype.visitDecimal=ju,Ou.prototype.visitList=Tu,Ou.prototype.visitStruct=Iu,Ou.prototype.visitUnion=function(e){var t=e.type,n=e.length,r=e.typeIds,i=e.valueOffsets;if(xu.call(this,r),t.mode===Kt.Sparse)return Iu.call(this,e);if(t.mode===Kt.Dense){if(e.offset<=0)return xu.call(this,i),Iu.call(this,e);for(var a,o,u=r.reduce((function(e,t){return Math.max(e,t)}),r[0]),s=new Int32Array(u+1),c=new Int32Array(u+1).fill(-1),l=new Int32Array(n),f=bt(-i[0],n,i),h=-1;++h<n;)-1===(o=c[a=r[h]])&&(o=c[a]=f[a]),l[h]=f[h]-o,++s[a];xu.call(this,l);for(var d,p=-1,y=t.children.length;++p<y;)if(d=e.getChildAt(p)){var v=t.typeIds[p],b=Math.min(n,s[v]);this.visit(d.slice(c[v],b))}}return this},Ou.prototype.visitInterval=ju,Ou.prototype.visitFixedSizeList=Tu,Ou.prototype.visitMap=Tu;function Eu(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new Au(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function Au(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return(Au=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new Au(e)}var Bu=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(e){var t;return Object(C.a)(this,r),(t=n.call(this))._position=0,t._started=!1,t._sink=new Ka,t._schema=null,t._dictionaryBlocks=[],t._recordBatchBlocks=[],t._dictionaryDeltaOffsets=new Map,me(e)||(e={autoDestroy:!0,writeLegacyIpcFormat:!1}),t._autoDestroy="boolean"!==typeof e.autoDestroy||e.autoDestroy,t._writeLegacyIpcFormat="boolean"===typeof e.writeLegacyIpcFormat&&e.writeLegacyIpcFormat,t}return Object(F.a)(r,[{key:"toString",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return this._sink.toString(e)}},{key:"toUint8Array",value:function(){var e=arguments.length>0&&void 0!==arguments[0]&&arguments[0];return this._sink.toUint8Array(e)}},{key:"writeAll",value:function(e){var t=this;return ge(e)?e.then((function(e){return t.writeAll(e)})):we(e)?Fu(this,e):Cu(this,e)}},{key:"closed",get:function(){return this._sink.closed}},{key:t,value:function(){return this._sink[Symbol.asyncIterator]()}},{key:"toDOMStream",value:function(e){return this._sink.toDOMStream(e)}},{key:"toNodeStream",value:function(e){return this._sink.toNodeStream(e)}},{key:"close",value:function(){return this.reset()._sink.close()}},{key:"abort",value:function(e){return this.reset()._sink.abort(e)}},{key:"finish",value:function(){return this._autoDestroy?this.close():this.reset(this._sink,this._schema),this}},{key:"reset",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._sink,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:null;return e===this._sink||e instanceof Ka?this._sink=e:(this._sink=new Ka,e&&Se(e)?this.toDOMStream({type:"bytes"}).pipeTo(e):e&&Ie(e)&&this.toNodeStream({objectMode:!1}).pipe(e)),this._started&&this._schema&&this._writeFooter(this._schema),this._started=!1,this._dictionaryBlocks=[],this._recordBatchBlocks=[],this._dictionaryDeltaOffsets=new Map,t&&t.compareTo(this._schema)||(null===t?(this._position=0,this._schema=null):(this._started=!0,this._schema=t,this._writeSchema(t))),this}},{key:"write",value:function(e){var t=null;if(!this._sink)throw new Error("RecordBatchWriter is closed");if(null===e||void 0===e)return this.finish()&&void 0;if(e instanceof Bc&&!(t=e.schema))return this.finish()&&void 0;if(e instanceof Dc&&!(t=e.schema))return this.finish()&&void 0;if(t&&!t.compareTo(this._schema)){if(this._started&&this._autoDestroy)return this.close();this.reset(this._sink,t)}e instanceof Dc?e instanceof Lc||this._writeRecordBatch(e):e instanceof Bc?this.writeAll(e.chunks):ke(e)&&this.writeAll(e)}},{key:"_writeMessage",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:8,n=t-1,r=qo.encode(e),i=r.byteLength,a=this._writeLegacyIpcFormat?4:8,o=i+a+n&~n,u=o-i-a;return e.headerType===qt.RecordBatch?this._recordBatchBlocks.push(new Ha(o,e.bodyLength,this._position)):e.headerType===qt.DictionaryBatch&&this._dictionaryBlocks.push(new Ha(o,e.bodyLength,this._position)),this._writeLegacyIpcFormat||this._write(Int32Array.of(-1)),this._write(Int32Array.of(o-a)),i>0&&this._write(r),this._writePadding(u)}},{key:"_write",value:function(e){if(this._started){var t=Ve(e);t&&t.byteLength>0&&(this._sink.write(t),this._position+=t.byteLength)}return this}},{key:"_writeSchema",value:function(e){return this._writeMessage(qo.from(e))}},{key:"_writeFooter",value:function(e){return this._writeLegacyIpcFormat?this._write(Int32Array.of(0)):this._write(Int32Array.of(-1,0))}},{key:"_writeMagic",value:function(){return this._write(bu)}},{key:"_writePadding",value:function(e){return e>0?this._write(new Uint8Array(e)):this}},{key:"_writeRecordBatch",value:function(e){var t=Ou.assemble(e),n=t.byteLength,r=t.nodes,i=t.bufferRegions,a=t.buffers,o=new Go(e.length,r,i),u=qo.from(o,n);return this._writeDictionaries(e)._writeMessage(u)._writeBodyBuffers(a)}},{key:"_writeDictionaryBatch",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2];this._dictionaryDeltaOffsets.set(t,e.length+(this._dictionaryDeltaOffsets.get(t)||0));var r=Ou.assemble(e),i=r.byteLength,a=r.nodes,o=r.bufferRegions,u=r.buffers,s=new Go(e.length,a,o),c=new Jo(s,t,n),l=qo.from(c,i);return this._writeMessage(l)._writeBodyBuffers(u)}},{key:"_writeBodyBuffers",value:function(e){for(var t,n,r,i=-1,a=e.length;++i<a;)(t=e[i])&&(n=t.byteLength)>0&&(this._write(t),(r=(n+7&-8)-n)>0&&this._writePadding(r));return this}},{key:"_writeDictionaries",value:function(e){var t,n=B(e.dictionaries);try{for(n.s();!(t=n.n()).done;){var r=N(t.value,2),i=r[0],a=r[1],o=this._dictionaryDeltaOffsets.get(i)||0;if(0===o||(a=a.slice(o)).length>0){var u,s=B("chunks"in a?a.chunks:[a]);try{for(s.s();!(u=s.n()).done;){var c=u.value;this._writeDictionaryBatch(c,i,o>0),o+=c.length}}catch(l){s.e(l)}finally{s.f()}}}}catch(l){n.e(l)}finally{n.f()}return this}}],[{key:"throughNode",value:function(e){throw new Error('"throughNode" not available in this environment')}},{key:"throughDOM",value:function(e,t){throw new Error('"throughDOM" not available in this environment')}}]),r}(oe,Symbol.asyncIterator),Du=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,null,[{key:"writeAll",value:function(e,t){var r=new n(t);return ge(e)?e.then((function(e){return r.writeAll(e)})):we(e)?Fu(r,e):Cu(r,e)}}]),n}(Bu),Lu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e;return Object(C.a)(this,n),(e=t.call(this))._autoDestroy=!0,e}return Object(F.a)(n,[{key:"_writeSchema",value:function(e){return this._writeMagic()._writePadding(2)}},{key:"_writeFooter",value:function(e){var t=Va.encode(new Va(e,Gt.V4,this._recordBatchBlocks,this._dictionaryBlocks));return Object(Pt.a)(Object(Rt.a)(n.prototype),"_writeFooter",this).call(this,e)._write(t)._write(Int32Array.of(t.byteLength))._writeMagic()}}],[{key:"writeAll",value:function(e){var t=new n;return ge(e)?e.then((function(e){return t.writeAll(e)})):we(e)?Fu(t,e):Cu(t,e)}}]),n}(Bu);function Cu(e,t){var n=t;t instanceof Bc&&(n=t.chunks,e.reset(void 0,t.schema));var r,i=B(n);try{for(i.s();!(r=i.n()).done;){var a=r.value;e.write(a)}}catch(o){i.e(o)}finally{i.f()}return e.finish()}function Fu(e,t){return Mu.apply(this,arguments)}function Mu(){return(Mu=L(M.mark((function e(t,n){var r,i,a,o,u,s;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:r=!1,i=!1,e.prev=2,o=Eu(n);case 4:return e.next=6,o.next();case 6:if(!(r=!(u=e.sent).done)){e.next=12;break}s=u.value,t.write(s);case 9:r=!1,e.next=4;break;case 12:e.next=18;break;case 14:e.prev=14,e.t0=e.catch(2),i=!0,a=e.t0;case 18:if(e.prev=18,e.prev=19,!r||null==o.return){e.next=23;break}return e.next=23,o.return();case 23:if(e.prev=23,!i){e.next=26;break}throw a;case 26:return e.finish(23);case 27:return e.finish(18);case 28:return e.abrupt("return",t.finish());case 29:case"end":return e.stop()}}),e,null,[[2,14,18,28],[19,,23,27]])})))).apply(this,arguments)}var Nu=new Uint8Array(0),Uu=function(e){return[Nu,Nu,new Uint8Array(e),Nu]};function Pu(e,t){for(var n,r,i=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t.reduce((function(e,t){return Math.max(e,t.length)}),0),a=-1,o=t.length,u=sn(e.fields),s=[],c=(i+63&-64)>>3;++a<o;)(n=t[a])&&n.length===i?s[a]=n:((r=u[a]).nullable||(u[a]=u[a].clone({nullable:!0})),s[a]=n?n._changeLengthAndBackfillNullBitmap(i):ar.new(r.type,0,i,i,Uu(c)));return[new ra(u),i,s]}function Ru(e){return zu(new ra(e.map((function(e){return e.field}))),e)}function zu(e,t){return function(e,t){var n,r=sn(e.fields),i=[],a={numBatches:t.reduce((function(e,t){return Math.max(e,t.length)}),0)},o=0,u=0,s=-1,c=t.length,l=[];for(;a.numBatches-- >0;){for(u=Number.POSITIVE_INFINITY,s=-1;++s<c;)l[s]=n=t[s].shift(),u=Math.min(u,n?n.length:u);isFinite(u)&&(l=Vu(r,u,l,t,a),u>0&&(i[o++]=[u,l.slice()]))}return[e=new ra(r,e.metadata),i.map((function(t){return Ur(Dc,[e].concat(sn(t)))}))]}(e,t.map((function(e){return e instanceof Vi?e.chunks.map((function(e){return e.data})):[e.data]})))}function Vu(e,t,n,r,i){for(var a,o,u=0,s=-1,c=r.length,l=(t+63&-64)>>3;++s<c;)(a=n[s])&&(u=a.length)>=t?u===t?n[s]=a:(n[s]=a.slice(0,t),a=a.slice(t,u-t),i.numBatches=Math.max(i.numBatches,r[s].unshift(a))):((o=e[s]).nullable||(e[s]=o.clone({nullable:!0})),n[s]=a?a._changeLengthAndBackfillNullBitmap(t):ar.new(o.type,0,t,t,Uu(l)));return n}function Wu(e,t){if(null==e)return{};var n,r,i=function(e,t){if(null==e)return{};var n,r,i={},a=Object.keys(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||(i[n]=e[n]);return i}(e,t);if(Object.getOwnPropertySymbols){var a=Object.getOwnPropertySymbols(e);for(r=0;r<a.length;r++)n=a[r],t.indexOf(n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(i[n]=e[n])}return i}var Hu=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(e,t){var i;return Object(C.a)(this,r),(i=n.call(this))._children=t,i.numChildren=e.childData.length,i._bindDataAccessors(i.data=e),i}return Object(F.a)(r,[{key:"type",get:function(){return this.data.type}},{key:"typeId",get:function(){return this.data.typeId}},{key:"length",get:function(){return this.data.length}},{key:"offset",get:function(){return this.data.offset}},{key:"stride",get:function(){return this.data.stride}},{key:"nullCount",get:function(){return this.data.nullCount}},{key:"byteLength",get:function(){return this.data.byteLength}},{key:"VectorName",get:function(){return"".concat(Vt[this.typeId],"Vector")}},{key:"ArrayType",get:function(){return this.type.ArrayType}},{key:"values",get:function(){return this.data.values}},{key:"typeIds",get:function(){return this.data.typeIds}},{key:"nullBitmap",get:function(){return this.data.nullBitmap}},{key:"valueOffsets",get:function(){return this.data.valueOffsets}},{key:t,get:function(){return"".concat(this.VectorName,"<").concat(this.type[Symbol.toStringTag],">")}},{key:"clone",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._children;return zt.new(e,t)}},{key:"concat",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Vi.concat.apply(Vi,[this].concat(t))}},{key:"slice",value:function(e,t){return Mi(this,e,t,this._sliceInternal)}},{key:"isValid",value:function(e){if(this.nullCount>0){var t=this.offset+e;return 0!==(this.nullBitmap[t>>3]&1<<t%8)}return!0}},{key:"getChildAt",value:function(e){return e<0||e>=this.numChildren?null:(this._children||(this._children=[]))[e]||(this._children[e]=zt.new(this.data.childData[e]))}},{key:"toJSON",value:function(){return sn(this)}},{key:"_sliceInternal",value:function(e,t,n){return e.clone(e.data.slice(t,n-t),null)}},{key:"_bindDataAccessors",value:function(e){}}]),r}(zt,Symbol.toStringTag);Hu.prototype[Symbol.isConcatSpreadable]=!0;var Yu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"asUtf8",value:function(){return zt.new(this.data.clone(new Rn))}}]),n}(Hu),$u=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,null,[{key:"from",value:function(e){return Ic((function(){return new zn}),e)}}]),n}(Hu),Ku=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,null,[{key:"from",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return 2===t.length?Ic((function(){return t[1]===Ht.DAY?new Hn:new Yn}),t[0]):Ic((function(){return new Yn}),t[0])}}]),n}(Hu),Qu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ku),qu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ku),Gu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),Ju=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e)).indices=zt.new(e.clone(r.type.indices)),r}return Object(F.a)(n,[{key:"dictionary",get:function(){return this.data.dictionary}},{key:"reverseLookup",value:function(e){return this.dictionary.indexOf(e)}},{key:"getKey",value:function(e){return this.indices.get(e)}},{key:"getValue",value:function(e){return this.dictionary.get(e)}},{key:"setKey",value:function(e,t){return this.indices.set(e,t)}},{key:"setValue",value:function(e,t){return this.dictionary.set(e,t)}}],[{key:"from",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];if(3===t.length){var r=t[0],i=t[1],a=t[2],o=new rr(r.type,i,null,null);return zt.new(ar.Dictionary(o,0,a.length,0,null,a,r))}return Ic((function(){return t[0].type}),t[0])}}]),n}(Hu);Ju.prototype.indices=null;var Zu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),Xu=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),es=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,null,[{key:"from",value:function(e){var t=os(this);if(e instanceof ArrayBuffer||ArrayBuffer.isView(e)){var n=as(e.constructor)||t;if(null===t&&(t=n),t&&t===n){var r=new t,i=e.byteLength/r.ArrayType.BYTES_PER_ELEMENT;if(!is(t,e.constructor))return zt.new(ar.Float(r,0,i,0,null,e))}}if(t)return Ic((function(){return new t}),e);if(e instanceof DataView||e instanceof ArrayBuffer)throw new TypeError("Cannot infer float type from instance of ".concat(e.constructor.name));throw new TypeError("Unrecognized FloatVector input")}}]),n}(Hu),ts=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"toFloat32Array",value:function(){return new Float32Array(this)}},{key:"toFloat64Array",value:function(){return new Float64Array(this)}}]),n}(es),ns=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(es),rs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(es),is=function(e,t){return e===Mn&&t!==Uint16Array},as=function(e){switch(e){case Uint16Array:return Mn;case Float32Array:return Nn;case Float64Array:return Un;default:return null}},os=function(e){switch(e){case ts:return Mn;case ns:return Nn;case rs:return Un;default:return null}},us=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),ss=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(us),cs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(us),ls=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,null,[{key:"from",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=t[0],i=t[1],a=void 0!==i&&i,o=ws(this,a);if(r instanceof ArrayBuffer||ArrayBuffer.isView(r)){var u=ks(r.constructor,a)||o;if(null===o&&(o=u),o&&o===u){var s=new o,c=r.byteLength/s.ArrayType.BYTES_PER_ELEMENT;return gs(o,r.constructor)&&(c*=.5),zt.new(ar.Int(s,0,c,0,null,r))}}if(o)return Ic((function(){return new o}),r);if(r instanceof DataView||r instanceof ArrayBuffer)throw new TypeError("Cannot infer integer type from instance of ".concat(r.constructor.name));throw new TypeError("Unrecognized IntVector input")}}]),n}(Hu),fs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(ls),hs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(ls),ds=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(ls),ps=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"toBigInt64Array",value:function(){return ze(this.values)}},{key:"values64",get:function(){return this._values64||(this._values64=this.toBigInt64Array())}}]),n}(ls),ys=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(ls),vs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(ls),bs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(ls),ms=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"toBigUint64Array",value:function(){return Ye(this.values)}},{key:"values64",get:function(){return this._values64||(this._values64=this.toBigUint64Array())}}]),n}(ls),gs=function(e,t){return(e===An||e===Cn)&&(t===Int32Array||t===Uint32Array)},ks=function(e,t){switch(e){case Int8Array:return Tn;case Int16Array:return In;case Int32Array:return t?An:En;case he:return An;case Uint8Array:return Bn;case Uint16Array:return Dn;case Uint32Array:return t?Cn:Ln;case pe:return Cn;default:return null}},ws=function(e,t){switch(e){case fs:return Tn;case hs:return In;case ds:return t?An:En;case ps:return An;case ys:return Bn;case vs:return Dn;case bs:return t?Cn:Ln;case ms:return Cn;default:return null}},_s=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),Os=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"asList",value:function(){var e=this.type.children[0];return zt.new(this.data.clone(new qn(e)))}},{key:"bind",value:function(e){var t=this.getChildAt(0),n=this.valueOffsets,r=n[e],i=n[e+1];return new Ai(t.slice(r,i))}}]),n}(Hu),xs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),js=Symbol.for("rowIndex"),Ss=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"bind",value:function(e){var t=this._row||(this._row=new Bi(this)),n=Object.create(t);return n[js]=e,n}}]),n}(Hu),Ts=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),Is=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ts),Es=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ts),As=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ts),Bs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ts),Ds=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Hu),Ls=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ds),Cs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ds),Fs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ds),Ms=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ds),Ns=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"typeIdToChildIndex",get:function(){return this.data.type.typeIdToChildIndex}}]),n}(Hu),Us=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"valueOffsets",get:function(){return this.data.valueOffsets}}]),n}(Ns),Ps=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(Ns),Rs=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"asBinary",value:function(){return zt.new(this.data.clone(new Pn))}}],[{key:"from",value:function(e){return Ic((function(){return new Rn}),e)}}]),n}(Hu);function zs(e){return function(){return e(this)}}function Vs(e){return function(t,n){return e(this,t,n)}}var Ws=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(cn),Hs=function(e,t){return 4294967296*e[t+1]+(e[t]>>>0)},Ys=function(e){return new Date(e)},$s=function(e,t,n){var r=t[n],i=t[n+1];return null!=r&&null!=i?e.subarray(r,i):null},Ks=function(e,t){return function(e,t){return Ys(function(e,t){return 864e5*e[t]}(e,t))}(e.values,t)},Qs=function(e,t){return function(e,t){return Ys(Hs(e,t))}(e.values,2*t)},qs=function(e,t){var n=e.stride;return e.values[n*t]},Gs=function(e,t){var n=e.stride;return Ar(e.values[n*t])},Js=function(e,t){var n=e.stride,r=e.values,i=e.type;return qr.new(r.subarray(n*t,n*(t+1)),i.isSigned)},Zs=function(e,t){var n=e.values;return 1e3*Hs(n,2*t)},Xs=function(e,t){var n=e.values;return Hs(n,2*t)},ec=function(e,t){return function(e,t){return e[t+1]/1e3*4294967296+(e[t]>>>0)/1e3}(e.values,2*t)},tc=function(e,t){return function(e,t){return e[t+1]/1e6*4294967296+(e[t]>>>0)/1e6}(e.values,2*t)},nc=function(e,t){return e.values[e.stride*t]},rc=function(e,t){return e.values[e.stride*t]},ic=function(e,t){var n=e.values;return qr.signed(n.subarray(2*t,2*(t+1)))},ac=function(e,t){var n=e.values;return qr.signed(n.subarray(2*t,2*(t+1)))},oc=function(e,t){var n=e.typeIdToChildIndex[e.typeIds[t]],r=e.getChildAt(n);return r?r.get(e.valueOffsets[t]):null},uc=function(e,t){var n=e.typeIdToChildIndex[e.typeIds[t]],r=e.getChildAt(n);return r?r.get(t):null},sc=function(e,t){return e.values.subarray(2*t,2*(t+1))},cc=function(e,t){var n=e.values[t],r=new Int32Array(2);return r[0]=n/12|0,r[1]=n%12|0,r};Ws.prototype.visitNull=function(e,t){return null},Ws.prototype.visitBool=function(e,t){var n=e.offset+t;return 0!==(e.values[n>>3]&1<<n%8)},Ws.prototype.visitInt=function(e,t){return e.type.bitWidth<64?qs(e,t):Js(e,t)},Ws.prototype.visitInt8=qs,Ws.prototype.visitInt16=qs,Ws.prototype.visitInt32=qs,Ws.prototype.visitInt64=Js,Ws.prototype.visitUint8=qs,Ws.prototype.visitUint16=qs,Ws.prototype.visitUint32=qs,Ws.prototype.visitUint64=Js,Ws.prototype.visitFloat=function(e,t){return e.type.precision!==$t.HALF?qs(e,t):Gs(e,t)},Ws.prototype.visitFloat16=Gs,Ws.prototype.visitFloat32=qs,Ws.prototype.visitFloat64=qs,Ws.prototype.visitUtf8=function(e,t){var n=e.values,r=e.valueOffsets,i=$s(n,r,t);return null!==i?ee(i):null},Ws.prototype.visitBinary=function(e,t){var n=e.values,r=e.valueOffsets;return $s(n,r,t)},Ws.prototype.visitFixedSizeBinary=function(e,t){var n=e.stride;return e.values.subarray(n*t,n*(t+1))},Ws.prototype.visitDate=function(e,t){return e.type.unit===Ht.DAY?Ks(e,t):Qs(e,t)},Ws.prototype.visitDateDay=Ks,Ws.prototype.visitDateMillisecond=Qs,Ws.prototype.visitTimestamp=function(e,t){switch(e.type.unit){case Yt.SECOND:return Zs(e,t);case Yt.MILLISECOND:return Xs(e,t);case Yt.MICROSECOND:return ec(e,t);case Yt.NANOSECOND:return tc(e,t)}},Ws.prototype.visitTimestampSecond=Zs,Ws.prototype.visitTimestampMillisecond=Xs,Ws.prototype.visitTimestampMicrosecond=ec,Ws.prototype.visitTimestampNanosecond=tc,Ws.prototype.visitTime=function(e,t){switch(e.type.unit){case Yt.SECOND:return nc(e,t);case Yt.MILLISECOND:return rc(e,t);case Yt.MICROSECOND:return ic(e,t);case Yt.NANOSECOND:return ac(e,t)}},Ws.prototype.visitTimeSecond=nc,Ws.prototype.visitTimeMillisecond=rc,Ws.prototype.visitTimeMicrosecond=ic,Ws.prototype.visitTimeNanosecond=ac,Ws.prototype.visitDecimal=function(e,t){var n=e.values;return qr.decimal(n.subarray(4*t,4*(t+1)))},Ws.prototype.visitList=function(e,t){var n=e.getChildAt(0),r=e.valueOffsets,i=e.stride;return n.slice(r[t*i],r[t*i+1])},Ws.prototype.visitStruct=function(e,t){return e.bind(t)},Ws.prototype.visitUnion=function(e,t){return e.type.mode===Kt.Dense?oc(e,t):uc(e,t)},Ws.prototype.visitDenseUnion=oc,Ws.prototype.visitSparseUnion=uc,Ws.prototype.visitDictionary=function(e,t){return e.getValue(e.getKey(t))},Ws.prototype.visitInterval=function(e,t){return e.type.unit===Qt.DAY_TIME?sc(e,t):cc(e,t)},Ws.prototype.visitIntervalDayTime=sc,Ws.prototype.visitIntervalYearMonth=cc,Ws.prototype.visitFixedSizeList=function(e,t){var n=e.getChildAt(0),r=e.stride;return n.slice(t*r,(t+1)*r)},Ws.prototype.visitMap=function(e,t){return e.bind(t)};var lc=new Ws,fc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(cn);function hc(e,t,n){if(void 0===t)return-1;if(null===t)return function(e,t){var n=e.nullBitmap;if(!n||e.nullCount<=0)return-1;var r,i=0,a=B(rn(n,e.data.offset+(t||0),e.length,n,Zt));try{for(a.s();!(r=a.n()).done;){if(!r.value)return i;++i}}catch(o){a.e(o)}finally{a.f()}return-1}(e,n);for(var r=Pi(t),i=(n||0)-1,a=e.length;++i<a;)if(r(e.get(i)))return i;return-1}function dc(e,t,n){for(var r=Pi(t),i=(n||0)-1,a=e.length;++i<a;)if(r(e.get(i)))return i;return-1}fc.prototype.visitNull=function(e,t){return null===t&&e.length>0?0:-1},fc.prototype.visitBool=hc,fc.prototype.visitInt=hc,fc.prototype.visitInt8=hc,fc.prototype.visitInt16=hc,fc.prototype.visitInt32=hc,fc.prototype.visitInt64=hc,fc.prototype.visitUint8=hc,fc.prototype.visitUint16=hc,fc.prototype.visitUint32=hc,fc.prototype.visitUint64=hc,fc.prototype.visitFloat=hc,fc.prototype.visitFloat16=hc,fc.prototype.visitFloat32=hc,fc.prototype.visitFloat64=hc,fc.prototype.visitUtf8=hc,fc.prototype.visitBinary=hc,fc.prototype.visitFixedSizeBinary=hc,fc.prototype.visitDate=hc,fc.prototype.visitDateDay=hc,fc.prototype.visitDateMillisecond=hc,fc.prototype.visitTimestamp=hc,fc.prototype.visitTimestampSecond=hc,fc.prototype.visitTimestampMillisecond=hc,fc.prototype.visitTimestampMicrosecond=hc,fc.prototype.visitTimestampNanosecond=hc,fc.prototype.visitTime=hc,fc.prototype.visitTimeSecond=hc,fc.prototype.visitTimeMillisecond=hc,fc.prototype.visitTimeMicrosecond=hc,fc.prototype.visitTimeNanosecond=hc,fc.prototype.visitDecimal=hc,fc.prototype.visitList=hc,fc.prototype.visitStruct=hc,fc.prototype.visitUnion=hc,fc.prototype.visitDenseUnion=dc,fc.prototype.visitSparseUnion=dc,fc.prototype.visitDictionary=hc,fc.prototype.visitInterval=hc,fc.prototype.visitIntervalDayTime=hc,fc.prototype.visitIntervalYearMonth=hc,fc.prototype.visitFixedSizeList=hc,fc.prototype.visitMap=hc;var pc=new fc,yc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(cn);function vc(e){if(e.nullCount>0)return function(e){var t=lc.getVisitFn(e);return rn(e.nullBitmap,e.offset,e.length,e,(function(e,n,r,i){return 0!==(r&1<<i)?t(e,n):null}))}(e);var t=e.type,n=e.typeId,r=e.length;return 1===e.stride&&(n===Vt.Timestamp||n===Vt.Int&&64!==t.bitWidth||n===Vt.Time&&64!==t.bitWidth||n===Vt.Float&&t.precision>0)?e.values.subarray(0,r)[Symbol.iterator]():M.mark((function t(n){var i;return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:i=-1;case 1:if(!(++i<r)){t.next=6;break}return t.next=4,n(e,i);case 4:t.next=1;break;case 6:case"end":return t.stop()}}),t)}))(lc.getVisitFn(e))}yc.prototype.visitNull=vc,yc.prototype.visitBool=vc,yc.prototype.visitInt=vc,yc.prototype.visitInt8=vc,yc.prototype.visitInt16=vc,yc.prototype.visitInt32=vc,yc.prototype.visitInt64=vc,yc.prototype.visitUint8=vc,yc.prototype.visitUint16=vc,yc.prototype.visitUint32=vc,yc.prototype.visitUint64=vc,yc.prototype.visitFloat=vc,yc.prototype.visitFloat16=vc,yc.prototype.visitFloat32=vc,yc.prototype.visitFloat64=vc,yc.prototype.visitUtf8=vc,yc.prototype.visitBinary=vc,yc.prototype.visitFixedSizeBinary=vc,yc.prototype.visitDate=vc,yc.prototype.visitDateDay=vc,yc.prototype.visitDateMillisecond=vc,yc.prototype.visitTimestamp=vc,yc.prototype.visitTimestampSecond=vc,yc.prototype.visitTimestampMillisecond=vc,yc.prototype.visitTimestampMicrosecond=vc,yc.prototype.visitTimestampNanosecond=vc,yc.prototype.visitTime=vc,yc.prototype.visitTimeSecond=vc,yc.prototype.visitTimeMillisecond=vc,yc.prototype.visitTimeMicrosecond=vc,yc.prototype.visitTimeNanosecond=vc,yc.prototype.visitDecimal=vc,yc.prototype.visitList=vc,yc.prototype.visitStruct=vc,yc.prototype.visitUnion=vc,yc.prototype.visitDenseUnion=vc,yc.prototype.visitSparseUnion=vc,yc.prototype.visitDictionary=vc,yc.prototype.visitInterval=vc,yc.prototype.visitIntervalDayTime=vc,yc.prototype.visitIntervalYearMonth=vc,yc.prototype.visitFixedSizeList=vc,yc.prototype.visitMap=vc;var bc=new yc,mc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n)}(cn);function gc(e){var t=e.type,n=e.length,r=e.stride;switch(t.typeId){case Vt.Int:case Vt.Float:case Vt.Decimal:case Vt.Time:case Vt.Timestamp:return e.values.subarray(0,n*r)}return sn(bc.visit(e))}mc.prototype.visitNull=gc,mc.prototype.visitBool=gc,mc.prototype.visitInt=gc,mc.prototype.visitInt8=gc,mc.prototype.visitInt16=gc,mc.prototype.visitInt32=gc,mc.prototype.visitInt64=gc,mc.prototype.visitUint8=gc,mc.prototype.visitUint16=gc,mc.prototype.visitUint32=gc,mc.prototype.visitUint64=gc,mc.prototype.visitFloat=gc,mc.prototype.visitFloat16=gc,mc.prototype.visitFloat32=gc,mc.prototype.visitFloat64=gc,mc.prototype.visitUtf8=gc,mc.prototype.visitBinary=gc,mc.prototype.visitFixedSizeBinary=gc,mc.prototype.visitDate=gc,mc.prototype.visitDateDay=gc,mc.prototype.visitDateMillisecond=gc,mc.prototype.visitTimestamp=gc,mc.prototype.visitTimestampSecond=gc,mc.prototype.visitTimestampMillisecond=gc,mc.prototype.visitTimestampMicrosecond=gc,mc.prototype.visitTimestampNanosecond=gc,mc.prototype.visitTime=gc,mc.prototype.visitTimeSecond=gc,mc.prototype.visitTimeMillisecond=gc,mc.prototype.visitTimeMicrosecond=gc,mc.prototype.visitTimeNanosecond=gc,mc.prototype.visitDecimal=gc,mc.prototype.visitList=gc,mc.prototype.visitStruct=gc,mc.prototype.visitUnion=gc,mc.prototype.visitDenseUnion=gc,mc.prototype.visitSparseUnion=gc,mc.prototype.visitDictionary=gc,mc.prototype.visitInterval=gc,mc.prototype.visitIntervalDayTime=gc,mc.prototype.visitIntervalYearMonth=gc,mc.prototype.visitFixedSizeList=gc,mc.prototype.visitMap=gc;var kc=new mc,wc=function(e,t){return e+t},_c=function(e){return"Cannot compute the byte width of variable-width column ".concat(e)},Oc=new(function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"visitNull",value:function(e){return 0}},{key:"visitInt",value:function(e){return e.bitWidth/8}},{key:"visitFloat",value:function(e){return e.ArrayType.BYTES_PER_ELEMENT}},{key:"visitBinary",value:function(e){throw new Error(_c(e))}},{key:"visitUtf8",value:function(e){throw new Error(_c(e))}},{key:"visitBool",value:function(e){return 1/8}},{key:"visitDecimal",value:function(e){return 16}},{key:"visitDate",value:function(e){return 4*(e.unit+1)}},{key:"visitTime",value:function(e){return e.bitWidth/8}},{key:"visitTimestamp",value:function(e){return e.unit===Yt.SECOND?4:8}},{key:"visitInterval",value:function(e){return 4*(e.unit+1)}},{key:"visitList",value:function(e){throw new Error(_c(e))}},{key:"visitStruct",value:function(e){return this.visitFields(e.children).reduce(wc,0)}},{key:"visitUnion",value:function(e){return this.visitFields(e.children).reduce(wc,0)}},{key:"visitFixedSizeBinary",value:function(e){return e.byteWidth}},{key:"visitFixedSizeList",value:function(e){return e.listSize*this.visitFields(e.children).reduce(wc,0)}},{key:"visitMap",value:function(e){return this.visitFields(e.children).reduce(wc,0)}},{key:"visitDictionary",value:function(e){return this.visit(e.indices)}},{key:"visitFields",value:function(e){var t=this;return(e||[]).map((function(e){return t.visit(e.type)}))}},{key:"visitSchema",value:function(e){return this.visitFields(e.fields).reduce(wc,0)}}]),n}(cn)),xc=new(function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"visitNull",value:function(){return xs}},{key:"visitBool",value:function(){return $u}},{key:"visitInt",value:function(){return ls}},{key:"visitInt8",value:function(){return fs}},{key:"visitInt16",value:function(){return hs}},{key:"visitInt32",value:function(){return ds}},{key:"visitInt64",value:function(){return ps}},{key:"visitUint8",value:function(){return ys}},{key:"visitUint16",value:function(){return vs}},{key:"visitUint32",value:function(){return bs}},{key:"visitUint64",value:function(){return ms}},{key:"visitFloat",value:function(){return es}},{key:"visitFloat16",value:function(){return ts}},{key:"visitFloat32",value:function(){return ns}},{key:"visitFloat64",value:function(){return rs}},{key:"visitUtf8",value:function(){return Rs}},{key:"visitBinary",value:function(){return Yu}},{key:"visitFixedSizeBinary",value:function(){return Zu}},{key:"visitDate",value:function(){return Ku}},{key:"visitDateDay",value:function(){return Qu}},{key:"visitDateMillisecond",value:function(){return qu}},{key:"visitTimestamp",value:function(){return Ts}},{key:"visitTimestampSecond",value:function(){return Is}},{key:"visitTimestampMillisecond",value:function(){return Es}},{key:"visitTimestampMicrosecond",value:function(){return As}},{key:"visitTimestampNanosecond",value:function(){return Bs}},{key:"visitTime",value:function(){return Ds}},{key:"visitTimeSecond",value:function(){return Ls}},{key:"visitTimeMillisecond",value:function(){return Cs}},{key:"visitTimeMicrosecond",value:function(){return Fs}},{key:"visitTimeNanosecond",value:function(){return Ms}},{key:"visitDecimal",value:function(){return Gu}},{key:"visitList",value:function(){return _s}},{key:"visitStruct",value:function(){return Ss}},{key:"visitUnion",value:function(){return Ns}},{key:"visitDenseUnion",value:function(){return Us}},{key:"visitSparseUnion",value:function(){return Ps}},{key:"visitDictionary",value:function(){return Ju}},{key:"visitInterval",value:function(){return us}},{key:"visitIntervalDayTime",value:function(){return ss}},{key:"visitIntervalYearMonth",value:function(){return cs}},{key:"visitFixedSizeList",value:function(){return Xu}},{key:"visitMap",value:function(){return Os}}]),n}(cn)),jc=["values"];function Sc(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new Tc(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function Tc(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return(Tc=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new Tc(e)}function Ic(e,t){if(ke(t))return zt.from({nullValues:[null,void 0],type:e(),values:t});if(we(t))return zt.from({nullValues:[null,void 0],type:e(),values:t});var n=Dt({},t),r=n.values,i=void 0===r?[]:r,a=n.type,o=void 0===a?e():a,u=n.nullValues,s=void 0===u?[null,void 0]:u;return ke(i),zt.from(Dt(Dt({nullValues:s},t),{},{type:o}))}function Ec(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new Ac(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function Ac(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return(Ac=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new Ac(e)}zt.new=function(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return Ur(xc.getVisitFn(e)(),[e].concat(n))},zt.from=function(e){var t=Dt({nullValues:[null,void 0]},e),n=t.values,r=void 0===n?[]:n,i=Wu(t,jc);if(ke(r)){var a=sn(br.throughIterable(i)(r));return 1===a.length?a[0]:Vi.concat(a)}return function(){var e=L(M.mark((function e(t){var n,a,o,u,s,c,l;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:n=br.throughAsyncIterable(i),a=!1,o=!1,e.prev=3,s=Sc(n(r));case 5:return e.next=7,s.next();case 7:if(!(a=!(c=e.sent).done)){e.next=13;break}l=c.value,t.push(l);case 10:a=!1,e.next=5;break;case 13:e.next=19;break;case 15:e.prev=15,e.t0=e.catch(3),o=!0,u=e.t0;case 19:if(e.prev=19,e.prev=20,!a||null==s.return){e.next=24;break}return e.next=24,s.return();case 24:if(e.prev=24,!o){e.next=27;break}throw u;case 27:return e.finish(24);case 28:return e.finish(19);case 29:return e.abrupt("return",1===t.length?t[0]:Vi.concat(t));case 30:case"end":return e.stop()}}),e,null,[[3,15,19,29],[20,,24,28]])})));return function(t){return e.apply(this,arguments)}}()([])},Hu.prototype.get=function(e){return lc.visit(this,e)},Hu.prototype.set=function(e,t){return Fa.visit(this,e,t)},Hu.prototype.indexOf=function(e,t){return pc.visit(this,e,t)},Hu.prototype.toArray=function(){return kc.visit(this)},Hu.prototype.getByteWidth=function(){return Oc.visit(this.type)},Hu.prototype[Symbol.iterator]=function(){return bc.visit(this)},Hu.prototype._bindDataAccessors=function(){var e=this.nullBitmap;e&&e.byteLength>0&&(this.get=(t=this.get,function(e){return this.isValid(e)?t.call(this,e):null}),this.set=function(e){return function(t,n){en(this.nullBitmap,this.offset+t,!(null===n||void 0===n))&&e.call(this,t,n)}}(this.set));var t},Object.keys(Vt).map((function(e){return Vt[e]})).filter((function(e){return"number"===typeof e})).filter((function(e){return e!==Vt.NONE})).forEach((function(e){var t,n=xc.visit(e);n.prototype.get=(t=lc.getVisitFn(e),function(e){return t(this,e)}),n.prototype.set=Vs(Fa.getVisitFn(e)),n.prototype.indexOf=Vs(pc.getVisitFn(e)),n.prototype.toArray=zs(kc.getVisitFn(e)),n.prototype.getByteWidth=function(e){return function(){return e(this.type)}}(Oc.getVisitFn(e)),n.prototype[Symbol.iterator]=zs(bc.getVisitFn(e))}));var Bc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e;Object(C.a)(this,n);for(var r=null,i=arguments.length,a=new Array(i),o=0;o<i;o++)a[o]=arguments[o];a[0]instanceof ra&&(r=a.shift());var u=qi(Dc,a);if(!r&&!(r=u[0]&&u[0].schema))throw new TypeError("Table must be initialized with a Schema or at least one RecordBatch");return u[0]||(u[0]=new Lc(r)),(e=t.call(this,new Gn(r.fields),u))._schema=r,e._chunks=u,e}return Object(F.a)(n,[{key:"schema",get:function(){return this._schema}},{key:"length",get:function(){return this._length}},{key:"chunks",get:function(){return this._chunks}},{key:"numCols",get:function(){return this._numChildren}},{key:"clone",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this._chunks;return new n(this._schema,e)}},{key:"getColumn",value:function(e){return this.getColumnAt(this.getColumnIndex(e))}},{key:"getColumnAt",value:function(e){return this.getChildAt(e)}},{key:"getColumnIndex",value:function(e){return this._schema.fields.findIndex((function(t){return t.name===e}))}},{key:"getChildAt",value:function(e){if(e<0||e>=this.numChildren)return null;var t,n,r=this._schema.fields,i=this._children||(this._children=[]);if(n=i[e])return n;if(t=r[e]){var a=this._chunks.map((function(t){return t.getChildAt(e)})).filter((function(e){return null!=e}));if(a.length>0)return i[e]=new $i(t,a)}return null}},{key:"serialize",value:function(){var e=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],t=e?Du:Lu;return t.writeAll(this).toUint8Array(!0)}},{key:"count",value:function(){return this._length}},{key:"select",value:function(){for(var e=this._schema.fields.reduce((function(e,t,n){return e.set(t.name,n)}),new Map),t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return this.selectAt.apply(this,sn(n.map((function(t){return e.get(t)})).filter((function(e){return e>-1}))))}},{key:"selectAt",value:function(){for(var e,t=arguments.length,r=new Array(t),i=0;i<t;i++)r[i]=arguments[i];var a=(e=this._schema).selectAt.apply(e,r);return new n(a,this._chunks.map((function(e){var t=e.length,n=e.data.childData;return new Dc(a,t,r.map((function(e){return n[e]})).filter(Boolean))})))}},{key:"assign",value:function(e){var t=this,r=this._schema.fields,i=e.schema.fields.reduce((function(e,t,n){var i=N(e,2),a=i[0],o=i[1],u=r.findIndex((function(e){return e.name===t.name}));return~u?o[u]=n:a.push(n),e}),[[],[]]),a=N(i,2),o=a[0],u=a[1],s=this._schema.assign(e.schema),c=[].concat(sn(r.map((function(n,r,i){var a=arguments.length>3&&void 0!==arguments[3]?arguments[3]:u[r];return void 0===a?t.getColumnAt(r):e.getColumnAt(a)}))),sn(o.map((function(t){return e.getColumnAt(t)})))).filter(Boolean);return Ur(n,sn(zu(s,c)))}}],[{key:"empty",value:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new ra([]);return new n(e,[])}},{key:"from",value:function(e){if(!e)return n.empty();if("object"===typeof e){var t=ke(e.values)?function(e){if(e.type instanceof Gn)return Bc.fromStruct(Ss.from(e));return null}(e):we(e.values)?function(e){if(e.type instanceof Gn)return Ss.from(e).then((function(e){return Bc.fromStruct(e)}));return null}(e):null;if(null!==t)return t}var r=Uc.from(e);return ge(r)?L(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.t0=n,e.next=3,r;case 3:return e.t1=e.sent,e.next=6,e.t0.from.call(e.t0,e.t1);case 6:return e.abrupt("return",e.sent);case 7:case"end":return e.stop()}}),e)})))():r.isSync()&&(r=r.open())?r.schema?new n(r.schema,sn(r)):n.empty():function(){var e=L(M.mark((function e(t){var r,i,a,o,u,s,c,l,f;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,t;case 2:if(r=e.sent,i=r.schema,a=[],!i){e.next=35;break}o=!1,u=!1,e.prev=8,c=Ec(r);case 10:return e.next=12,c.next();case 12:if(!(o=!(l=e.sent).done)){e.next=18;break}f=l.value,a.push(f);case 15:o=!1,e.next=10;break;case 18:e.next=24;break;case 20:e.prev=20,e.t0=e.catch(8),u=!0,s=e.t0;case 24:if(e.prev=24,e.prev=25,!o||null==c.return){e.next=29;break}return e.next=29,c.return();case 29:if(e.prev=29,!u){e.next=32;break}throw s;case 32:return e.finish(29);case 33:return e.finish(24);case 34:return e.abrupt("return",new n(i,a));case 35:return e.abrupt("return",n.empty());case 36:case"end":return e.stop()}}),e,null,[[8,20,24,34],[25,,29,33]])})));return function(t){return e.apply(this,arguments)}}()(r.open())}},{key:"fromAsync",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,n.from(t);case 2:return e.abrupt("return",e.sent);case 3:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}()},{key:"fromStruct",value:function(e){return n.new(e.data.childData,e.type.children)}},{key:"new",value:function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];return Ur(n,sn(Ru(Gi(t))))}}]),n}(Vi);var Dc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e,r;Object(C.a)(this,n);for(var i=arguments.length,a=new Array(i),o=0;o<i;o++)a[o]=arguments[o];var u,s=a[0];if(a[1]instanceof ar)r=a[1],u=a[2];else{var c=s.fields,l=a[1],f=a[2];r=ar.Struct(new Gn(c),0,l,0,null,f)}return(e=t.call(this,r,u))._schema=s,e}return Object(F.a)(n,[{key:"clone",value:function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this._children;return new n(this._schema,e,t)}},{key:"concat",value:function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var i=this._schema,a=Vi.flatten.apply(Vi,[this].concat(t));return new Bc(i,a.map((function(e){var t=e.data;return new n(i,t)})))}},{key:"schema",get:function(){return this._schema}},{key:"numCols",get:function(){return this._schema.fields.length}},{key:"dictionaries",get:function(){return this._dictionaries||(this._dictionaries=Cc.collect(this))}},{key:"select",value:function(){for(var e=this._schema.fields.reduce((function(e,t,n){return e.set(t.name,n)}),new Map),t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return this.selectAt.apply(this,sn(n.map((function(t){return e.get(t)})).filter((function(e){return e>-1}))))}},{key:"selectAt",value:function(){for(var e,t=this,r=arguments.length,i=new Array(r),a=0;a<r;a++)i[a]=arguments[a];var o=(e=this._schema).selectAt.apply(e,i),u=i.map((function(e){return t.data.childData[e]})).filter(Boolean);return new n(o,this.length,u)}}],[{key:"from",value:function(e){return ke(e.values),Bc.from(e)}},{key:"new",value:function(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];var i=Ji(t),a=N(i,2),o=a[0],u=a[1],s=u.filter((function(e){return e instanceof zt}));return Ur(n,sn(Pu(new ra(o),s.map((function(e){return e.data})))))}}]),n}(Ss),Lc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){return Object(C.a)(this,n),t.call(this,e,0,e.fields.map((function(e){return ar.new(e.type,0,0,0)})))}return Object(F.a)(n)}(Dc),Cc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e;return Object(C.a)(this,n),(e=t.apply(this,arguments)).dictionaries=new Map,e}return Object(F.a)(n,[{key:"visit",value:function(e,t){var n=this;return xn.isDictionary(t)?this.visitDictionary(e,t):(e.childData.forEach((function(e,r){return n.visit(e,t.children[r].type)})),this)}},{key:"visitDictionary",value:function(e,t){var n=e.dictionary;return n&&n.length>0&&this.dictionaries.set(t.id,n),this}}],[{key:"collect",value:function(e){return(new n).visit(e.data,new Gn(e.schema.fields)).dictionaries}}]),n}(cn),Fc=M.mark(Gc);function Mc(e){var t,n,r,i=2;for("undefined"!=typeof Symbol&&(n=Symbol.asyncIterator,r=Symbol.iterator);i--;){if(n&&null!=(t=e[n]))return t.call(e);if(r&&null!=(t=e[r]))return new Nc(t.call(e));n="@@asyncIterator",r="@@iterator"}throw new TypeError("Object is not async iterable")}function Nc(e){function t(e){if(Object(e)!==e)return Promise.reject(new TypeError(e+" is not an object."));var t=e.done;return Promise.resolve(e.value).then((function(e){return{value:e,done:t}}))}return(Nc=function(e){this.s=e,this.n=e.next}).prototype={s:null,n:null,next:function(){return t(this.n.apply(this.s,arguments))},return:function(e){var n=this.s.return;return void 0===n?Promise.resolve({value:e,done:!0}):t(n.apply(this.s,arguments))},throw:function(e){var n=this.s.return;return void 0===n?Promise.reject(e):t(n.apply(this.s,arguments))}},new Nc(e)}var Uc=function(e,t,n){Object(ne.a)(i,e);var r=Object(re.a)(i);function i(e){var t;return Object(C.a)(this,i),(t=r.call(this))._impl=e,t}return Object(F.a)(i,[{key:"closed",get:function(){return this._impl.closed}},{key:"schema",get:function(){return this._impl.schema}},{key:"autoDestroy",get:function(){return this._impl.autoDestroy}},{key:"dictionaries",get:function(){return this._impl.dictionaries}},{key:"numDictionaries",get:function(){return this._impl.numDictionaries}},{key:"numRecordBatches",get:function(){return this._impl.numRecordBatches}},{key:"footer",get:function(){return this._impl.isFile()?this._impl.footer:null}},{key:"isSync",value:function(){return this._impl.isSync()}},{key:"isAsync",value:function(){return this._impl.isAsync()}},{key:"isFile",value:function(){return this._impl.isFile()}},{key:"isStream",value:function(){return this._impl.isStream()}},{key:"next",value:function(){return this._impl.next()}},{key:"throw",value:function(e){return this._impl.throw(e)}},{key:"return",value:function(e){return this._impl.return(e)}},{key:"cancel",value:function(){return this._impl.cancel()}},{key:"reset",value:function(e){return this._impl.reset(e),this._DOMStream=void 0,this._nodeStream=void 0,this}},{key:"open",value:function(e){var t=this,n=this._impl.open(e);return ge(n)?n.then((function(){return t})):this}},{key:"readRecordBatch",value:function(e){return this._impl.isFile()?this._impl.readRecordBatch(e):null}},{key:t,value:function(){return this._impl[Symbol.iterator]()}},{key:n,value:function(){return this._impl[Symbol.asyncIterator]()}},{key:"toDOMStream",value:function(){var e=this;return kt.toDOMStream(this.isSync()?At({},Symbol.iterator,(function(){return e})):At({},Symbol.asyncIterator,(function(){return e})))}},{key:"toNodeStream",value:function(){var e=this;return kt.toNodeStream(this.isSync()?At({},Symbol.iterator,(function(){return e})):At({},Symbol.asyncIterator,(function(){return e})),{objectMode:!0})}}],[{key:"throughNode",value:function(e){throw new Error('"throughNode" not available in this environment')}},{key:"throughDOM",value:function(e,t){throw new Error('"throughDOM" not available in this environment')}},{key:"from",value:function(e){return e instanceof i?e:_e(e)?function(e){return new Pc(new Qc(e))}(e):xe(e)?function(e){return el.apply(this,arguments)}(e):ge(e)?L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.t0=i,t.next=3,e;case 3:return t.t1=t.sent,t.next=6,t.t0.from.call(t.t0,t.t1);case 6:return t.abrupt("return",t.sent);case 7:case"end":return t.stop()}}),t)})))():je(e)||Te(e)||Ee(e)||we(e)?function(e){return Xc.apply(this,arguments)}(new qa(e)):function(e){var t=e.peek(ku+7&-8);return t&&t.byteLength>=4?gu(t)?new zc(new $c(e.read())):new Pc(new Hc(e)):new Pc(new Hc(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:case"end":return e.stop()}}),e)}))()))}(new Qa(e))}},{key:"readAll",value:function(e){return e instanceof i?e.isSync()?Gc(e):Jc(e):_e(e)||ArrayBuffer.isView(e)||ke(e)||Oe(e)?Gc(e):Jc(e)}}]),i}(oe,Symbol.iterator,Symbol.asyncIterator),Pc=function(e,t,n){Object(ne.a)(i,e);var r=Object(re.a)(i);function i(e){var t;return Object(C.a)(this,i),(t=r.call(this,e))._impl=e,t}return Object(F.a)(i,[{key:t,value:function(){return this._impl[Symbol.iterator]()}},{key:n,value:function(){var e=this;return z(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.delegateYield(V(Mc(e[Symbol.iterator]()),P),"t0",1);case 1:case"end":return t.stop()}}),t)})))()}}]),i}(Uc,Symbol.iterator,Symbol.asyncIterator),Rc=function(e,t,n){Object(ne.a)(i,e);var r=Object(re.a)(i);function i(e){var t;return Object(C.a)(this,i),(t=r.call(this,e))._impl=e,t}return Object(F.a)(i,[{key:t,value:function(){throw new Error("AsyncRecordBatchStreamReader is not Iterable")}},{key:n,value:function(){return this._impl[Symbol.asyncIterator]()}}]),i}(Uc,Symbol.iterator,Symbol.asyncIterator),zc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._impl=e,r}return Object(F.a)(n)}(Pc),Vc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this,e))._impl=e,r}return Object(F.a)(n)}(Rc),Wc=function(){function e(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new Map;Object(C.a)(this,e),this.closed=!1,this.autoDestroy=!0,this._dictionaryIndex=0,this._recordBatchIndex=0,this.dictionaries=t}return Object(F.a)(e,[{key:"numDictionaries",get:function(){return this._dictionaryIndex}},{key:"numRecordBatches",get:function(){return this._recordBatchIndex}},{key:"isSync",value:function(){return!1}},{key:"isAsync",value:function(){return!1}},{key:"isFile",value:function(){return!1}},{key:"isStream",value:function(){return!1}},{key:"reset",value:function(e){return this._dictionaryIndex=0,this._recordBatchIndex=0,this.schema=e,this.dictionaries=new Map,this}},{key:"_loadRecordBatch",value:function(e,t){return new Dc(this.schema,e.length,this._loadVectors(e,t,this.schema.fields))}},{key:"_loadDictionaryBatch",value:function(e,t){var n=e.id,r=e.isDelta,i=e.data,a=this.dictionaries,o=this.schema,u=a.get(n);if(r||!u){var s=o.dictionaries.get(n);return u&&r?u.concat(zt.new(this._loadVectors(i,t,[s])[0])):zt.new(this._loadVectors(i,t,[s])[0])}return u}},{key:"_loadVectors",value:function(e,t,n){return new oo(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}]),e}(),Hc=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(e,t){var i;return Object(C.a)(this,r),(i=n.call(this,t))._reader=_e(e)?new yu(i._handle=e):new du(i._handle=e),i}return Object(F.a)(r,[{key:"isSync",value:function(){return!0}},{key:"isStream",value:function(){return!0}},{key:t,value:function(){return this}},{key:"cancel",value:function(){!this.closed&&(this.closed=!0)&&(this.reset()._reader.return(),this._reader=null,this.dictionaries=null)}},{key:"open",value:function(e){return this.closed||(this.autoDestroy=qc(this,e),this.schema||(this.schema=this._reader.readSchema())||this.cancel()),this}},{key:"throw",value:function(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.throw(e):ie}},{key:"return",value:function(e){return!this.closed&&this.autoDestroy&&(this.closed=!0)?this.reset()._reader.return(e):ie}},{key:"next",value:function(){if(this.closed)return ie;for(var e,t=this._reader;e=this._readNextMessageAndValidate();)if(e.isSchema())this.reset(e.header());else{if(e.isRecordBatch()){this._recordBatchIndex++;var n=e.header(),r=t.readMessageBody(e.bodyLength);return{done:!1,value:this._loadRecordBatch(n,r)}}if(e.isDictionaryBatch()){this._dictionaryIndex++;var i=e.header(),a=t.readMessageBody(e.bodyLength),o=this._loadDictionaryBatch(i,a);this.dictionaries.set(i.id,o)}}return this.schema&&0===this._recordBatchIndex?(this._recordBatchIndex++,{done:!1,value:new Lc(this.schema)}):this.return()}},{key:"_readNextMessageAndValidate",value:function(e){return this._reader.readMessage(e)}}]),r}(Wc,Symbol.iterator),Yc=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(e,t){var i;return Object(C.a)(this,r),(i=n.call(this,t))._reader=new pu(i._handle=e),i}return Object(F.a)(r,[{key:"isAsync",value:function(){return!0}},{key:"isStream",value:function(){return!0}},{key:t,value:function(){return this}},{key:"cancel",value:function(){var e=L(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.closed||!(this.closed=!0)){e.next=5;break}return e.next=3,this.reset()._reader.return();case 3:this._reader=null,this.dictionaries=null;case 5:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"open",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.closed){e.next=10;break}if(this.autoDestroy=qc(this,t),e.t0=this.schema,e.t0){e.next=7;break}return e.next=6,this._reader.readSchema();case 6:e.t0=this.schema=e.sent;case 7:if(e.t0){e.next=10;break}return e.next=10,this.cancel();case 10:return e.abrupt("return",this);case 11:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"throw",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.closed||!this.autoDestroy||!(this.closed=!0)){e.next=4;break}return e.next=3,this.reset()._reader.throw(t);case 3:return e.abrupt("return",e.sent);case 4:return e.abrupt("return",ie);case 5:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"return",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.closed||!this.autoDestroy||!(this.closed=!0)){e.next=4;break}return e.next=3,this.reset()._reader.return(t);case 3:return e.abrupt("return",e.sent);case 4:return e.abrupt("return",ie);case 5:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"next",value:function(){var e=L(M.mark((function e(){var t,n,r,i,a,o,u,s;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!this.closed){e.next=2;break}return e.abrupt("return",ie);case 2:n=this._reader;case 3:return e.next=5,this._readNextMessageAndValidate();case 5:if(!(t=e.sent)){e.next=31;break}if(!t.isSchema()){e.next=11;break}return e.next=9,this.reset(t.header());case 9:e.next=29;break;case 11:if(!t.isRecordBatch()){e.next=21;break}return this._recordBatchIndex++,r=t.header(),e.next=16,n.readMessageBody(t.bodyLength);case 16:return i=e.sent,a=this._loadRecordBatch(r,i),e.abrupt("return",{done:!1,value:a});case 21:if(!t.isDictionaryBatch()){e.next=29;break}return this._dictionaryIndex++,o=t.header(),e.next=26,n.readMessageBody(t.bodyLength);case 26:u=e.sent,s=this._loadDictionaryBatch(o,u),this.dictionaries.set(o.id,s);case 29:e.next=3;break;case 31:if(!this.schema||0!==this._recordBatchIndex){e.next=34;break}return this._recordBatchIndex++,e.abrupt("return",{done:!1,value:new Lc(this.schema)});case 34:return e.next=36,this.return();case 36:return e.abrupt("return",e.sent);case 37:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"_readNextMessageAndValidate",value:function(){var e=L(M.mark((function e(t){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,this._reader.readMessage(t);case 2:return e.abrupt("return",e.sent);case 3:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()}]),r}(Wc,Symbol.asyncIterator),$c=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){return Object(C.a)(this,n),t.call(this,e instanceof Za?e:new Za(e),r)}return Object(F.a)(n,[{key:"footer",get:function(){return this._footer}},{key:"numDictionaries",get:function(){return this._footer?this._footer.numDictionaries:0}},{key:"numRecordBatches",get:function(){return this._footer?this._footer.numRecordBatches:0}},{key:"isSync",value:function(){return!0}},{key:"isFile",value:function(){return!0}},{key:"open",value:function(e){if(!this.closed&&!this._footer){this.schema=(this._footer=this._readFooter()).schema;var t,r=B(this._footer.dictionaryBatches());try{for(r.s();!(t=r.n()).done;){t.value&&this._readDictionaryBatch(this._dictionaryIndex++)}}catch(i){r.e(i)}finally{r.f()}}return Object(Pt.a)(Object(Rt.a)(n.prototype),"open",this).call(this,e)}},{key:"readRecordBatch",value:function(e){if(this.closed)return null;this._footer||this.open();var t=this._footer&&this._footer.getRecordBatch(e);if(t&&this._handle.seek(t.offset)){var n=this._reader.readMessage(qt.RecordBatch);if(n&&n.isRecordBatch()){var r=n.header(),i=this._reader.readMessageBody(n.bodyLength);return this._loadRecordBatch(r,i)}}return null}},{key:"_readDictionaryBatch",value:function(e){var t=this._footer&&this._footer.getDictionaryBatch(e);if(t&&this._handle.seek(t.offset)){var n=this._reader.readMessage(qt.DictionaryBatch);if(n&&n.isDictionaryBatch()){var r=n.header(),i=this._reader.readMessageBody(n.bodyLength),a=this._loadDictionaryBatch(r,i);this.dictionaries.set(r.id,a)}}}},{key:"_readFooter",value:function(){var e=this._handle,t=e.size-wu,n=e.readInt32(t),r=e.readAt(t-n,n);return Va.decode(r)}},{key:"_readNextMessageAndValidate",value:function(e){if(this._footer||this.open(),this._footer&&this._recordBatchIndex<this.numRecordBatches){var t=this._footer&&this._footer.getRecordBatch(this._recordBatchIndex);if(t&&this._handle.seek(t.offset))return this._reader.readMessage(e)}return null}}]),n}(Hc),Kc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){Object(C.a)(this,n);for(var r=arguments.length,i=new Array(r>1?r-1:0),a=1;a<r;a++)i[a-1]=arguments[a];var o="number"!==typeof i[0]?i.shift():void 0,u=i[0]instanceof Map?i.shift():void 0;return t.call(this,e instanceof Xa?e:new Xa(e,o),u)}return Object(F.a)(n,[{key:"footer",get:function(){return this._footer}},{key:"numDictionaries",get:function(){return this._footer?this._footer.numDictionaries:0}},{key:"numRecordBatches",get:function(){return this._footer?this._footer.numRecordBatches:0}},{key:"isFile",value:function(){return!0}},{key:"isAsync",value:function(){return!0}},{key:"open",value:function(){var e=L(M.mark((function e(t){var r,i,a;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this.closed||this._footer){e.next=23;break}return e.next=3,this._readFooter();case 3:this.schema=(this._footer=e.sent).schema,r=B(this._footer.dictionaryBatches()),e.prev=5,r.s();case 7:if((i=r.n()).done){e.next=15;break}if(a=i.value,e.t0=a,!e.t0){e.next=13;break}return e.next=13,this._readDictionaryBatch(this._dictionaryIndex++);case 13:e.next=7;break;case 15:e.next=20;break;case 17:e.prev=17,e.t1=e.catch(5),r.e(e.t1);case 20:return e.prev=20,r.f(),e.finish(20);case 23:return e.next=25,Object(Pt.a)(Object(Rt.a)(n.prototype),"open",this).call(this,t);case 25:return e.abrupt("return",e.sent);case 26:case"end":return e.stop()}}),e,this,[[5,17,20,23]])})));return function(t){return e.apply(this,arguments)}}()},{key:"readRecordBatch",value:function(){var e=L(M.mark((function e(t){var n,r,i,a,o;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(!this.closed){e.next=2;break}return e.abrupt("return",null);case 2:if(this._footer){e.next=5;break}return e.next=5,this.open();case 5:if(n=this._footer&&this._footer.getRecordBatch(t),e.t0=n,!e.t0){e.next=11;break}return e.next=10,this._handle.seek(n.offset);case 10:e.t0=e.sent;case 11:if(!e.t0){e.next=22;break}return e.next=14,this._reader.readMessage(qt.RecordBatch);case 14:if(!(r=e.sent)||!r.isRecordBatch()){e.next=22;break}return i=r.header(),e.next=19,this._reader.readMessageBody(r.bodyLength);case 19:return a=e.sent,o=this._loadRecordBatch(i,a),e.abrupt("return",o);case 22:return e.abrupt("return",null);case 23:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"_readDictionaryBatch",value:function(){var e=L(M.mark((function e(t){var n,r,i,a,o;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(n=this._footer&&this._footer.getDictionaryBatch(t),e.t0=n,!e.t0){e.next=6;break}return e.next=5,this._handle.seek(n.offset);case 5:e.t0=e.sent;case 6:if(!e.t0){e.next=17;break}return e.next=9,this._reader.readMessage(qt.DictionaryBatch);case 9:if(!(r=e.sent)||!r.isDictionaryBatch()){e.next=17;break}return i=r.header(),e.next=14,this._reader.readMessageBody(r.bodyLength);case 14:a=e.sent,o=this._loadDictionaryBatch(i,a),this.dictionaries.set(i.id,o);case 17:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()},{key:"_readFooter",value:function(){var e=L(M.mark((function e(){var t,n,r,i;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t=this._handle,e.t0=t._pending,!e.t0){e.next=5;break}return e.next=5,t._pending;case 5:return n=t.size-wu,e.next=8,t.readInt32(n);case 8:return r=e.sent,e.next=11,t.readAt(n-r,r);case 11:return i=e.sent,e.abrupt("return",Va.decode(i));case 13:case"end":return e.stop()}}),e,this)})));return function(){return e.apply(this,arguments)}}()},{key:"_readNextMessageAndValidate",value:function(){var e=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(this._footer){e.next=3;break}return e.next=3,this.open();case 3:if(!(this._footer&&this._recordBatchIndex<this.numRecordBatches)){e.next=14;break}if(n=this._footer.getRecordBatch(this._recordBatchIndex),e.t0=n,!e.t0){e.next=10;break}return e.next=9,this._handle.seek(n.offset);case 9:e.t0=e.sent;case 10:if(!e.t0){e.next=14;break}return e.next=13,this._reader.readMessage(t);case 13:return e.abrupt("return",e.sent);case 14:return e.abrupt("return",null);case 15:case"end":return e.stop()}}),e,this)})));return function(t){return e.apply(this,arguments)}}()}]),n}(Yc),Qc=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){return Object(C.a)(this,n),t.call(this,e,r)}return Object(F.a)(n,[{key:"_loadVectors",value:function(e,t,n){return new uo(t,e.nodes,e.buffers,this.dictionaries).visitMany(n)}}]),n}(Hc);function qc(e,t){return t&&"boolean"===typeof t.autoDestroy?t.autoDestroy:e.autoDestroy}function Gc(e){var t;return M.wrap((function(n){for(;;)switch(n.prev=n.next){case 0:if(t=Uc.from(e),n.prev=1,t.open({autoDestroy:!1}).closed){n.next=6;break}case 3:return n.next=5,t;case 5:if(!t.reset().open().closed){n.next=3;break}case 6:return n.prev=6,t.cancel(),n.finish(6);case 9:case"end":return n.stop()}}),Fc,null,[[1,,6,9]])}function Jc(e){return Zc.apply(this,arguments)}function Zc(){return(Zc=z(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,P(Uc.from(t));case 2:return n=e.sent,e.prev=3,e.next=6,P(n.open({autoDestroy:!1}));case 6:if(e.sent.closed){e.next=12;break}case 7:return e.next=9,n;case 9:return e.next=11,P(n.reset().open());case 11:if(!e.sent.closed){e.next=7;break}case 12:return e.prev=12,e.next=15,P(n.cancel());case 15:return e.finish(12);case 16:case"end":return e.stop()}}),e,null,[[3,,12,16]])})))).apply(this,arguments)}function Xc(){return(Xc=L(M.mark((function e(t){var n;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,t.peek(ku+7&-8);case 2:if(!((n=e.sent)&&n.byteLength>=4)){e.next=18;break}if(gu(n)){e.next=8;break}e.t1=new Rc(new Yc(t)),e.next=15;break;case 8:return e.t2=zc,e.t3=$c,e.next=12,t.read();case 12:e.t4=e.sent,e.t5=new e.t3(e.t4),e.t1=new e.t2(e.t5);case 15:e.t0=e.t1,e.next=19;break;case 18:e.t0=new Rc(new Yc(z(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:case"end":return e.stop()}}),e)})))()));case 19:return e.abrupt("return",e.t0);case 20:case"end":return e.stop()}}),e)})))).apply(this,arguments)}function el(){return(el=L(M.mark((function e(t){var n,r,i;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,t.stat();case 2:if(n=e.sent,r=n.size,i=new Xa(t,r),!(r>=_u)){e.next=12;break}return e.t0=gu,e.next=9,i.readAt(0,ku+7&-8);case 9:if(e.t1=e.sent,!(0,e.t0)(e.t1)){e.next=12;break}return e.abrupt("return",new Vc(new Kc(i)));case 12:return e.abrupt("return",new Rc(new Yc(i)));case 13:case"end":return e.stop()}}),e)})))).apply(this,arguments)}var tl=["readableStrategy","writableStrategy","queueingStrategy"];var nl=function(){function e(t){var n,r,i=this;Object(C.a)(this,e),this._numChunks=0,this._finished=!1,this._bufferedSize=0;var a=t.readableStrategy,o=t.writableStrategy,u=t.queueingStrategy,s=void 0===u?"count":u,c=Wu(t,tl);this._controller=null,this._builder=br.new(c),this._getSize="bytes"!==s?rl:il;var l=Dt({},a).highWaterMark,f=void 0===l?"bytes"===s?Math.pow(2,14):1e3:l,h=Dt({},o).highWaterMark,d=void 0===h?"bytes"===s?Math.pow(2,14):1e3:h;this.readable=new ReadableStream((At(n={},"cancel",(function(){i._builder.clear()})),At(n,"pull",(function(e){i._maybeFlush(i._builder,i._controller=e)})),At(n,"start",(function(e){i._maybeFlush(i._builder,i._controller=e)})),n),{highWaterMark:f,size:"bytes"!==s?rl:il}),this.writable=new WritableStream((At(r={},"abort",(function(){i._builder.clear()})),At(r,"write",(function(){i._maybeFlush(i._builder,i._controller)})),At(r,"close",(function(){i._maybeFlush(i._builder.finish(),i._controller)})),r),{highWaterMark:d,size:function(e){return i._writeValueAndReturnChunkSize(e)}})}return Object(F.a)(e,[{key:"_writeValueAndReturnChunkSize",value:function(e){var t=this._bufferedSize;return this._bufferedSize=this._getSize(this._builder.append(e)),this._bufferedSize-t}},{key:"_maybeFlush",value:function(e,t){null!==t&&(this._bufferedSize>=t.desiredSize&&++this._numChunks&&this._enqueue(t,e.toVector()),e.finished&&((e.length>0||0===this._numChunks)&&++this._numChunks&&this._enqueue(t,e.toVector()),!this._finished&&(this._finished=!0)&&this._enqueue(t,null)))}},{key:"_enqueue",value:function(e,t){this._bufferedSize=0,this._controller=null,null===t?e.close():e.enqueue(t)}}]),e}(),rl=function(e){return e.length},il=function(e){return e.byteLength};var al=function(){function e(){Object(C.a)(this,e)}return Object(F.a)(e,[{key:"eq",value:function(t){return t instanceof e||(t=new ol(t)),new dl(this,t)}},{key:"le",value:function(t){return t instanceof e||(t=new ol(t)),new pl(this,t)}},{key:"ge",value:function(t){return t instanceof e||(t=new ol(t)),new yl(this,t)}},{key:"lt",value:function(e){return new vl(this.ge(e))}},{key:"gt",value:function(e){return new vl(this.le(e))}},{key:"ne",value:function(e){return new vl(this.eq(e))}}]),e}(),ol=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).v=e,r}return Object(F.a)(n)}(al),ul=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).name=e,r}return Object(F.a)(n,[{key:"bind",value:function(e){if(!this.colidx){this.colidx=-1;for(var t=e.schema.fields,n=-1;++n<t.length;)if(t[n].name===this.name){this.colidx=n;break}if(this.colidx<0)throw new Error('Failed to bind Col "'.concat(this.name,'"'))}var r=this.vector=e.getChildAt(this.colidx);return function(e){return r.get(e)}}}]),n}(al),sl=function(){function e(){Object(C.a)(this,e)}return Object(F.a)(e,[{key:"and",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Ur(fl,[this].concat(t))}},{key:"or",value:function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return Ur(hl,[this].concat(t))}},{key:"not",value:function(){return new vl(this)}}]),e}(),cl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){var i;return Object(C.a)(this,n),(i=t.call(this)).left=e,i.right=r,i}return Object(F.a)(n,[{key:"bind",value:function(e){return this.left instanceof ol?this.right instanceof ol?this._bindLitLit(e,this.left,this.right):this._bindLitCol(e,this.left,this.right):this.right instanceof ol?this._bindColLit(e,this.left,this.right):this._bindColCol(e,this.left,this.right)}}]),n}(sl),ll=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){var e;Object(C.a)(this,n),e=t.call(this);for(var r=arguments.length,i=new Array(r),a=0;a<r;a++)i[a]=arguments[a];return e.children=i,e}return Object(F.a)(n)}(sl);ll.prototype.children=Object.freeze([]);var fl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){for(var e=arguments.length,r=new Array(e),i=0;i<e;i++)r[i]=arguments[i];return Object(C.a)(this,n),r=r.reduce((function(e,t){return e.concat(t instanceof n?t.children:t)}),[]),t.call.apply(t,[this].concat(sn(r)))}return Object(F.a)(n,[{key:"bind",value:function(e){var t=this.children.map((function(t){return t.bind(e)}));return function(e,n){return t.every((function(t){return t(e,n)}))}}}]),n}(ll),hl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){for(var e=arguments.length,r=new Array(e),i=0;i<e;i++)r[i]=arguments[i];return Object(C.a)(this,n),r=r.reduce((function(e,t){return e.concat(t instanceof n?t.children:t)}),[]),t.call.apply(t,[this].concat(sn(r)))}return Object(F.a)(n,[{key:"bind",value:function(e){var t=this.children.map((function(t){return t.bind(e)}));return function(e,n){return t.some((function(t){return t(e,n)}))}}}]),n}(ll),dl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"_bindLitLit",value:function(e,t,n){var r=t.v==n.v;return function(){return r}}},{key:"_bindColCol",value:function(e,t,n){var r=t.bind(e),i=n.bind(e);return function(e,t){return r(e,t)==i(e,t)}}},{key:"_bindColLit",value:function(e,t,n){var r=t.bind(e);if(t.vector instanceof Ju){var i,a=t.vector;return a.dictionary!==this.lastDictionary?(i=a.reverseLookup(n.v),this.lastDictionary=a.dictionary,this.lastKey=i):i=this.lastKey,-1===i?function(){return!1}:function(e){return a.getKey(e)===i}}return function(e,t){return r(e,t)==n.v}}},{key:"_bindLitCol",value:function(e,t,n){return this._bindColLit(e,n,t)}}]),n}(cl),pl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"_bindLitLit",value:function(e,t,n){var r=t.v<=n.v;return function(){return r}}},{key:"_bindColCol",value:function(e,t,n){var r=t.bind(e),i=n.bind(e);return function(e,t){return r(e,t)<=i(e,t)}}},{key:"_bindColLit",value:function(e,t,n){var r=t.bind(e);return function(e,t){return r(e,t)<=n.v}}},{key:"_bindLitCol",value:function(e,t,n){var r=n.bind(e);return function(e,n){return t.v<=r(e,n)}}}]),n}(cl),yl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"_bindLitLit",value:function(e,t,n){var r=t.v>=n.v;return function(){return r}}},{key:"_bindColCol",value:function(e,t,n){var r=t.bind(e),i=n.bind(e);return function(e,t){return r(e,t)>=i(e,t)}}},{key:"_bindColLit",value:function(e,t,n){var r=t.bind(e);return function(e,t){return r(e,t)>=n.v}}},{key:"_bindLitCol",value:function(e,t,n){var r=n.bind(e);return function(e,n){return t.v>=r(e,n)}}}]),n}(cl),vl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e){var r;return Object(C.a)(this,n),(r=t.call(this)).child=e,r}return Object(F.a)(n,[{key:"bind",value:function(e){var t=this.child.bind(e);return function(e,n){return!t(e,n)}}}]),n}(sl);Bc.prototype.countBy=function(e){return new bl(this.chunks).countBy(e)},Bc.prototype.scan=function(e,t){return new bl(this.chunks).scan(e,t)},Bc.prototype.scanReverse=function(e,t){return new bl(this.chunks).scanReverse(e,t)},Bc.prototype.filter=function(e){return new bl(this.chunks).filter(e)};var bl=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(){return Object(C.a)(this,n),t.apply(this,arguments)}return Object(F.a)(n,[{key:"filter",value:function(e){return new gl(this.chunks,e)}},{key:"scan",value:function(e,t){for(var n=this.chunks,r=n.length,i=-1;++i<r;){var a=n[i];t&&t(a);for(var o=-1,u=a.length;++o<u;)e(o,a)}}},{key:"scanReverse",value:function(e,t){for(var n=this.chunks,r=n.length;--r>=0;){var i=n[r];t&&t(i);for(var a=i.length;--a>=0;)e(a,i)}}},{key:"countBy",value:function(e){var t=this.chunks,n=t.length,r="string"===typeof e?new ul(e):e;r.bind(t[n-1]);var i=r.vector;if(!xn.isDictionary(i.type))throw new Error("countBy currently only supports dictionary-encoded columns");for(var a=Math.ceil(Math.log(i.length)/Math.log(256)),o=new(4==a?Uint32Array:a>=2?Uint16Array:Uint8Array)(i.dictionary.length),u=-1;++u<n;){var s=t[u];r.bind(s);for(var c=r.vector.indices,l=-1,f=s.length;++l<f;){var h=c.get(l);null!==h&&o[h]++}}return new ml(i.dictionary,ls.from(o))}}]),n}(Bc),ml=function(e){Object(ne.a)(n,e);var t=Object(re.a)(n);function n(e,r){Object(C.a)(this,n);var i=new ra([new ia("values",e.type),new ia("counts",r.type)]);return t.call(this,new Dc(i,r.length,[e,r]))}return Object(F.a)(n,[{key:"toJSON",value:function(){for(var e=this.getColumnAt(0),t=this.getColumnAt(1),n={},r=-1;++r<this.length;)n[e.get(r)]=t.get(r);return n}}]),n}(Bc),gl=function(e,t){Object(ne.a)(r,e);var n=Object(re.a)(r);function r(e,t){var i;return Object(C.a)(this,r),(i=n.call(this,e))._predicate=t,i}return Object(F.a)(r,[{key:"scan",value:function(e,t){for(var n=this._chunks,r=n.length,i=-1;++i<r;)for(var a=n[i],o=this._predicate.bind(a),u=!1,s=-1,c=a.length;++s<c;)o(s,a)&&(t&&!u&&(t(a),u=!0),e(s,a))}},{key:"scanReverse",value:function(e,t){for(var n=this._chunks,r=n.length;--r>=0;)for(var i=n[r],a=this._predicate.bind(i),o=!1,u=i.length;--u>=0;)a(u,i)&&(t&&!o&&(t(i),o=!0),e(u,i))}},{key:"count",value:function(){for(var e=0,t=this._chunks,n=t.length,r=-1;++r<n;)for(var i=t[r],a=this._predicate.bind(i),o=-1,u=i.length;++o<u;)a(o,i)&&++e;return e}},{key:t,value:M.mark((function e(){var t,n,r,i,a,o,u;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:t=this._chunks,n=t.length,r=-1;case 3:if(!(++r<n)){e.next=15;break}i=t[r],a=this._predicate.bind(i),o=-1,u=i.length;case 7:if(!(++o<u)){e.next=13;break}if(!a(o,i)){e.next=11;break}return e.next=11,i.get(o);case 11:e.next=7;break;case 13:e.next=3;break;case 15:case"end":return e.stop()}}),e,this)}))},{key:"filter",value:function(e){return new r(this._chunks,this._predicate.and(e))}},{key:"countBy",value:function(e){var t=this._chunks,n=t.length,r="string"===typeof e?new ul(e):e;r.bind(t[n-1]);var i=r.vector;if(!xn.isDictionary(i.type))throw new Error("countBy currently only supports dictionary-encoded columns");for(var a=Math.ceil(Math.log(i.length)/Math.log(256)),o=new(4==a?Uint32Array:a>=2?Uint16Array:Uint8Array)(i.dictionary.length),u=-1;++u<n;){var s=t[u],c=this._predicate.bind(s);r.bind(s);for(var l=r.vector.indices,f=-1,h=s.length;++f<h;){var d=l.get(f);null!==d&&c(f,s)&&o[d]++}}return new ml(i.dictionary,ls.from(o))}}]),r}(bl,Symbol.iterator);Dt(Dt(Dt(Dt(Dt(Dt({},o),s),i),a),r),u);kt.toDOMStream=function(e,t){if(we(e))return function(e,t){var n=null,r=t&&"bytes"===t.type||!1,i=t&&t.highWaterMark||Math.pow(2,24);return new ReadableStream(Dt(Dt({},t),{},{start:function(t){return L(M.mark((function r(){return M.wrap((function(r){for(;;)switch(r.prev=r.next){case 0:return r.next=2,a(t,n||(n=e[Symbol.asyncIterator]()));case 2:case"end":return r.stop()}}),r)})))()},pull:function(e){return L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!n){t.next=5;break}return t.next=3,a(e,n);case 3:t.next=6;break;case 5:e.close();case 6:case"end":return t.stop()}}),t)})))()},cancel:function(){return L(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(e.t1=n,!e.t1){e.next=8;break}if(e.t2=n.return,!e.t2){e.next=7;break}return e.next=6,n.return();case 6:e.t2=e.sent;case 7:e.t1=e.t2;case 8:if(e.t0=e.t1,e.t0){e.next=11;break}e.t0=!0;case 11:if(e.t3=e.t0,!e.t3){e.next=14;break}n=null;case 14:case"end":return e.stop()}}),e)})))()}}),Dt({highWaterMark:r?i:void 0},t));function a(e,t){return o.apply(this,arguments)}function o(){return(o=L(M.mark((function e(t,n){var i,a,o;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:a=null,o=t.desiredSize||null;case 2:return e.next=4,n.next(r?o:null);case 4:if((a=e.sent).done){e.next=11;break}if(ArrayBuffer.isView(a.value)&&(i=Ve(a.value))&&(null!=o&&r&&(o=o-i.byteLength+1),a.value=i),t.enqueue(a.value),!(null!=o&&--o<=0)){e.next=9;break}return e.abrupt("return");case 9:e.next=2;break;case 11:t.close();case 12:case"end":return e.stop()}}),e)})))).apply(this,arguments)}}(e,t);if(ke(e))return function(e,t){var n=null,r=t&&"bytes"===t.type||!1,i=t&&t.highWaterMark||Math.pow(2,24);return new ReadableStream(Dt(Dt({},t),{},{start:function(t){a(t,n||(n=e[Symbol.iterator]()))},pull:function(e){n?a(e,n):e.close()},cancel:function(){n&&n.return&&n.return(),n=null}}),Dt({highWaterMark:r?i:void 0},t));function a(e,t){for(var n,i=null,a=e.desiredSize||null;!(i=t.next(r?a:null)).done;)if(ArrayBuffer.isView(i.value)&&(n=Ve(i.value))&&(null!=a&&r&&(a=a-n.byteLength+1),i.value=n),e.enqueue(i.value),null!=a&&--a<=0)return;e.close()}}(e,t);throw new Error("toDOMStream() must be called with an Iterable or AsyncIterable")},br.throughDOM=function(e){return new nl(e)},Uc.throughDOM=function(e,t){var n=new Ka,r=null,i=new ReadableStream({cancel:function(){return L(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,n.close();case 2:case"end":return e.stop()}}),e)})))()},start:function(e){return L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(t.t0=u,t.t1=e,t.t2=r,t.t2){t.next=7;break}return t.next=6,a();case 6:t.t2=r=t.sent;case 7:return t.t3=t.t2,t.next=10,(0,t.t0)(t.t1,t.t3);case 10:case"end":return t.stop()}}),t)})))()},pull:function(e){return L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:if(!r){t.next=5;break}return t.next=3,u(e,r);case 3:t.next=6;break;case 5:e.close();case 6:case"end":return t.stop()}}),t)})))()}});return{writable:new WritableStream(n,Dt({highWaterMark:Math.pow(2,14)},e)),readable:i};function a(){return o.apply(this,arguments)}function o(){return(o=L(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,Uc.from(n);case 2:return e.next=4,e.sent.open(t);case 4:return e.abrupt("return",e.sent);case 5:case"end":return e.stop()}}),e)})))).apply(this,arguments)}function u(e,t){return s.apply(this,arguments)}function s(){return(s=L(M.mark((function e(t,n){var r,i;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:r=t.desiredSize,i=null;case 2:return e.next=4,n.next();case 4:if((i=e.sent).done){e.next=10;break}if(t.enqueue(i.value),!(null!=r&&--r<=0)){e.next=8;break}return e.abrupt("return");case 8:e.next=2;break;case 10:t.close();case 11:case"end":return e.stop()}}),e)})))).apply(this,arguments)}},Bu.throughDOM=function(e,t){var n=new this(e),r=new qa(n),i=new ReadableStream({type:"bytes",cancel:function(){return L(M.mark((function e(){return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,r.cancel();case 2:case"end":return e.stop()}}),e)})))()},pull:function(e){return L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,a(e);case 2:case"end":return t.stop()}}),t)})))()},start:function(e){return L(M.mark((function t(){return M.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,a(e);case 2:case"end":return t.stop()}}),t)})))()}},Dt({highWaterMark:Math.pow(2,14)},t));return{writable:new WritableStream(n,e),readable:i};function a(e){return o.apply(this,arguments)}function o(){return(o=L(M.mark((function e(t){var n,i;return M.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:n=null,i=t.desiredSize;case 2:return e.next=4,r.read(i||null);case 4:if(!(n=e.sent)){e.next=10;break}if(t.enqueue(n),!(null!=i&&(i-=n.byteLength)<=0)){e.next=8;break}return e.abrupt("return");case 8:e.next=2;break;case 10:t.close();case 11:case"end":return e.stop()}}),e)})))).apply(this,arguments)}};var kl,wl=function(){function e(e,t,n,r){var i=this;this.getCell=function(e,t){var n=e<i.headerRows&&t<i.headerColumns,r=e>=i.headerRows&&t<i.headerColumns,a=e<i.headerRows&&t>=i.headerColumns;if(n){var o=["blank"];return t>0&&o.push("level"+e),{type:"blank",classNames:o.join(" "),content:""}}if(a)return{type:"columns",classNames:(o=["col_heading","level"+e,"col"+(s=t-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,s,e)};if(r){o=["row_heading","level"+t,"row"+(u=e-i.headerRows)];return{type:"index",id:"T_"+i.uuid+"level"+t+"_row"+u,classNames:o.join(" "),content:i.getContent(i.indexTable,u,t)}}o=["data","row"+(u=e-i.headerRows),"col"+(s=t-i.headerColumns)];var u,s,c=i.styler?i.getContent(i.styler.displayValuesTable,u,s):i.getContent(i.dataTable,u,s);return{type:"data",id:"T_"+i.uuid+"row"+u+"_col"+s,classNames:o.join(" "),content:c}},this.getContent=function(e,t,n){var r=e.getColumnAt(n);if(null===r)return"";switch(i.getColumnTypeId(e,n)){case Vt.Timestamp:return i.nanosToDate(r.get(t));default:return r.get(t)}},this.dataTable=Bc.from(e),this.indexTable=Bc.from(t),this.columnsTable=Bc.from(n),this.styler=r?{caption:r.caption,displayValuesTable:Bc.from(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.length+this.columnsTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!0,configurable:!0}),e.prototype.serialize=function(){return{data:this.dataTable.serialize(),index:this.indexTable.serialize(),columns:this.columnsTable.serialize()}},e.prototype.getColumnTypeId=function(e,t){return e.schema.fields[t].type.typeId},e.prototype.nanosToDate=function(e){return new Date(e/1e6)},e}(),_l=function(){return(_l=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var i in t=arguments[n])Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i]);return e}).apply(this,arguments)};!function(e){e.COMPONENT_READY="streamlit:componentReady",e.SET_COMPONENT_VALUE="streamlit:setComponentValue",e.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(kl||(kl={}));var Ol=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new I,e.registeredMessageListener=!1,e.setComponentReady=function(){e.registeredMessageListener||(window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0),e.sendBackMsg(kl.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){void 0===t&&(t=document.body.scrollHeight),t!==e.lastFrameHeight&&(e.lastFrameHeight=t,e.sendBackMsg(kl.SET_FRAME_HEIGHT,{height:t}))},e.setComponentValue=function(t){var n;t instanceof wl?(n="dataframe",t=t.serialize()):!function(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(n){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}(t)?t instanceof ArrayBuffer?(n="bytes",t=new Uint8Array(t)):n="json":(n="bytes",t=new Uint8Array(t.buffer)),e.sendBackMsg(kl.SET_COMPONENT_VALUE,{value:t,dataType:n})},e.onMessageEvent=function(t){switch(t.data.type){case e.RENDER_EVENT:e.onRenderMessage(t.data)}},e.onRenderMessage=function(t){var n=t.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};n=_l(_l({},n),r);var i=Boolean(t.disabled),a=t.theme;a&&xl(a);var o={disabled:i,args:n,theme:a},u=new CustomEvent(e.RENDER_EVENT,{detail:o});e.events.dispatchEvent(u)},e.argsDataframeToObject=function(t){var n=t.map((function(t){var n=t.key,r=t.value;return[n,e.toArrowTable(r)]}));return Object.fromEntries(n)},e.toArrowTable=function(e){var t=e.data,n=t.data,r=t.index,i=t.columns,a=t.styler;return new wl(n,r,i,a)},e.sendBackMsg=function(e,t){window.parent.postMessage(_l({isStreamlitMessage:!0,type:e},t),"*")},e}(),xl=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML="\n    :root {\n      --primary-color: "+e.primaryColor+";\n      --background-color: "+e.backgroundColor+";\n      --secondary-background-color: "+e.secondaryBackgroundColor+";\n      --text-color: "+e.textColor+";\n      --font: "+e.font+";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  "};var jl=function(){var e=function(t,n){return(e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n])})(t,n)};return function(t,n){function r(){this.constructor=t}e(t,n),t.prototype=null===n?Object.create(n):(r.prototype=n.prototype,new r)}}(),Sl=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return jl(t,e),t.prototype.componentDidMount=function(){Ol.setFrameHeight()},t.prototype.componentDidUpdate=function(){Ol.setFrameHeight()},t}(h.a.PureComponent);function Tl(e){var t=function(t){function n(n){var r=t.call(this,n)||this;return r.componentDidMount=function(){Ol.events.addEventListener(Ol.RENDER_EVENT,r.onRenderEvent),Ol.setComponentReady()},r.componentDidUpdate=function(){null!=r.state.componentError&&Ol.setFrameHeight()},r.componentWillUnmount=function(){Ol.events.removeEventListener(Ol.RENDER_EVENT,r.onRenderEvent)},r.onRenderEvent=function(e){var t=e;r.setState({renderData:t.detail})},r.render=function(){return null!=r.state.componentError?h.a.createElement("div",null,h.a.createElement("h1",null,"Component Error"),h.a.createElement("span",null,r.state.componentError.message)):null==r.state.renderData?null:h.a.createElement(e,{width:window.innerWidth,disabled:r.state.renderData.disabled,args:r.state.renderData.args,theme:r.state.renderData.theme})},r.state={renderData:void 0,componentError:void 0},r}return jl(n,t),n.getDerivedStateFromError=function(e){return{componentError:e}},n}(h.a.PureComponent);return l()(t,e)}},function(e,t,n){"use strict";function r(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}n.d(t,"a",(function(){return r}))},function(e,t,n){"use strict";function r(e){return(r="function"===typeof Symbol&&"symbol"===typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"===typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}n.d(t,"a",(function(){return a}));var i=n(10);function a(e,t){return!t||"object"!==r(t)&&"function"!==typeof t?Object(i.a)(e):t}},function(e,t,n){"use strict";n.d(t,"a",(function(){return s}));var r=n(7),i=n.n(r),a=n(8),o=n.n(a);function u(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}"undefined"!==typeof Symbol&&(Symbol.iterator||(Symbol.iterator=Symbol("Symbol.iterator"))),"undefined"!==typeof Symbol&&(Symbol.asyncIterator||(Symbol.asyncIterator=Symbol("Symbol.asyncIterator")));var s=Object.freeze({START:"start",PAUSE:"pause",STOP:"stop",NONE:"none"}),c=function(e){var t,n;function r(t){var n;return(n=e.call(this,t)||this).init=function(){try{return n.leftchannel=[],n.rightchannel=[],n.recorder=null,n.recording=!1,n.recordingLength=0,n.volume=null,n.audioInput=null,n.sampleRate=null,n.AudioContext=window.AudioContext||window.webkitAudioContext,n.context=null,n.analyser=null,n.canvas=n.canvasRef.current,n.canvasCtx=n.canvas.getContext("2d"),n.stream=null,n.tested=!1,navigator.getUserMedia=navigator.getUserMedia||navigator.webkitGetUserMedia||navigator.mozGetUserMedia,Promise.resolve()}catch(e){return Promise.reject(e)}},n.getStream=function(e){return e||(e={audio:!0,video:!1}),navigator.mediaDevices.getUserMedia(e)},n.setUpRecording=function(){n.context=new n.AudioContext,n.sampleRate=n.context.sampleRate,n.volume=n.context.createGain(),n.audioInput=n.context.createMediaStreamSource(n.stream),n.analyser=n.context.createAnalyser(),n.audioInput.connect(n.analyser);n.recorder=n.context.createScriptProcessor(2048,2,2),n.analyser.connect(n.recorder),n.recorder.connect(n.context.destination);var e=u(n);n.recorder.onaudioprocess=function(t){if(e.recording){var n=t.inputBuffer.getChannelData(0),r=t.inputBuffer.getChannelData(1);e.tested||(e.tested=!0,n.reduce((function(e,t){return e+t}))||(console.log("Error: There seems to be an issue with your Mic"),e.stop(),e.stream.getTracks().forEach((function(e){e.stop()})),e.context.close())),e.leftchannel.push(new Float32Array(n)),e.rightchannel.push(new Float32Array(r)),e.recordingLength+=2048}},n.visualize()},n.mergeBuffers=function(e,t){for(var n=new Float32Array(t),r=0,i=e.length,a=0;a<i;a++){var o=e[a];n.set(o,r),r+=o.length}return n},n.interleave=function(e,t){for(var n=e.length+t.length,r=new Float32Array(n),i=0,a=0;a<n;)r[a++]=e[i],r[a++]=t[i],i++;return r},n.writeUTFBytes=function(e,t,n){for(var r=n.length,i=0;i<r;i++)e.setUint8(t+i,n.charCodeAt(i))},n.visualize=function(){var e=n.props,t=e.backgroundColor,r=e.foregroundColor;if(n.WIDTH=n.canvas.width,n.HEIGHT=n.canvas.height,n.CENTERX=n.canvas.width/2,n.CENTERY=n.canvas.height/2,n.analyser){n.analyser.fftSize=2048;var i=n.analyser.fftSize,a=new Uint8Array(i);n.canvasCtx.clearRect(0,0,n.WIDTH,n.HEIGHT);var o=u(n);!function e(){o.drawVisual=requestAnimationFrame(e),o.analyser.getByteTimeDomainData(a),o.canvasCtx.fillStyle=t,o.canvasCtx.fillRect(0,0,o.WIDTH,o.HEIGHT),o.canvasCtx.lineWidth=2,o.canvasCtx.strokeStyle=r,o.canvasCtx.beginPath();for(var n=1*o.WIDTH/i,u=0,s=0;s<i;s++){var c=a[s]/128*o.HEIGHT/2;0===s?o.canvasCtx.moveTo(u,c):o.canvasCtx.lineTo(u,c),u+=n}o.canvasCtx.lineTo(o.canvas.width,o.canvas.height/2),o.canvasCtx.stroke()}()}},n.setupMic=function(){try{var e=function(){n.setUpRecording()},t=function(e,t){try{var n=e()}catch(r){return t(r)}return n&&n.then?n.then(void 0,t):n}((function(){return Promise.resolve(n.getStream()).then((function(e){window.stream=n.stream=e}))}),(function(e){console.log("Error: Issue getting mic",e)}));return Promise.resolve(t&&t.then?t.then(e):e())}catch(r){return Promise.reject(r)}},n.start=function(){try{return Promise.resolve(n.setupMic()).then((function(){n.recording=!0,n.leftchannel.length=n.rightchannel.length=0,n.recordingLength=0}))}catch(e){return Promise.reject(e)}},n.stop=function(){var e=n.props,t=e.onStop,r=e.type;n.recording=!1,n.closeMic(),n.leftBuffer=n.mergeBuffers(n.leftchannel,n.recordingLength),n.rightBuffer=n.mergeBuffers(n.rightchannel,n.recordingLength);var i=n.interleave(n.leftBuffer,n.rightBuffer),a=new ArrayBuffer(44+2*i.length),o=new DataView(a);n.writeUTFBytes(o,0,"RIFF"),o.setUint32(4,44+2*i.length,!0),n.writeUTFBytes(o,8,"WAVE"),n.writeUTFBytes(o,12,"fmt "),o.setUint32(16,16,!0),o.setUint16(20,1,!0),o.setUint16(22,2,!0),o.setUint32(24,n.sampleRate,!0),o.setUint32(28,4*n.sampleRate,!0),o.setUint16(32,4,!0),o.setUint16(34,16,!0),n.writeUTFBytes(o,36,"data"),o.setUint32(40,2*i.length,!0);for(var u=i.length,s=44,c=0;c<u;c++)o.setInt16(s,32767*i[c],!0),s+=2;var l=new Blob([o],{type:r}),f=URL.createObjectURL(l);t&&t({blob:l,url:f,type:r})},n.pause=function(){n.recording=!1,n.closeMic()},n.resume=function(){n.setupMic(),n.recording=!0},n.closeMic=function(){n.stream.getAudioTracks().forEach((function(e){e.stop()})),n.audioInput.disconnect(0),n.analyser.disconnect(0),n.recorder.disconnect(0)},n.canvasRef=i.a.createRef(),n}n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n;var a=r.prototype;return a.componentDidMount=function(){this.init()},a.componentDidUpdate=function(e,t){var n=this.props.state;this.checkState(e.state,n)},a.checkState=function(e){switch(e){case s.START:this.doIfState(s.PAUSE,this.pause),this.doIfState(s.STOP,this.stop);break;case s.PAUSE:this.doIfState(s.START,this.resume),this.doIfState(s.STOP,this.stop);break;case s.STOP:default:this.doIfState(s.START,this.start)}},a.doIfState=function(e,t){this.props.state==e&&t&&t()},a.componentWillUnmount=function(){},a.render=function(){var e=this.props,t=e.canvasWidth,n=e.canvasHeight;return i.a.createElement("div",{className:"audio-react-recorder"},i.a.createElement("canvas",{ref:this.canvasRef,width:t,height:n,className:"audio-react-recorder__canvas"}))},r}(i.a.Component);c.propTypes={state:o.a.string,type:o.a.string.isRequired,backgroundColor:o.a.string,foregroundColor:o.a.string,canvasWidth:o.a.oneOfType([o.a.string,o.a.number]),canvasHeight:o.a.oneOfType([o.a.string,o.a.number]),onStop:o.a.func},c.defaultProps={state:s.NONE,type:"audio/wav",backgroundColor:"rgb(200, 200, 200)",foregroundColor:"rgb(0, 0, 0)",canvasWidth:500,canvasHeight:300},t.b=c},function(e,t,n){"use strict";function r(e,t){return(r=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}n.d(t,"a",(function(){return r}))},function(e,t,n){"use strict";function r(){if("undefined"===typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"===typeof Proxy)return!0;try{return Date.prototype.toString.call(Reflect.construct(Date,[],(function(){}))),!0}catch(e){return!1}}n.d(t,"a",(function(){return r}))},function(e,t,n){"use strict";var r=Object.getOwnPropertySymbols,i=Object.prototype.hasOwnProperty,a=Object.prototype.propertyIsEnumerable;function o(e){if(null===e||void 0===e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(i){return!1}}()?Object.assign:function(e,t){for(var n,u,s=o(e),c=1;c<arguments.length;c++){for(var l in n=Object(arguments[c]))i.call(n,l)&&(s[l]=n[l]);if(r){u=r(n);for(var f=0;f<u.length;f++)a.call(n,u[f])&&(s[u[f]]=n[u[f]])}}return s}},function(e,t,n){"use strict";!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE){0;try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}}(),e.exports=n(20)},function(e,t,n){"use strict";var r=n(23),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},a={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},o={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},u={};function s(e){return r.isMemo(e)?o:u[e.$$typeof]||i}u[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},u[r.Memo]=o;var c=Object.defineProperty,l=Object.getOwnPropertyNames,f=Object.getOwnPropertySymbols,h=Object.getOwnPropertyDescriptor,d=Object.getPrototypeOf,p=Object.prototype;e.exports=function e(t,n,r){if("string"!==typeof n){if(p){var i=d(n);i&&i!==p&&e(t,i,r)}var o=l(n);f&&(o=o.concat(f(n)));for(var u=s(t),y=s(n),v=0;v<o.length;++v){var b=o[v];if(!a[b]&&(!r||!r[b])&&(!y||!y[b])&&(!u||!u[b])){var m=h(n,b);try{c(t,b,m)}catch(g){}}}}return t}},,function(e,t,n){"use strict";var r=n(15),i="function"===typeof Symbol&&Symbol.for,a=i?Symbol.for("react.element"):60103,o=i?Symbol.for("react.portal"):60106,u=i?Symbol.for("react.fragment"):60107,s=i?Symbol.for("react.strict_mode"):60108,c=i?Symbol.for("react.profiler"):60114,l=i?Symbol.for("react.provider"):60109,f=i?Symbol.for("react.context"):60110,h=i?Symbol.for("react.forward_ref"):60112,d=i?Symbol.for("react.suspense"):60113,p=i?Symbol.for("react.memo"):60115,y=i?Symbol.for("react.lazy"):60116,v="function"===typeof Symbol&&Symbol.iterator;function b(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var m={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},g={};function k(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||m}function w(){}function _(e,t,n){this.props=e,this.context=t,this.refs=g,this.updater=n||m}k.prototype.isReactComponent={},k.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error(b(85));this.updater.enqueueSetState(this,e,t,"setState")},k.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},w.prototype=k.prototype;var O=_.prototype=new w;O.constructor=_,r(O,k.prototype),O.isPureReactComponent=!0;var x={current:null},j=Object.prototype.hasOwnProperty,S={key:!0,ref:!0,__self:!0,__source:!0};function T(e,t,n){var r,i={},o=null,u=null;if(null!=t)for(r in void 0!==t.ref&&(u=t.ref),void 0!==t.key&&(o=""+t.key),t)j.call(t,r)&&!S.hasOwnProperty(r)&&(i[r]=t[r]);var s=arguments.length-2;if(1===s)i.children=n;else if(1<s){for(var c=Array(s),l=0;l<s;l++)c[l]=arguments[l+2];i.children=c}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===i[r]&&(i[r]=s[r]);return{$$typeof:a,type:e,key:o,ref:u,props:i,_owner:x.current}}function I(e){return"object"===typeof e&&null!==e&&e.$$typeof===a}var E=/\/+/g,A=[];function B(e,t,n,r){if(A.length){var i=A.pop();return i.result=e,i.keyPrefix=t,i.func=n,i.context=r,i.count=0,i}return{result:e,keyPrefix:t,func:n,context:r,count:0}}function D(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>A.length&&A.push(e)}function L(e,t,n){return null==e?0:function e(t,n,r,i){var u=typeof t;"undefined"!==u&&"boolean"!==u||(t=null);var s=!1;if(null===t)s=!0;else switch(u){case"string":case"number":s=!0;break;case"object":switch(t.$$typeof){case a:case o:s=!0}}if(s)return r(i,t,""===n?"."+C(t,0):n),1;if(s=0,n=""===n?".":n+":",Array.isArray(t))for(var c=0;c<t.length;c++){var l=n+C(u=t[c],c);s+=e(u,l,r,i)}else if(null===t||"object"!==typeof t?l=null:l="function"===typeof(l=v&&t[v]||t["@@iterator"])?l:null,"function"===typeof l)for(t=l.call(t),c=0;!(u=t.next()).done;)s+=e(u=u.value,l=n+C(u,c++),r,i);else if("object"===u)throw r=""+t,Error(b(31,"[object Object]"===r?"object with keys {"+Object.keys(t).join(", ")+"}":r,""));return s}(e,"",t,n)}function C(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,(function(e){return t[e]}))}(e.key):t.toString(36)}function F(e,t){e.func.call(e.context,t,e.count++)}function M(e,t,n){var r=e.result,i=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?N(e,r,n,(function(e){return e})):null!=e&&(I(e)&&(e=function(e,t){return{$$typeof:a,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(e,i+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(E,"$&/")+"/")+n)),r.push(e))}function N(e,t,n,r,i){var a="";null!=n&&(a=(""+n).replace(E,"$&/")+"/"),L(e,M,t=B(t,a,r,i)),D(t)}var U={current:null};function P(){var e=U.current;if(null===e)throw Error(b(321));return e}var R={ReactCurrentDispatcher:U,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:x,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:function(e,t,n){if(null==e)return e;var r=[];return N(e,r,null,t,n),r},forEach:function(e,t,n){if(null==e)return e;L(e,F,t=B(null,null,t,n)),D(t)},count:function(e){return L(e,(function(){return null}),null)},toArray:function(e){var t=[];return N(e,t,null,(function(e){return e})),t},only:function(e){if(!I(e))throw Error(b(143));return e}},t.Component=k,t.Fragment=u,t.Profiler=c,t.PureComponent=_,t.StrictMode=s,t.Suspense=d,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=R,t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error(b(267,e));var i=r({},e.props),o=e.key,u=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(u=t.ref,s=x.current),void 0!==t.key&&(o=""+t.key),e.type&&e.type.defaultProps)var c=e.type.defaultProps;for(l in t)j.call(t,l)&&!S.hasOwnProperty(l)&&(i[l]=void 0===t[l]&&void 0!==c?c[l]:t[l])}var l=arguments.length-2;if(1===l)i.children=n;else if(1<l){c=Array(l);for(var f=0;f<l;f++)c[f]=arguments[f+2];i.children=c}return{$$typeof:a,type:e.type,key:o,ref:u,props:i,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:f,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:l,_context:e},e.Consumer=e},t.createElement=T,t.createFactory=function(e){var t=T.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:h,render:e}},t.isValidElement=I,t.lazy=function(e){return{$$typeof:y,_ctor:e,_status:-1,_result:null}},t.memo=function(e,t){return{$$typeof:p,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return P().useCallback(e,t)},t.useContext=function(e,t){return P().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return P().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return P().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return P().useLayoutEffect(e,t)},t.useMemo=function(e,t){return P().useMemo(e,t)},t.useReducer=function(e,t,n){return P().useReducer(e,t,n)},t.useRef=function(e){return P().useRef(e)},t.useState=function(e){return P().useState(e)},t.version="16.14.0"},function(e,t,n){"use strict";var r=n(7),i=n(15),a=n(21);function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(o(227));function u(e,t,n,r,i,a,o,u,s){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(l){this.onError(l)}}var s=!1,c=null,l=!1,f=null,h={onError:function(e){s=!0,c=e}};function d(e,t,n,r,i,a,o,l,f){s=!1,c=null,u.apply(h,arguments)}var p=null,y=null,v=null;function b(e,t,n){var r=e.type||"unknown-event";e.currentTarget=v(n),function(e,t,n,r,i,a,u,h,p){if(d.apply(this,arguments),s){if(!s)throw Error(o(198));var y=c;s=!1,c=null,l||(l=!0,f=y)}}(r,t,void 0,e),e.currentTarget=null}var m=null,g={};function k(){if(m)for(var e in g){var t=g[e],n=m.indexOf(e);if(!(-1<n))throw Error(o(96,e));if(!_[n]){if(!t.extractEvents)throw Error(o(97,e));for(var r in _[n]=t,n=t.eventTypes){var i=void 0,a=n[r],u=t,s=r;if(O.hasOwnProperty(s))throw Error(o(99,s));O[s]=a;var c=a.phasedRegistrationNames;if(c){for(i in c)c.hasOwnProperty(i)&&w(c[i],u,s);i=!0}else a.registrationName?(w(a.registrationName,u,s),i=!0):i=!1;if(!i)throw Error(o(98,r,e))}}}}function w(e,t,n){if(x[e])throw Error(o(100,e));x[e]=t,j[e]=t.eventTypes[n].dependencies}var _=[],O={},x={},j={};function S(e){var t,n=!1;for(t in e)if(e.hasOwnProperty(t)){var r=e[t];if(!g.hasOwnProperty(t)||g[t]!==r){if(g[t])throw Error(o(102,t));g[t]=r,n=!0}}n&&k()}var T=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),I=null,E=null,A=null;function B(e){if(e=y(e)){if("function"!==typeof I)throw Error(o(280));var t=e.stateNode;t&&(t=p(t),I(e.stateNode,e.type,t))}}function D(e){E?A?A.push(e):A=[e]:E=e}function L(){if(E){var e=E,t=A;if(A=E=null,B(e),t)for(e=0;e<t.length;e++)B(t[e])}}function C(e,t){return e(t)}function F(e,t,n,r,i){return e(t,n,r,i)}function M(){}var N=C,U=!1,P=!1;function R(){null===E&&null===A||(M(),L())}function z(e,t,n){if(P)return e(t,n);P=!0;try{return N(e,t,n)}finally{P=!1,R()}}var V=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,W=Object.prototype.hasOwnProperty,H={},Y={};function $(e,t,n,r,i,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=a}var K={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){K[e]=new $(e,0,!1,e,null,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];K[t]=new $(t,1,!1,e[1],null,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){K[e]=new $(e,2,!1,e.toLowerCase(),null,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){K[e]=new $(e,2,!1,e,null,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){K[e]=new $(e,3,!1,e.toLowerCase(),null,!1)})),["checked","multiple","muted","selected"].forEach((function(e){K[e]=new $(e,3,!0,e,null,!1)})),["capture","download"].forEach((function(e){K[e]=new $(e,4,!1,e,null,!1)})),["cols","rows","size","span"].forEach((function(e){K[e]=new $(e,6,!1,e,null,!1)})),["rowSpan","start"].forEach((function(e){K[e]=new $(e,5,!1,e.toLowerCase(),null,!1)}));var Q=/[\-:]([a-z])/g;function q(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(Q,q);K[t]=new $(t,1,!1,e,null,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(Q,q);K[t]=new $(t,1,!1,e,"http://www.w3.org/1999/xlink",!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(Q,q);K[t]=new $(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1)})),["tabIndex","crossOrigin"].forEach((function(e){K[e]=new $(e,1,!1,e.toLowerCase(),null,!1)})),K.xlinkHref=new $("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0),["src","href","action","formAction"].forEach((function(e){K[e]=new $(e,1,!1,e.toLowerCase(),null,!0)}));var G=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED;function J(e,t,n,r){var i=K.hasOwnProperty(t)?K[t]:null;(null!==i?0===i.type:!r&&(2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1])))||(function(e,t,n,r){if(null===t||"undefined"===typeof t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,i,r)&&(n=null),r||null===i?function(e){return!!W.call(Y,e)||!W.call(H,e)&&(V.test(e)?Y[e]=!0:(H[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):i.mustUseProperty?e[i.propertyName]=null===n?3!==i.type&&"":n:(t=i.attributeName,r=i.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}G.hasOwnProperty("ReactCurrentDispatcher")||(G.ReactCurrentDispatcher={current:null}),G.hasOwnProperty("ReactCurrentBatchConfig")||(G.ReactCurrentBatchConfig={suspense:null});var Z=/^(.*)[\\\/]/,X="function"===typeof Symbol&&Symbol.for,ee=X?Symbol.for("react.element"):60103,te=X?Symbol.for("react.portal"):60106,ne=X?Symbol.for("react.fragment"):60107,re=X?Symbol.for("react.strict_mode"):60108,ie=X?Symbol.for("react.profiler"):60114,ae=X?Symbol.for("react.provider"):60109,oe=X?Symbol.for("react.context"):60110,ue=X?Symbol.for("react.concurrent_mode"):60111,se=X?Symbol.for("react.forward_ref"):60112,ce=X?Symbol.for("react.suspense"):60113,le=X?Symbol.for("react.suspense_list"):60120,fe=X?Symbol.for("react.memo"):60115,he=X?Symbol.for("react.lazy"):60116,de=X?Symbol.for("react.block"):60121,pe="function"===typeof Symbol&&Symbol.iterator;function ye(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=pe&&e[pe]||e["@@iterator"])?e:null}function ve(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case ne:return"Fragment";case te:return"Portal";case ie:return"Profiler";case re:return"StrictMode";case ce:return"Suspense";case le:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case oe:return"Context.Consumer";case ae:return"Context.Provider";case se:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case fe:return ve(e.type);case de:return ve(e.render);case he:if(e=1===e._status?e._result:null)return ve(e)}return null}function be(e){var t="";do{e:switch(e.tag){case 3:case 4:case 6:case 7:case 10:case 9:var n="";break e;default:var r=e._debugOwner,i=e._debugSource,a=ve(e.type);n=null,r&&(n=ve(r.type)),r=a,a="",i?a=" (at "+i.fileName.replace(Z,"")+":"+i.lineNumber+")":n&&(a=" (created by "+n+")"),n="\n    in "+(r||"Unknown")+a}t+=n,e=e.return}while(e);return t}function me(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function ge(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function ke(e){e._valueTracker||(e._valueTracker=function(e){var t=ge(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var i=n.get,a=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function we(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=ge(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function _e(e,t){var n=t.checked;return i({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function Oe(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=me(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function xe(e,t){null!=(t=t.checked)&&J(e,"checked",t,!1)}function je(e,t){xe(e,t);var n=me(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?Te(e,t.type,n):t.hasOwnProperty("defaultValue")&&Te(e,t.type,me(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Se(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function Te(e,t,n){"number"===t&&e.ownerDocument.activeElement===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function Ie(e,t){return e=i({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function Ee(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+me(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function Ae(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(o(91));return i({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Be(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(o(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(o(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:me(n)}}function De(e,t){var n=me(t.value),r=me(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function Le(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}var Ce="http://www.w3.org/1999/xhtml",Fe="http://www.w3.org/2000/svg";function Me(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Ne(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?Me(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var Ue,Pe=function(e){return"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(t,n,r,i){MSApp.execUnsafeLocalFunction((function(){return e(t,n)}))}:e}((function(e,t){if(e.namespaceURI!==Fe||"innerHTML"in e)e.innerHTML=t;else{for((Ue=Ue||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Ue.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}}));function Re(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}function ze(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Ve={animationend:ze("Animation","AnimationEnd"),animationiteration:ze("Animation","AnimationIteration"),animationstart:ze("Animation","AnimationStart"),transitionend:ze("Transition","TransitionEnd")},We={},He={};function Ye(e){if(We[e])return We[e];if(!Ve[e])return e;var t,n=Ve[e];for(t in n)if(n.hasOwnProperty(t)&&t in He)return We[e]=n[t];return e}T&&(He=document.createElement("div").style,"AnimationEvent"in window||(delete Ve.animationend.animation,delete Ve.animationiteration.animation,delete Ve.animationstart.animation),"TransitionEvent"in window||delete Ve.transitionend.transition);var $e=Ye("animationend"),Ke=Ye("animationiteration"),Qe=Ye("animationstart"),qe=Ye("transitionend"),Ge="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Je=new("function"===typeof WeakMap?WeakMap:Map);function Ze(e){var t=Je.get(e);return void 0===t&&(t=new Map,Je.set(e,t)),t}function Xe(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(1026&(t=e).effectTag)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function et(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function tt(e){if(Xe(e)!==e)throw Error(o(188))}function nt(e){if(!(e=function(e){var t=e.alternate;if(!t){if(null===(t=Xe(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var a=i.alternate;if(null===a){if(null!==(r=i.return)){n=r;continue}break}if(i.child===a.child){for(a=i.child;a;){if(a===n)return tt(i),e;if(a===r)return tt(i),t;a=a.sibling}throw Error(o(188))}if(n.return!==r.return)n=i,r=a;else{for(var u=!1,s=i.child;s;){if(s===n){u=!0,n=i,r=a;break}if(s===r){u=!0,r=i,n=a;break}s=s.sibling}if(!u){for(s=a.child;s;){if(s===n){u=!0,n=a,r=i;break}if(s===r){u=!0,r=a,n=i;break}s=s.sibling}if(!u)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(e)))return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function rt(e,t){if(null==t)throw Error(o(30));return null==e?t:Array.isArray(e)?Array.isArray(t)?(e.push.apply(e,t),e):(e.push(t),e):Array.isArray(t)?[e].concat(t):[e,t]}function it(e,t,n){Array.isArray(e)?e.forEach(t,n):e&&t.call(n,e)}var at=null;function ot(e){if(e){var t=e._dispatchListeners,n=e._dispatchInstances;if(Array.isArray(t))for(var r=0;r<t.length&&!e.isPropagationStopped();r++)b(e,t[r],n[r]);else t&&b(e,t,n);e._dispatchListeners=null,e._dispatchInstances=null,e.isPersistent()||e.constructor.release(e)}}function ut(e){if(null!==e&&(at=rt(at,e)),e=at,at=null,e){if(it(e,ot),at)throw Error(o(95));if(l)throw e=f,l=!1,f=null,e}}function st(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}function ct(e){if(!T)return!1;var t=(e="on"+e)in document;return t||((t=document.createElement("div")).setAttribute(e,"return;"),t="function"===typeof t[e]),t}var lt=[];function ft(e){e.topLevelType=null,e.nativeEvent=null,e.targetInst=null,e.ancestors.length=0,10>lt.length&&lt.push(e)}function ht(e,t,n,r){if(lt.length){var i=lt.pop();return i.topLevelType=e,i.eventSystemFlags=r,i.nativeEvent=t,i.targetInst=n,i}return{topLevelType:e,eventSystemFlags:r,nativeEvent:t,targetInst:n,ancestors:[]}}function dt(e){var t=e.targetInst,n=t;do{if(!n){e.ancestors.push(n);break}var r=n;if(3===r.tag)r=r.stateNode.containerInfo;else{for(;r.return;)r=r.return;r=3!==r.tag?null:r.stateNode.containerInfo}if(!r)break;5!==(t=n.tag)&&6!==t||e.ancestors.push(n),n=Tn(r)}while(n);for(n=0;n<e.ancestors.length;n++){t=e.ancestors[n];var i=st(e.nativeEvent);r=e.topLevelType;var a=e.nativeEvent,o=e.eventSystemFlags;0===n&&(o|=64);for(var u=null,s=0;s<_.length;s++){var c=_[s];c&&(c=c.extractEvents(r,t,a,i,o))&&(u=rt(u,c))}ut(u)}}function pt(e,t,n){if(!n.has(e)){switch(e){case"scroll":Qt(t,"scroll",!0);break;case"focus":case"blur":Qt(t,"focus",!0),Qt(t,"blur",!0),n.set("blur",null),n.set("focus",null);break;case"cancel":case"close":ct(e)&&Qt(t,e,!0);break;case"invalid":case"submit":case"reset":break;default:-1===Ge.indexOf(e)&&Kt(e,t)}n.set(e,null)}}var yt,vt,bt,mt=!1,gt=[],kt=null,wt=null,_t=null,Ot=new Map,xt=new Map,jt=[],St="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput close cancel copy cut paste click change contextmenu reset submit".split(" "),Tt="focus blur dragenter dragleave mouseover mouseout pointerover pointerout gotpointercapture lostpointercapture".split(" ");function It(e,t,n,r,i){return{blockedOn:e,topLevelType:t,eventSystemFlags:32|n,nativeEvent:i,container:r}}function Et(e,t){switch(e){case"focus":case"blur":kt=null;break;case"dragenter":case"dragleave":wt=null;break;case"mouseover":case"mouseout":_t=null;break;case"pointerover":case"pointerout":Ot.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":xt.delete(t.pointerId)}}function At(e,t,n,r,i,a){return null===e||e.nativeEvent!==a?(e=It(t,n,r,i,a),null!==t&&(null!==(t=In(t))&&vt(t)),e):(e.eventSystemFlags|=r,e)}function Bt(e){var t=Tn(e.target);if(null!==t){var n=Xe(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=et(n)))return e.blockedOn=t,void a.unstable_runWithPriority(e.priority,(function(){bt(n)}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Dt(e){if(null!==e.blockedOn)return!1;var t=Zt(e.topLevelType,e.eventSystemFlags,e.container,e.nativeEvent);if(null!==t){var n=In(t);return null!==n&&vt(n),e.blockedOn=t,!1}return!0}function Lt(e,t,n){Dt(e)&&n.delete(t)}function Ct(){for(mt=!1;0<gt.length;){var e=gt[0];if(null!==e.blockedOn){null!==(e=In(e.blockedOn))&&yt(e);break}var t=Zt(e.topLevelType,e.eventSystemFlags,e.container,e.nativeEvent);null!==t?e.blockedOn=t:gt.shift()}null!==kt&&Dt(kt)&&(kt=null),null!==wt&&Dt(wt)&&(wt=null),null!==_t&&Dt(_t)&&(_t=null),Ot.forEach(Lt),xt.forEach(Lt)}function Ft(e,t){e.blockedOn===t&&(e.blockedOn=null,mt||(mt=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,Ct)))}function Mt(e){function t(t){return Ft(t,e)}if(0<gt.length){Ft(gt[0],e);for(var n=1;n<gt.length;n++){var r=gt[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==kt&&Ft(kt,e),null!==wt&&Ft(wt,e),null!==_t&&Ft(_t,e),Ot.forEach(t),xt.forEach(t),n=0;n<jt.length;n++)(r=jt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<jt.length&&null===(n=jt[0]).blockedOn;)Bt(n),null===n.blockedOn&&jt.shift()}var Nt={},Ut=new Map,Pt=new Map,Rt=["abort","abort",$e,"animationEnd",Ke,"animationIteration",Qe,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",qe,"transitionEnd","waiting","waiting"];function zt(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],i=e[n+1],a="on"+(i[0].toUpperCase()+i.slice(1));a={phasedRegistrationNames:{bubbled:a,captured:a+"Capture"},dependencies:[r],eventPriority:t},Pt.set(r,t),Ut.set(r,a),Nt[i]=a}}zt("blur blur cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focus focus input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),zt("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),zt(Rt,2);for(var Vt="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Wt=0;Wt<Vt.length;Wt++)Pt.set(Vt[Wt],0);var Ht=a.unstable_UserBlockingPriority,Yt=a.unstable_runWithPriority,$t=!0;function Kt(e,t){Qt(t,e,!1)}function Qt(e,t,n){var r=Pt.get(t);switch(void 0===r?2:r){case 0:r=qt.bind(null,t,1,e);break;case 1:r=Gt.bind(null,t,1,e);break;default:r=Jt.bind(null,t,1,e)}n?e.addEventListener(t,r,!0):e.addEventListener(t,r,!1)}function qt(e,t,n,r){U||M();var i=Jt,a=U;U=!0;try{F(i,e,t,n,r)}finally{(U=a)||R()}}function Gt(e,t,n,r){Yt(Ht,Jt.bind(null,e,t,n,r))}function Jt(e,t,n,r){if($t)if(0<gt.length&&-1<St.indexOf(e))e=It(null,e,t,n,r),gt.push(e);else{var i=Zt(e,t,n,r);if(null===i)Et(e,r);else if(-1<St.indexOf(e))e=It(i,e,t,n,r),gt.push(e);else if(!function(e,t,n,r,i){switch(t){case"focus":return kt=At(kt,e,t,n,r,i),!0;case"dragenter":return wt=At(wt,e,t,n,r,i),!0;case"mouseover":return _t=At(_t,e,t,n,r,i),!0;case"pointerover":var a=i.pointerId;return Ot.set(a,At(Ot.get(a)||null,e,t,n,r,i)),!0;case"gotpointercapture":return a=i.pointerId,xt.set(a,At(xt.get(a)||null,e,t,n,r,i)),!0}return!1}(i,e,t,n,r)){Et(e,r),e=ht(e,r,null,t);try{z(dt,e)}finally{ft(e)}}}}function Zt(e,t,n,r){if(null!==(n=Tn(n=st(r)))){var i=Xe(n);if(null===i)n=null;else{var a=i.tag;if(13===a){if(null!==(n=et(i)))return n;n=null}else if(3===a){if(i.stateNode.hydrate)return 3===i.tag?i.stateNode.containerInfo:null;n=null}else i!==n&&(n=null)}}e=ht(e,r,n,t);try{z(dt,e)}finally{ft(e)}return null}var Xt={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},en=["Webkit","ms","Moz","O"];function tn(e,t,n){return null==t||"boolean"===typeof t||""===t?"":n||"number"!==typeof t||0===t||Xt.hasOwnProperty(e)&&Xt[e]?(""+t).trim():t+"px"}function nn(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=tn(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}Object.keys(Xt).forEach((function(e){en.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Xt[t]=Xt[e]}))}));var rn=i({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function an(e,t){if(t){if(rn[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(o(137,e,""));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(o(60));if("object"!==typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=t.style&&"object"!==typeof t.style)throw Error(o(62,""))}}function on(e,t){if(-1===e.indexOf("-"))return"string"===typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var un=Ce;function sn(e,t){var n=Ze(e=9===e.nodeType||11===e.nodeType?e:e.ownerDocument);t=j[t];for(var r=0;r<t.length;r++)pt(t[r],e,n)}function cn(){}function ln(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function fn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function hn(e,t){var n,r=fn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=fn(r)}}function dn(){for(var e=window,t=ln();t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=ln((e=t.contentWindow).document)}return t}function pn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var yn=null,vn=null;function bn(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function mn(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var gn="function"===typeof setTimeout?setTimeout:void 0,kn="function"===typeof clearTimeout?clearTimeout:void 0;function wn(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function _n(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var On=Math.random().toString(36).slice(2),xn="__reactInternalInstance$"+On,jn="__reactEventHandlers$"+On,Sn="__reactContainere$"+On;function Tn(e){var t=e[xn];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Sn]||n[xn]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=_n(e);null!==e;){if(n=e[xn])return n;e=_n(e)}return t}n=(e=n).parentNode}return null}function In(e){return!(e=e[xn]||e[Sn])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function En(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(o(33))}function An(e){return e[jn]||null}function Bn(e){do{e=e.return}while(e&&5!==e.tag);return e||null}function Dn(e,t){var n=e.stateNode;if(!n)return null;var r=p(n);if(!r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}function Ln(e,t,n){(t=Dn(e,n.dispatchConfig.phasedRegistrationNames[t]))&&(n._dispatchListeners=rt(n._dispatchListeners,t),n._dispatchInstances=rt(n._dispatchInstances,e))}function Cn(e){if(e&&e.dispatchConfig.phasedRegistrationNames){for(var t=e._targetInst,n=[];t;)n.push(t),t=Bn(t);for(t=n.length;0<t--;)Ln(n[t],"captured",e);for(t=0;t<n.length;t++)Ln(n[t],"bubbled",e)}}function Fn(e,t,n){e&&n&&n.dispatchConfig.registrationName&&(t=Dn(e,n.dispatchConfig.registrationName))&&(n._dispatchListeners=rt(n._dispatchListeners,t),n._dispatchInstances=rt(n._dispatchInstances,e))}function Mn(e){e&&e.dispatchConfig.registrationName&&Fn(e._targetInst,null,e)}function Nn(e){it(e,Cn)}var Un=null,Pn=null,Rn=null;function zn(){if(Rn)return Rn;var e,t,n=Pn,r=n.length,i="value"in Un?Un.value:Un.textContent,a=i.length;for(e=0;e<r&&n[e]===i[e];e++);var o=r-e;for(t=1;t<=o&&n[r-t]===i[a-t];t++);return Rn=i.slice(e,1<t?1-t:void 0)}function Vn(){return!0}function Wn(){return!1}function Hn(e,t,n,r){for(var i in this.dispatchConfig=e,this._targetInst=t,this.nativeEvent=n,e=this.constructor.Interface)e.hasOwnProperty(i)&&((t=e[i])?this[i]=t(n):"target"===i?this.target=r:this[i]=n[i]);return this.isDefaultPrevented=(null!=n.defaultPrevented?n.defaultPrevented:!1===n.returnValue)?Vn:Wn,this.isPropagationStopped=Wn,this}function Yn(e,t,n,r){if(this.eventPool.length){var i=this.eventPool.pop();return this.call(i,e,t,n,r),i}return new this(e,t,n,r)}function $n(e){if(!(e instanceof this))throw Error(o(279));e.destructor(),10>this.eventPool.length&&this.eventPool.push(e)}function Kn(e){e.eventPool=[],e.getPooled=Yn,e.release=$n}i(Hn.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=Vn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=Vn)},persist:function(){this.isPersistent=Vn},isPersistent:Wn,destructor:function(){var e,t=this.constructor.Interface;for(e in t)this[e]=null;this.nativeEvent=this._targetInst=this.dispatchConfig=null,this.isPropagationStopped=this.isDefaultPrevented=Wn,this._dispatchInstances=this._dispatchListeners=null}}),Hn.Interface={type:null,target:null,currentTarget:function(){return null},eventPhase:null,bubbles:null,cancelable:null,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:null,isTrusted:null},Hn.extend=function(e){function t(){}function n(){return r.apply(this,arguments)}var r=this;t.prototype=r.prototype;var a=new t;return i(a,n.prototype),n.prototype=a,n.prototype.constructor=n,n.Interface=i({},r.Interface,e),n.extend=r.extend,Kn(n),n},Kn(Hn);var Qn=Hn.extend({data:null}),qn=Hn.extend({data:null}),Gn=[9,13,27,32],Jn=T&&"CompositionEvent"in window,Zn=null;T&&"documentMode"in document&&(Zn=document.documentMode);var Xn=T&&"TextEvent"in window&&!Zn,er=T&&(!Jn||Zn&&8<Zn&&11>=Zn),tr=String.fromCharCode(32),nr={beforeInput:{phasedRegistrationNames:{bubbled:"onBeforeInput",captured:"onBeforeInputCapture"},dependencies:["compositionend","keypress","textInput","paste"]},compositionEnd:{phasedRegistrationNames:{bubbled:"onCompositionEnd",captured:"onCompositionEndCapture"},dependencies:"blur compositionend keydown keypress keyup mousedown".split(" ")},compositionStart:{phasedRegistrationNames:{bubbled:"onCompositionStart",captured:"onCompositionStartCapture"},dependencies:"blur compositionstart keydown keypress keyup mousedown".split(" ")},compositionUpdate:{phasedRegistrationNames:{bubbled:"onCompositionUpdate",captured:"onCompositionUpdateCapture"},dependencies:"blur compositionupdate keydown keypress keyup mousedown".split(" ")}},rr=!1;function ir(e,t){switch(e){case"keyup":return-1!==Gn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"blur":return!0;default:return!1}}function ar(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var or=!1;var ur={eventTypes:nr,extractEvents:function(e,t,n,r){var i;if(Jn)e:{switch(e){case"compositionstart":var a=nr.compositionStart;break e;case"compositionend":a=nr.compositionEnd;break e;case"compositionupdate":a=nr.compositionUpdate;break e}a=void 0}else or?ir(e,n)&&(a=nr.compositionEnd):"keydown"===e&&229===n.keyCode&&(a=nr.compositionStart);return a?(er&&"ko"!==n.locale&&(or||a!==nr.compositionStart?a===nr.compositionEnd&&or&&(i=zn()):(Pn="value"in(Un=r)?Un.value:Un.textContent,or=!0)),a=Qn.getPooled(a,t,n,r),i?a.data=i:null!==(i=ar(n))&&(a.data=i),Nn(a),i=a):i=null,(e=Xn?function(e,t){switch(e){case"compositionend":return ar(t);case"keypress":return 32!==t.which?null:(rr=!0,tr);case"textInput":return(e=t.data)===tr&&rr?null:e;default:return null}}(e,n):function(e,t){if(or)return"compositionend"===e||!Jn&&ir(e,t)?(e=zn(),Rn=Pn=Un=null,or=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return er&&"ko"!==t.locale?null:t.data;default:return null}}(e,n))?((t=qn.getPooled(nr.beforeInput,t,n,r)).data=e,Nn(t)):t=null,null===i?t:null===t?i:[i,t]}},sr={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function cr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!sr[e.type]:"textarea"===t}var lr={change:{phasedRegistrationNames:{bubbled:"onChange",captured:"onChangeCapture"},dependencies:"blur change click focus input keydown keyup selectionchange".split(" ")}};function fr(e,t,n){return(e=Hn.getPooled(lr.change,e,t,n)).type="change",D(n),Nn(e),e}var hr=null,dr=null;function pr(e){ut(e)}function yr(e){if(we(En(e)))return e}function vr(e,t){if("change"===e)return t}var br=!1;function mr(){hr&&(hr.detachEvent("onpropertychange",gr),dr=hr=null)}function gr(e){if("value"===e.propertyName&&yr(dr))if(e=fr(dr,e,st(e)),U)ut(e);else{U=!0;try{C(pr,e)}finally{U=!1,R()}}}function kr(e,t,n){"focus"===e?(mr(),dr=n,(hr=t).attachEvent("onpropertychange",gr)):"blur"===e&&mr()}function wr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return yr(dr)}function _r(e,t){if("click"===e)return yr(t)}function Or(e,t){if("input"===e||"change"===e)return yr(t)}T&&(br=ct("input")&&(!document.documentMode||9<document.documentMode));var xr={eventTypes:lr,_isInputEventSupported:br,extractEvents:function(e,t,n,r){var i=t?En(t):window,a=i.nodeName&&i.nodeName.toLowerCase();if("select"===a||"input"===a&&"file"===i.type)var o=vr;else if(cr(i))if(br)o=Or;else{o=wr;var u=kr}else(a=i.nodeName)&&"input"===a.toLowerCase()&&("checkbox"===i.type||"radio"===i.type)&&(o=_r);if(o&&(o=o(e,t)))return fr(o,n,r);u&&u(e,i,t),"blur"===e&&(e=i._wrapperState)&&e.controlled&&"number"===i.type&&Te(i,"number",i.value)}},jr=Hn.extend({view:null,detail:null}),Sr={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Tr(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=Sr[e])&&!!t[e]}function Ir(){return Tr}var Er=0,Ar=0,Br=!1,Dr=!1,Lr=jr.extend({screenX:null,screenY:null,clientX:null,clientY:null,pageX:null,pageY:null,ctrlKey:null,shiftKey:null,altKey:null,metaKey:null,getModifierState:Ir,button:null,buttons:null,relatedTarget:function(e){return e.relatedTarget||(e.fromElement===e.srcElement?e.toElement:e.fromElement)},movementX:function(e){if("movementX"in e)return e.movementX;var t=Er;return Er=e.screenX,Br?"mousemove"===e.type?e.screenX-t:0:(Br=!0,0)},movementY:function(e){if("movementY"in e)return e.movementY;var t=Ar;return Ar=e.screenY,Dr?"mousemove"===e.type?e.screenY-t:0:(Dr=!0,0)}}),Cr=Lr.extend({pointerId:null,width:null,height:null,pressure:null,tangentialPressure:null,tiltX:null,tiltY:null,twist:null,pointerType:null,isPrimary:null}),Fr={mouseEnter:{registrationName:"onMouseEnter",dependencies:["mouseout","mouseover"]},mouseLeave:{registrationName:"onMouseLeave",dependencies:["mouseout","mouseover"]},pointerEnter:{registrationName:"onPointerEnter",dependencies:["pointerout","pointerover"]},pointerLeave:{registrationName:"onPointerLeave",dependencies:["pointerout","pointerover"]}},Mr={eventTypes:Fr,extractEvents:function(e,t,n,r,i){var a="mouseover"===e||"pointerover"===e,o="mouseout"===e||"pointerout"===e;if(a&&0===(32&i)&&(n.relatedTarget||n.fromElement)||!o&&!a)return null;(a=r.window===r?r:(a=r.ownerDocument)?a.defaultView||a.parentWindow:window,o)?(o=t,null!==(t=(t=n.relatedTarget||n.toElement)?Tn(t):null)&&(t!==Xe(t)||5!==t.tag&&6!==t.tag)&&(t=null)):o=null;if(o===t)return null;if("mouseout"===e||"mouseover"===e)var u=Lr,s=Fr.mouseLeave,c=Fr.mouseEnter,l="mouse";else"pointerout"!==e&&"pointerover"!==e||(u=Cr,s=Fr.pointerLeave,c=Fr.pointerEnter,l="pointer");if(e=null==o?a:En(o),a=null==t?a:En(t),(s=u.getPooled(s,o,n,r)).type=l+"leave",s.target=e,s.relatedTarget=a,(n=u.getPooled(c,t,n,r)).type=l+"enter",n.target=a,n.relatedTarget=e,l=t,(r=o)&&l)e:{for(c=l,o=0,e=u=r;e;e=Bn(e))o++;for(e=0,t=c;t;t=Bn(t))e++;for(;0<o-e;)u=Bn(u),o--;for(;0<e-o;)c=Bn(c),e--;for(;o--;){if(u===c||u===c.alternate)break e;u=Bn(u),c=Bn(c)}u=null}else u=null;for(c=u,u=[];r&&r!==c&&(null===(o=r.alternate)||o!==c);)u.push(r),r=Bn(r);for(r=[];l&&l!==c&&(null===(o=l.alternate)||o!==c);)r.push(l),l=Bn(l);for(l=0;l<u.length;l++)Fn(u[l],"bubbled",s);for(l=r.length;0<l--;)Fn(r[l],"captured",n);return 0===(64&i)?[s]:[s,n]}};var Nr="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t},Ur=Object.prototype.hasOwnProperty;function Pr(e,t){if(Nr(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!Ur.call(t,n[r])||!Nr(e[n[r]],t[n[r]]))return!1;return!0}var Rr=T&&"documentMode"in document&&11>=document.documentMode,zr={select:{phasedRegistrationNames:{bubbled:"onSelect",captured:"onSelectCapture"},dependencies:"blur contextmenu dragend focus keydown keyup mousedown mouseup selectionchange".split(" ")}},Vr=null,Wr=null,Hr=null,Yr=!1;function $r(e,t){var n=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;return Yr||null==Vr||Vr!==ln(n)?null:("selectionStart"in(n=Vr)&&pn(n)?n={start:n.selectionStart,end:n.selectionEnd}:n={anchorNode:(n=(n.ownerDocument&&n.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:n.anchorOffset,focusNode:n.focusNode,focusOffset:n.focusOffset},Hr&&Pr(Hr,n)?null:(Hr=n,(e=Hn.getPooled(zr.select,Wr,e,t)).type="select",e.target=Vr,Nn(e),e))}var Kr={eventTypes:zr,extractEvents:function(e,t,n,r,i,a){if(!(a=!(i=a||(r.window===r?r.document:9===r.nodeType?r:r.ownerDocument)))){e:{i=Ze(i),a=j.onSelect;for(var o=0;o<a.length;o++)if(!i.has(a[o])){i=!1;break e}i=!0}a=!i}if(a)return null;switch(i=t?En(t):window,e){case"focus":(cr(i)||"true"===i.contentEditable)&&(Vr=i,Wr=t,Hr=null);break;case"blur":Hr=Wr=Vr=null;break;case"mousedown":Yr=!0;break;case"contextmenu":case"mouseup":case"dragend":return Yr=!1,$r(n,r);case"selectionchange":if(Rr)break;case"keydown":case"keyup":return $r(n,r)}return null}},Qr=Hn.extend({animationName:null,elapsedTime:null,pseudoElement:null}),qr=Hn.extend({clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Gr=jr.extend({relatedTarget:null});function Jr(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}var Zr={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Xr={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},ei=jr.extend({key:function(e){if(e.key){var t=Zr[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=Jr(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Xr[e.keyCode]||"Unidentified":""},location:null,ctrlKey:null,shiftKey:null,altKey:null,metaKey:null,repeat:null,locale:null,getModifierState:Ir,charCode:function(e){return"keypress"===e.type?Jr(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?Jr(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),ti=Lr.extend({dataTransfer:null}),ni=jr.extend({touches:null,targetTouches:null,changedTouches:null,altKey:null,metaKey:null,ctrlKey:null,shiftKey:null,getModifierState:Ir}),ri=Hn.extend({propertyName:null,elapsedTime:null,pseudoElement:null}),ii=Lr.extend({deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:null,deltaMode:null}),ai={eventTypes:Nt,extractEvents:function(e,t,n,r){var i=Ut.get(e);if(!i)return null;switch(e){case"keypress":if(0===Jr(n))return null;case"keydown":case"keyup":e=ei;break;case"blur":case"focus":e=Gr;break;case"click":if(2===n.button)return null;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":e=Lr;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":e=ti;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":e=ni;break;case $e:case Ke:case Qe:e=Qr;break;case qe:e=ri;break;case"scroll":e=jr;break;case"wheel":e=ii;break;case"copy":case"cut":case"paste":e=qr;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":e=Cr;break;default:e=Hn}return Nn(t=e.getPooled(i,t,n,r)),t}};if(m)throw Error(o(101));m=Array.prototype.slice.call("ResponderEventPlugin SimpleEventPlugin EnterLeaveEventPlugin ChangeEventPlugin SelectEventPlugin BeforeInputEventPlugin".split(" ")),k(),p=An,y=In,v=En,S({SimpleEventPlugin:ai,EnterLeaveEventPlugin:Mr,ChangeEventPlugin:xr,SelectEventPlugin:Kr,BeforeInputEventPlugin:ur});var oi=[],ui=-1;function si(e){0>ui||(e.current=oi[ui],oi[ui]=null,ui--)}function ci(e,t){ui++,oi[ui]=e.current,e.current=t}var li={},fi={current:li},hi={current:!1},di=li;function pi(e,t){var n=e.type.contextTypes;if(!n)return li;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i,a={};for(i in n)a[i]=t[i];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=a),a}function yi(e){return null!==(e=e.childContextTypes)&&void 0!==e}function vi(){si(hi),si(fi)}function bi(e,t,n){if(fi.current!==li)throw Error(o(168));ci(fi,t),ci(hi,n)}function mi(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var a in r=r.getChildContext())if(!(a in e))throw Error(o(108,ve(t)||"Unknown",a));return i({},n,{},r)}function gi(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||li,di=fi.current,ci(fi,e),ci(hi,hi.current),!0}function ki(e,t,n){var r=e.stateNode;if(!r)throw Error(o(169));n?(e=mi(e,t,di),r.__reactInternalMemoizedMergedChildContext=e,si(hi),si(fi),ci(fi,e)):si(hi),ci(hi,n)}var wi=a.unstable_runWithPriority,_i=a.unstable_scheduleCallback,Oi=a.unstable_cancelCallback,xi=a.unstable_requestPaint,ji=a.unstable_now,Si=a.unstable_getCurrentPriorityLevel,Ti=a.unstable_ImmediatePriority,Ii=a.unstable_UserBlockingPriority,Ei=a.unstable_NormalPriority,Ai=a.unstable_LowPriority,Bi=a.unstable_IdlePriority,Di={},Li=a.unstable_shouldYield,Ci=void 0!==xi?xi:function(){},Fi=null,Mi=null,Ni=!1,Ui=ji(),Pi=1e4>Ui?ji:function(){return ji()-Ui};function Ri(){switch(Si()){case Ti:return 99;case Ii:return 98;case Ei:return 97;case Ai:return 96;case Bi:return 95;default:throw Error(o(332))}}function zi(e){switch(e){case 99:return Ti;case 98:return Ii;case 97:return Ei;case 96:return Ai;case 95:return Bi;default:throw Error(o(332))}}function Vi(e,t){return e=zi(e),wi(e,t)}function Wi(e,t,n){return e=zi(e),_i(e,t,n)}function Hi(e){return null===Fi?(Fi=[e],Mi=_i(Ti,$i)):Fi.push(e),Di}function Yi(){if(null!==Mi){var e=Mi;Mi=null,Oi(e)}$i()}function $i(){if(!Ni&&null!==Fi){Ni=!0;var e=0;try{var t=Fi;Vi(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),Fi=null}catch(n){throw null!==Fi&&(Fi=Fi.slice(e+1)),_i(Ti,Yi),n}finally{Ni=!1}}}function Ki(e,t,n){return 1073741821-(1+((1073741821-e+t/10)/(n/=10)|0))*n}function Qi(e,t){if(e&&e.defaultProps)for(var n in t=i({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}var qi={current:null},Gi=null,Ji=null,Zi=null;function Xi(){Zi=Ji=Gi=null}function ea(e){var t=qi.current;si(qi),e.type._context._currentValue=t}function ta(e,t){for(;null!==e;){var n=e.alternate;if(e.childExpirationTime<t)e.childExpirationTime=t,null!==n&&n.childExpirationTime<t&&(n.childExpirationTime=t);else{if(!(null!==n&&n.childExpirationTime<t))break;n.childExpirationTime=t}e=e.return}}function na(e,t){Gi=e,Zi=Ji=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(e.expirationTime>=t&&(Ao=!0),e.firstContext=null)}function ra(e,t){if(Zi!==e&&!1!==t&&0!==t)if("number"===typeof t&&1073741823!==t||(Zi=e,t=1073741823),t={context:e,observedBits:t,next:null},null===Ji){if(null===Gi)throw Error(o(308));Ji=t,Gi.dependencies={expirationTime:0,firstContext:t,responders:null}}else Ji=Ji.next=t;return e._currentValue}var ia=!1;function aa(e){e.updateQueue={baseState:e.memoizedState,baseQueue:null,shared:{pending:null},effects:null}}function oa(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,baseQueue:e.baseQueue,shared:e.shared,effects:e.effects})}function ua(e,t){return(e={expirationTime:e,suspenseConfig:t,tag:0,payload:null,callback:null,next:null}).next=e}function sa(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function ca(e,t){var n=e.alternate;null!==n&&oa(n,e),null===(n=(e=e.updateQueue).baseQueue)?(e.baseQueue=t.next=t,t.next=t):(t.next=n.next,n.next=t)}function la(e,t,n,r){var a=e.updateQueue;ia=!1;var o=a.baseQueue,u=a.shared.pending;if(null!==u){if(null!==o){var s=o.next;o.next=u.next,u.next=s}o=u,a.shared.pending=null,null!==(s=e.alternate)&&(null!==(s=s.updateQueue)&&(s.baseQueue=u))}if(null!==o){s=o.next;var c=a.baseState,l=0,f=null,h=null,d=null;if(null!==s)for(var p=s;;){if((u=p.expirationTime)<r){var y={expirationTime:p.expirationTime,suspenseConfig:p.suspenseConfig,tag:p.tag,payload:p.payload,callback:p.callback,next:null};null===d?(h=d=y,f=c):d=d.next=y,u>l&&(l=u)}else{null!==d&&(d=d.next={expirationTime:1073741823,suspenseConfig:p.suspenseConfig,tag:p.tag,payload:p.payload,callback:p.callback,next:null}),as(u,p.suspenseConfig);e:{var v=e,b=p;switch(u=t,y=n,b.tag){case 1:if("function"===typeof(v=b.payload)){c=v.call(y,c,u);break e}c=v;break e;case 3:v.effectTag=-4097&v.effectTag|64;case 0:if(null===(u="function"===typeof(v=b.payload)?v.call(y,c,u):v)||void 0===u)break e;c=i({},c,u);break e;case 2:ia=!0}}null!==p.callback&&(e.effectTag|=32,null===(u=a.effects)?a.effects=[p]:u.push(p))}if(null===(p=p.next)||p===s){if(null===(u=a.shared.pending))break;p=o.next=u.next,u.next=s,a.baseQueue=o=u,a.shared.pending=null}}null===d?f=c:d.next=h,a.baseState=f,a.baseQueue=d,os(l),e.expirationTime=l,e.memoizedState=c}}function fa(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(null!==i){if(r.callback=null,r=i,i=n,"function"!==typeof r)throw Error(o(191,r));r.call(i)}}}var ha=G.ReactCurrentBatchConfig,da=(new r.Component).refs;function pa(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:i({},t,n),e.memoizedState=n,0===e.expirationTime&&(e.updateQueue.baseState=n)}var ya={isMounted:function(e){return!!(e=e._reactInternalFiber)&&Xe(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternalFiber;var r=$u(),i=ha.suspense;(i=ua(r=Ku(r,e,i),i)).payload=t,void 0!==n&&null!==n&&(i.callback=n),sa(e,i),Qu(e,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternalFiber;var r=$u(),i=ha.suspense;(i=ua(r=Ku(r,e,i),i)).tag=1,i.payload=t,void 0!==n&&null!==n&&(i.callback=n),sa(e,i),Qu(e,r)},enqueueForceUpdate:function(e,t){e=e._reactInternalFiber;var n=$u(),r=ha.suspense;(r=ua(n=Ku(n,e,r),r)).tag=2,void 0!==t&&null!==t&&(r.callback=t),sa(e,r),Qu(e,n)}};function va(e,t,n,r,i,a,o){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,o):!t.prototype||!t.prototype.isPureReactComponent||(!Pr(n,r)||!Pr(i,a))}function ba(e,t,n){var r=!1,i=li,a=t.contextType;return"object"===typeof a&&null!==a?a=ra(a):(i=yi(t)?di:fi.current,a=(r=null!==(r=t.contextTypes)&&void 0!==r)?pi(e,i):li),t=new t(n,a),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ya,e.stateNode=t,t._reactInternalFiber=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=a),t}function ma(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ya.enqueueReplaceState(t,t.state,null)}function ga(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs=da,aa(e);var a=t.contextType;"object"===typeof a&&null!==a?i.context=ra(a):(a=yi(t)?di:fi.current,i.context=pi(e,a)),la(e,n,i,r),i.state=e.memoizedState,"function"===typeof(a=t.getDerivedStateFromProps)&&(pa(e,t,a,n),i.state=e.memoizedState),"function"===typeof t.getDerivedStateFromProps||"function"===typeof i.getSnapshotBeforeUpdate||"function"!==typeof i.UNSAFE_componentWillMount&&"function"!==typeof i.componentWillMount||(t=i.state,"function"===typeof i.componentWillMount&&i.componentWillMount(),"function"===typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),t!==i.state&&ya.enqueueReplaceState(i,i.state,null),la(e,n,i,r),i.state=e.memoizedState),"function"===typeof i.componentDidMount&&(e.effectTag|=4)}var ka=Array.isArray;function wa(e,t,n){if(null!==(e=n.ref)&&"function"!==typeof e&&"object"!==typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,e));var i=""+e;return null!==t&&null!==t.ref&&"function"===typeof t.ref&&t.ref._stringRef===i?t.ref:((t=function(e){var t=r.refs;t===da&&(t=r.refs={}),null===e?delete t[i]:t[i]=e})._stringRef=i,t)}if("string"!==typeof e)throw Error(o(284));if(!n._owner)throw Error(o(290,e))}return e}function _a(e,t){if("textarea"!==e.type)throw Error(o(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t,""))}function Oa(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.effectTag=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function i(e,t){return(e=Ss(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.effectTag=2,n):r:(t.effectTag=2,n):n}function u(t){return e&&null===t.alternate&&(t.effectTag=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Es(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function c(e,t,n,r){return null!==t&&t.elementType===n.type?((r=i(t,n.props)).ref=wa(e,t,n),r.return=e,r):((r=Ts(n.type,n.key,n.props,null,e.mode,r)).ref=wa(e,t,n),r.return=e,r)}function l(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=As(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function f(e,t,n,r,a){return null===t||7!==t.tag?((t=Is(n,e.mode,r,a)).return=e,t):((t=i(t,n)).return=e,t)}function h(e,t,n){if("string"===typeof t||"number"===typeof t)return(t=Es(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case ee:return(n=Ts(t.type,t.key,t.props,null,e.mode,n)).ref=wa(e,null,t),n.return=e,n;case te:return(t=As(t,e.mode,n)).return=e,t}if(ka(t)||ye(t))return(t=Is(t,e.mode,n,null)).return=e,t;_a(e,t)}return null}function d(e,t,n,r){var i=null!==t?t.key:null;if("string"===typeof n||"number"===typeof n)return null!==i?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case ee:return n.key===i?n.type===ne?f(e,t,n.props.children,r,i):c(e,t,n,r):null;case te:return n.key===i?l(e,t,n,r):null}if(ka(n)||ye(n))return null!==i?null:f(e,t,n,r,null);_a(e,n)}return null}function p(e,t,n,r,i){if("string"===typeof r||"number"===typeof r)return s(t,e=e.get(n)||null,""+r,i);if("object"===typeof r&&null!==r){switch(r.$$typeof){case ee:return e=e.get(null===r.key?n:r.key)||null,r.type===ne?f(t,e,r.props.children,i,r.key):c(t,e,r,i);case te:return l(t,e=e.get(null===r.key?n:r.key)||null,r,i)}if(ka(r)||ye(r))return f(t,e=e.get(n)||null,r,i,null);_a(t,r)}return null}function y(i,o,u,s){for(var c=null,l=null,f=o,y=o=0,v=null;null!==f&&y<u.length;y++){f.index>y?(v=f,f=null):v=f.sibling;var b=d(i,f,u[y],s);if(null===b){null===f&&(f=v);break}e&&f&&null===b.alternate&&t(i,f),o=a(b,o,y),null===l?c=b:l.sibling=b,l=b,f=v}if(y===u.length)return n(i,f),c;if(null===f){for(;y<u.length;y++)null!==(f=h(i,u[y],s))&&(o=a(f,o,y),null===l?c=f:l.sibling=f,l=f);return c}for(f=r(i,f);y<u.length;y++)null!==(v=p(f,i,y,u[y],s))&&(e&&null!==v.alternate&&f.delete(null===v.key?y:v.key),o=a(v,o,y),null===l?c=v:l.sibling=v,l=v);return e&&f.forEach((function(e){return t(i,e)})),c}function v(i,u,s,c){var l=ye(s);if("function"!==typeof l)throw Error(o(150));if(null==(s=l.call(s)))throw Error(o(151));for(var f=l=null,y=u,v=u=0,b=null,m=s.next();null!==y&&!m.done;v++,m=s.next()){y.index>v?(b=y,y=null):b=y.sibling;var g=d(i,y,m.value,c);if(null===g){null===y&&(y=b);break}e&&y&&null===g.alternate&&t(i,y),u=a(g,u,v),null===f?l=g:f.sibling=g,f=g,y=b}if(m.done)return n(i,y),l;if(null===y){for(;!m.done;v++,m=s.next())null!==(m=h(i,m.value,c))&&(u=a(m,u,v),null===f?l=m:f.sibling=m,f=m);return l}for(y=r(i,y);!m.done;v++,m=s.next())null!==(m=p(y,i,v,m.value,c))&&(e&&null!==m.alternate&&y.delete(null===m.key?v:m.key),u=a(m,u,v),null===f?l=m:f.sibling=m,f=m);return e&&y.forEach((function(e){return t(i,e)})),l}return function(e,r,a,s){var c="object"===typeof a&&null!==a&&a.type===ne&&null===a.key;c&&(a=a.props.children);var l="object"===typeof a&&null!==a;if(l)switch(a.$$typeof){case ee:e:{for(l=a.key,c=r;null!==c;){if(c.key===l){switch(c.tag){case 7:if(a.type===ne){n(e,c.sibling),(r=i(c,a.props.children)).return=e,e=r;break e}break;default:if(c.elementType===a.type){n(e,c.sibling),(r=i(c,a.props)).ref=wa(e,c,a),r.return=e,e=r;break e}}n(e,c);break}t(e,c),c=c.sibling}a.type===ne?((r=Is(a.props.children,e.mode,s,a.key)).return=e,e=r):((s=Ts(a.type,a.key,a.props,null,e.mode,s)).ref=wa(e,r,a),s.return=e,e=s)}return u(e);case te:e:{for(c=a.key;null!==r;){if(r.key===c){if(4===r.tag&&r.stateNode.containerInfo===a.containerInfo&&r.stateNode.implementation===a.implementation){n(e,r.sibling),(r=i(r,a.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=As(a,e.mode,s)).return=e,e=r}return u(e)}if("string"===typeof a||"number"===typeof a)return a=""+a,null!==r&&6===r.tag?(n(e,r.sibling),(r=i(r,a)).return=e,e=r):(n(e,r),(r=Es(a,e.mode,s)).return=e,e=r),u(e);if(ka(a))return y(e,r,a,s);if(ye(a))return v(e,r,a,s);if(l&&_a(e,a),"undefined"===typeof a&&!c)switch(e.tag){case 1:case 0:throw e=e.type,Error(o(152,e.displayName||e.name||"Component"))}return n(e,r)}}var xa=Oa(!0),ja=Oa(!1),Sa={},Ta={current:Sa},Ia={current:Sa},Ea={current:Sa};function Aa(e){if(e===Sa)throw Error(o(174));return e}function Ba(e,t){switch(ci(Ea,t),ci(Ia,e),ci(Ta,Sa),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:Ne(null,"");break;default:t=Ne(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}si(Ta),ci(Ta,t)}function Da(){si(Ta),si(Ia),si(Ea)}function La(e){Aa(Ea.current);var t=Aa(Ta.current),n=Ne(t,e.type);t!==n&&(ci(Ia,e),ci(Ta,n))}function Ca(e){Ia.current===e&&(si(Ta),si(Ia))}var Fa={current:0};function Ma(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(64&t.effectTag))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function Na(e,t){return{responder:e,props:t}}var Ua=G.ReactCurrentDispatcher,Pa=G.ReactCurrentBatchConfig,Ra=0,za=null,Va=null,Wa=null,Ha=!1;function Ya(){throw Error(o(321))}function $a(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Nr(e[n],t[n]))return!1;return!0}function Ka(e,t,n,r,i,a){if(Ra=a,za=t,t.memoizedState=null,t.updateQueue=null,t.expirationTime=0,Ua.current=null===e||null===e.memoizedState?bo:mo,e=n(r,i),t.expirationTime===Ra){a=0;do{if(t.expirationTime=0,!(25>a))throw Error(o(301));a+=1,Wa=Va=null,t.updateQueue=null,Ua.current=go,e=n(r,i)}while(t.expirationTime===Ra)}if(Ua.current=vo,t=null!==Va&&null!==Va.next,Ra=0,Wa=Va=za=null,Ha=!1,t)throw Error(o(300));return e}function Qa(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===Wa?za.memoizedState=Wa=e:Wa=Wa.next=e,Wa}function qa(){if(null===Va){var e=za.alternate;e=null!==e?e.memoizedState:null}else e=Va.next;var t=null===Wa?za.memoizedState:Wa.next;if(null!==t)Wa=t,Va=e;else{if(null===e)throw Error(o(310));e={memoizedState:(Va=e).memoizedState,baseState:Va.baseState,baseQueue:Va.baseQueue,queue:Va.queue,next:null},null===Wa?za.memoizedState=Wa=e:Wa=Wa.next=e}return Wa}function Ga(e,t){return"function"===typeof t?t(e):t}function Ja(e){var t=qa(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=Va,i=r.baseQueue,a=n.pending;if(null!==a){if(null!==i){var u=i.next;i.next=a.next,a.next=u}r.baseQueue=i=a,n.pending=null}if(null!==i){i=i.next,r=r.baseState;var s=u=a=null,c=i;do{var l=c.expirationTime;if(l<Ra){var f={expirationTime:c.expirationTime,suspenseConfig:c.suspenseConfig,action:c.action,eagerReducer:c.eagerReducer,eagerState:c.eagerState,next:null};null===s?(u=s=f,a=r):s=s.next=f,l>za.expirationTime&&(za.expirationTime=l,os(l))}else null!==s&&(s=s.next={expirationTime:1073741823,suspenseConfig:c.suspenseConfig,action:c.action,eagerReducer:c.eagerReducer,eagerState:c.eagerState,next:null}),as(l,c.suspenseConfig),r=c.eagerReducer===e?c.eagerState:e(r,c.action);c=c.next}while(null!==c&&c!==i);null===s?a=r:s.next=u,Nr(r,t.memoizedState)||(Ao=!0),t.memoizedState=r,t.baseState=a,t.baseQueue=s,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function Za(e){var t=qa(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,a=t.memoizedState;if(null!==i){n.pending=null;var u=i=i.next;do{a=e(a,u.action),u=u.next}while(u!==i);Nr(a,t.memoizedState)||(Ao=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function Xa(e){var t=Qa();return"function"===typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:Ga,lastRenderedState:e}).dispatch=yo.bind(null,za,e),[t.memoizedState,e]}function eo(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=za.updateQueue)?(t={lastEffect:null},za.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function to(){return qa().memoizedState}function no(e,t,n,r){var i=Qa();za.effectTag|=e,i.memoizedState=eo(1|t,n,void 0,void 0===r?null:r)}function ro(e,t,n,r){var i=qa();r=void 0===r?null:r;var a=void 0;if(null!==Va){var o=Va.memoizedState;if(a=o.destroy,null!==r&&$a(r,o.deps))return void eo(t,n,a,r)}za.effectTag|=e,i.memoizedState=eo(1|t,n,a,r)}function io(e,t){return no(516,4,e,t)}function ao(e,t){return ro(516,4,e,t)}function oo(e,t){return ro(4,2,e,t)}function uo(e,t){return"function"===typeof t?(e=e(),t(e),function(){t(null)}):null!==t&&void 0!==t?(e=e(),t.current=e,function(){t.current=null}):void 0}function so(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,ro(4,2,uo.bind(null,t,e),n)}function co(){}function lo(e,t){return Qa().memoizedState=[e,void 0===t?null:t],e}function fo(e,t){var n=qa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&$a(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function ho(e,t){var n=qa();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&$a(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function po(e,t,n){var r=Ri();Vi(98>r?98:r,(function(){e(!0)})),Vi(97<r?97:r,(function(){var r=Pa.suspense;Pa.suspense=void 0===t?null:t;try{e(!1),n()}finally{Pa.suspense=r}}))}function yo(e,t,n){var r=$u(),i=ha.suspense;i={expirationTime:r=Ku(r,e,i),suspenseConfig:i,action:n,eagerReducer:null,eagerState:null,next:null};var a=t.pending;if(null===a?i.next=i:(i.next=a.next,a.next=i),t.pending=i,a=e.alternate,e===za||null!==a&&a===za)Ha=!0,i.expirationTime=Ra,za.expirationTime=Ra;else{if(0===e.expirationTime&&(null===a||0===a.expirationTime)&&null!==(a=t.lastRenderedReducer))try{var o=t.lastRenderedState,u=a(o,n);if(i.eagerReducer=a,i.eagerState=u,Nr(u,o))return}catch(s){}Qu(e,r)}}var vo={readContext:ra,useCallback:Ya,useContext:Ya,useEffect:Ya,useImperativeHandle:Ya,useLayoutEffect:Ya,useMemo:Ya,useReducer:Ya,useRef:Ya,useState:Ya,useDebugValue:Ya,useResponder:Ya,useDeferredValue:Ya,useTransition:Ya},bo={readContext:ra,useCallback:lo,useContext:ra,useEffect:io,useImperativeHandle:function(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,no(4,2,uo.bind(null,t,e),n)},useLayoutEffect:function(e,t){return no(4,2,e,t)},useMemo:function(e,t){var n=Qa();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Qa();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=yo.bind(null,za,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Qa().memoizedState=e},useState:Xa,useDebugValue:co,useResponder:Na,useDeferredValue:function(e,t){var n=Xa(e),r=n[0],i=n[1];return io((function(){var n=Pa.suspense;Pa.suspense=void 0===t?null:t;try{i(e)}finally{Pa.suspense=n}}),[e,t]),r},useTransition:function(e){var t=Xa(!1),n=t[0];return t=t[1],[lo(po.bind(null,t,e),[t,e]),n]}},mo={readContext:ra,useCallback:fo,useContext:ra,useEffect:ao,useImperativeHandle:so,useLayoutEffect:oo,useMemo:ho,useReducer:Ja,useRef:to,useState:function(){return Ja(Ga)},useDebugValue:co,useResponder:Na,useDeferredValue:function(e,t){var n=Ja(Ga),r=n[0],i=n[1];return ao((function(){var n=Pa.suspense;Pa.suspense=void 0===t?null:t;try{i(e)}finally{Pa.suspense=n}}),[e,t]),r},useTransition:function(e){var t=Ja(Ga),n=t[0];return t=t[1],[fo(po.bind(null,t,e),[t,e]),n]}},go={readContext:ra,useCallback:fo,useContext:ra,useEffect:ao,useImperativeHandle:so,useLayoutEffect:oo,useMemo:ho,useReducer:Za,useRef:to,useState:function(){return Za(Ga)},useDebugValue:co,useResponder:Na,useDeferredValue:function(e,t){var n=Za(Ga),r=n[0],i=n[1];return ao((function(){var n=Pa.suspense;Pa.suspense=void 0===t?null:t;try{i(e)}finally{Pa.suspense=n}}),[e,t]),r},useTransition:function(e){var t=Za(Ga),n=t[0];return t=t[1],[fo(po.bind(null,t,e),[t,e]),n]}},ko=null,wo=null,_o=!1;function Oo(e,t){var n=xs(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.effectTag=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function xo(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);case 13:default:return!1}}function jo(e){if(_o){var t=wo;if(t){var n=t;if(!xo(e,t)){if(!(t=wn(n.nextSibling))||!xo(e,t))return e.effectTag=-1025&e.effectTag|2,_o=!1,void(ko=e);Oo(ko,n)}ko=e,wo=wn(t.firstChild)}else e.effectTag=-1025&e.effectTag|2,_o=!1,ko=e}}function So(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ko=e}function To(e){if(e!==ko)return!1;if(!_o)return So(e),_o=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!mn(t,e.memoizedProps))for(t=wo;t;)Oo(e,t),t=wn(t.nextSibling);if(So(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){wo=wn(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}wo=null}}else wo=ko?wn(e.stateNode.nextSibling):null;return!0}function Io(){wo=ko=null,_o=!1}var Eo=G.ReactCurrentOwner,Ao=!1;function Bo(e,t,n,r){t.child=null===e?ja(t,null,n,r):xa(t,e.child,n,r)}function Do(e,t,n,r,i){n=n.render;var a=t.ref;return na(t,i),r=Ka(e,t,n,r,a,i),null===e||Ao?(t.effectTag|=1,Bo(e,t,r,i),t.child):(t.updateQueue=e.updateQueue,t.effectTag&=-517,e.expirationTime<=i&&(e.expirationTime=0),Qo(e,t,i))}function Lo(e,t,n,r,i,a){if(null===e){var o=n.type;return"function"!==typeof o||js(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Ts(n.type,null,r,null,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,Co(e,t,o,r,i,a))}return o=e.child,i<a&&(i=o.memoizedProps,(n=null!==(n=n.compare)?n:Pr)(i,r)&&e.ref===t.ref)?Qo(e,t,a):(t.effectTag|=1,(e=Ss(o,r)).ref=t.ref,e.return=t,t.child=e)}function Co(e,t,n,r,i,a){return null!==e&&Pr(e.memoizedProps,r)&&e.ref===t.ref&&(Ao=!1,i<a)?(t.expirationTime=e.expirationTime,Qo(e,t,a)):Mo(e,t,n,r,a)}function Fo(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.effectTag|=128)}function Mo(e,t,n,r,i){var a=yi(n)?di:fi.current;return a=pi(t,a),na(t,i),n=Ka(e,t,n,r,a,i),null===e||Ao?(t.effectTag|=1,Bo(e,t,n,i),t.child):(t.updateQueue=e.updateQueue,t.effectTag&=-517,e.expirationTime<=i&&(e.expirationTime=0),Qo(e,t,i))}function No(e,t,n,r,i){if(yi(n)){var a=!0;gi(t)}else a=!1;if(na(t,i),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),ba(t,n,r),ga(t,n,r,i),r=!0;else if(null===e){var o=t.stateNode,u=t.memoizedProps;o.props=u;var s=o.context,c=n.contextType;"object"===typeof c&&null!==c?c=ra(c):c=pi(t,c=yi(n)?di:fi.current);var l=n.getDerivedStateFromProps,f="function"===typeof l||"function"===typeof o.getSnapshotBeforeUpdate;f||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(u!==r||s!==c)&&ma(t,o,r,c),ia=!1;var h=t.memoizedState;o.state=h,la(t,r,o,i),s=t.memoizedState,u!==r||h!==s||hi.current||ia?("function"===typeof l&&(pa(t,n,l,r),s=t.memoizedState),(u=ia||va(t,n,u,r,h,s,c))?(f||"function"!==typeof o.UNSAFE_componentWillMount&&"function"!==typeof o.componentWillMount||("function"===typeof o.componentWillMount&&o.componentWillMount(),"function"===typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount()),"function"===typeof o.componentDidMount&&(t.effectTag|=4)):("function"===typeof o.componentDidMount&&(t.effectTag|=4),t.memoizedProps=r,t.memoizedState=s),o.props=r,o.state=s,o.context=c,r=u):("function"===typeof o.componentDidMount&&(t.effectTag|=4),r=!1)}else o=t.stateNode,oa(e,t),u=t.memoizedProps,o.props=t.type===t.elementType?u:Qi(t.type,u),s=o.context,"object"===typeof(c=n.contextType)&&null!==c?c=ra(c):c=pi(t,c=yi(n)?di:fi.current),(f="function"===typeof(l=n.getDerivedStateFromProps)||"function"===typeof o.getSnapshotBeforeUpdate)||"function"!==typeof o.UNSAFE_componentWillReceiveProps&&"function"!==typeof o.componentWillReceiveProps||(u!==r||s!==c)&&ma(t,o,r,c),ia=!1,s=t.memoizedState,o.state=s,la(t,r,o,i),h=t.memoizedState,u!==r||s!==h||hi.current||ia?("function"===typeof l&&(pa(t,n,l,r),h=t.memoizedState),(l=ia||va(t,n,u,r,s,h,c))?(f||"function"!==typeof o.UNSAFE_componentWillUpdate&&"function"!==typeof o.componentWillUpdate||("function"===typeof o.componentWillUpdate&&o.componentWillUpdate(r,h,c),"function"===typeof o.UNSAFE_componentWillUpdate&&o.UNSAFE_componentWillUpdate(r,h,c)),"function"===typeof o.componentDidUpdate&&(t.effectTag|=4),"function"===typeof o.getSnapshotBeforeUpdate&&(t.effectTag|=256)):("function"!==typeof o.componentDidUpdate||u===e.memoizedProps&&s===e.memoizedState||(t.effectTag|=4),"function"!==typeof o.getSnapshotBeforeUpdate||u===e.memoizedProps&&s===e.memoizedState||(t.effectTag|=256),t.memoizedProps=r,t.memoizedState=h),o.props=r,o.state=h,o.context=c,r=l):("function"!==typeof o.componentDidUpdate||u===e.memoizedProps&&s===e.memoizedState||(t.effectTag|=4),"function"!==typeof o.getSnapshotBeforeUpdate||u===e.memoizedProps&&s===e.memoizedState||(t.effectTag|=256),r=!1);return Uo(e,t,n,r,a,i)}function Uo(e,t,n,r,i,a){Fo(e,t);var o=0!==(64&t.effectTag);if(!r&&!o)return i&&ki(t,n,!1),Qo(e,t,a);r=t.stateNode,Eo.current=t;var u=o&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return t.effectTag|=1,null!==e&&o?(t.child=xa(t,e.child,null,a),t.child=xa(t,null,u,a)):Bo(e,t,u,a),t.memoizedState=r.state,i&&ki(t,n,!0),t.child}function Po(e){var t=e.stateNode;t.pendingContext?bi(0,t.pendingContext,t.pendingContext!==t.context):t.context&&bi(0,t.context,!1),Ba(e,t.containerInfo)}var Ro,zo,Vo,Wo={dehydrated:null,retryTime:0};function Ho(e,t,n){var r,i=t.mode,a=t.pendingProps,o=Fa.current,u=!1;if((r=0!==(64&t.effectTag))||(r=0!==(2&o)&&(null===e||null!==e.memoizedState)),r?(u=!0,t.effectTag&=-65):null!==e&&null===e.memoizedState||void 0===a.fallback||!0===a.unstable_avoidThisFallback||(o|=1),ci(Fa,1&o),null===e){if(void 0!==a.fallback&&jo(t),u){if(u=a.fallback,(a=Is(null,i,0,null)).return=t,0===(2&t.mode))for(e=null!==t.memoizedState?t.child.child:t.child,a.child=e;null!==e;)e.return=a,e=e.sibling;return(n=Is(u,i,n,null)).return=t,a.sibling=n,t.memoizedState=Wo,t.child=a,n}return i=a.children,t.memoizedState=null,t.child=ja(t,null,i,n)}if(null!==e.memoizedState){if(i=(e=e.child).sibling,u){if(a=a.fallback,(n=Ss(e,e.pendingProps)).return=t,0===(2&t.mode)&&(u=null!==t.memoizedState?t.child.child:t.child)!==e.child)for(n.child=u;null!==u;)u.return=n,u=u.sibling;return(i=Ss(i,a)).return=t,n.sibling=i,n.childExpirationTime=0,t.memoizedState=Wo,t.child=n,i}return n=xa(t,e.child,a.children,n),t.memoizedState=null,t.child=n}if(e=e.child,u){if(u=a.fallback,(a=Is(null,i,0,null)).return=t,a.child=e,null!==e&&(e.return=a),0===(2&t.mode))for(e=null!==t.memoizedState?t.child.child:t.child,a.child=e;null!==e;)e.return=a,e=e.sibling;return(n=Is(u,i,n,null)).return=t,a.sibling=n,n.effectTag|=2,a.childExpirationTime=0,t.memoizedState=Wo,t.child=a,n}return t.memoizedState=null,t.child=xa(t,e,a.children,n)}function Yo(e,t){e.expirationTime<t&&(e.expirationTime=t);var n=e.alternate;null!==n&&n.expirationTime<t&&(n.expirationTime=t),ta(e.return,t)}function $o(e,t,n,r,i,a){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailExpiration:0,tailMode:i,lastEffect:a}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailExpiration=0,o.tailMode=i,o.lastEffect=a)}function Ko(e,t,n){var r=t.pendingProps,i=r.revealOrder,a=r.tail;if(Bo(e,t,r.children,n),0!==(2&(r=Fa.current)))r=1&r|2,t.effectTag|=64;else{if(null!==e&&0!==(64&e.effectTag))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Yo(e,n);else if(19===e.tag)Yo(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(ci(Fa,r),0===(2&t.mode))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===Ma(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),$o(t,!1,i,n,a,t.lastEffect);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===Ma(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}$o(t,!0,n,null,a,t.lastEffect);break;case"together":$o(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}return t.child}function Qo(e,t,n){null!==e&&(t.dependencies=e.dependencies);var r=t.expirationTime;if(0!==r&&os(r),t.childExpirationTime<n)return null;if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=Ss(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Ss(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function qo(e,t){switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Go(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:return yi(t.type)&&vi(),null;case 3:return Da(),si(hi),si(fi),(n=t.stateNode).pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||!To(t)||(t.effectTag|=4),null;case 5:Ca(t),n=Aa(Ea.current);var a=t.type;if(null!==e&&null!=t.stateNode)zo(e,t,a,r,n),e.ref!==t.ref&&(t.effectTag|=128);else{if(!r){if(null===t.stateNode)throw Error(o(166));return null}if(e=Aa(Ta.current),To(t)){r=t.stateNode,a=t.type;var u=t.memoizedProps;switch(r[xn]=t,r[jn]=u,a){case"iframe":case"object":case"embed":Kt("load",r);break;case"video":case"audio":for(e=0;e<Ge.length;e++)Kt(Ge[e],r);break;case"source":Kt("error",r);break;case"img":case"image":case"link":Kt("error",r),Kt("load",r);break;case"form":Kt("reset",r),Kt("submit",r);break;case"details":Kt("toggle",r);break;case"input":Oe(r,u),Kt("invalid",r),sn(n,"onChange");break;case"select":r._wrapperState={wasMultiple:!!u.multiple},Kt("invalid",r),sn(n,"onChange");break;case"textarea":Be(r,u),Kt("invalid",r),sn(n,"onChange")}for(var s in an(a,u),e=null,u)if(u.hasOwnProperty(s)){var c=u[s];"children"===s?"string"===typeof c?r.textContent!==c&&(e=["children",c]):"number"===typeof c&&r.textContent!==""+c&&(e=["children",""+c]):x.hasOwnProperty(s)&&null!=c&&sn(n,s)}switch(a){case"input":ke(r),Se(r,u,!0);break;case"textarea":ke(r),Le(r);break;case"select":case"option":break;default:"function"===typeof u.onClick&&(r.onclick=cn)}n=e,t.updateQueue=n,null!==n&&(t.effectTag|=4)}else{switch(s=9===n.nodeType?n:n.ownerDocument,e===un&&(e=Me(a)),e===un?"script"===a?((e=s.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=s.createElement(a,{is:r.is}):(e=s.createElement(a),"select"===a&&(s=e,r.multiple?s.multiple=!0:r.size&&(s.size=r.size))):e=s.createElementNS(e,a),e[xn]=t,e[jn]=r,Ro(e,t),t.stateNode=e,s=on(a,r),a){case"iframe":case"object":case"embed":Kt("load",e),c=r;break;case"video":case"audio":for(c=0;c<Ge.length;c++)Kt(Ge[c],e);c=r;break;case"source":Kt("error",e),c=r;break;case"img":case"image":case"link":Kt("error",e),Kt("load",e),c=r;break;case"form":Kt("reset",e),Kt("submit",e),c=r;break;case"details":Kt("toggle",e),c=r;break;case"input":Oe(e,r),c=_e(e,r),Kt("invalid",e),sn(n,"onChange");break;case"option":c=Ie(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},c=i({},r,{value:void 0}),Kt("invalid",e),sn(n,"onChange");break;case"textarea":Be(e,r),c=Ae(e,r),Kt("invalid",e),sn(n,"onChange");break;default:c=r}an(a,c);var l=c;for(u in l)if(l.hasOwnProperty(u)){var f=l[u];"style"===u?nn(e,f):"dangerouslySetInnerHTML"===u?null!=(f=f?f.__html:void 0)&&Pe(e,f):"children"===u?"string"===typeof f?("textarea"!==a||""!==f)&&Re(e,f):"number"===typeof f&&Re(e,""+f):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(x.hasOwnProperty(u)?null!=f&&sn(n,u):null!=f&&J(e,u,f,s))}switch(a){case"input":ke(e),Se(e,r,!1);break;case"textarea":ke(e),Le(e);break;case"option":null!=r.value&&e.setAttribute("value",""+me(r.value));break;case"select":e.multiple=!!r.multiple,null!=(n=r.value)?Ee(e,!!r.multiple,n,!1):null!=r.defaultValue&&Ee(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof c.onClick&&(e.onclick=cn)}bn(a,r)&&(t.effectTag|=4)}null!==t.ref&&(t.effectTag|=128)}return null;case 6:if(e&&null!=t.stateNode)Vo(0,t,e.memoizedProps,r);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));n=Aa(Ea.current),Aa(Ta.current),To(t)?(n=t.stateNode,r=t.memoizedProps,n[xn]=t,n.nodeValue!==r&&(t.effectTag|=4)):((n=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[xn]=t,t.stateNode=n)}return null;case 13:return si(Fa),r=t.memoizedState,0!==(64&t.effectTag)?(t.expirationTime=n,t):(n=null!==r,r=!1,null===e?void 0!==t.memoizedProps.fallback&&To(t):(r=null!==(a=e.memoizedState),n||null===a||null!==(a=e.child.sibling)&&(null!==(u=t.firstEffect)?(t.firstEffect=a,a.nextEffect=u):(t.firstEffect=t.lastEffect=a,a.nextEffect=null),a.effectTag=8)),n&&!r&&0!==(2&t.mode)&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||0!==(1&Fa.current)?Tu===ku&&(Tu=wu):(Tu!==ku&&Tu!==wu||(Tu=_u),0!==Du&&null!==xu&&(Ls(xu,Su),Cs(xu,Du)))),(n||r)&&(t.effectTag|=4),null);case 4:return Da(),null;case 10:return ea(t),null;case 17:return yi(t.type)&&vi(),null;case 19:if(si(Fa),null===(r=t.memoizedState))return null;if(a=0!==(64&t.effectTag),null===(u=r.rendering)){if(a)qo(r,!1);else if(Tu!==ku||null!==e&&0!==(64&e.effectTag))for(u=t.child;null!==u;){if(null!==(e=Ma(u))){for(t.effectTag|=64,qo(r,!1),null!==(a=e.updateQueue)&&(t.updateQueue=a,t.effectTag|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=t.child;null!==r;)u=n,(a=r).effectTag&=2,a.nextEffect=null,a.firstEffect=null,a.lastEffect=null,null===(e=a.alternate)?(a.childExpirationTime=0,a.expirationTime=u,a.child=null,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null):(a.childExpirationTime=e.childExpirationTime,a.expirationTime=e.expirationTime,a.child=e.child,a.memoizedProps=e.memoizedProps,a.memoizedState=e.memoizedState,a.updateQueue=e.updateQueue,u=e.dependencies,a.dependencies=null===u?null:{expirationTime:u.expirationTime,firstContext:u.firstContext,responders:u.responders}),r=r.sibling;return ci(Fa,1&Fa.current|2),t.child}u=u.sibling}}else{if(!a)if(null!==(e=Ma(u))){if(t.effectTag|=64,a=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.effectTag|=4),qo(r,!0),null===r.tail&&"hidden"===r.tailMode&&!u.alternate)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*Pi()-r.renderingStartTime>r.tailExpiration&&1<n&&(t.effectTag|=64,a=!0,qo(r,!1),t.expirationTime=t.childExpirationTime=n-1);r.isBackwards?(u.sibling=t.child,t.child=u):(null!==(n=r.last)?n.sibling=u:t.child=u,r.last=u)}return null!==r.tail?(0===r.tailExpiration&&(r.tailExpiration=Pi()+500),n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=Pi(),n.sibling=null,t=Fa.current,ci(Fa,a?1&t|2:1&t),n):null}throw Error(o(156,t.tag))}function Jo(e){switch(e.tag){case 1:yi(e.type)&&vi();var t=e.effectTag;return 4096&t?(e.effectTag=-4097&t|64,e):null;case 3:if(Da(),si(hi),si(fi),0!==(64&(t=e.effectTag)))throw Error(o(285));return e.effectTag=-4097&t|64,e;case 5:return Ca(e),null;case 13:return si(Fa),4096&(t=e.effectTag)?(e.effectTag=-4097&t|64,e):null;case 19:return si(Fa),null;case 4:return Da(),null;case 10:return ea(e),null;default:return null}}function Zo(e,t){return{value:e,source:t,stack:be(t)}}Ro=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},zo=function(e,t,n,r,a){var o=e.memoizedProps;if(o!==r){var u,s,c=t.stateNode;switch(Aa(Ta.current),e=null,n){case"input":o=_e(c,o),r=_e(c,r),e=[];break;case"option":o=Ie(c,o),r=Ie(c,r),e=[];break;case"select":o=i({},o,{value:void 0}),r=i({},r,{value:void 0}),e=[];break;case"textarea":o=Ae(c,o),r=Ae(c,r),e=[];break;default:"function"!==typeof o.onClick&&"function"===typeof r.onClick&&(c.onclick=cn)}for(u in an(n,r),n=null,o)if(!r.hasOwnProperty(u)&&o.hasOwnProperty(u)&&null!=o[u])if("style"===u)for(s in c=o[u])c.hasOwnProperty(s)&&(n||(n={}),n[s]="");else"dangerouslySetInnerHTML"!==u&&"children"!==u&&"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&"autoFocus"!==u&&(x.hasOwnProperty(u)?e||(e=[]):(e=e||[]).push(u,null));for(u in r){var l=r[u];if(c=null!=o?o[u]:void 0,r.hasOwnProperty(u)&&l!==c&&(null!=l||null!=c))if("style"===u)if(c){for(s in c)!c.hasOwnProperty(s)||l&&l.hasOwnProperty(s)||(n||(n={}),n[s]="");for(s in l)l.hasOwnProperty(s)&&c[s]!==l[s]&&(n||(n={}),n[s]=l[s])}else n||(e||(e=[]),e.push(u,n)),n=l;else"dangerouslySetInnerHTML"===u?(l=l?l.__html:void 0,c=c?c.__html:void 0,null!=l&&c!==l&&(e=e||[]).push(u,l)):"children"===u?c===l||"string"!==typeof l&&"number"!==typeof l||(e=e||[]).push(u,""+l):"suppressContentEditableWarning"!==u&&"suppressHydrationWarning"!==u&&(x.hasOwnProperty(u)?(null!=l&&sn(a,u),e||c===l||(e=[])):(e=e||[]).push(u,l))}n&&(e=e||[]).push("style",n),a=e,(t.updateQueue=a)&&(t.effectTag|=4)}},Vo=function(e,t,n,r){n!==r&&(t.effectTag|=4)};var Xo="function"===typeof WeakSet?WeakSet:Set;function eu(e,t){var n=t.source,r=t.stack;null===r&&null!==n&&(r=be(n)),null!==n&&ve(n.type),t=t.value,null!==e&&1===e.tag&&ve(e.type);try{console.error(t)}catch(i){setTimeout((function(){throw i}))}}function tu(e){var t=e.ref;if(null!==t)if("function"===typeof t)try{t(null)}catch(n){ms(e,n)}else t.current=null}function nu(e,t){switch(t.tag){case 0:case 11:case 15:case 22:return;case 1:if(256&t.effectTag&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Qi(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return;case 3:case 5:case 6:case 4:case 17:return}throw Error(o(163))}function ru(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.destroy;n.destroy=void 0,void 0!==r&&r()}n=n.next}while(n!==t)}}function iu(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function au(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:return void iu(3,n);case 1:if(e=n.stateNode,4&n.effectTag)if(null===t)e.componentDidMount();else{var r=n.elementType===n.type?t.memoizedProps:Qi(n.type,t.memoizedProps);e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate)}return void(null!==(t=n.updateQueue)&&fa(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:e=n.child.stateNode;break;case 1:e=n.child.stateNode}fa(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.effectTag&&bn(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&Mt(n)))));case 19:case 17:case 20:case 21:return}throw Error(o(163))}function ou(e,t,n){switch("function"===typeof _s&&_s(t),t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var r=e.next;Vi(97<n?97:n,(function(){var e=r;do{var n=e.destroy;if(void 0!==n){var i=t;try{n()}catch(a){ms(i,a)}}e=e.next}while(e!==r)}))}break;case 1:tu(t),"function"===typeof(n=t.stateNode).componentWillUnmount&&function(e,t){try{t.props=e.memoizedProps,t.state=e.memoizedState,t.componentWillUnmount()}catch(n){ms(e,n)}}(t,n);break;case 5:tu(t);break;case 4:lu(e,t,n)}}function uu(e){var t=e.alternate;e.return=null,e.child=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.alternate=null,e.firstEffect=null,e.lastEffect=null,e.pendingProps=null,e.memoizedProps=null,e.stateNode=null,null!==t&&uu(t)}function su(e){return 5===e.tag||3===e.tag||4===e.tag}function cu(e){e:{for(var t=e.return;null!==t;){if(su(t)){var n=t;break e}t=t.return}throw Error(o(160))}switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(o(161))}16&n.effectTag&&(Re(t,""),n.effectTag&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||su(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.effectTag)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.effectTag)){n=n.stateNode;break e}}r?function e(t,n,r){var i=t.tag,a=5===i||6===i;if(a)t=a?t.stateNode:t.stateNode.instance,n?8===r.nodeType?r.parentNode.insertBefore(t,n):r.insertBefore(t,n):(8===r.nodeType?(n=r.parentNode).insertBefore(t,r):(n=r).appendChild(t),null!==(r=r._reactRootContainer)&&void 0!==r||null!==n.onclick||(n.onclick=cn));else if(4!==i&&null!==(t=t.child))for(e(t,n,r),t=t.sibling;null!==t;)e(t,n,r),t=t.sibling}(e,n,t):function e(t,n,r){var i=t.tag,a=5===i||6===i;if(a)t=a?t.stateNode:t.stateNode.instance,n?r.insertBefore(t,n):r.appendChild(t);else if(4!==i&&null!==(t=t.child))for(e(t,n,r),t=t.sibling;null!==t;)e(t,n,r),t=t.sibling}(e,n,t)}function lu(e,t,n){for(var r,i,a=t,u=!1;;){if(!u){u=a.return;e:for(;;){if(null===u)throw Error(o(160));switch(r=u.stateNode,u.tag){case 5:i=!1;break e;case 3:case 4:r=r.containerInfo,i=!0;break e}u=u.return}u=!0}if(5===a.tag||6===a.tag){e:for(var s=e,c=a,l=n,f=c;;)if(ou(s,f,l),null!==f.child&&4!==f.tag)f.child.return=f,f=f.child;else{if(f===c)break e;for(;null===f.sibling;){if(null===f.return||f.return===c)break e;f=f.return}f.sibling.return=f.return,f=f.sibling}i?(s=r,c=a.stateNode,8===s.nodeType?s.parentNode.removeChild(c):s.removeChild(c)):r.removeChild(a.stateNode)}else if(4===a.tag){if(null!==a.child){r=a.stateNode.containerInfo,i=!0,a.child.return=a,a=a.child;continue}}else if(ou(e,a,n),null!==a.child){a.child.return=a,a=a.child;continue}if(a===t)break;for(;null===a.sibling;){if(null===a.return||a.return===t)return;4===(a=a.return).tag&&(u=!1)}a.sibling.return=a.return,a=a.sibling}}function fu(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:return void ru(3,t);case 1:return;case 5:var n=t.stateNode;if(null!=n){var r=t.memoizedProps,i=null!==e?e.memoizedProps:r;e=t.type;var a=t.updateQueue;if(t.updateQueue=null,null!==a){for(n[jn]=r,"input"===e&&"radio"===r.type&&null!=r.name&&xe(n,r),on(e,i),t=on(e,r),i=0;i<a.length;i+=2){var u=a[i],s=a[i+1];"style"===u?nn(n,s):"dangerouslySetInnerHTML"===u?Pe(n,s):"children"===u?Re(n,s):J(n,u,s,t)}switch(e){case"input":je(n,r);break;case"textarea":De(n,r);break;case"select":t=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(e=r.value)?Ee(n,!!r.multiple,e,!1):t!==!!r.multiple&&(null!=r.defaultValue?Ee(n,!!r.multiple,r.defaultValue,!0):Ee(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(o(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((t=t.stateNode).hydrate&&(t.hydrate=!1,Mt(t.containerInfo)));case 12:return;case 13:if(n=t,null===t.memoizedState?r=!1:(r=!0,n=t.child,Cu=Pi()),null!==n)e:for(e=n;;){if(5===e.tag)a=e.stateNode,r?"function"===typeof(a=a.style).setProperty?a.setProperty("display","none","important"):a.display="none":(a=e.stateNode,i=void 0!==(i=e.memoizedProps.style)&&null!==i&&i.hasOwnProperty("display")?i.display:null,a.style.display=tn("display",i));else if(6===e.tag)e.stateNode.nodeValue=r?"":e.memoizedProps;else{if(13===e.tag&&null!==e.memoizedState&&null===e.memoizedState.dehydrated){(a=e.child.sibling).return=e,e=a;continue}if(null!==e.child){e.child.return=e,e=e.child;continue}}if(e===n)break;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}return void hu(t);case 19:return void hu(t);case 17:return}throw Error(o(163))}function hu(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Xo),t.forEach((function(t){var r=ks.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}var du="function"===typeof WeakMap?WeakMap:Map;function pu(e,t,n){(n=ua(n,null)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Mu||(Mu=!0,Nu=r),eu(e,t)},n}function yu(e,t,n){(n=ua(n,null)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var i=t.value;n.payload=function(){return eu(e,t),r(i)}}var a=e.stateNode;return null!==a&&"function"===typeof a.componentDidCatch&&(n.callback=function(){"function"!==typeof r&&(null===Uu?Uu=new Set([this]):Uu.add(this),eu(e,t));var n=t.stack;this.componentDidCatch(t.value,{componentStack:null!==n?n:""})}),n}var vu,bu=Math.ceil,mu=G.ReactCurrentDispatcher,gu=G.ReactCurrentOwner,ku=0,wu=3,_u=4,Ou=0,xu=null,ju=null,Su=0,Tu=ku,Iu=null,Eu=1073741823,Au=1073741823,Bu=null,Du=0,Lu=!1,Cu=0,Fu=null,Mu=!1,Nu=null,Uu=null,Pu=!1,Ru=null,zu=90,Vu=null,Wu=0,Hu=null,Yu=0;function $u(){return 0!==(48&Ou)?1073741821-(Pi()/10|0):0!==Yu?Yu:Yu=1073741821-(Pi()/10|0)}function Ku(e,t,n){if(0===(2&(t=t.mode)))return 1073741823;var r=Ri();if(0===(4&t))return 99===r?1073741823:1073741822;if(0!==(16&Ou))return Su;if(null!==n)e=Ki(e,0|n.timeoutMs||5e3,250);else switch(r){case 99:e=1073741823;break;case 98:e=Ki(e,150,100);break;case 97:case 96:e=Ki(e,5e3,250);break;case 95:e=2;break;default:throw Error(o(326))}return null!==xu&&e===Su&&--e,e}function Qu(e,t){if(50<Wu)throw Wu=0,Hu=null,Error(o(185));if(null!==(e=qu(e,t))){var n=Ri();1073741823===t?0!==(8&Ou)&&0===(48&Ou)?Xu(e):(Ju(e),0===Ou&&Yi()):Ju(e),0===(4&Ou)||98!==n&&99!==n||(null===Vu?Vu=new Map([[e,t]]):(void 0===(n=Vu.get(e))||n>t)&&Vu.set(e,t))}}function qu(e,t){e.expirationTime<t&&(e.expirationTime=t);var n=e.alternate;null!==n&&n.expirationTime<t&&(n.expirationTime=t);var r=e.return,i=null;if(null===r&&3===e.tag)i=e.stateNode;else for(;null!==r;){if(n=r.alternate,r.childExpirationTime<t&&(r.childExpirationTime=t),null!==n&&n.childExpirationTime<t&&(n.childExpirationTime=t),null===r.return&&3===r.tag){i=r.stateNode;break}r=r.return}return null!==i&&(xu===i&&(os(t),Tu===_u&&Ls(i,Su)),Cs(i,t)),i}function Gu(e){var t=e.lastExpiredTime;if(0!==t)return t;if(!Ds(e,t=e.firstPendingTime))return t;var n=e.lastPingedTime;return 2>=(e=n>(e=e.nextKnownPendingLevel)?n:e)&&t!==e?0:e}function Ju(e){if(0!==e.lastExpiredTime)e.callbackExpirationTime=1073741823,e.callbackPriority=99,e.callbackNode=Hi(Xu.bind(null,e));else{var t=Gu(e),n=e.callbackNode;if(0===t)null!==n&&(e.callbackNode=null,e.callbackExpirationTime=0,e.callbackPriority=90);else{var r=$u();if(1073741823===t?r=99:1===t||2===t?r=95:r=0>=(r=10*(1073741821-t)-10*(1073741821-r))?99:250>=r?98:5250>=r?97:95,null!==n){var i=e.callbackPriority;if(e.callbackExpirationTime===t&&i>=r)return;n!==Di&&Oi(n)}e.callbackExpirationTime=t,e.callbackPriority=r,t=1073741823===t?Hi(Xu.bind(null,e)):Wi(r,Zu.bind(null,e),{timeout:10*(1073741821-t)-Pi()}),e.callbackNode=t}}}function Zu(e,t){if(Yu=0,t)return Fs(e,t=$u()),Ju(e),null;var n=Gu(e);if(0!==n){if(t=e.callbackNode,0!==(48&Ou))throw Error(o(327));if(ys(),e===xu&&n===Su||ns(e,n),null!==ju){var r=Ou;Ou|=16;for(var i=is();;)try{ss();break}catch(s){rs(e,s)}if(Xi(),Ou=r,mu.current=i,1===Tu)throw t=Iu,ns(e,n),Ls(e,n),Ju(e),t;if(null===ju)switch(i=e.finishedWork=e.current.alternate,e.finishedExpirationTime=n,r=Tu,xu=null,r){case ku:case 1:throw Error(o(345));case 2:Fs(e,2<n?2:n);break;case wu:if(Ls(e,n),n===(r=e.lastSuspendedTime)&&(e.nextKnownPendingLevel=fs(i)),1073741823===Eu&&10<(i=Cu+500-Pi())){if(Lu){var a=e.lastPingedTime;if(0===a||a>=n){e.lastPingedTime=n,ns(e,n);break}}if(0!==(a=Gu(e))&&a!==n)break;if(0!==r&&r!==n){e.lastPingedTime=r;break}e.timeoutHandle=gn(hs.bind(null,e),i);break}hs(e);break;case _u:if(Ls(e,n),n===(r=e.lastSuspendedTime)&&(e.nextKnownPendingLevel=fs(i)),Lu&&(0===(i=e.lastPingedTime)||i>=n)){e.lastPingedTime=n,ns(e,n);break}if(0!==(i=Gu(e))&&i!==n)break;if(0!==r&&r!==n){e.lastPingedTime=r;break}if(1073741823!==Au?r=10*(1073741821-Au)-Pi():1073741823===Eu?r=0:(r=10*(1073741821-Eu)-5e3,0>(r=(i=Pi())-r)&&(r=0),(n=10*(1073741821-n)-i)<(r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*bu(r/1960))-r)&&(r=n)),10<r){e.timeoutHandle=gn(hs.bind(null,e),r);break}hs(e);break;case 5:if(1073741823!==Eu&&null!==Bu){a=Eu;var u=Bu;if(0>=(r=0|u.busyMinDurationMs)?r=0:(i=0|u.busyDelayMs,r=(a=Pi()-(10*(1073741821-a)-(0|u.timeoutMs||5e3)))<=i?0:i+r-a),10<r){Ls(e,n),e.timeoutHandle=gn(hs.bind(null,e),r);break}}hs(e);break;default:throw Error(o(329))}if(Ju(e),e.callbackNode===t)return Zu.bind(null,e)}}return null}function Xu(e){var t=e.lastExpiredTime;if(t=0!==t?t:1073741823,0!==(48&Ou))throw Error(o(327));if(ys(),e===xu&&t===Su||ns(e,t),null!==ju){var n=Ou;Ou|=16;for(var r=is();;)try{us();break}catch(i){rs(e,i)}if(Xi(),Ou=n,mu.current=r,1===Tu)throw n=Iu,ns(e,t),Ls(e,t),Ju(e),n;if(null!==ju)throw Error(o(261));e.finishedWork=e.current.alternate,e.finishedExpirationTime=t,xu=null,hs(e),Ju(e)}return null}function es(e,t){var n=Ou;Ou|=1;try{return e(t)}finally{0===(Ou=n)&&Yi()}}function ts(e,t){var n=Ou;Ou&=-2,Ou|=8;try{return e(t)}finally{0===(Ou=n)&&Yi()}}function ns(e,t){e.finishedWork=null,e.finishedExpirationTime=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,kn(n)),null!==ju)for(n=ju.return;null!==n;){var r=n;switch(r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&vi();break;case 3:Da(),si(hi),si(fi);break;case 5:Ca(r);break;case 4:Da();break;case 13:case 19:si(Fa);break;case 10:ea(r)}n=n.return}xu=e,ju=Ss(e.current,null),Su=t,Tu=ku,Iu=null,Au=Eu=1073741823,Bu=null,Du=0,Lu=!1}function rs(e,t){for(;;){try{if(Xi(),Ua.current=vo,Ha)for(var n=za.memoizedState;null!==n;){var r=n.queue;null!==r&&(r.pending=null),n=n.next}if(Ra=0,Wa=Va=za=null,Ha=!1,null===ju||null===ju.return)return Tu=1,Iu=t,ju=null;e:{var i=e,a=ju.return,o=ju,u=t;if(t=Su,o.effectTag|=2048,o.firstEffect=o.lastEffect=null,null!==u&&"object"===typeof u&&"function"===typeof u.then){var s=u;if(0===(2&o.mode)){var c=o.alternate;c?(o.updateQueue=c.updateQueue,o.memoizedState=c.memoizedState,o.expirationTime=c.expirationTime):(o.updateQueue=null,o.memoizedState=null)}var l=0!==(1&Fa.current),f=a;do{var h;if(h=13===f.tag){var d=f.memoizedState;if(null!==d)h=null!==d.dehydrated;else{var p=f.memoizedProps;h=void 0!==p.fallback&&(!0!==p.unstable_avoidThisFallback||!l)}}if(h){var y=f.updateQueue;if(null===y){var v=new Set;v.add(s),f.updateQueue=v}else y.add(s);if(0===(2&f.mode)){if(f.effectTag|=64,o.effectTag&=-2981,1===o.tag)if(null===o.alternate)o.tag=17;else{var b=ua(1073741823,null);b.tag=2,sa(o,b)}o.expirationTime=1073741823;break e}u=void 0,o=t;var m=i.pingCache;if(null===m?(m=i.pingCache=new du,u=new Set,m.set(s,u)):void 0===(u=m.get(s))&&(u=new Set,m.set(s,u)),!u.has(o)){u.add(o);var g=gs.bind(null,i,s,o);s.then(g,g)}f.effectTag|=4096,f.expirationTime=t;break e}f=f.return}while(null!==f);u=Error((ve(o.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display."+be(o))}5!==Tu&&(Tu=2),u=Zo(u,o),f=a;do{switch(f.tag){case 3:s=u,f.effectTag|=4096,f.expirationTime=t,ca(f,pu(f,s,t));break e;case 1:s=u;var k=f.type,w=f.stateNode;if(0===(64&f.effectTag)&&("function"===typeof k.getDerivedStateFromError||null!==w&&"function"===typeof w.componentDidCatch&&(null===Uu||!Uu.has(w)))){f.effectTag|=4096,f.expirationTime=t,ca(f,yu(f,s,t));break e}}f=f.return}while(null!==f)}ju=ls(ju)}catch(_){t=_;continue}break}}function is(){var e=mu.current;return mu.current=vo,null===e?vo:e}function as(e,t){e<Eu&&2<e&&(Eu=e),null!==t&&e<Au&&2<e&&(Au=e,Bu=t)}function os(e){e>Du&&(Du=e)}function us(){for(;null!==ju;)ju=cs(ju)}function ss(){for(;null!==ju&&!Li();)ju=cs(ju)}function cs(e){var t=vu(e.alternate,e,Su);return e.memoizedProps=e.pendingProps,null===t&&(t=ls(e)),gu.current=null,t}function ls(e){ju=e;do{var t=ju.alternate;if(e=ju.return,0===(2048&ju.effectTag)){if(t=Go(t,ju,Su),1===Su||1!==ju.childExpirationTime){for(var n=0,r=ju.child;null!==r;){var i=r.expirationTime,a=r.childExpirationTime;i>n&&(n=i),a>n&&(n=a),r=r.sibling}ju.childExpirationTime=n}if(null!==t)return t;null!==e&&0===(2048&e.effectTag)&&(null===e.firstEffect&&(e.firstEffect=ju.firstEffect),null!==ju.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=ju.firstEffect),e.lastEffect=ju.lastEffect),1<ju.effectTag&&(null!==e.lastEffect?e.lastEffect.nextEffect=ju:e.firstEffect=ju,e.lastEffect=ju))}else{if(null!==(t=Jo(ju)))return t.effectTag&=2047,t;null!==e&&(e.firstEffect=e.lastEffect=null,e.effectTag|=2048)}if(null!==(t=ju.sibling))return t;ju=e}while(null!==ju);return Tu===ku&&(Tu=5),null}function fs(e){var t=e.expirationTime;return t>(e=e.childExpirationTime)?t:e}function hs(e){var t=Ri();return Vi(99,ds.bind(null,e,t)),null}function ds(e,t){do{ys()}while(null!==Ru);if(0!==(48&Ou))throw Error(o(327));var n=e.finishedWork,r=e.finishedExpirationTime;if(null===n)return null;if(e.finishedWork=null,e.finishedExpirationTime=0,n===e.current)throw Error(o(177));e.callbackNode=null,e.callbackExpirationTime=0,e.callbackPriority=90,e.nextKnownPendingLevel=0;var i=fs(n);if(e.firstPendingTime=i,r<=e.lastSuspendedTime?e.firstSuspendedTime=e.lastSuspendedTime=e.nextKnownPendingLevel=0:r<=e.firstSuspendedTime&&(e.firstSuspendedTime=r-1),r<=e.lastPingedTime&&(e.lastPingedTime=0),r<=e.lastExpiredTime&&(e.lastExpiredTime=0),e===xu&&(ju=xu=null,Su=0),1<n.effectTag?null!==n.lastEffect?(n.lastEffect.nextEffect=n,i=n.firstEffect):i=n:i=n.firstEffect,null!==i){var a=Ou;Ou|=32,gu.current=null,yn=$t;var u=dn();if(pn(u)){if("selectionStart"in u)var s={start:u.selectionStart,end:u.selectionEnd};else e:{var c=(s=(s=u.ownerDocument)&&s.defaultView||window).getSelection&&s.getSelection();if(c&&0!==c.rangeCount){s=c.anchorNode;var l=c.anchorOffset,f=c.focusNode;c=c.focusOffset;try{s.nodeType,f.nodeType}catch(S){s=null;break e}var h=0,d=-1,p=-1,y=0,v=0,b=u,m=null;t:for(;;){for(var g;b!==s||0!==l&&3!==b.nodeType||(d=h+l),b!==f||0!==c&&3!==b.nodeType||(p=h+c),3===b.nodeType&&(h+=b.nodeValue.length),null!==(g=b.firstChild);)m=b,b=g;for(;;){if(b===u)break t;if(m===s&&++y===l&&(d=h),m===f&&++v===c&&(p=h),null!==(g=b.nextSibling))break;m=(b=m).parentNode}b=g}s=-1===d||-1===p?null:{start:d,end:p}}else s=null}s=s||{start:0,end:0}}else s=null;vn={activeElementDetached:null,focusedElem:u,selectionRange:s},$t=!1,Fu=i;do{try{ps()}catch(S){if(null===Fu)throw Error(o(330));ms(Fu,S),Fu=Fu.nextEffect}}while(null!==Fu);Fu=i;do{try{for(u=e,s=t;null!==Fu;){var k=Fu.effectTag;if(16&k&&Re(Fu.stateNode,""),128&k){var w=Fu.alternate;if(null!==w){var _=w.ref;null!==_&&("function"===typeof _?_(null):_.current=null)}}switch(1038&k){case 2:cu(Fu),Fu.effectTag&=-3;break;case 6:cu(Fu),Fu.effectTag&=-3,fu(Fu.alternate,Fu);break;case 1024:Fu.effectTag&=-1025;break;case 1028:Fu.effectTag&=-1025,fu(Fu.alternate,Fu);break;case 4:fu(Fu.alternate,Fu);break;case 8:lu(u,l=Fu,s),uu(l)}Fu=Fu.nextEffect}}catch(S){if(null===Fu)throw Error(o(330));ms(Fu,S),Fu=Fu.nextEffect}}while(null!==Fu);if(_=vn,w=dn(),k=_.focusedElem,s=_.selectionRange,w!==k&&k&&k.ownerDocument&&function e(t,n){return!(!t||!n)&&(t===n||(!t||3!==t.nodeType)&&(n&&3===n.nodeType?e(t,n.parentNode):"contains"in t?t.contains(n):!!t.compareDocumentPosition&&!!(16&t.compareDocumentPosition(n))))}(k.ownerDocument.documentElement,k)){null!==s&&pn(k)&&(w=s.start,void 0===(_=s.end)&&(_=w),"selectionStart"in k?(k.selectionStart=w,k.selectionEnd=Math.min(_,k.value.length)):(_=(w=k.ownerDocument||document)&&w.defaultView||window).getSelection&&(_=_.getSelection(),l=k.textContent.length,u=Math.min(s.start,l),s=void 0===s.end?u:Math.min(s.end,l),!_.extend&&u>s&&(l=s,s=u,u=l),l=hn(k,u),f=hn(k,s),l&&f&&(1!==_.rangeCount||_.anchorNode!==l.node||_.anchorOffset!==l.offset||_.focusNode!==f.node||_.focusOffset!==f.offset)&&((w=w.createRange()).setStart(l.node,l.offset),_.removeAllRanges(),u>s?(_.addRange(w),_.extend(f.node,f.offset)):(w.setEnd(f.node,f.offset),_.addRange(w))))),w=[];for(_=k;_=_.parentNode;)1===_.nodeType&&w.push({element:_,left:_.scrollLeft,top:_.scrollTop});for("function"===typeof k.focus&&k.focus(),k=0;k<w.length;k++)(_=w[k]).element.scrollLeft=_.left,_.element.scrollTop=_.top}$t=!!yn,vn=yn=null,e.current=n,Fu=i;do{try{for(k=e;null!==Fu;){var O=Fu.effectTag;if(36&O&&au(k,Fu.alternate,Fu),128&O){w=void 0;var x=Fu.ref;if(null!==x){var j=Fu.stateNode;switch(Fu.tag){case 5:w=j;break;default:w=j}"function"===typeof x?x(w):x.current=w}}Fu=Fu.nextEffect}}catch(S){if(null===Fu)throw Error(o(330));ms(Fu,S),Fu=Fu.nextEffect}}while(null!==Fu);Fu=null,Ci(),Ou=a}else e.current=n;if(Pu)Pu=!1,Ru=e,zu=t;else for(Fu=i;null!==Fu;)t=Fu.nextEffect,Fu.nextEffect=null,Fu=t;if(0===(t=e.firstPendingTime)&&(Uu=null),1073741823===t?e===Hu?Wu++:(Wu=0,Hu=e):Wu=0,"function"===typeof ws&&ws(n.stateNode,r),Ju(e),Mu)throw Mu=!1,e=Nu,Nu=null,e;return 0!==(8&Ou)||Yi(),null}function ps(){for(;null!==Fu;){var e=Fu.effectTag;0!==(256&e)&&nu(Fu.alternate,Fu),0===(512&e)||Pu||(Pu=!0,Wi(97,(function(){return ys(),null}))),Fu=Fu.nextEffect}}function ys(){if(90!==zu){var e=97<zu?97:zu;return zu=90,Vi(e,vs)}}function vs(){if(null===Ru)return!1;var e=Ru;if(Ru=null,0!==(48&Ou))throw Error(o(331));var t=Ou;for(Ou|=32,e=e.current.firstEffect;null!==e;){try{var n=e;if(0!==(512&n.effectTag))switch(n.tag){case 0:case 11:case 15:case 22:ru(5,n),iu(5,n)}}catch(r){if(null===e)throw Error(o(330));ms(e,r)}n=e.nextEffect,e.nextEffect=null,e=n}return Ou=t,Yi(),!0}function bs(e,t,n){sa(e,t=pu(e,t=Zo(n,t),1073741823)),null!==(e=qu(e,1073741823))&&Ju(e)}function ms(e,t){if(3===e.tag)bs(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){bs(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"===typeof n.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Uu||!Uu.has(r))){sa(n,e=yu(n,e=Zo(t,e),1073741823)),null!==(n=qu(n,1073741823))&&Ju(n);break}}n=n.return}}function gs(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),xu===e&&Su===n?Tu===_u||Tu===wu&&1073741823===Eu&&Pi()-Cu<500?ns(e,Su):Lu=!0:Ds(e,n)&&(0!==(t=e.lastPingedTime)&&t<n||(e.lastPingedTime=n,Ju(e)))}function ks(e,t){var n=e.stateNode;null!==n&&n.delete(t),0===(t=0)&&(t=Ku(t=$u(),e,null)),null!==(e=qu(e,t))&&Ju(e)}vu=function(e,t,n){var r=t.expirationTime;if(null!==e){var i=t.pendingProps;if(e.memoizedProps!==i||hi.current)Ao=!0;else{if(r<n){switch(Ao=!1,t.tag){case 3:Po(t),Io();break;case 5:if(La(t),4&t.mode&&1!==n&&i.hidden)return t.expirationTime=t.childExpirationTime=1,null;break;case 1:yi(t.type)&&gi(t);break;case 4:Ba(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value,i=t.type._context,ci(qi,i._currentValue),i._currentValue=r;break;case 13:if(null!==t.memoizedState)return 0!==(r=t.child.childExpirationTime)&&r>=n?Ho(e,t,n):(ci(Fa,1&Fa.current),null!==(t=Qo(e,t,n))?t.sibling:null);ci(Fa,1&Fa.current);break;case 19:if(r=t.childExpirationTime>=n,0!==(64&e.effectTag)){if(r)return Ko(e,t,n);t.effectTag|=64}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null),ci(Fa,Fa.current),!r)return null}return Qo(e,t,n)}Ao=!1}}else Ao=!1;switch(t.expirationTime=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),e=t.pendingProps,i=pi(t,fi.current),na(t,n),i=Ka(null,t,r,e,i,n),t.effectTag|=1,"object"===typeof i&&null!==i&&"function"===typeof i.render&&void 0===i.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,yi(r)){var a=!0;gi(t)}else a=!1;t.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,aa(t);var u=r.getDerivedStateFromProps;"function"===typeof u&&pa(t,r,u,e),i.updater=ya,t.stateNode=i,i._reactInternalFiber=t,ga(t,r,e,n),t=Uo(null,t,r,!0,a,n)}else t.tag=0,Bo(null,t,i,n),t=t.child;return t;case 16:e:{if(i=t.elementType,null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),e=t.pendingProps,function(e){if(-1===e._status){e._status=0;var t=e._ctor;t=t(),e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}}(i),1!==i._status)throw i._result;switch(i=i._result,t.type=i,a=t.tag=function(e){if("function"===typeof e)return js(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===se)return 11;if(e===fe)return 14}return 2}(i),e=Qi(i,e),a){case 0:t=Mo(null,t,i,e,n);break e;case 1:t=No(null,t,i,e,n);break e;case 11:t=Do(null,t,i,e,n);break e;case 14:t=Lo(null,t,i,Qi(i.type,e),r,n);break e}throw Error(o(306,i,""))}return t;case 0:return r=t.type,i=t.pendingProps,Mo(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 1:return r=t.type,i=t.pendingProps,No(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 3:if(Po(t),r=t.updateQueue,null===e||null===r)throw Error(o(282));if(r=t.pendingProps,i=null!==(i=t.memoizedState)?i.element:null,oa(e,t),la(t,r,null,n),(r=t.memoizedState.element)===i)Io(),t=Qo(e,t,n);else{if((i=t.stateNode.hydrate)&&(wo=wn(t.stateNode.containerInfo.firstChild),ko=t,i=_o=!0),i)for(n=ja(t,null,r,n),t.child=n;n;)n.effectTag=-3&n.effectTag|1024,n=n.sibling;else Bo(e,t,r,n),Io();t=t.child}return t;case 5:return La(t),null===e&&jo(t),r=t.type,i=t.pendingProps,a=null!==e?e.memoizedProps:null,u=i.children,mn(r,i)?u=null:null!==a&&mn(r,a)&&(t.effectTag|=16),Fo(e,t),4&t.mode&&1!==n&&i.hidden?(t.expirationTime=t.childExpirationTime=1,t=null):(Bo(e,t,u,n),t=t.child),t;case 6:return null===e&&jo(t),null;case 13:return Ho(e,t,n);case 4:return Ba(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=xa(t,null,r,n):Bo(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,Do(e,t,r,i=t.elementType===r?i:Qi(r,i),n);case 7:return Bo(e,t,t.pendingProps,n),t.child;case 8:case 12:return Bo(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,i=t.pendingProps,u=t.memoizedProps,a=i.value;var s=t.type._context;if(ci(qi,s._currentValue),s._currentValue=a,null!==u)if(s=u.value,0===(a=Nr(s,a)?0:0|("function"===typeof r._calculateChangedBits?r._calculateChangedBits(s,a):1073741823))){if(u.children===i.children&&!hi.current){t=Qo(e,t,n);break e}}else for(null!==(s=t.child)&&(s.return=t);null!==s;){var c=s.dependencies;if(null!==c){u=s.child;for(var l=c.firstContext;null!==l;){if(l.context===r&&0!==(l.observedBits&a)){1===s.tag&&((l=ua(n,null)).tag=2,sa(s,l)),s.expirationTime<n&&(s.expirationTime=n),null!==(l=s.alternate)&&l.expirationTime<n&&(l.expirationTime=n),ta(s.return,n),c.expirationTime<n&&(c.expirationTime=n);break}l=l.next}}else u=10===s.tag&&s.type===t.type?null:s.child;if(null!==u)u.return=s;else for(u=s;null!==u;){if(u===t){u=null;break}if(null!==(s=u.sibling)){s.return=u.return,u=s;break}u=u.return}s=u}Bo(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=(a=t.pendingProps).children,na(t,n),r=r(i=ra(i,a.unstable_observedBits)),t.effectTag|=1,Bo(e,t,r,n),t.child;case 14:return a=Qi(i=t.type,t.pendingProps),Lo(e,t,i,a=Qi(i.type,a),r,n);case 15:return Co(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:Qi(r,i),null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),t.tag=1,yi(r)?(e=!0,gi(t)):e=!1,na(t,n),ba(t,r,i),ga(t,r,i,n),Uo(null,t,r,!0,e,n);case 19:return Ko(e,t,n)}throw Error(o(156,t.tag))};var ws=null,_s=null;function Os(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.effectTag=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childExpirationTime=this.expirationTime=0,this.alternate=null}function xs(e,t,n,r){return new Os(e,t,n,r)}function js(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Ss(e,t){var n=e.alternate;return null===n?((n=xs(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.effectTag=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childExpirationTime=e.childExpirationTime,n.expirationTime=e.expirationTime,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{expirationTime:t.expirationTime,firstContext:t.firstContext,responders:t.responders},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Ts(e,t,n,r,i,a){var u=2;if(r=e,"function"===typeof e)js(e)&&(u=1);else if("string"===typeof e)u=5;else e:switch(e){case ne:return Is(n.children,i,a,t);case ue:u=8,i|=7;break;case re:u=8,i|=1;break;case ie:return(e=xs(12,n,t,8|i)).elementType=ie,e.type=ie,e.expirationTime=a,e;case ce:return(e=xs(13,n,t,i)).type=ce,e.elementType=ce,e.expirationTime=a,e;case le:return(e=xs(19,n,t,i)).elementType=le,e.expirationTime=a,e;default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case ae:u=10;break e;case oe:u=9;break e;case se:u=11;break e;case fe:u=14;break e;case he:u=16,r=null;break e;case de:u=22;break e}throw Error(o(130,null==e?e:typeof e,""))}return(t=xs(u,n,t,i)).elementType=e,t.type=r,t.expirationTime=a,t}function Is(e,t,n,r){return(e=xs(7,e,r,t)).expirationTime=n,e}function Es(e,t,n){return(e=xs(6,e,null,t)).expirationTime=n,e}function As(e,t,n){return(t=xs(4,null!==e.children?e.children:[],e.key,t)).expirationTime=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Bs(e,t,n){this.tag=t,this.current=null,this.containerInfo=e,this.pingCache=this.pendingChildren=null,this.finishedExpirationTime=0,this.finishedWork=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=90,this.lastExpiredTime=this.lastPingedTime=this.nextKnownPendingLevel=this.lastSuspendedTime=this.firstSuspendedTime=this.firstPendingTime=0}function Ds(e,t){var n=e.firstSuspendedTime;return e=e.lastSuspendedTime,0!==n&&n>=t&&e<=t}function Ls(e,t){var n=e.firstSuspendedTime,r=e.lastSuspendedTime;n<t&&(e.firstSuspendedTime=t),(r>t||0===n)&&(e.lastSuspendedTime=t),t<=e.lastPingedTime&&(e.lastPingedTime=0),t<=e.lastExpiredTime&&(e.lastExpiredTime=0)}function Cs(e,t){t>e.firstPendingTime&&(e.firstPendingTime=t);var n=e.firstSuspendedTime;0!==n&&(t>=n?e.firstSuspendedTime=e.lastSuspendedTime=e.nextKnownPendingLevel=0:t>=e.lastSuspendedTime&&(e.lastSuspendedTime=t+1),t>e.nextKnownPendingLevel&&(e.nextKnownPendingLevel=t))}function Fs(e,t){var n=e.lastExpiredTime;(0===n||n>t)&&(e.lastExpiredTime=t)}function Ms(e,t,n,r){var i=t.current,a=$u(),u=ha.suspense;a=Ku(a,i,u);e:if(n){t:{if(Xe(n=n._reactInternalFiber)!==n||1!==n.tag)throw Error(o(170));var s=n;do{switch(s.tag){case 3:s=s.stateNode.context;break t;case 1:if(yi(s.type)){s=s.stateNode.__reactInternalMemoizedMergedChildContext;break t}}s=s.return}while(null!==s);throw Error(o(171))}if(1===n.tag){var c=n.type;if(yi(c)){n=mi(n,c,s);break e}}n=s}else n=li;return null===t.context?t.context=n:t.pendingContext=n,(t=ua(a,u)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),sa(i,t),Qu(i,a),a}function Ns(e){if(!(e=e.current).child)return null;switch(e.child.tag){case 5:default:return e.child.stateNode}}function Us(e,t){null!==(e=e.memoizedState)&&null!==e.dehydrated&&e.retryTime<t&&(e.retryTime=t)}function Ps(e,t){Us(e,t),(e=e.alternate)&&Us(e,t)}function Rs(e,t,n){var r=new Bs(e,t,n=null!=n&&!0===n.hydrate),i=xs(3,null,null,2===t?7:1===t?3:0);r.current=i,i.stateNode=r,aa(i),e[Sn]=r.current,n&&0!==t&&function(e,t){var n=Ze(t);St.forEach((function(e){pt(e,t,n)})),Tt.forEach((function(e){pt(e,t,n)}))}(0,9===e.nodeType?e:e.ownerDocument),this._internalRoot=r}function zs(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Vs(e,t,n,r,i){var a=n._reactRootContainer;if(a){var o=a._internalRoot;if("function"===typeof i){var u=i;i=function(){var e=Ns(o);u.call(e)}}Ms(t,o,e,i)}else{if(a=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new Rs(e,0,t?{hydrate:!0}:void 0)}(n,r),o=a._internalRoot,"function"===typeof i){var s=i;i=function(){var e=Ns(o);s.call(e)}}ts((function(){Ms(t,o,e,i)}))}return Ns(o)}function Ws(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:te,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}function Hs(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!zs(t))throw Error(o(200));return Ws(e,t,null,n)}Rs.prototype.render=function(e){Ms(e,this._internalRoot,null,null)},Rs.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Ms(null,e,null,(function(){t[Sn]=null}))},yt=function(e){if(13===e.tag){var t=Ki($u(),150,100);Qu(e,t),Ps(e,t)}},vt=function(e){13===e.tag&&(Qu(e,3),Ps(e,3))},bt=function(e){if(13===e.tag){var t=$u();Qu(e,t=Ku(t,e,null)),Ps(e,t)}},I=function(e,t,n){switch(t){case"input":if(je(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=An(r);if(!i)throw Error(o(90));we(r),je(r,i)}}}break;case"textarea":De(e,n);break;case"select":null!=(t=n.value)&&Ee(e,!!n.multiple,t,!1)}},C=es,F=function(e,t,n,r,i){var a=Ou;Ou|=4;try{return Vi(98,e.bind(null,t,n,r,i))}finally{0===(Ou=a)&&Yi()}},M=function(){0===(49&Ou)&&(function(){if(null!==Vu){var e=Vu;Vu=null,e.forEach((function(e,t){Fs(t,e),Ju(t)})),Yi()}}(),ys())},N=function(e,t){var n=Ou;Ou|=2;try{return e(t)}finally{0===(Ou=n)&&Yi()}};var Ys={Events:[In,En,An,S,O,Nn,function(e){it(e,Mn)},D,L,Jt,ut,ys,{current:!1}]};!function(e){var t=e.findFiberByHostInstance;(function(e){if("undefined"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__)return!1;var t=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(t.isDisabled||!t.supportsFiber)return!0;try{var n=t.inject(e);ws=function(e){try{t.onCommitFiberRoot(n,e,void 0,64===(64&e.current.effectTag))}catch(r){}},_s=function(e){try{t.onCommitFiberUnmount(n,e)}catch(r){}}}catch(r){}})(i({},e,{overrideHookState:null,overrideProps:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:G.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=nt(e))?null:e.stateNode},findFiberByHostInstance:function(e){return t?t(e):null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null}))}({findFiberByHostInstance:Tn,bundleType:0,version:"16.14.0",rendererPackageName:"react-dom"}),t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Ys,t.createPortal=Hs,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternalFiber;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw Error(o(268,Object.keys(e)))}return e=null===(e=nt(t))?null:e.stateNode},t.flushSync=function(e,t){if(0!==(48&Ou))throw Error(o(187));var n=Ou;Ou|=1;try{return Vi(99,e.bind(null,t))}finally{Ou=n,Yi()}},t.hydrate=function(e,t,n){if(!zs(t))throw Error(o(200));return Vs(null,e,t,!0,n)},t.render=function(e,t,n){if(!zs(t))throw Error(o(200));return Vs(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!zs(e))throw Error(o(40));return!!e._reactRootContainer&&(ts((function(){Vs(null,null,e,!1,(function(){e._reactRootContainer=null,e[Sn]=null}))})),!0)},t.unstable_batchedUpdates=es,t.unstable_createPortal=function(e,t){return Hs(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!zs(n))throw Error(o(200));if(null==e||void 0===e._reactInternalFiber)throw Error(o(38));return Vs(e,t,n,!1,r)},t.version="16.14.0"},function(e,t,n){"use strict";e.exports=n(22)},function(e,t,n){"use strict";var r,i,a,o,u;if("undefined"===typeof window||"function"!==typeof MessageChannel){var s=null,c=null,l=function e(){if(null!==s)try{var n=t.unstable_now();s(!0,n),s=null}catch(r){throw setTimeout(e,0),r}},f=Date.now();t.unstable_now=function(){return Date.now()-f},r=function(e){null!==s?setTimeout(r,0,e):(s=e,setTimeout(l,0))},i=function(e,t){c=setTimeout(e,t)},a=function(){clearTimeout(c)},o=function(){return!1},u=t.unstable_forceFrameRate=function(){}}else{var h=window.performance,d=window.Date,p=window.setTimeout,y=window.clearTimeout;if("undefined"!==typeof console){var v=window.cancelAnimationFrame;"function"!==typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://fb.me/react-polyfills"),"function"!==typeof v&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://fb.me/react-polyfills")}if("object"===typeof h&&"function"===typeof h.now)t.unstable_now=function(){return h.now()};else{var b=d.now();t.unstable_now=function(){return d.now()-b}}var m=!1,g=null,k=-1,w=5,_=0;o=function(){return t.unstable_now()>=_},u=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing framerates higher than 125 fps is not unsupported"):w=0<e?Math.floor(1e3/e):5};var O=new MessageChannel,x=O.port2;O.port1.onmessage=function(){if(null!==g){var e=t.unstable_now();_=e+w;try{g(!0,e)?x.postMessage(null):(m=!1,g=null)}catch(n){throw x.postMessage(null),n}}else m=!1},r=function(e){g=e,m||(m=!0,x.postMessage(null))},i=function(e,n){k=p((function(){e(t.unstable_now())}),n)},a=function(){y(k),k=-1}}function j(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,i=e[r];if(!(void 0!==i&&0<I(i,t)))break e;e[r]=t,e[n]=i,n=r}}function S(e){return void 0===(e=e[0])?null:e}function T(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length;r<i;){var a=2*(r+1)-1,o=e[a],u=a+1,s=e[u];if(void 0!==o&&0>I(o,n))void 0!==s&&0>I(s,o)?(e[r]=s,e[u]=n,r=u):(e[r]=o,e[a]=n,r=a);else{if(!(void 0!==s&&0>I(s,n)))break e;e[r]=s,e[u]=n,r=u}}}return t}return null}function I(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var E=[],A=[],B=1,D=null,L=3,C=!1,F=!1,M=!1;function N(e){for(var t=S(A);null!==t;){if(null===t.callback)T(A);else{if(!(t.startTime<=e))break;T(A),t.sortIndex=t.expirationTime,j(E,t)}t=S(A)}}function U(e){if(M=!1,N(e),!F)if(null!==S(E))F=!0,r(P);else{var t=S(A);null!==t&&i(U,t.startTime-e)}}function P(e,n){F=!1,M&&(M=!1,a()),C=!0;var r=L;try{for(N(n),D=S(E);null!==D&&(!(D.expirationTime>n)||e&&!o());){var u=D.callback;if(null!==u){D.callback=null,L=D.priorityLevel;var s=u(D.expirationTime<=n);n=t.unstable_now(),"function"===typeof s?D.callback=s:D===S(E)&&T(E),N(n)}else T(E);D=S(E)}if(null!==D)var c=!0;else{var l=S(A);null!==l&&i(U,l.startTime-n),c=!1}return c}finally{D=null,L=r,C=!1}}function R(e){switch(e){case 1:return-1;case 2:return 250;case 5:return 1073741823;case 4:return 1e4;default:return 5e3}}var z=u;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){F||C||(F=!0,r(P))},t.unstable_getCurrentPriorityLevel=function(){return L},t.unstable_getFirstCallbackNode=function(){return S(E)},t.unstable_next=function(e){switch(L){case 1:case 2:case 3:var t=3;break;default:t=L}var n=L;L=t;try{return e()}finally{L=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=z,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=L;L=e;try{return t()}finally{L=n}},t.unstable_scheduleCallback=function(e,n,o){var u=t.unstable_now();if("object"===typeof o&&null!==o){var s=o.delay;s="number"===typeof s&&0<s?u+s:u,o="number"===typeof o.timeout?o.timeout:R(e)}else o=R(e),s=u;return e={id:B++,callback:n,priorityLevel:e,startTime:s,expirationTime:o=s+o,sortIndex:-1},s>u?(e.sortIndex=s,j(A,e),null===S(E)&&e===S(A)&&(M?a():M=!0,i(U,s-u))):(e.sortIndex=o,j(E,e),F||C||(F=!0,r(P))),e},t.unstable_shouldYield=function(){var e=t.unstable_now();N(e);var n=S(E);return n!==D&&null!==D&&null!==n&&null!==n.callback&&n.startTime<=e&&n.expirationTime<D.expirationTime||o()},t.unstable_wrapCallback=function(e){var t=L;return function(){var n=L;L=t;try{return e.apply(this,arguments)}finally{L=n}}}},function(e,t,n){"use strict";e.exports=n(24)},function(e,t,n){"use strict";var r="function"===typeof Symbol&&Symbol.for,i=r?Symbol.for("react.element"):60103,a=r?Symbol.for("react.portal"):60106,o=r?Symbol.for("react.fragment"):60107,u=r?Symbol.for("react.strict_mode"):60108,s=r?Symbol.for("react.profiler"):60114,c=r?Symbol.for("react.provider"):60109,l=r?Symbol.for("react.context"):60110,f=r?Symbol.for("react.async_mode"):60111,h=r?Symbol.for("react.concurrent_mode"):60111,d=r?Symbol.for("react.forward_ref"):60112,p=r?Symbol.for("react.suspense"):60113,y=r?Symbol.for("react.suspense_list"):60120,v=r?Symbol.for("react.memo"):60115,b=r?Symbol.for("react.lazy"):60116,m=r?Symbol.for("react.block"):60121,g=r?Symbol.for("react.fundamental"):60117,k=r?Symbol.for("react.responder"):60118,w=r?Symbol.for("react.scope"):60119;function _(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case i:switch(e=e.type){case f:case h:case o:case s:case u:case p:return e;default:switch(e=e&&e.$$typeof){case l:case d:case b:case v:case c:return e;default:return t}}case a:return t}}}function O(e){return _(e)===h}t.AsyncMode=f,t.ConcurrentMode=h,t.ContextConsumer=l,t.ContextProvider=c,t.Element=i,t.ForwardRef=d,t.Fragment=o,t.Lazy=b,t.Memo=v,t.Portal=a,t.Profiler=s,t.StrictMode=u,t.Suspense=p,t.isAsyncMode=function(e){return O(e)||_(e)===f},t.isConcurrentMode=O,t.isContextConsumer=function(e){return _(e)===l},t.isContextProvider=function(e){return _(e)===c},t.isElement=function(e){return"object"===typeof e&&null!==e&&e.$$typeof===i},t.isForwardRef=function(e){return _(e)===d},t.isFragment=function(e){return _(e)===o},t.isLazy=function(e){return _(e)===b},t.isMemo=function(e){return _(e)===v},t.isPortal=function(e){return _(e)===a},t.isProfiler=function(e){return _(e)===s},t.isStrictMode=function(e){return _(e)===u},t.isSuspense=function(e){return _(e)===p},t.isValidElementType=function(e){return"string"===typeof e||"function"===typeof e||e===o||e===h||e===s||e===u||e===p||e===y||"object"===typeof e&&null!==e&&(e.$$typeof===b||e.$$typeof===v||e.$$typeof===c||e.$$typeof===l||e.$$typeof===d||e.$$typeof===g||e.$$typeof===k||e.$$typeof===w||e.$$typeof===m)},t.typeOf=_},function(e,t,n){var r=function(e){"use strict";var t=Object.prototype,n=t.hasOwnProperty,r="function"===typeof Symbol?Symbol:{},i=r.iterator||"@@iterator",a=r.asyncIterator||"@@asyncIterator",o=r.toStringTag||"@@toStringTag";function u(e,t,n){return Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}),e[t]}try{u({},"")}catch(S){u=function(e,t,n){return e[t]=n}}function s(e,t,n,r){var i=t&&t.prototype instanceof f?t:f,a=Object.create(i.prototype),o=new O(r||[]);return a._invoke=function(e,t,n){var r="suspendedStart";return function(i,a){if("executing"===r)throw new Error("Generator is already running");if("completed"===r){if("throw"===i)throw a;return j()}for(n.method=i,n.arg=a;;){var o=n.delegate;if(o){var u=k(o,n);if(u){if(u===l)continue;return u}}if("next"===n.method)n.sent=n._sent=n.arg;else if("throw"===n.method){if("suspendedStart"===r)throw r="completed",n.arg;n.dispatchException(n.arg)}else"return"===n.method&&n.abrupt("return",n.arg);r="executing";var s=c(e,t,n);if("normal"===s.type){if(r=n.done?"completed":"suspendedYield",s.arg===l)continue;return{value:s.arg,done:n.done}}"throw"===s.type&&(r="completed",n.method="throw",n.arg=s.arg)}}}(e,n,o),a}function c(e,t,n){try{return{type:"normal",arg:e.call(t,n)}}catch(S){return{type:"throw",arg:S}}}e.wrap=s;var l={};function f(){}function h(){}function d(){}var p={};u(p,i,(function(){return this}));var y=Object.getPrototypeOf,v=y&&y(y(x([])));v&&v!==t&&n.call(v,i)&&(p=v);var b=d.prototype=f.prototype=Object.create(p);function m(e){["next","throw","return"].forEach((function(t){u(e,t,(function(e){return this._invoke(t,e)}))}))}function g(e,t){var r;this._invoke=function(i,a){function o(){return new t((function(r,o){!function r(i,a,o,u){var s=c(e[i],e,a);if("throw"!==s.type){var l=s.arg,f=l.value;return f&&"object"===typeof f&&n.call(f,"__await")?t.resolve(f.__await).then((function(e){r("next",e,o,u)}),(function(e){r("throw",e,o,u)})):t.resolve(f).then((function(e){l.value=e,o(l)}),(function(e){return r("throw",e,o,u)}))}u(s.arg)}(i,a,r,o)}))}return r=r?r.then(o,o):o()}}function k(e,t){var n=e.iterator[t.method];if(void 0===n){if(t.delegate=null,"throw"===t.method){if(e.iterator.return&&(t.method="return",t.arg=void 0,k(e,t),"throw"===t.method))return l;t.method="throw",t.arg=new TypeError("The iterator does not provide a 'throw' method")}return l}var r=c(n,e.iterator,t.arg);if("throw"===r.type)return t.method="throw",t.arg=r.arg,t.delegate=null,l;var i=r.arg;return i?i.done?(t[e.resultName]=i.value,t.next=e.nextLoc,"return"!==t.method&&(t.method="next",t.arg=void 0),t.delegate=null,l):i:(t.method="throw",t.arg=new TypeError("iterator result is not an object"),t.delegate=null,l)}function w(e){var t={tryLoc:e[0]};1 in e&&(t.catchLoc=e[1]),2 in e&&(t.finallyLoc=e[2],t.afterLoc=e[3]),this.tryEntries.push(t)}function _(e){var t=e.completion||{};t.type="normal",delete t.arg,e.completion=t}function O(e){this.tryEntries=[{tryLoc:"root"}],e.forEach(w,this),this.reset(!0)}function x(e){if(e){var t=e[i];if(t)return t.call(e);if("function"===typeof e.next)return e;if(!isNaN(e.length)){var r=-1,a=function t(){for(;++r<e.length;)if(n.call(e,r))return t.value=e[r],t.done=!1,t;return t.value=void 0,t.done=!0,t};return a.next=a}}return{next:j}}function j(){return{value:void 0,done:!0}}return h.prototype=d,u(b,"constructor",d),u(d,"constructor",h),h.displayName=u(d,o,"GeneratorFunction"),e.isGeneratorFunction=function(e){var t="function"===typeof e&&e.constructor;return!!t&&(t===h||"GeneratorFunction"===(t.displayName||t.name))},e.mark=function(e){return Object.setPrototypeOf?Object.setPrototypeOf(e,d):(e.__proto__=d,u(e,o,"GeneratorFunction")),e.prototype=Object.create(b),e},e.awrap=function(e){return{__await:e}},m(g.prototype),u(g.prototype,a,(function(){return this})),e.AsyncIterator=g,e.async=function(t,n,r,i,a){void 0===a&&(a=Promise);var o=new g(s(t,n,r,i),a);return e.isGeneratorFunction(n)?o:o.next().then((function(e){return e.done?e.value:o.next()}))},m(b),u(b,o,"Generator"),u(b,i,(function(){return this})),u(b,"toString",(function(){return"[object Generator]"})),e.keys=function(e){var t=[];for(var n in e)t.push(n);return t.reverse(),function n(){for(;t.length;){var r=t.pop();if(r in e)return n.value=r,n.done=!1,n}return n.done=!0,n}},e.values=x,O.prototype={constructor:O,reset:function(e){if(this.prev=0,this.next=0,this.sent=this._sent=void 0,this.done=!1,this.delegate=null,this.method="next",this.arg=void 0,this.tryEntries.forEach(_),!e)for(var t in this)"t"===t.charAt(0)&&n.call(this,t)&&!isNaN(+t.slice(1))&&(this[t]=void 0)},stop:function(){this.done=!0;var e=this.tryEntries[0].completion;if("throw"===e.type)throw e.arg;return this.rval},dispatchException:function(e){if(this.done)throw e;var t=this;function r(n,r){return o.type="throw",o.arg=e,t.next=n,r&&(t.method="next",t.arg=void 0),!!r}for(var i=this.tryEntries.length-1;i>=0;--i){var a=this.tryEntries[i],o=a.completion;if("root"===a.tryLoc)return r("end");if(a.tryLoc<=this.prev){var u=n.call(a,"catchLoc"),s=n.call(a,"finallyLoc");if(u&&s){if(this.prev<a.catchLoc)return r(a.catchLoc,!0);if(this.prev<a.finallyLoc)return r(a.finallyLoc)}else if(u){if(this.prev<a.catchLoc)return r(a.catchLoc,!0)}else{if(!s)throw new Error("try statement without catch or finally");if(this.prev<a.finallyLoc)return r(a.finallyLoc)}}}},abrupt:function(e,t){for(var r=this.tryEntries.length-1;r>=0;--r){var i=this.tryEntries[r];if(i.tryLoc<=this.prev&&n.call(i,"finallyLoc")&&this.prev<i.finallyLoc){var a=i;break}}a&&("break"===e||"continue"===e)&&a.tryLoc<=t&&t<=a.finallyLoc&&(a=null);var o=a?a.completion:{};return o.type=e,o.arg=t,a?(this.method="next",this.next=a.finallyLoc,l):this.complete(o)},complete:function(e,t){if("throw"===e.type)throw e.arg;return"break"===e.type||"continue"===e.type?this.next=e.arg:"return"===e.type?(this.rval=this.arg=e.arg,this.method="return",this.next="end"):"normal"===e.type&&t&&(this.next=t),l},finish:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var n=this.tryEntries[t];if(n.finallyLoc===e)return this.complete(n.completion,n.afterLoc),_(n),l}},catch:function(e){for(var t=this.tryEntries.length-1;t>=0;--t){var n=this.tryEntries[t];if(n.tryLoc===e){var r=n.completion;if("throw"===r.type){var i=r.arg;_(n)}return i}}throw new Error("illegal catch attempt")},delegateYield:function(e,t,n){return this.delegate={iterator:x(e),resultName:t,nextLoc:n},"next"===this.method&&(this.arg=void 0),l}},e}(e.exports);try{regeneratorRuntime=r}catch(i){"object"===typeof globalThis?globalThis.regeneratorRuntime=r:Function("r","regeneratorRuntime = r")(r)}},function(e,t,n){"use strict";var r=n(27);function i(){}function a(){}a.resetWarningCache=i,e.exports=function(){function e(e,t,n,i,a,o){if(o!==r){var u=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw u.name="Invariant Violation",u}}function t(){return e}e.isRequired=e;var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:a,resetWarningCache:i};return n.PropTypes=n,n}},function(e,t,n){"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},function(e,t,n){}]]);
+//# sourceMappingURL=2.240923d3.chunk.js.map
\ No newline at end of file
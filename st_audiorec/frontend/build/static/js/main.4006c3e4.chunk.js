@@ -0,0 +1,2 @@
+(this.webpackJsonpstreamlit_component_template=this.webpackJsonpstreamlit_component_template||[]).push([[0],{18:function(e,t,n){e.exports=n(29)},29:function(e,t,n){"use strict";n.r(t);var a=n(7),o=n.n(a),r=n(16),c=n.n(r),s=n(0),i=n(1),u=n(6),p=n(5),l=n(2),d=n(3),m=n(9),h=n(12),g=(n(28),function(e){Object(l.a)(n,e);var t=Object(d.a)(n);function n(){var e;Object(s.a)(this,n);for(var a=arguments.length,r=new Array(a),c=0;c<a;c++)r[c]=arguments[c];return(e=t.call.apply(t,[this].concat(r))).state={isFocused:!1,recordState:null,audioDataURL:"",reset:!1},e.pcmChunks=[],e.sentSeq=-1,e.capture=null,e.pending=[],e.pendingFrames=0,e.recId=0,e.render=function(){var t=e.props.theme,n={},a=e.state.recordState;if(t){var r="1px solid ".concat(e.state.isFocused?t.primaryColor:"gray");n.border=r,n.outline=r}return o.a.createElement("span",null,o.a.createElement("div",null,o.a.createElement(h.b,{state:a,onStop:e.onStop_audio,type:"audio/wav",backgroundColor:"rgb(15, 17, 22)",foregroundColor:"rgb(227, 252, 3)",canvasWidth:450,canvasHeight:100}),o.a.createElement("audio",{id:"audio",controls:!0,src:e.state.audioDataURL}),o.a.createElement("button",{id:"record",onClick:e.onClick_start},"Start Recording"),o.a.createElement("button",{id:"stop",onClick:e.onClick_stop},"Stop"),o.a.createElement("button",{id:"reset",onClick:e.onClick_reset},"Reset"),o.a.createElement("button",{id:"continue",onClick:e.onClick_continue},"Download")))},e.onClick_start=function(){e.pcmChunks=[],e.sentSeq=-1,e.setState({reset:!1,audioDataURL:"",recordState:h.a.START}),m.a.setComponentValue(""),e.start_capture()},e.onClick_stop=function(){e.stop_capture(!0),e.setState({reset:!1,recordState:h.a.STOP})},e.onClick_reset=function(){e.stop_capture(!1),e.pcmChunks=[],e.setState({reset:!0,audioDataURL:"",recordState:h.a.STOP}),m.a.setComponentValue("")},e.onClick_continue=function(){if(""!==e.state.audioDataURL){var t=(new Date).toLocaleString(),n="beatinspect_rec_"+(t=(t=(t=t.replace(" ","")).replace(/_/g,"")).replace(",",""))+".wav",a=document.createElement("a");a.style.display="none",a.href=e.state.audioDataURL,a.download=n,document.body.appendChild(a),a.click()}},e.onStop_audio=function(t){!0===e.state.reset?(e.setState({audioDataURL:""}),m.a.setComponentValue("")):e.setState({audioDataURL:t.url})},e.start_capture=function(){e.recId=Math.floor(4294967295*Math.random()),e.pending=[],e.pendingFrames=0,navigator.mediaDevices.getUserMedia({audio:!0}).then((function(t){var n=new AudioContext,a=n.createMediaStreamSource(t),o=n.createScriptProcessor(4096,1,1);o.onaudioprocess=function(t){for(var a=t.inputBuffer.getChannelData(0),o=new Int16Array(a.length),r=0;r<a.length;r++)o[r]=Math.max(-32768,Math.min(32767,Math.round(32768*a[r])));e.pending.push(o),e.pendingFrames+=o.length,e.pendingFrames>=n.sampleRate*f&&e.queue_pending(n.sampleRate,!1)},a.connect(o),o.connect(n.destination),e.capture={stream:t,context:n,source:a,processor:o}}))},e.stop_capture=function(t){if(null!==e.capture){var n=e.capture,a=n.stream,o=n.context,r=n.source,c=n.processor;c.onaudioprocess=null,r.disconnect(),c.disconnect(),a.getTracks().forEach((function(e){return e.stop()})),t&&e.queue_pending(o.sampleRate,!0),o.close(),e.capture=null}},e.queue_pending=function(t,n){var a=new Int16Array(e.pendingFrames),o=0;e.pending.forEach((function(e){a.set(e,o),o+=e.length})),e.pending=[],e.pendingFrames=0,e.pcmChunks.push(C(e.recId,e.pcmChunks.length,t,1,16,n,new Uint8Array(a.buffer))),e.send_next_chunk()},e.send_next_chunk=function(){var t=e.sentSeq+1;t>=e.pcmChunks.length||0!==t&&e.props.args.next_seq!==t||(e.sentSeq=t,m.a.setComponentValue(e.pcmChunks[t]))},e}return Object(i.a)(n,[{key:"componentDidUpdate",value:function(){Object(u.a)(Object(p.a)(n.prototype),"componentDidUpdate",this).call(this),this.send_next_chunk()}}]),n}(m.b)),f=1;function C(e,t,n,a,o,r,c){for(var s=new Uint8Array(21+c.byteLength),i=new DataView(s.buffer),u=0;u<"BIPC".length;u++)i.setUint8(u,"BIPC".charCodeAt(u));return i.setUint32(4,e,!0),i.setUint32(8,t,!0),i.setUint32(12,n,!0),i.setUint16(16,a,!0),i.setUint16(18,o,!0),i.setUint8(20,r?1:0),s.set(c,21),s}var _=Object(m.c)(g);m.a.setComponentReady(),m.a.setFrameHeight(),c.a.render(o.a.createElement(o.a.StrictMode,null,o.a.createElement(_,null)),document.getElementById("root"))}},[[18,1,2]]]);
+//# sourceMappingURL=main.4006c3e4.chunk.js.map
\ No newline at end of file
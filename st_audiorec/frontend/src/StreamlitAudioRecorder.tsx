@@ -17,6 +17,12 @@ interface State {
 
 class StAudioRec extends StreamlitComponentBase<State> {
   public state = { isFocused: false, recordState: null, audioDataURL: '', reset: false}
+  private pcmChunks: Uint8Array[] = []  // binary chunks of the last recording
+  private sentSeq = -1  // sequence number of the last chunk sent to Python
+  private capture: any = null  // web audio graph tapping the microphone
+  private pending: Int16Array[] = []  // captured PCM not yet in a chunk
+  private pendingFrames = 0
+  private recId = 0
 
   public render = (): ReactNode => {
     // Arguments that are passed to the plugin in Python are accessible
@@ -79,15 +85,19 @@ class StAudioRec extends StreamlitComponentBase<State> {
 
 
   private onClick_start = () => {
+    this.pcmChunks = []
+    this.sentSeq = -1
     this.setState({
       reset: false,
       audioDataURL: '',
       recordState: RecordState.START
     })
     Streamlit.setComponentValue('')
+    this.start_capture()
   }
 
   private onClick_stop = () => {
+    this.stop_capture(true)  // remaining PCM becomes the last chunk
     this.setState({
       reset: false,
       recordState: RecordState.STOP
@@ -95,6 +105,8 @@ class StAudioRec extends StreamlitComponentBase<State> {
   }
 
   private onClick_reset = () => {
+    this.stop_capture(false)
+    this.pcmChunks = []
     this.setState({
       reset: true,
       audioDataURL: '',
@@ -138,266 +150,113 @@ class StAudioRec extends StreamlitComponentBase<State> {
       this.setState({
         audioDataURL: data.url
       })
+      // the PCM chunks were already streamed to Python while recording,
+      // the wav blob is only used for the audio player & the download
+    }
+  }
 
-      /*
-      // ALL EFFORTS for directly handing stuff back to Streamlit
-
-
-
-      // **CONCEPT for Data-Handling**
-      // fetch blob-object from blob-url
-      // convert blob object --> blob base64data
-      // convert base64data --> ogg file and save to temp
-      // load file from temp and return via st component value
-
-      // tested: loading the blob from Url: low time consumption
-      // tested: initiating new filereader: low time consumption
-      // tested: loading blob into filereader: low time consumption
-      // tested: splitting blob into chunks: low time consumption
-      // tested: converting blob to base64: insane time consumption
-      // tested: fetching blob arrayBuffer: insane time consumption
-
-      // info: apparently for larger blob sizes converting to buffer
-      // via response constructor is 6x faster than using FileReader
-
-      // info: apparently WAV files take up around 10x more space
-      // then equivalent MP3-based files. (.ogg is even smaller)
-
-      // 20sec WAV audio blob --> 4Mb in memory size
-      // reading in the whole blob file into memory before processing
-      // causes memory overload and lag --> freezes the browser
-      // read in the blob in sub-sets/blob chunks to avoid inefficiencies
-
-      var xhr = new XMLHttpRequest();
-      xhr.open('GET', data.url, true);
-      xhr.responseType = 'blob';
-      xhr.onload = function(e) {
-        if (this.status == 200) {
-          var myBlob = this.response;
-
-
-          // PROCESSING APPROACH A: all at once
-          var reader = new FileReader();
-          reader.readAsDataURL(myBlob);
-          reader.onloadend = () => {
-            const base64data = reader.result;
-            base64string = String(base64data);
-            base64string = base64string.substring(22);
-            Streamlit.setComponentValue(base64string);
-          }
-
-          // PROCESSING APPROACH B:
-          let cSize = 1024*10; // chunksize 10kB
-          var base64full = ''; // final base64 string
-          var base64string = ''; // substring for one chunk
-          let startPointer = 44; // start after WAV header
-          let endPointer = myBlob.size;
-          let endReached = false;
-
-          var wavHeader44byte = myBlob.slice(0, 44); // first 44 bytes
-          // the end byte is NOT included (exclusive byte44)
-
-          while(startPointer<endPointer){
-            // initiate start chunk pointer
-            let newStartPointer = startPointer+cSize;
-            if (newStartPointer > endPointer){
-              // in case all chunks have been processed
-              newStartPointer = endPointer;
-              endReached = true;
-            };
-
-            // **BAUSTELLE 1**
-            // slice out one chunk from the initial WAV-Blob
-            // concatenate sliced out chunk with header bytes
-
-            // var chunk = new Blob([myBlob.slice(startPointer, newStartPointer, 'audio/wav')]);
-            var chunk = myBlob.slice(startPointer, newStartPointer, 'audio/wav');
-            var chunkAudio = new Blob([wavHeader44byte, chunk], { type: "audio/wav" });
-            // var chunkAudio = new Blob([wavHeader44byte, chunk]);
-
-            var reader = new FileReader(); // initiate file reader
-            reader.readAsDataURL(chunkAudio); // read in the chunk
-            reader.onloadend = () => {
-              var base64data = reader.result;
-              // export chunk to string of base64 WAV Audio including header
-              base64string = String(base64data);
-
-
-
-
-              // **BAUSTELLE 2**
-              // concatenate two base64 strings
-
-
-              // ATTEMPT REMOVE BASE64
-              // remove base64 WAV header "data:audio/wav;base64,"
-              var base64stringArr = base64string.split(',');
-              //base64string = base64string.substring(22);
-              base64string = base64stringArr[1];
-
-              if (base64full == ''){
-                base64full = base64string;
-              } else {
-                // both need to be header free before
-                //var bothData = atob(base64full) + atob(base64string); // binary string
-                // var bothData64 = btoa(bothData); // base64 encoded
-                //base64full = //version of bothData64 without the header
-                // base64full = bothData64;
-                base64full = base64full + base64string;
-              };
-
-
-
-              // ATTEMPT CONCAT BASE64 main
-              if (base64full == ''){
-                base64full = base64string;
-              } else {
-
-                // convert base64full to ArrayBuffer
-                var myB64Data1  = base64full.split(',');
-                var myB64Chunk1 = myB64Data1[1];
-                var binary_string1 = window.atob(myB64Chunk1);
-                var len1 = binary_string1.length;
-                var bytes1 = new Uint8Array(len1);
-                for (var i = 0; i < len1; i++) {
-                    bytes1[i] = binary_string1.charCodeAt(i);
-                  }
-                var myBuffer1 = bytes1.buffer;
-
-                // convert base64string to ArrayBuffer
-                var myB64Data2  = base64string.split(',');
-                var myB64Chunk2 = myB64Data2[1];
-                var binary_string2 = window.atob(myB64Chunk2);
-                var len2 = binary_string2.length;
-                var bytes2 = new Uint8Array(len2);
-                for (var j = 0; j < len2; j++) {
-                    bytes2[i] = binary_string2.charCodeAt(j);
-                  }
-                var myBuffer2 = bytes2.buffer;
-
-                Streamlit.setComponentValue('test_buffers');
-
-                // create final full array buffer
-                var myFinalBuffer = new Uint8Array(myBuffer1.byteLength + myBuffer2.byteLength);
-                myFinalBuffer.set(new Uint8Array(myBuffer1), 0);
-                myFinalBuffer.set(new Uint8Array(myBuffer2), myBuffer1.byteLength);
-
-                Streamlit.setComponentValue('test_buffers_concat');
-
-
-                var options = {isFloat: false, numChannels: 2, sampleRate: 44100}
-
-                const type = options.isFloat ? Float32Array : Uint16Array
-                const numFrames = myFinalBuffer.byteLength / type.BYTES_PER_ELEMENT
-
-                options = Object.assign({}, options, { numFrames })
-                // TODO is this allocation allowed?????????
-
-                const numChannels =    options.numChannels || 2;
-                const sampleRate =     options.sampleRate || 44100;
-                const bytesPerSample = options.isFloat? 4 : 2;
-                const format =         options.isFloat? 3 : 1;
-
-                const blockAlign = numChannels * bytesPerSample;
-                const byteRate = sampleRate * blockAlign;
-                const dataSize = numFrames * blockAlign;
-
-                const bufferHeader = new ArrayBuffer(44);
-                const dv = new DataView(bufferHeader);
-
-                let p = 0;
-                let s = '';
-
-                s = 'RIFF'; // ChunkID
-                for (let i = 0; i < s.length; i++) {
-                  dv.setUint8(p + i, s.charCodeAt(i));};
-                p += s.length;
-
-                dv.setUint32(p, (dataSize + 36), true);
-                p += 4; // ChunkSize
-
-                s = 'WAVE'; // Format
-                for (let i = 0; i < s.length; i++) {
-                  dv.setUint8(p + i, s.charCodeAt(i));};
-                p += s.length;
-
-                s = 'fmt '; // Subchunk1ID
-                for (let i = 0; i < s.length; i++) {
-                  dv.setUint8(p + i, s.charCodeAt(i));};
-                p += s.length;
-
-                dv.setUint32(p, 16, true);
-                p += 4; // Subchunk1Size
-
-                dv.setUint16(p, format, true);
-                p += 2; // AudioFormat
-
-                dv.setUint16(p, numChannels, true);
-                p += 2; // NumChannels
-
-                dv.setUint32(p, sampleRate, true);
-                p += 4; // SampleRate
-
-                dv.setUint32(p, byteRate, true);
-                p += 4; // ByteRate
-
-                dv.setUint16(p, blockAlign, true);
-                p += 2; // BlockAlign
-
-                dv.setUint16(p, (bytesPerSample * 8), true);
-                p += 2; // BitsPerSample
-
-                s = 'data'; // Subchunk2ID
-                for (let i = 0; i < s.length; i++) {
-                  dv.setUint8(p + i, s.charCodeAt(i));};
-                p += s.length;
-
-                dv.setUint32(p, dataSize, true);
-                p += 4; // Subchunk2Size
-
-                const headerBytes = new Uint8Array(bufferHeader);
-                const wavBytes = new Uint8Array(headerBytes.length + myFinalBuffer.byteLength);
-
-                // prepend header, then add pcmBytes
-                wavBytes.set(headerBytes, 0)
-                wavBytes.set(new Uint8Array(myFinalBuffer), headerBytes.length)
-
-                myFinalBuffer = wavBytes;
-
-                var binary = '';
-                var bytes = new Uint8Array(myFinalBuffer);
-                var len = bytes.byteLength;
-                for (var k = 0; k < len; k++) {
-                   binary += String.fromCharCode(bytes[k]);
-                 };
-                base64full = window.btoa(binary);
-
-              }; // close else
-
-
-
-              // update current status of base64full after every iteration
-              // keep the setComponentValue statement within the filereader!
-              if (endReached){
-                // fs.writeFileSync('file.ogg', Buffer.from(base64data, 'base64'));
-                // base64full is returned WITHOUT the base64 header "data:audio/wav;base64,"
-                Streamlit.setComponentValue(base64full);
-              }
-            };
-            //update chunk pointer
-            startPointer = newStartPointer;
-          };
+  private start_capture = () => {
+    // tap the microphone with web audio and stream raw PCM chunks to Python
+    // while recording --> live metrics (rms, key, tempo) during recording
+    this.recId = Math.floor(Math.random() * 0xffffffff)  // tells recordings apart
+    this.pending = []
+    this.pendingFrames = 0
+    navigator.mediaDevices.getUserMedia({ audio: true }).then(stream => {
+      const context = new AudioContext()
+      const source = context.createMediaStreamSource(stream)
+      const processor = context.createScriptProcessor(4096, 1, 1)
+      processor.onaudioprocess = (event) => {
+        // float32 [-1, 1] --> 16 bit PCM (mono)
+        const input = event.inputBuffer.getChannelData(0)
+        const pcm = new Int16Array(input.length)
+        for (let i = 0; i < input.length; i++) {
+          pcm[i] = Math.max(-32768, Math.min(32767, Math.round(input[i] * 32768)))
+        }
+        this.pending.push(pcm)
+        this.pendingFrames += pcm.length
+        if (this.pendingFrames >= context.sampleRate * LIVE_CHUNK_SEC) {
+          this.queue_pending(context.sampleRate, false)
+        }
+      }
+      source.connect(processor)
+      processor.connect(context.destination)
+      this.capture = { stream, context, source, processor }
+    })
+  }
 
-        };
-      };
-      xhr.send();
+  private stop_capture = (flush: boolean) => {
+    if (this.capture === null) {
+      return
+    }
+    const { stream, context, source, processor } = this.capture
+    processor.onaudioprocess = null
+    source.disconnect()
+    processor.disconnect()
+    stream.getTracks().forEach(track => track.stop())
+    if (flush) {
+      this.queue_pending(context.sampleRate, true)
+    }
+    context.close()
+    this.capture = null
+  }
 
+  private queue_pending = (sampleRate: number, last: boolean) => {
+    // join the captured PCM blocks into one binary chunk and send it
+    const pcm = new Int16Array(this.pendingFrames)
+    let offset = 0
+    this.pending.forEach(block => {
+      pcm.set(block, offset)
+      offset += block.length
+    })
+    this.pending = []
+    this.pendingFrames = 0
+    this.pcmChunks.push(encode_chunk(this.recId, this.pcmChunks.length, sampleRate,
+                                     1, 16, last, new Uint8Array(pcm.buffer)))
+    this.send_next_chunk()
+  }
 
-    */
-    } // close all efforts to export to Streamlit
+  private send_next_chunk = () => {
+    // chunk n is only sent once Python acknowledged n-1 via args.next_seq
+    // --> no chunk gets lost when Streamlit coalesces component values
+    const seq = this.sentSeq + 1
+    if (seq >= this.pcmChunks.length) {
+      return
+    }
+    if (seq === 0 || this.props.args['next_seq'] === seq) {
+      this.sentSeq = seq
+      Streamlit.setComponentValue(this.pcmChunks[seq])
+    }
+  }
 
+  public componentDidUpdate(): void {
+    super.componentDidUpdate()  // keeps the frame height in sync
+    // new args (acknowledgement) from Python after every rerun
+    this.send_next_chunk()
+  }
+}
 
+// seconds of captured audio per binary component value (live update rate)
+const LIVE_CHUNK_SEC = 1
+// header: magic 'BIPC', recording id (u32), seq (u32), sample rate (u32),
+// channels (u16), bits per sample (u16), last chunk flag (u8) - little endian
+const PCM_HEADER_BYTES = 21
+
+function encode_chunk(recId: number, seq: number, sampleRate: number, channels: number,
+                      bits: number, last: boolean, pcm: Uint8Array): Uint8Array {
+  const chunk = new Uint8Array(PCM_HEADER_BYTES + pcm.byteLength)
+  const dv = new DataView(chunk.buffer)
+  const magic = 'BIPC'
+  for (let i = 0; i < magic.length; i++) {
+    dv.setUint8(i, magic.charCodeAt(i))
   }
+  dv.setUint32(4, recId, true)
+  dv.setUint32(8, seq, true)
+  dv.setUint32(12, sampleRate, true)
+  dv.setUint16(16, channels, true)
+  dv.setUint16(18, bits, true)
+  dv.setUint8(20, last ? 1 : 0)
+  chunk.set(pcm, PCM_HEADER_BYTES)
+  return chunk
 }
 
 // "withStreamlitConnection" is a wrapper function. It bootstraps the
@@ -10,18 +10,17 @@ import streamlit as st
 import streamlit.components.v1 as components
 
 import os
-import sys
-import time
-import librosa
-import numpy as np
-import soundfile as sf
-import pyloudnorm as pyln
-import essentia.standard as es
 
 import src_visual.plots_matplotlib as plots_mtpl  # plotting framework matplotly
 import src_visual.plots_plotly as plots_pltl  # plotting framework plotly dash
 import src_algo.utils as utils  # utility functions
-import src_algo.detect_keyscale as detect_keyscale
+import src_algo.analysis as analysis  # cached analysis stages
+import src_algo.jobs as jobs  # background analysis jobs per content hash
+import src_algo.features as features  # single STFT spectral features
+import src_algo.export as export  # beat grid & onset downloads
+import src_algo.ingest as ingest  # hashing & in-memory/spilled uploads
+import src_algo.recording as recording  # raw PCM chunks of the recorder
+from src_algo.audio_asset import AUDIO_EXTENSIONS  # wav, flac, mp3, aiff, ogg
 
 # import design augmentation for streamlit UX/UI
 import src_visual.streamlit_design as streamlit_design
@@ -33,6 +32,7 @@ build_dir = os.path.join(parent_dir, "st_audiorec/frontend/build")
 st_audiorec = components.declare_component("st_audiorec", path=build_dir)
 
 
+
 # CALLBACK FUNCTIONS & Session States
 def radiobuttons1_callback():
     st.session_state.spectrum3d = st.session_state['radiobuttons1_value']
@@ -44,6 +44,35 @@ def slider1_callback():
     st.session_state.melspec_treshold = st.session_state['slider1_value']
 
 
+def show_job_progress(placeholder, job):
+    # progress bar + status of every stage of the analysis job
+    if job.done:
+        placeholder.empty()
+        return
+    with placeholder.container():
+        st.progress(job.progress())
+        st.caption(' | '.join(f'{stage} {status}' for stage, status in job.status.items()))
+
+
+def stage_error(job, stage):
+    # message for a failed analysis stage, the other sections still render
+    error = job.errors[stage]
+    return f'{stage} analysis failed - {type(error).__name__}: {error}'
+
+
+def show_similar(placeholder, similar):
+    # most similar tracks of the library (similarity index of all analyses)
+    if not similar:
+        placeholder.caption('No similar beats found - the library grows with every analysed file')
+        return
+    with placeholder.container():
+        for _, score, meta in similar:
+            key = f"{meta['key']}-{meta['scale']}" if meta.get('key') else ''
+            bpm = f"{meta['bpm']} BPM" if meta.get('bpm') else ''
+            st.markdown(f"**{meta.get('name') or 'unnamed upload'}** &nbsp; {key} &nbsp; {bpm} "
+                        f"&nbsp; (similarity {round(score, 2)})")
+
+
 def beatinspect_main():
 
     # DESIGN implement changes to the standard streamlit UI/UX
@@ -52,6 +81,10 @@ def beatinspect_main():
     # initialize global vars
     advanced_analytics = False
     audiofile_name = None
+    audio_hash = None
+    audio_source = None  # in-memory upload buffer or temporary spill file
+    job = None  # background analysis job of the current audio content
+    similar_placeholder = None  # filled once the whole analysis is done
 
     # TITLE and Information
     header_col1, header_col2, header_col3 = st.columns([10, 2.5, 2.5])
@@ -77,18 +110,17 @@ def beatinspect_main():
             st.write('')  # add spacing
         with audio_col2:
             if 'Upload' in choice:
-                audiofile = st.file_uploader("", type='wav')
+                audiofile = st.file_uploader("", type=[ext.lstrip('.') for ext
+                                                       in AUDIO_EXTENSIONS])
                 if audiofile is not None:
                     # only enable advanced analytics for files
                     # that have not been recorded with beatinspect
                     audiofile_name = audiofile.name
-                    if not "beatinspect_rec_" in audiofile_name:
-                        advanced_analytics = True
-                        # enable advanced analytics bc uploaded
-
-                    # Save to main dir to be called via path
-                    with open(audiofile_name,"wb") as f:
-                        f.write(audiofile.getbuffer())
+                    # results are cached by content, not by filename
+                    # the upload is hashed while streaming it, decoded from
+                    # memory (large uploads from a unique temporary file)
+                    audio_hash, audio_source = ingest.ingest(audiofile)
+                    advanced_analytics = True  # incl. downloaded recordings
 
             elif 'Record' in choice:
                 audiofile = None
@@ -99,35 +131,43 @@ def beatinspect_main():
                           'seconds for optimal functionality!</p>'
                 st.markdown(rec_msg, unsafe_allow_html=True)
 
-                # the audiorec custom component
-                base64data_audio = st_audiorec()
-
-                # APPROACH: DECODE BASE64 DATA FROM return value
-                # st.write(base64data_audio)
-                # if (base64data_audio != None) and (base64data_audio != '') and ('test' not in base64data_audio):
-                    # decoding process of base64 string to wav file
-                    # with st.spinner('Decoding audio data...'):
-                        # base64data_audio = base64data_audio.replace('data:audio/wav;base64,', '')
-                        # st.write(base64data_audio)  # remove metadata header of base64 string
-
-                        # audiofile_name = "temp.wav"
-                        # wav_file = open(audiofile_name, "wb")
-                        # decode_string = base64.b64decode(base64data_audio+'==')
-                        # wav_file.write(decode_string)
-
-                    # audiofile_path = os.path.join(os.getcwd(), audiofile_name)
-                    # st.audio(audiofile_path)
+                # the audiorec custom component streams the recording as raw
+                # PCM chunks, each one acknowledged via next_seq before the
+                # next is sent --> assembled in memory, no base64 decoding
+                recorder = st.session_state.recording
+                recorder.feed(st.session_state.get('audiorec'))
+                st_audiorec(next_seq=recorder.next_seq, key='audiorec')
+
+                if recorder.live is not None and not recorder.complete:
+                    # metrics of the online estimators, updated per chunk
+                    live = recorder.live.metrics()
+                    live_col1, live_col2, live_col3 = st.columns(3)
+                    live_col1.metric(label="", value=f"{int(live['duration'])} sec",
+                                     delta=f"RMS {round(live['rms_db'], 1)} dB"
+                                           if live['rms_db'] is not None else 'RMS',
+                                     delta_color="off")
+                    live_col2.metric(label="", value=f"{live['key']}-{live['scale']}"
+                                     if live['key'] else '...',
+                                     delta='Musical Key (live)', delta_color="off")
+                    live_col3.metric(label="", value=f"{round(live['bpm'], 1)} BPM"
+                                     if live['bpm'] else '...',
+                                     delta='Beat Tempo (live)', delta_color="off")
+
+                if recorder.complete:
+                    # recordings run through the full analysis like uploads
+                    audiofile_name = recorder.name
+                    audio_hash, audio_source = ingest.ingest(recorder.wav_buffer())
+                    advanced_analytics = True
 
 
     # ANALYTICS for Audio File
     if audiofile_name is not None:
 
-        audiofile_path = os.path.join(os.getcwd(), audiofile_name)
         # evaluate whether the input audiofile has changed
-        new_audiofile = False # same audiofile --> load from session_state
-        if audiofile_name != st.session_state.audiofile_name:
-            # update session state and order new calc of attr
-            st.session_state.audiofile_name = audiofile_name
+        # (same audiofile --> ui selections are kept)
+        if audio_hash != st.session_state.audio_hash:
+            # update session state for the current audio content
+            st.session_state.audio_hash = audio_hash
             # reset session state for selected amp/rms plot
 
             # RESET critical selection values in case of file change
@@ -135,7 +175,20 @@ def beatinspect_main():
             st.session_state.spectrum3d = 'Peaks'
             st.session_state.melspec_treshold = -10
 
-            new_audiofile = True # new audiofile --> update session sates
+        # the analysis runs as background job (id = content hash), reruns
+        # caused by widget interactions attach to the running job
+        # the audio file is decoded ONCE, every stage reads from this buffer
+        job = jobs.submit(audio_hash, audio_source, audiofile_name)
+        job_progress = st.empty()  # per stage progress of the analysis job
+        with st.spinner('Decoding audio'):
+            asset = job.result('decode')
+            original = job.result('original')  # fingerprint lookup at ingest
+        if asset is None:  # nothing to analyse without the decoded audio
+            st.error(stage_error(job, 'decode'))
+            st.stop()
+        if original is not None and original['duplicate_of'] is not None:
+            st.info(f"Near-duplicate of {original['duplicate_of']} "
+                    f"- Key & BPM results are reused")
 
         # Musical and Tech Specs Overview
         with st.expander("SECTION - Musical & Technical Specifications",
@@ -143,15 +196,10 @@ def beatinspect_main():
 
             # extract technical specifications about wav file
             # no needfor session_state saving bc instant calc
-            wav_specs = sf.SoundFile(audiofile_path)
-            wav_data, _ = sf.read(audiofile_path)
-            try:
-                bit_depth = int(str(wav_specs.subtype)[4:])
-            except:
-                bit_depth = ''
-            sampling_freq = wav_specs.samplerate
-            channels = wav_specs.channels
-            frames = wav_specs.frames
+            bit_depth = asset.bit_depth
+            sampling_freq = asset.sr
+            channels = asset.channels
+            frames = asset.frames
             # seconds = frames/sampling_freq
 
             pref_col0, pref_col1, pref_col2, pref_col3 = st.columns([0.2, 1, 1, 1])
@@ -167,82 +215,89 @@ def beatinspect_main():
                     channels = str(channels) + ' Channel'
 
                 st.metric(label="", value=f"{sampling_freq} Hz",
-                          delta=f'{bit_depth}bit WAV - {channels}', delta_color="off")
+                          delta=f'{bit_depth}bit {asset.format} - {channels}' if bit_depth
+                                else f'{asset.format} - {channels}',  # lossy formats
+                          delta_color="off")
                 st.write('')  # add spacing
 
             with pref_col2:  # metrics : column for music scale evaluation
-                if new_audiofile:  # new audiofile --> update session sates
-                    with st.spinner('Finding Key & Scale'):
-                        time.sleep(0.3)  # buffer for loading the spinner
-                        # utility funct that calculates key & scale via essentia
-                        # https://essentia.upf.edu/reference/streaming_Key.html
-                        key, scale, key_strength = detect_keyscale.detect_ks(
-                            audiofile_name, 'diatonic')
-                        st.session_state.key = key
-                        st.session_state.scale = scale
-                        st.session_state.key_strength = key_strength
-                else:  # same audiofile --> load from session_state
-                    key = st.session_state.key
-                    scale = st.session_state.scale
-                    key_strength = st.session_state.key_strength
-
-                st.metric(label="", value=f"{key}-{scale}",
-                          delta=f"Confidence {round(key_strength, 2)}",
-                          delta_color="off")
+                key_metric = st.empty()  # filled as soon as the stage is done
+                key_metric.info('Finding Key & Scale')
+                key_profiles_caption = st.empty()  # opinions of other key profiles
                 st.write('')  # add spacing
 
             with pref_col3:  # metrics: calculcation of tempo
-                if new_audiofile:  # new audiofile --> update session sates
-                    with st.spinner('Calculating BPM'):
-                        time.sleep(0.3)  # buffer for loading the spinner
-                        # BPM estimation using essentia library
-                        es_audio = es.MonoLoader(filename=audiofile_name)()
-                        rhythm_ex = es.RhythmExtractor2013(method="multifeature")
-                        bpm_essentia, _, _, _, _ = rhythm_ex(es_audio)
-                        st.session_state.bpm_essentia = bpm_essentia
-                else:  # same audiofile --> load from session_state
-                    bpm_essentia = st.session_state.bpm_essentia
-
-                st.metric(label="", value=f"{round(bpm_essentia, 1)} BPM",
-                          delta=f'Beat Tempo', delta_color="off")
+                bpm_metric = st.empty()  # filled as soon as the stage is done
+                bpm_metric.info('Calculating BPM')
                 streamlit_design.add_spacing(1)  # add linebreak
 
+            # key & scale, BPM and loudness stages run concurrently in the
+            # job, their results are rendered as soon as each one is done
+            # https://essentia.upf.edu/reference/streaming_Key.html
+            rhythm, loudness, bpm_refined = None, None, False
+            for stage, result in job.as_completed(['key', 'key_profiles', 'bpm', 'loudness']):
+                show_job_progress(job_progress, job)
+                if result is None:  # failed stage, its metric shows the error
+                    if stage == 'key':
+                        key_metric.error(stage_error(job, stage))
+                    elif stage == 'bpm':
+                        bpm_metric.error(stage_error(job, stage))
+                    elif stage == 'key_profiles':
+                        key_profiles_caption.empty()
+                elif stage == 'key':
+                    consumed = (f" ({int(result['consumed_sec'])} sec)"
+                                if 'consumed_sec' in result else '')  # early terminated
+                    key_metric.metric(label="", value=f"{result['key']}-{result['scale']}",
+                                      delta=f"Confidence {round(result['strength'], 2)}{consumed}",
+                                      delta_color="off")
+                elif stage == 'key_profiles':
+                    # one HPCP pass scored against several key profiles
+                    opinions = ', '.join(f'{k}-{s} ({p})' for k, s, _, p in result[:3])
+                    key_profiles_caption.caption(f'Profiles: {opinions}')
+                elif stage == 'bpm':
+                    # full multifeature tempo refines the fast provisional bpm
+                    # in the job, the metric is replaced as soon as it is ready
+                    rhythm = result  # beat grid is reused for plots & export
+                    bpm_refined = job.status['bpm_refined'] == jobs.DONE
+                    if bpm_refined:  # refined result already available
+                        rhythm = job.results['bpm_refined']
+                    bpm_essentia = rhythm['bpm']
+                    bpm_metric.metric(label="", value=f"{round(bpm_essentia, 1)} BPM",
+                                      delta='Beat Tempo' if bpm_refined
+                                            else 'Beat Tempo (refining...)',
+                                      delta_color="off")
+                elif stage == 'loudness':
+                    loudness = result  # displayed in the loudness section
+
+            # time-resolved key & tempo map (key changes, tempo drifts)
+            with st.spinner('Mapping Key & Tempo over time'):
+                segments = job.result('timeline')
+            show_job_progress(job_progress, job)
+            if segments is None:
+                st.error(stage_error(job, 'timeline'))
+            elif len(segments['start']) > 1:  # only useful for multiple windows
+                plots_pltl.key_tempo_timeline(segments)
+
 
         if advanced_analytics:
             # calculate the necessary spectrum data for in-depth insights
             # however only calc data in case the file is suitable/qualified
 
-            if new_audiofile:
-                # new audiofile --> update session states
-                with st.spinner('calculating spectrogram insights'):
-                    y, sr = librosa.load(audiofile_path, sr=sampling_freq)
-                    y_stft = librosa.stft(y)  # STFT of y audio signal
-                    scale_db = librosa.amplitude_to_db(np.abs(y_stft), ref=np.max)
-                    spectrogram_magn, phase = librosa.magphase(librosa.stft(y))
-                    rms = librosa.feature.rms(S=spectrogram_magn)  # calculating rms
-                    times = librosa.times_like(rms) #extracting rms timestamps
-                    duration = librosa.get_duration(y=y, sr=sr)
-                    st.session_state.y, st.session_state.sr = y, sr
-                    st.session_state.times, st.session_state.rms = times, rms
-                    st.session_state.duration = duration
-
-            if not new_audiofile:
-                # same audiofile --> load from session_state
-                y, sr = st.session_state.y, st.session_state.sr
-                times, rms = st.session_state.times, st.session_state.rms
-                duration = st.session_state.duration
+            with st.spinner('calculating spectrogram insights'):
+                spectrogram = job.result('spectrogram')
+            if spectrogram is None:  # no plots, the loudness results still render
+                st.error(stage_error(job, 'spectrogram'))
+            else:
+                spectral, envelope = spectrogram['spectral'], spectrogram['envelope']
+                onsets = spectrogram['onsets']
+                times, rms = spectral['times'], spectral['rms']
+                duration = spectral['duration']
 
 
         # Inspect Audio File Specifications
         with st.expander("SECTION - Loudness Amplitude Analytics",
                          expanded=True):
 
-            if not advanced_analytics:
-                analytics_msg = '<p style="color: #e3fc03; font-size: 1rem;">'\
-                                'Only available for original audio files '\
-                                '(excluding beatinspect recordings)</p>'
-                st.markdown(analytics_msg, unsafe_allow_html=True)
-
             if advanced_analytics:  # only if audio file uploaded
                 # Generate graphs/plots for RMS & Amplitude over time
                 # st.audio(audiofile)  # display web audio player UX/UI
@@ -250,14 +305,18 @@ def beatinspect_main():
                 streamlit_design.add_spacing(1)  # add linebreak
                 # due to the session state only updating after Selection
                 # these plot calls need to be inversed/swapped like below
-                if 'AMP' in st.session_state.spectrum2d:  # generate rms spectrum plots
+                if spectrogram is not None and 'AMP' in st.session_state.spectrum2d:
                     with st.spinner('generating AMP spectrum plot'):
                         # time.sleep(0.3)  # add delay for spinner
-                        plots_mtpl.amp_spectrum(y, sr)
-                if 'RMS' in st.session_state.spectrum2d:  # generate amp spectrum plots
+                        plots_mtpl.amp_spectrum(envelope, audio_hash,
+                                                rhythm['beats'] if rhythm else None)
+                if spectrogram is not None and 'RMS' in st.session_state.spectrum2d:
                     with st.spinner('generating RMS spectrum plot'):
                         # time.sleep(0.3)  # add delay for spinner
-                        plots_mtpl.rms_spectrum(times, rms)
+                        plots_mtpl.rms_spectrum(times, rms, audio_hash)
+                if loudness is not None and 'LUFS' in st.session_state.spectrum2d:
+                    with st.spinner('generating LUFS spectrum plot'):
+                        plots_mtpl.lufs_spectrum(loudness, audio_hash)
 
                 # radio button selection for spectrum plot over time
                 streamlit_design.radiobutton_horizontal()  # switch alignment
@@ -265,15 +324,34 @@ def beatinspect_main():
                 with sradio2_col2:
                     streamlit_design.add_spacing(2)  # add linebreaks
                     st.radio('Please select your Volume-Spectrum of choice.',
-                              ['AMP Spectrum  ', 'RMS Spectrum  '],
+                              ['AMP Spectrum  ', 'RMS Spectrum  ', 'LUFS Spectrum  '],
                               key='radiobuttons2_value', on_change=radiobuttons2_callback)
 
                 with sradio2_col3:
-                    meter = pyln.Meter(sampling_freq) # create BS.1770 meter --> international standard
-                    peak_normalized_audio = pyln.normalize.peak(wav_data, 0)  # peak normalize audio to 0 dB
-                    loudness = meter.integrated_loudness(peak_normalized_audio) # measure loudness
-                    st.metric(label="", value=f"{round(loudness, 2)} dB",
-                              delta=f'Audio Loudness', delta_color="off")
+                    # BS.1770 integrated loudness --> international standard
+                    if loudness is None:
+                        st.error(stage_error(job, 'loudness'))
+                    else:
+                        st.metric(label="", value=f"{round(loudness['integrated_normalized'], 2)} dB",
+                                  delta=f'Audio Loudness', delta_color="off")
+                        st.caption(f"{round(loudness['integrated'], 1)} LUFS integrated, "
+                                   f"LRA {round(loudness['lra'], 1)} LU, "
+                                   f"True Peak {round(loudness['true_peak_db'], 1)} dBTP")
+
+                # beat grid & onsets from the already computed rhythm/spectrum data
+                export_col1, export_col2, export_col3, export_col4 = st.columns([0.08, 1.5, 1.5, 0.1])
+                file_stem = os.path.splitext(audiofile_name)[0]
+                with export_col2:
+                    if rhythm is not None:
+                        st.download_button('Download Beat Grid (.csv)',
+                                           export.beat_grid_csv(rhythm),
+                                           file_name=f'{file_stem}_beatgrid.csv',
+                                           mime='text/csv')
+                with export_col3:
+                    if spectrogram is not None:
+                        st.download_button('Download Onsets (.csv)',
+                                           export.onsets_csv(onsets),
+                                           file_name=f'{file_stem}_onsets.csv', mime='text/csv')
 
                 st.write('')  # add spacing
 
@@ -282,15 +360,12 @@ def beatinspect_main():
         with st.expander("SECTION - 3D MEL Spectrogram & Peak Detection",
                          expanded=True):
 
-            if not advanced_analytics:
-                analytics_msg = '<p style="color: #e3fc03; font-size: 1rem;">'\
-                                'Only available for original audio files '\
-                                '(excluding beatinspect recordings)</p>'
-                st.markdown(analytics_msg, unsafe_allow_html=True)
-
-            if advanced_analytics:  # only if audio file uploaded
+            if advanced_analytics and spectrogram is not None:  # only if audio file uploaded
                 # Generate graphs/plots for RMS & Amplitude over time
-                st.audio(audiofile)  # display web audio player UX/UI
+                if audiofile is not None:  # display web audio player UX/UI
+                    st.audio(audiofile)
+                else:  # browser recording, played back from the assembled wav
+                    st.audio(st.session_state.recording.wav_buffer(), format='audio/wav')
 
 
                 # AUDIO TIMEFRAME Selection for Mel-Spectrogram
@@ -298,26 +373,35 @@ def beatinspect_main():
                 with slider0_col2:  # add columns for sufficient padding
                     streamlit_design.add_spacing(1)  # add linebreak
 
-                    if duration > 30:  # if audio is longer than 30 sec --> performance limited
-                        # Select Timeframe for the spectrogram - Limited Performance if longer than 30 sec!
-                        sec_range = st.slider('', 0, int(duration), (0, 30), format="%d sec")  # only select first 30 sec
-                    else:  # if the audio file is shorter than 30 sec  --> no performance loss
-                        sec_range = st.slider('', 0, int(duration), (0, int(duration)), format="%d sec")  # full timeframe
+                    # Select Timeframe for the spectrogram - full track by default
+                    # the level of detail pyramid keeps the plot payload bounded
+                    sec_range = st.slider('', 0, int(duration), (0, int(duration)), format="%d sec")
+
+                    # select the frames of the cached full-track mel spectrogram
+                    # from the pyramid level that fits the surface point budget
+                    frame_start, frame_end = features.frame_range(
+                        sec_range[0], sec_range[1], spectral['sr'], spectral['hop_length'])
+                    mel_slice = features.pyramid_slice(
+                        analysis.spectral_pyramid(spectral, audio_hash), frame_start, frame_end)
+                    slice_duration = sec_range[1] - sec_range[0]
 
-                    y_slice, sr_slice = librosa.load(audiofile_path, sr=sampling_freq, offset=sec_range[0], duration=sec_range[1] - sec_range[0])
+                    # play back just the selected timeframe (range read)
+                    if slice_duration < int(duration):
+                        st.audio(export.timeframe_wav(asset, sec_range[0], sec_range[1]),
+                                 format='audio/wav')
 
                 if 'Peaks' in st.session_state.spectrum3d:
                     with st.spinner('generating 3D Mel Spectrogram - PEAKS DETECTION'):
                         # plot 3D interactive mel spectrogram
-                        plots_pltl.melspectrogram_plotly3d(y_slice, sr_slice, sec_range[0], True, True, st.session_state.melspec_treshold)
+                        plots_pltl.melspectrogram_plotly3d(mel_slice, slice_duration, sec_range[0], True, True, st.session_state.melspec_treshold)
                 if 'Default' in st.session_state.spectrum3d:
                     with st.spinner('generating 3D Mel Spectrogram - DEFAULT MODE'):
                         # plot 3D interactive mel spectrogram
-                        plots_pltl.melspectrogram_plotly3d(y_slice, sr_slice, sec_range[0], False, False, st.session_state.melspec_treshold)
+                        plots_pltl.melspectrogram_plotly3d(mel_slice, slice_duration, sec_range[0], False, False, st.session_state.melspec_treshold)
 
                 fullscreen_msg = '<p style="color: #e3fc03; font-size: 1rem;">'\
                                 'Select a specific Timeframe using the top Slider.'\
-                                '  ➟ limited performance if >> 30 seconds!<br>'\
+                                '  ➟ zoom in for more time & frequency detail!<br>'\
                                 'Drag the graph to explore 3D viewing angles & zooming.'\
                                 '  ➟ works best in fullscreen mode!'
                 mardown1_col1, mardown1_col2 = st.columns([0.05, 3])
@@ -338,6 +422,14 @@ def beatinspect_main():
                 st.write('')
 
 
+        # Similar beats of the library, the track is added to the index
+        # as the last stage of its analysis job
+        with st.expander("SECTION - Similar Beats in your Library",
+                         expanded=True):
+            similar_placeholder = st.empty()
+            similar_placeholder.info('Searching for similar beats')
+
+
     with st.spinner('footer logos'):
         # FOOTER Content and Coop logos etc
         foot_col1, foot_col2, foot_col3, foot_col4, foot_col5 = st.columns([2,1.5,1.5,1.5,2])
@@ -357,6 +449,21 @@ def beatinspect_main():
             st.markdown(librosa_html, unsafe_allow_html=True)
             # st.image('img/coop_utility_studio.png')
 
+    # REFINED BPM replaces the provisional one once the page is rendered
+    if job is not None and not bpm_refined:
+        refined = job.result('bpm_refined')
+        if refined is not None:  # otherwise the provisional bpm stays
+            bpm_metric.metric(label="", value=f"{round(refined['bpm'], 1)} BPM",
+                              delta='Beat Tempo', delta_color="off")
+        show_job_progress(job_progress, job)
+    if job is not None:
+        similar = job.result('similar')
+        if similar is None:
+            similar_placeholder.error(stage_error(job, 'similar'))
+        else:
+            show_similar(similar_placeholder, similar)
+        show_job_progress(job_progress, job)
+
     # CONCEPT FOR ONE PAGE WITH TWO GIANT COLUMNS
     # col_test1, col_test2 = st.columns([1,1])
     # with col_test1:
@@ -379,31 +486,14 @@ if __name__ == '__main__':
     if "melspec_treshold" not in st.session_state:
         st.session_state.melspec_treshold = -10
 
-    # initialize session state for audiofile.name
-    if "audiofile_name" not in st.session_state:
-        st.session_state.audiofile_name = None
-
-    # initialize session states for attributes
-    if "key" not in st.session_state:
-        st.session_state.key = None
-    if "scale" not in st.session_state:
-        st.session_state.scale = None
-    if "bpm_essentia" not in st.session_state:
-        st.session_state.bpm_essentia = None
-    if "key_strength" not in st.session_state:
-        st.session_state.key_strength = None
-
-    # initialize session states for plots attr
-    if "y" not in st.session_state:
-        st.session_state.y = None
-    if "sr" not in st.session_state:
-        st.session_state.sr = None
-    if "rms" not in st.session_state:
-        st.session_state.rms = None
-    if "times" not in st.session_state:
-        st.session_state.times = None
-    if "duration" not in st.session_state:
-        st.session_state.duration = None
+    # initialize session state for the content hash of the audio file
+    # analysis results live in the process-wide cache (src_algo.analysis_cache)
+    if "audio_hash" not in st.session_state:
+        st.session_state.audio_hash = None
+
+    # PCM chunks of the browser recording of this session
+    if "recording" not in st.session_state:
+        st.session_state.recording = recording.RecordingAssembler()
 
     # everytime something on a streamlit app interface is clicked it is automatically run again!
     # Callbacks are run before the app script run. On clicking/dragging any slider or button,